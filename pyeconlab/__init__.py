@@ -4,6 +4,8 @@ Package: PyEconLab
 
 from __future__ import division
 
+__version__ = '0.1-alpha'
+
 #----------#
 #-Datasets-#
 #----------#
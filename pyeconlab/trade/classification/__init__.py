@@ -6,5 +6,6 @@ This provides the API to the Trade Classification Subpackage
 
 """
 
-from sitc import SITC, SITCR1, SITCR2, SITCR3, SITCR4
-from hs import HS, HS1992, HS1996, HS2002, HS2007 	
\ No newline at end of file
+from sitc import SITC, SITCR1, SITCR2, SITCR3, SITCR4, get_sitc
+from hs import HS, HS1992, HS1996, HS2002, HS2007, get_hs
+from hierarchy import CodeHierarchy 	
\ No newline at end of file
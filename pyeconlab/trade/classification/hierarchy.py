@@ -0,0 +1,268 @@
+"""
+Product Code Hierarchy
+======================
+
+A prefix index over the codes of a hierarchical product classification (i.e. SITC, HS) where the level of a code
+is its length and the parent of a code is its longest prefix that is also a code.
+
+Index
+-----
+1. Codes are held in a sorted array for each level so membership and prefix queries are binary searches (O(log n))
+2. All codes that share a prefix are contiguous in a sorted level array. ``child_offsets`` holds the (start, end)
+   range of each code's children in the (nearest) deeper level and ``parent_offsets`` the position of each code's parent
+3. Mapping a Series of codes to a parent level or validating a Series of (mixed level) codes is computed once for
+   each unique code and broadcast to the rows
+
+Notes
+-----
+1. The parent of a code is found at the nearest lower level that contains its prefix (i.e. HS6 codes have HS4 parents).
+   Codes without a prefix in the classification (i.e. 'TOTAL') are roots
+2. The children of a code are the codes at the nearest deeper level that contains codes with its prefix
+
+"""
+
+import numpy as np
+import pandas as pd
+
+from pyeconlab.util import is_categorical
+
+def _successor(code):
+	""" Smallest string that is greater than all strings with prefix code """
+	char = unichr if isinstance(code, unicode) else chr
+	return code[:-1] + char(ord(code[-1]) + 1)
+
+def _factorize(codes):
+	""" Return (labels, uniques) for codes (Categoricals use their codes and categories) """
+	if isinstance(codes, pd.Series) and is_categorical(codes):
+		return codes.cat.codes.values.astype(np.int64), np.asarray(codes.cat.categories, dtype=object)
+	labels, uniques = pd.factorize(np.asarray(codes, dtype=object))
+	return labels.astype(np.int64), np.asarray(uniques, dtype=object)
+
+def _result(codes, values):
+	""" Return values as a Series if codes is a Series """
+	if isinstance(codes, pd.Series):
+		return pd.Series(values, index=codes.index, name=codes.name)
+	return values
+
+class CodeHierarchy(object):
+	"""
+	Prefix Index of a Hierarchical Product Classification
+
+	Parameters
+	----------
+	codes 	: 	array_like
+				Codes of all levels (i.e. SITC(revision=2).codes). Duplicate and missing codes are ignored
+
+	Attributes
+	----------
+	levels 			: 	list
+						Levels (code lengths) in the classification
+	parent_offsets 	: 	dict(level : (np.ndarray, np.ndarray))
+						Level and position of the parent of each code (-1 for roots)
+	child_offsets 	: 	dict(level : (np.ndarray, np.ndarray, np.ndarray))
+						Child level and the (start, end) positions of the children of each code in the child level
+	"""
+
+	def __init__(self, codes):
+		codes = pd.unique(np.asarray(codes, dtype=object))
+		codes = np.array([code for code in codes if isinstance(code, basestring) and len(code) > 0], dtype=object)
+		lengths = np.array([len(code) for code in codes], dtype=np.int64)
+		self.levels = sorted(set(lengths.tolist()))
+		self._codes = dict([(level, np.sort(codes[lengths == level])) for level in self.levels])
+		self.construct_offsets()
+
+	def __repr__(self):
+		return "%s(%s)" % (self.__class__.__name__, ", ".join(["L%s: %s" % (level, len(self._codes[level])) for level in self.levels]))
+
+	def __len__(self):
+		return sum([len(self._codes[level]) for level in self.levels])
+
+	def __contains__(self, code):
+		return self.position(code) >= 0
+
+	#-Construct Methods-#
+
+	def construct_offsets(self):
+		"""
+		Build parent and child offset arrays for each level
+		"""
+		self.parent_offsets = dict()
+		for level in self.levels:
+			codes = self._codes[level]
+			parent_level = np.empty(len(codes), dtype=np.int64)
+			parent_level.fill(-1)
+			parent = np.empty(len(codes), dtype=np.int64)
+			parent.fill(-1)
+			for lower in reversed([item for item in self.levels if item < level]): 			#Nearest lower level first
+				todo = np.flatnonzero(parent < 0)
+				if len(todo) == 0:
+					break
+				found = self._positions(lower, np.array([code[:lower] for code in codes[todo]], dtype=object))
+				match = found >= 0
+				parent_level[todo[match]] = lower
+				parent[todo[match]] = found[match]
+			self.parent_offsets[level] = (parent_level, parent)
+		self.child_offsets = dict()
+		for level in self.levels:
+			codes = self._codes[level]
+			child_level = np.empty(len(codes), dtype=np.int64)
+			child_level.fill(-1)
+			start = np.zeros(len(codes), dtype=np.int64)
+			end = np.zeros(len(codes), dtype=np.int64)
+			if len(codes) > 0:
+				upper = np.array([_successor(code) for code in codes], dtype=object)
+				for deeper in [item for item in self.levels if item > level]: 				#Nearest deeper level first
+					todo = np.flatnonzero(child_level < 0)
+					if len(todo) == 0:
+						break
+					lo = np.searchsorted(self._codes[deeper], codes[todo], side='left')
+					hi = np.searchsorted(self._codes[deeper], upper[todo], side='left')
+					match = hi > lo
+					child_level[todo[match]] = deeper
+					start[todo[match]] = lo[match]
+					end[todo[match]] = hi[match]
+			self.child_offsets[level] = (child_level, start, end)
+
+	#-Lookups-#
+
+	def codes(self, level):
+		""" Sorted array of the codes at a level """
+		if level not in self._codes:
+			raise ValueError("Level %s is not in the classification (levels: %s)" % (level, self.levels))
+		return self._codes[level]
+
+	def _positions(self, level, codes):
+		""" Positions of an array of codes in a level array (-1 if not found) """
+		array = self._codes.get(level, np.array([], dtype=object))
+		if len(array) == 0 or len(codes) == 0:
+			return np.zeros(len(codes), dtype=np.int64) - 1
+		positions = np.searchsorted(array, codes, side='left')
+		found = array.take(np.minimum(positions, len(array) - 1)) == codes
+		return np.where(found & (positions < len(array)), positions, -1).astype(np.int64)
+
+	def position(self, code):
+		""" Position of code in its level array (-1 if code is not in the classification) """
+		if not isinstance(code, basestring) or len(code) == 0:
+			return -1
+		return int(self._positions(len(code), np.array([code], dtype=object))[0])
+
+	def parent(self, code, level=None):
+		"""
+		Return the parent (or the ancestor at a level) of a code
+
+		Parameters
+		----------
+		code 	: 	str
+		level 	: 	int, optional(default=None)
+					Return the ancestor at level (Default: the parent)
+
+		Returns
+		-------
+		str or None (if code has no parent)
+		"""
+		if level is not None:
+			if level >= len(code) or self.position(code[:level]) < 0:
+				return None
+			return code[:level]
+		position = self.position(code)
+		if position < 0:
+			raise ValueError("%s is not in the classification" % code)
+		parent_level, parent = self.parent_offsets[len(code)]
+		if parent[position] < 0:
+			return None
+		return self._codes[parent_level[position]][parent[position]]
+
+	def ancestors(self, code):
+		""" Return the ancestors of a code (nearest first) """
+		ancestors = []
+		parent = self.parent(code)
+		while parent is not None:
+			ancestors.append(parent)
+			parent = self.parent(parent)
+		return ancestors
+
+	def children(self, code):
+		""" Return the children of a code (sorted array) """
+		position = self.position(code)
+		if position < 0:
+			raise ValueError("%s is not in the classification" % code)
+		child_level, start, end = self.child_offsets[len(code)]
+		if child_level[position] < 0:
+			return np.array([], dtype=object)
+		return self._codes[child_level[position]][start[position]:end[position]]
+
+	def descendants(self, code, level=None):
+		"""
+		Return the codes with prefix code (i.e. all codes under a chapter)
+
+		Parameters
+		----------
+		code 	: 	str
+		level 	: 	int, optional(default=None)
+					Only return descendants at level (Default: all deeper levels)
+
+		Returns
+		-------
+		np.ndarray (sorted by level and code)
+		"""
+		levels = [item for item in self.levels if item > len(code) and (level is None or item == level)]
+		result = []
+		for item in levels:
+			array = self.codes(item)
+			lo, hi = np.searchsorted(array, [code, _successor(code)], side='left')
+			result.append(array[lo:hi])
+		if len(result) == 0:
+			return np.array([], dtype=object)
+		return np.concatenate(result)
+
+	#-Vectorized Methods-#
+
+	def validate(self, codes, levels=None):
+		"""
+		Return a boolean marker for codes (of mixed levels) that are in the classification
+
+		Parameters
+		----------
+		codes 	: 	pd.Series or array_like
+		levels 	: 	list, optional(default=None)
+					Only accept codes at these levels (Default: any level)
+
+		Returns
+		-------
+		pd.Series (same index as codes) or np.ndarray
+		"""
+		labels, uniques = _factorize(codes)
+		lengths = np.array([len(code) if isinstance(code, basestring) else -1 for code in uniques], dtype=np.int64)
+		valid = np.zeros(len(uniques), dtype=bool)
+		for level in (self.levels if levels is None else levels):
+			select = np.flatnonzero(lengths == level)
+			valid[select] = self._positions(level, uniques[select]) >= 0
+		return _result(codes, np.append(valid, False).take(labels))
+
+	def to_parent(self, codes, level, official=False):
+		"""
+		Map codes to their ancestor at a level (i.e. sitc4 -> sitc3)
+
+		Parameters
+		----------
+		codes 		: 	pd.Series or array_like
+		level 		: 	int
+		official 	: 	bool, optional(default=False)
+						Only map to ancestors that are in the classification (otherwise np.nan)
+
+		Returns
+		-------
+		pd.Series (same index as codes, Categorical if codes is Categorical) or np.ndarray
+
+		Notes
+		-----
+		1. Codes shorter than level are mapped to np.nan
+		"""
+		labels, uniques = _factorize(codes)
+		parents = np.array([code[:level] if isinstance(code, basestring) and len(code) >= level else np.nan for code in uniques], dtype=object)
+		if official:
+			parents[~self.validate(parents, levels=[level])] = np.nan
+		if isinstance(codes, pd.Series) and is_categorical(codes):
+			new_labels, new_uniques = pd.factorize(parents, sort=True)
+			return _result(codes, pd.Categorical.from_codes(np.append(new_labels, -1).take(labels), categories=new_uniques))
+		return _result(codes, np.append(parents, np.nan).take(labels))
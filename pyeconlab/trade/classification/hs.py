@@ -26,12 +26,13 @@ import os
 import pandas as pd
 
 from pyeconlab.util import check_directory
+from .lookup import CodeLookup
 
 #-Data in `data/`-#
 this_dir, this_filename = os.path.split(__file__)
 DATA_PATH = check_directory(os.path.join(this_dir, "data"))
 
-class HS(object):
+class HS(CodeLookup):
 	"""
 	HS Classification Object
 
@@ -46,7 +47,13 @@ class HS(object):
 							Provide source institution string (i.e. "un"). 
 							See data/README.md for more information
 
+	Notes
+	-----
+	1. Vectorized code lookups (lookup, is_official, describe) are provided by lookup.CodeLookup
+
 	"""
+
+	LEVELS = [1, 2, 3, 4, 5, 6]
 	
 	def __init__(self, revision, source_institution='un', verbose=False):
 		"""
@@ -66,7 +73,7 @@ class HS(object):
 		#-Source: United Nations-#
 		if source_institution == 'un':
 			self.source_web = u"http://wits.worldbank.org/referencedata.html"
-			self.data = pd.read_csv(DATA_PATH + 'un/' + 'H'+str(self.revision_map[revision])+'.txt')
+			self.data = pd.read_csv(DATA_PATH + 'un/' + 'H'+str(self.revision_map[revision])+'.txt', dtype={'Code' : str, 'parentCode' : str})
 		#-Source: World Bank - WITS-#
 		elif source_institution == 'wits': 	
 			raise NotImplementedError('wits not yet implemented')	#-Update Error Once Implemented-#
@@ -75,6 +82,7 @@ class HS(object):
 		#-Run Some Standard Methods to Populate attributes-#
 		self.construct_level()
 		self.construct_description()
+		self.construct_lookup()
 
 	def __repr__(self):
 		obstring 	= 	"HS Revision: %s\n" % self.revision 	+\
@@ -207,6 +215,32 @@ class HS(object):
 		return self.data[['Code', 'Description']].set_index(['Code'])['Description'].to_dict()
 		
 
+#-------#
+#-Cache-#
+#-------#
+
+_HS_CACHE = dict()
+
+def get_hs(revision, source_institution='un'):
+	"""
+	Return a shared HS Classification Object (the data file is only loaded once per process)
+
+	Parameters
+	----------
+	revision 			: 	int
+							Specify HS Revision
+	source_institution 	: 	str, optional(default="un")
+							Provide source institution string (i.e. "un")
+
+	Notes
+	-----
+	1. The object is shared by all callers and should be treated as read only. Use HS() for an object that can be modified
+	"""
+	key = (revision, source_institution)
+	if key not in _HS_CACHE:
+		_HS_CACHE[key] = HS(revision=revision, source_institution=source_institution)
+	return _HS_CACHE[key]
+
 #----------#
 #-Revision-#
 #----------#
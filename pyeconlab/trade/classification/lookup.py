@@ -0,0 +1,96 @@
+"""
+Product Code Lookups
+====================
+
+Vectorized code lookups shared by the SITC and HS classification objects
+
+Notes
+-----
+1. Lookups are computed once for each unique code (or category for Categoricals) and broadcast to the rows
+2. Codes that occur more than once in a data file (i.e. SITC Revision 3) use the first entry. This matches
+   description() while code_description_dict() uses the last entry. The duplicated entries in the shipped data files are
+   identical so both give the same descriptions
+
+"""
+
+import numpy as np
+import pandas as pd
+
+from .hierarchy import CodeHierarchy, _factorize, _result
+
+class CodeLookup(object):
+	"""
+	Mixin for Classification Objects with a ``data`` attribute containing 'Code', 'level' and 'Description' columns
+
+	Attributes
+	----------
+	LEVELS 	: 	list
+				Levels of the classification (set by the subclass)
+	"""
+
+	LEVELS = []
+
+	def construct_lookup(self):
+		"""
+		Build Code Lookups (frozen sets of codes by level, code -> level, description arrays and the prefix hierarchy)
+		"""
+		data = self.data[~self.data['Code'].duplicated()]
+		self.code_index 		= pd.Index(data['Code'].values)
+		self.code_levels 		= data['level'].values
+		self.code_descriptions 	= data['Description'].values
+		self.code_set 			= frozenset(self.code_index)
+		self.level_sets 		= dict([(level, frozenset(data['Code'][data['level'] == level])) for level in self.LEVELS])
+		self.hierarchy 			= CodeHierarchy(self.code_index)
+
+	def lookup(self, codes):
+		"""
+		Return the position of each code in the lookup arrays (-1 if not a code in the classification)
+
+		Parameters
+		----------
+		codes 	: 	pd.Series or array_like
+					Codes to lookup (may be Categorical)
+
+		Returns
+		-------
+		np.ndarray (int64)
+		"""
+		labels, uniques = _factorize(codes)
+		return np.append(self.code_index.get_indexer(uniques), -1).take(labels).astype(np.int64)
+
+	def is_official(self, codes, level=None):
+		"""
+		Return a boolean marker for codes that are official codes in the classification
+
+		Parameters
+		----------
+		codes 	: 	pd.Series or array_like
+		level 	: 	int, optional(default=None)
+					Only mark codes at this level (Default: any level)
+
+		Returns
+		-------
+		pd.Series (same index as codes) or np.ndarray
+		"""
+		positions = self.lookup(codes)
+		marker = positions >= 0
+		if level is not None:
+			marker &= (np.append(self.code_levels, 0).take(positions) == level)
+		return _result(codes, marker)
+
+	def describe(self, codes, missing=np.nan):
+		"""
+		Return the description of each code
+
+		Parameters
+		----------
+		codes 	: 	pd.Series or array_like
+		missing : 	optional(default=np.nan)
+					Value for codes that are not in the classification
+
+		Returns
+		-------
+		pd.Series (same index as codes) or np.ndarray
+		"""
+		descriptions = np.append(self.code_descriptions.astype(object), np.array([missing], dtype=object))
+		return _result(codes, descriptions.take(self.lookup(codes)))
@@ -18,16 +18,16 @@ Future Work
 """
 
 import os
-import copy
 import pandas as pd
 
 from pyeconlab.util import check_directory
+from .lookup import CodeLookup
 
 # - Data in data/ - #
 this_dir, this_filename = os.path.split(__file__)
 DATA_PATH = check_directory(os.path.join(this_dir, "data"))
 
-class SITC(object):
+class SITC(CodeLookup):
 	"""
 	SITC Classification Object
 
@@ -42,8 +42,14 @@ class SITC(object):
 							Provide source institution string (i.e. "un"). 
 							See data/README.md for more information
 
+	Notes
+	-----
+	1. Vectorized code lookups (lookup, is_official, describe) are provided by lookup.CodeLookup
+
 	"""
 
+	LEVELS = [1, 2, 3, 4, 5]
+
 	def __init__(self, revision, source_institution='un', verbose=False):
 		"""
 		Load SITC Classification Data
@@ -55,7 +61,7 @@ class SITC(object):
 		#-Source: United Nations-#
 		if source_institution == 'un':
 			self.source_web = u"http://unstats.un.org/unsd/tradekb/Knowledgebase/UN-Comtrade-Reference-Tables"
-			self.data = pd.read_csv(DATA_PATH + 'un/' + 'S'+str(revision)+'.txt')
+			self.data = pd.read_csv(DATA_PATH + 'un/' + 'S'+str(revision)+'.txt', dtype={'Code' : str, 'parentCode' : str})
 		#-Source: World Bank - WITS-#
 		elif source_institution == 'wits':
 			raise NotImplementedError('wits not yet implemented') 		#-Update Error Message when Implemented
@@ -64,6 +70,7 @@ class SITC(object):
 		#-Run Some Standard Methods-#
 		self.construct_level()
 		self.construct_description()
+		self.construct_lookup()
 
 	def __repr__(self):
 		obstring 	= 	"SITC Revision: %s\n" % self.revision 	+\
@@ -130,14 +137,11 @@ class SITC(object):
 
 	def get_codes(self, level):
 		"""
-		Retrive a Code List by Level
+		Retrive a (sorted) Code List by Level
 		"""
-		data = copy.deepcopy(self.get_level(level)['Code']) 	#Copy to Make New List rather than a Slice
-		data = data.reset_index()
-		del data['index'] 										#Drop obs number from Original Data File
-		colname = 'SITCL' + str(level)
-		data.rename_axis({'Code' : colname}, axis=1, inplace=True)
-		return sorted(list(data[colname]))
+		if level not in [1, 2, 3, 4, 5]:
+			raise ValueError("[ERROR] Level can only be specifed as 1,2,3,4 or 5!")
+		return list(self.hierarchy.codes(level))
 
 
 	#-------------------#
@@ -243,6 +247,32 @@ class SITC(object):
 			raise NotImplementedError("%s is not yet implimented" % fltype)
 
 
+#-------#
+#-Cache-#
+#-------#
+
+_SITC_CACHE = dict()
+
+def get_sitc(revision, source_institution='un'):
+	"""
+	Return a shared SITC Classification Object (the data file is only loaded once per process)
+
+	Parameters
+	----------
+	revision 			: 	int
+							Specify SITC Revision
+	source_institution 	: 	str, optional(default="un")
+							Provide source institution string (i.e. "un")
+
+	Notes
+	-----
+	1. The object is shared by all callers and should be treated as read only. Use SITC() for an object that can be modified
+	"""
+	key = (revision, source_institution)
+	if key not in _SITC_CACHE:
+		_SITC_CACHE[key] = SITC(revision=revision, source_institution=source_institution)
+	return _SITC_CACHE[key]
+
 #-----------#
 #-Revisions-#
 #-----------#
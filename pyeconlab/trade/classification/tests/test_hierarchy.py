@@ -0,0 +1,51 @@
+"""
+Tests for the Product Code Hierarchy
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+
+from pyeconlab.trade.classification import CodeHierarchy, get_sitc
+
+
+class TestSuite_CodeHierarchy(unittest.TestCase):
+
+	def setUp(self):
+		self.codes = ['01', '0101', '010111', '010119', '0102', '010210', '02', '0201', '020110', 'TOTAL']
+		self.hierarchy = CodeHierarchy(self.codes)
+
+	def test_lookups(self):
+		h = self.hierarchy
+		assert h.levels == [2, 4, 5, 6]
+		assert len(h) == len(self.codes)
+		assert '0102' in h and '0103' not in h
+		assert h.parent('010111') == '0101' 								#Level 5 only contains 'TOTAL'
+		assert h.parent('01') is None and h.parent('TOTAL') is None
+		assert h.parent('010111', level=2) == '01'
+		assert h.ancestors('020110') == ['0201', '02']
+		assert list(h.children('01')) == ['0101', '0102']
+		assert list(h.children('0101')) == ['010111', '010119']
+		assert list(h.children('010111')) == []
+		assert list(h.descendants('01')) == ['0101', '0102', '010111', '010119', '010210']
+		assert list(h.descendants('01', level=6)) == ['010111', '010119', '010210']
+
+	def test_vectorized(self):
+		h = self.hierarchy
+		codes = pd.Series(['010111', '0102', 'ABCD', np.nan, '010199', '02'])
+		assert list(h.validate(codes)) == [True, True, False, False, False, True]
+		assert list(h.validate(codes, levels=[6])) == [True, False, False, False, False, False]
+		result = h.to_parent(codes, 4)
+		assert list(result.iloc[[0, 1, 2, 4]]) == ['0101', '0102', 'ABCD', '0101']
+		assert result.iloc[[3, 5]].isnull().all()
+		result = h.to_parent(codes.astype('category'), 4, official=True)
+		assert str(result.dtype) == 'category'
+		assert list(result.cat.categories) == ['0101', '0102']
+
+	def test_sitc(self):
+		sitc = get_sitc(revision=2)
+		codes = sitc.get_codes(level=4)
+		assert codes == sorted(sitc.L4['Code'])
+		for code in codes[:50]:
+			assert sitc.hierarchy.parent(code) == code[:3]
+			assert code in list(sitc.hierarchy.children(code[:3]))
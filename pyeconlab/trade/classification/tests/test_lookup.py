@@ -0,0 +1,59 @@
+"""
+Tests for the Vectorized Code Lookups of the SITC and HS Classification Objects
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+
+from pyeconlab.trade.classification import SITC, HS, get_sitc, get_hs
+
+
+class TestSuite_CodeLookup(unittest.TestCase):
+
+	def setUp(self):
+		self.sitc = get_sitc(revision=2)
+		self.hs = get_hs(revision=1992)
+
+	def test_cache(self):
+		assert get_sitc(revision=2) is self.sitc
+		assert get_sitc(revision=2, source_institution='un') is self.sitc
+		assert get_sitc(revision=3) is not self.sitc
+		assert get_hs(revision=1992) is self.hs
+		assert get_hs(revision=1996) is not self.hs
+		assert SITC(revision=2) is not self.sitc 								#Constructor is not cached
+
+	def test_is_official(self):
+		codes = pd.Series(['0011', '001', '0010', 'ABCD', np.nan, '0011'], index=[5, 4, 3, 2, 1, 0], name='sitc4')
+		result = self.sitc.is_official(codes)
+		assert list(result.index) == list(codes.index) and result.name == 'sitc4'
+		assert list(result) == [True, True, False, False, False, True]
+		assert list(self.sitc.is_official(codes, level=4)) == [True, False, False, False, False, True]
+		categorical = self.sitc.is_official(codes.astype('category'), level=4)
+		assert list(categorical.index) == list(codes.index)
+		assert list(categorical) == [True, False, False, False, False, True]
+		assert list(self.sitc.is_official(list(codes), level=3)) == [False, True, False, False, False, False]
+		assert list(self.hs.is_official(pd.Series(['010111', '0101', '01011X']), level=6)) == [True, False, False]
+
+	def test_describe(self):
+		codes = pd.Series(['0011', 'ABCD', '001', np.nan])
+		result = self.sitc.describe(codes, missing='.')
+		assert list(result.iloc[[1, 3]]) == ['.', '.']
+		assert result.iloc[0] == self.sitc.description('0011')
+		assert result.iloc[2] == self.sitc.description('001')
+		assert pd.isnull(self.sitc.describe(codes).iloc[1])
+		assert list(self.sitc.describe(codes.astype('category'), missing='.')) == list(result)
+
+	def test_against_code_lists(self):
+		""" Compare is_official and describe against get_codes and code_description_dict """
+		for classification in [get_sitc(revision) for revision in [1, 2, 3, 4]] + [get_hs(revision) for revision in [1992, 2007]]:
+			descriptions = classification.code_description_dict()
+			codes = pd.Series(sorted(descriptions.keys()) + ['ABCD'])
+			expected = codes.map(descriptions)
+			result = classification.describe(codes)
+			assert ((result == expected) | (result.isnull() & expected.isnull())).all()
+			for level in classification.LEVELS:
+				official = set(codes[classification.is_official(codes, level=level).values])
+				assert official == set(classification.get_level(level)['Code'])
+				if isinstance(classification, SITC):
+					assert official == set(classification.get_codes(level))
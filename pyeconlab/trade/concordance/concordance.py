@@ -17,7 +17,7 @@ import os
 import copy
 import pandas as pd
 
-from pyeconlab.util import check_directory
+from pyeconlab.util import check_directory, cow_view
 
 # - Data in data/ - #
 this_dir, this_filename = os.path.split(__file__)
@@ -78,7 +78,7 @@ class HS_To_SITC(object):
 
     @property 
     def data(self):
-        return self.__data.copy(deep=True)      #-Should this Return COPY or View?-#
+        return cow_view(self.__data)            #-Copy-on-Write View (columns are copied when modified)-#
 
     @property 
     def concordance(self):
@@ -188,7 +188,7 @@ class HS1996_To_SITCR2(object):
 
     @property 
     def data(self):
-        return self.__data.copy(deep=True)      #-Should this Return COPY or View?-#
+        return cow_view(self.__data)            #-Copy-on-Write View (columns are copied when modified)-#
 
     @property 
     def concordance(self):
@@ -286,7 +286,7 @@ class HS2002_To_SITCR2(object):
 
     @property 
     def data(self):
-        return self.__data.copy(deep=True)      #-Should this Return COPY or View?-#
+        return cow_view(self.__data)            #-Copy-on-Write View (columns are copied when modified)-#
 
     @property 
     def concordance(self):
@@ -69,6 +69,12 @@ class BACI(object):
         'HS96' : 'baci96_1998_%s_yearindex.h5' % (END_YEAR['HS96']),
         'HS02' : "baci02_2003_%s_yearindex.h5"%(END_YEAR['HS02'])
     }
+    #-Columnar Cache Versions-#
+    raw_data_columnar_dir = {
+        'HS92' : 'baci92_1995_%s_columnar/' % (END_YEAR['HS92']),
+        'HS96' : 'baci96_1998_%s_columnar/' % (END_YEAR['HS96']),
+        'HS02' : "baci02_2003_%s_columnar/"%(END_YEAR['HS02'])
+    }
 
     #-Deletions to Remove Non-Country Entries by ISO3C-#
     country_only_iso3c_deletions = {
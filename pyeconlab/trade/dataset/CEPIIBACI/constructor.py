@@ -58,7 +58,9 @@ from .base import BACI
 from .dataset import BACITradeData, BACIExportData, BACIImportData
 from pyeconlab.trade.dataset import CPTradeData, CPExportData, CPImportData
 from pyeconlab.country import ISO3166
-from pyeconlab.util import check_directory, check_operations, update_operations, from_idxseries_to_pydict, concord_data
+from pyeconlab.util import check_directory, check_operations, update_operations, from_idxseries_to_pydict, concord_data, concord_series, read_frames, downcast_dtypes, categorize, \
+                            cow_view, isin_columns
+from pyeconlab.util.cache import get_cache, CACHE_FORMATS, HDFYearIndexWriter
 
 class BACIConstructor(BACI):
     """
@@ -75,7 +77,7 @@ class BACIConstructor(BACI):
     source_classification   :   str
                                 Type of Source Files to Load ['HS92', 'HS96', 'HS02']
     ftype                   :   str, optional(default='hdf')
-                                Specify File Type ['rar', 'csv', 'hdf']
+                                Specify File Type ['rar', 'csv', 'hdf', 'npy'] ('npy' = year partitioned columnar cache)
     years                   :   list, optional(default=[])
                                 Apply a Year Filter [Default: All Years Available in the Data]
     skip_setup              :   bool, optional(default=False)
@@ -85,6 +87,8 @@ class BACIConstructor(BACI):
                                 This will delete self.__raw_data after initializing self.dataset with the raw_data
                                 [Warning: This will render properties that depend on self.__raw_data inoperable]
                                 Useful when building datasets to be more memory efficient as the operations don't require a record of the original raw_data
+    optimize_memory         :   bool, optional(default=False)
+                                Load 'hs6' as a Categorical (shared categories across years) and downcast numeric columns (int32, float32 where lossless)
 
     Warnings
     --------
@@ -131,9 +135,10 @@ class BACIConstructor(BACI):
 
     product_datafl_fixed = bool 
     country_datafl_fixed = bool
+    _categorical_columns = ['hs6']
 
 
-    def __init__(self, source_dir, source_classification, ftype='hdf', years=[], standard_names=True, skip_setup=False, reduce_memory=False, verbose=True):
+    def __init__(self, source_dir, source_classification, ftype='hdf', years=[], standard_names=True, skip_setup=False, reduce_memory=False, optimize_memory=False, verbose=True):
         """ 
         Load RAW Data into Object
 
@@ -144,7 +149,7 @@ class BACIConstructor(BACI):
         source_classification   :   str
                                     Type of Source Files to Load ['HS92', 'HS96', 'HS02']
         ftype                   :   str, optional(default='hdf')
-                                    Specify File Type ['rar', 'csv', hdf']
+                                    Specify File Type ['rar', 'csv', hdf', 'npy'] ('npy' = year partitioned columnar cache)
         years                   :   list, optional(default=[])
                                     Apply a Year Filter [Default: All Years Available in the Data]
         skip_setup              :   bool, optional(default=True)
@@ -154,6 +159,8 @@ class BACIConstructor(BACI):
                                     This will delete self.__raw_data after initializing self.dataset with the raw_data
                                     [Warning: This will render properties that depend on self.__raw_data inoperable]
                                     Useful when building datasets to be more memory efficient as the operations don't require a record of the original raw_data
+        optimize_memory         :   bool, optional(default=False)
+                                    Load 'hs6' as a Categorical (shared categories across years) and downcast numeric columns (int32, float32 where lossless)
     
         """
         #-Assign Source Directory-#
@@ -199,31 +206,45 @@ class BACIConstructor(BACI):
             return None
 
         # - Fetch Raw Data for Years - #
+        if optimize_memory:
+            load_options = {'downcast' : 'all', 'categorical' : self._categorical_columns}
+        else:
+            load_options = {}
         if ftype == 'rar':
             self.load_raw_from_rar(verbose=verbose)
         elif ftype == 'csv':
-            self.load_raw_from_csv(standard_names=False, verbose=verbose)
+            self.load_raw_from_csv(standard_names=False, verbose=verbose, **load_options)
         elif ftype == 'hdf':
             try:
-                self.load_raw_from_hdf(years=years, verbose=verbose)
+                self.load_raw_from_hdf(years=years, verbose=verbose, **load_options)
             except:
                 print "[INFO] Your source directory: %s does not contain h5 version.\nStarting to compile one now ...." % self.source_dir
                 #-Check Cache Folder Exists-#
                 if not os.path.exists(self.__source_dir + self.__cache_dir):
                     print "[INFO] Setting up a Cache Directory ..."
                     os.makedirs(self.__source_dir + self.__cache_dir)
-                self.load_raw_from_csv(standard_names=False, verbose=verbose)
+                self.load_raw_from_csv(standard_names=False, verbose=verbose, **load_options)
                 self.convert_raw_data_to_hdf(verbose=verbose)               #Compute hdf file for next load
                 self.convert_raw_data_to_hdf_yearindex(verbose=verbose)     #Compute Year Index Version Also
+        elif ftype in CACHE_FORMATS:
+            try:
+                self.load_raw_from_columnar(years=years, cache_format=ftype, verbose=verbose, **load_options)
+            except (IOError, ValueError):
+                print "[INFO] Your source directory: %s does not contain a %s columnar cache.\nStarting to compile one now ...." % (self.source_dir, ftype)
+                if not os.path.exists(self.__source_dir + self.__cache_dir):
+                    print "[INFO] Setting up a Cache Directory ..."
+                    os.makedirs(self.__source_dir + self.__cache_dir)
+                self.load_raw_from_csv(standard_names=False, verbose=verbose, **load_options)
+                self.convert_raw_data_to_columnar(cache_format=ftype, verbose=verbose)
         else:
-            raise ValueError("ftype must be 'rar', 'csv', or 'hdf'")
+            raise ValueError("ftype must be 'rar', 'csv', 'hdf' or a columnar cache format %s" % sorted(CACHE_FORMATS.keys()))
 
         #-Reduce Memory-#
         if reduce_memory:
             self.dataset = self.__raw_data                                  #Saves ~2Gb of RAM (but cannot access raw_data)
             self.__raw_data = None
         else:
-            self.dataset = self.__raw_data.copy(deep=True)                  #[Default] pandas.DataFrame.copy(deep=True) is much more efficient than copy.deepcopy()
+            self.dataset = cow_view(self.__raw_data)                        #[Default] Copy-on-Write View (columns are copied when modified)
 
         #-Standard Names Option-#
         self.standard_names = standard_names
@@ -251,10 +272,10 @@ class BACIConstructor(BACI):
         Raw Data Property to Return a Copy of the Private Attribute
         """ 
         try:
-            return self.__raw_data.copy(deep=True)                              #Always Return a Copy
+            return cow_view(self.__raw_data)                                    #Always Return a Copy (on Write)
         except:                                                                 #Load from h5 file (quickest Load Times)
             self.load_raw_from_hdf(years=self.years, verbose=False)
-            return self.__raw_data.copy(deep=True)
+            return cow_view(self.__raw_data)
 
     def del_raw_data(self, force=False):
         """ Delete Raw Data """
@@ -276,11 +297,11 @@ class BACIConstructor(BACI):
         """
         Reset Dataset to raw_data
         """
-        if type(self.__raw_data) != pd.DataFrame:
+        if not isinstance(self.__raw_data, pd.DataFrame):
             raise ValueError("RAW DATA is not a DataFrame! Most likely it has been deleted")
         if verbose: print "[INFO] Reseting Dataset to Raw Data"
         del self.dataset                                                                           #Clean-up old dataset
-        self.dataset = self.__raw_data.copy(deep=True)
+        self.dataset = cow_view(self.__raw_data)
         self.operations = ''
         self.level = 6
 
@@ -288,7 +309,7 @@ class BACIConstructor(BACI):
     #-IO-#
     #----#
 
-    def load_raw_from_csv(self, standard_names=False, deletions=True, verbose=False):
+    def load_raw_from_csv(self, standard_names=False, deletions=True, workers=None, downcast=False, categorical=None, verbose=False):
         """ 
         Load Raw Data from CSV Files [Main Entry Point for Raw Data]
 
@@ -298,19 +319,24 @@ class BACIConstructor(BACI):
                             Apply standard names [True/False] using interface dictionary
         deletions       :   bool, optional(default=True)
                             Apply the deletions attribute 
+        workers         :   int, optional(default=None)
+                            Number of threads used to read the year files (Default: min(#years, cpu_count, 4))
+        downcast        :   bool or str, optional(default=False)
+                            Downcast dtypes of each year as it is read (True = integers, 'all' = integers and floats to float32)
+        categorical     :   list, optional(default=None)
+                            Columns to convert to Categoricals as each year is read (i.e. ['hs6'])
 
         ..  Questions
             ---------
             1. Should this be moved to Generic Constructor Class? 
         """
         if verbose: print "[INFO] Loading RAW [.csv] Files from: %s" % (self.source_dir)
-        self.__raw_data = pd.DataFrame()
+        items = []
         for year in self.years:
             fn = self.source_dir + 'baci' + self.classification.strip('HS') + '_' + str(year) + '.csv'
             if verbose: print "[INFO] Loading Year: %s from file: %s" % (year, fn)
-            self.__raw_data = self.__raw_data.append(pd.read_csv(fn, dtype={'hs6' : str}))
-        self.__raw_data = self.__raw_data.reset_index()                     #Otherwise Each year has repeated obs numbers
-        del self.__raw_data['index']
+            items.append(((fn,), {'dtype' : {'hs6' : str}}))
+        self.__raw_data = read_frames(pd.read_csv, items, pool='thread', workers=workers, downcast=downcast, categorical=categorical, ignore_index=True, verbose=verbose)   #New Index: Otherwise Each year has repeated obs numbers
         if deletions:
             for item in self.source_deletions[self.classification]:
                 if verbose: print "[DELETING] Column: %s" % item
@@ -318,14 +344,20 @@ class BACIConstructor(BACI):
         if standard_names:                                                      #Current Default is 'False' to keep raw_data in it's raw state
             self.use_standard_column_names(self.__raw_data)
 
-    def load_raw_from_hdf(self, years=[], verbose=False):
+    def load_raw_from_hdf(self, years=[], workers=None, downcast=False, categorical=None, verbose=False):
         """
         Load HDF Version of RAW Dataset from a source_directory
 
         Parameters
         ----------
-        years   :   list(int), optional(default=[])
-                    Specify a year filter. Default is all years
+        years       :   list(int), optional(default=[])
+                        Specify a year filter. Default is all years
+        workers     :   int, optional(default=None)
+                        Number of processes used to read year keys (Default: min(#years, cpu_count, 4))
+        downcast    :   bool or str, optional(default=False)
+                        Downcast dtypes of each year as it is read (True = integers, 'all' = integers and floats to float32)
+        categorical :   list, optional(default=None)
+                        Columns to convert to Categoricals as each year is read (i.e. ['hs6'])
 
         Notes
         -----   
@@ -337,16 +369,57 @@ class BACIConstructor(BACI):
             1. Should this be moved to Generic Constructor Class?
 
         """
-        self.__raw_data = pd.DataFrame() 
         if years == [] or years == self.source_available_years[self.classification]:
             fn = self.source_dir + self.__cache_dir + self.raw_data_hdf_fn[self.classification]
             if verbose: print "[INFO] Loading RAW DATA from %s" % fn
             self.__raw_data = pd.read_hdf(fn, key='raw_data')
+            if downcast:
+                downcast_dtypes(self.__raw_data, integer=True, floating=(downcast == 'all'))
+            if categorical:
+                categorize(self.__raw_data, categorical)
         else:
             fn = self.source_dir + self.__cache_dir + self.raw_data_hdf_yearindex_fn[self.classification] 
-            for year in years:
-                if verbose: print "[INFO] Loading RAW DATA for year: %s from %s" % (year, fn)
-                self.__raw_data = self.__raw_data.append(pd.read_hdf(fn, key='Y'+str(year)))
+            if verbose: print "[INFO] Loading RAW DATA for years: %s from %s" % (years, fn)
+            items = [((fn,), {'key' : 'Y'+str(year)}) for year in years]
+            self.__raw_data = read_frames(pd.read_hdf, items, pool='process', workers=workers, downcast=downcast, categorical=categorical, ignore_index=False, verbose=verbose)
+
+    def load_raw_from_columnar(self, years=[], columns=None, cache_format='npy', downcast=False, categorical=None, verbose=False):
+        """
+        Load RAW Dataset from the Year Partitioned Columnar Cache
+
+        Parameters
+        ----------
+        years           :   list(int), optional(default=[])
+                            Specify a year filter (only these partitions are read). Default is all years
+        columns         :   list, optional(default=None)
+                            Specify Columns to Load (only these column files are read) [Default: All]
+        cache_format    :   str, optional(default='npy')
+                            Registered Cache Format (pyeconlab.util.cache.CACHE_FORMATS)
+        downcast        :   bool or str, optional(default=False)
+                            Downcast dtypes (True = integers, 'all' = integers and floats to float32)
+        categorical     :   list, optional(default=None)
+                            Return these columns as Categoricals (i.e. ['hs6'])
+
+        Notes
+        -----
+        1. Generate the cache using ``convert_raw_data_to_columnar()``
+        2. The requested partitions are validated against the manifest (source file signatures and rows).
+           A ValueError is raised if the cache is stale so it can be regenerated
+        """
+        cache = get_cache(self.source_dir + self.__cache_dir + self.raw_data_columnar_dir[self.classification], format=cache_format)
+        if years == []:
+            years = None
+        else:
+            years = [int(year) for year in years]
+        problems = cache.validate(years=years)
+        if len(problems) > 0:
+            raise ValueError("Columnar Cache: %s is stale or incomplete: %s" % (cache.path, problems))
+        if verbose: print "[INFO] Loading RAW DATA from %s" % cache
+        self.__raw_data = cache.read(years=years, columns=columns, verbose=verbose)
+        if downcast:
+            downcast_dtypes(self.__raw_data, integer=True, floating=(downcast == 'all'))
+        if categorical:
+            categorize(self.__raw_data, categorical)
 
     def load_country_data(self, fix_source=True, standard_names=True, verbose=True):
         """
@@ -466,48 +539,81 @@ class BACIConstructor(BACI):
         if verbose: print hdf
         hdf.close()
     
-    def convert_raw_data_to_hdf_yearindex(self, format='table', hdf_fn='', verbose=True):
+    def convert_raw_data_to_columnar(self, cache_format='npy', cache_dir='', verbose=True):
+        """ 
+        Convert Raw Data to the Year Partitioned Columnar Cache
+
+        Parameters
+        ----------
+        cache_format    :   str, optional(default='npy')
+                            Registered Cache Format (pyeconlab.util.cache.CACHE_FORMATS)
+        cache_dir       :   str, optional(default='')
+                            Specify a custom directory, otherwise attribute raw_data_columnar_dir is used
+        """
+        if cache_dir == '':
+            cache_dir = self.source_dir + self.__cache_dir + self.raw_data_columnar_dir[self.classification]
+        if verbose: print "[INFO] Writing raw_data to %s" % cache_dir
+        if 't' in self.__raw_data.columns:
+            yid = 't'
+        else:
+            yid = 'year'
+        sources = dict()
+        for year in self.__raw_data[yid].unique():
+            fn = self.source_dir + 'baci' + self.classification.strip('HS') + '_' + str(year) + '.csv'
+            if os.path.exists(fn):
+                sources[year] = [fn]
+        get_cache(cache_dir, format=cache_format).write(self.__raw_data, partition=yid, sources=sources, verbose=verbose)
+
+    def convert_raw_data_to_hdf_yearindex(self, format='table', hdf_fn='', complevel=9, complib='zlib', verbose=True):
         """ 
         Convert Raw Data to HDF File Indexed by Year
         
         Parameters
         ----------
-        format  :   str, optional(defualt='table') #Fixed or Table?
-                    Specify hdf file format 
-        hdf_fn  :   str, optional(default='')
-                    Specify a custom file name, otherwise attribute hdf_fn is used
+        format      :   str, optional(defualt='table') #Fixed or Table?
+                        Specify hdf file format 
+        hdf_fn      :   str, optional(default='')
+                        Specify a custom file name, otherwise attribute hdf_fn is used
+        complevel   :   int, optional(default=9)
+        complib     :   str, optional(default='zlib')
+                        Compression library ('blosc' is much faster to write)
 
         Notes 
         -----
-        1. This compute a list of unique years from self.__raw_data
+        1. Years are split from self.__raw_data with a single sort and written atomically (see pyeconlab.util.HDFYearIndexWriter)
+        2. Years are added to (or replaced in) an existing file
 
         """
         if hdf_fn == '': 
             hdf_fn = self.source_dir + self.__cache_dir + self.raw_data_hdf_yearindex_fn[self.classification]  #This default is the entire dataset for any given classification
         if verbose: print "[INFO] Writing raw_data to %s" % hdf_fn
-        #-Construct HDF File-#
-        hdf = pd.HDFStore(hdf_fn, complevel=9, complib='zlib')
-        if self.standard_names == True:
-            yid = 'year'
-        else:
+        if 't' in self.__raw_data.columns:
             yid = 't'
-        for year in self.raw_data[yid].unique():
-            hdf.put('Y'+str(year), self.raw_data.loc[self.raw_data[yid] == year], format=format)    
-        if verbose: print hdf
-        hdf.close()
+        else:
+            yid = 'year'
+        writer = HDFYearIndexWriter(hdf_fn, format=format, complevel=complevel, complib=complib, mode='a')
+        writer.write(self.__raw_data, partition=yid, verbose=verbose)
 
-    def convert_csv_to_hdf_yearindex(self, years=[], format='fixed', hdf_fn='', verbose=True):
+    def convert_csv_to_hdf_yearindex(self, years=[], format='fixed', hdf_fn='', complevel=9, complib='zlib', workers=None, verbose=True):
         """ 
         Convert CSV Files to HDF File Indexed by Year
 
         Parameters
         ----------
-        years   :   list, optional(defualt=[])
-                    Apply a year filter. Default to all years
-        format  :   str, optional(defualt='fixed')
-                    Specify hdf file format
-        hdf_fn  :   str, optional(default='')
-                    Specify a custom file name, otherwise attribute hdf_fn is used
+        years       :   list, optional(defualt=[])
+                        Apply a year filter. Default to all years
+        format      :   str, optional(defualt='fixed')
+                        Specify hdf file format
+        hdf_fn      :   str, optional(default='')
+                        Specify a custom file name, otherwise attribute hdf_fn is used
+        complevel   :   int, optional(default=9)
+        complib     :   str, optional(default='zlib')
+        workers     :   int, optional(default=None)
+                        Number of processes used to read the csv files (Default: min(#years, cpu_count, 4))
+
+        Notes
+        -----
+        1. Years are added to (or replaced in) an existing file
 
         """
         if years == []:
@@ -515,14 +621,11 @@ class BACIConstructor(BACI):
         #-Setup HDF File-#
         if hdf_fn == '':
             hdf_fn = self.source_dir + self.__cache_dir + self.raw_data_hdf_yearindex_fn[self.classification]
-        hdf = pd.HDFStore(hdf_fn, complevel=9, complib='zlib')
         #-Convert Years-#
-        for year in years:
-            csv_fn = self.source_dir + 'baci' + self.classification.strip('HS') + '_' + str(year) + '.csv'
-            if verbose: print "[INFO] Converting file: %s to file: %s" % (csv_fn, hdf_fn)
-            hdf.put('Y'+str(year), pd.read_csv(csv_fn, data_type={'hs6' : str}), format=format)
-        if verbose: print hdf
-        hdf.close()
+        items = [(year, self.source_dir + 'baci' + self.classification.strip('HS') + '_' + str(year) + '.csv', {'dtype' : {'hs6' : str}}) for year in years]
+        if verbose: print "[INFO] Converting %s csv files to file: %s" % (len(items), hdf_fn)
+        writer = HDFYearIndexWriter(hdf_fn, format=format, complevel=complevel, complib=complib, mode='a')
+        writer.convert(pd.read_csv, items, pool='process', workers=workers, verbose=verbose)
         return hdf_fn
 
     #---------#
@@ -814,21 +917,18 @@ class BACIConstructor(BACI):
             1. Write a decorator to print number of observations before and after the function runs
         """
         if cid == 'iso3n':
-            for item in self.country_only_iso3n_deletions[self.classification]:
-                if verbose: print "[INFO] Deleting iiso3n and eiso3n code: %s" % item
-                init_numobs = self.dataset.shape[0]
-                self.dataset = self.dataset[self.dataset['eiso3n'] != item]
-                self.dataset = self.dataset[self.dataset['iiso3n'] != item]
-                if verbose: print "[DELETED] %s observations" % (init_numobs - self.dataset.shape[0])
+            items = self.country_only_iso3n_deletions[self.classification]
         elif cid == 'iso3c':
-            for item in self.country_only_iso3c_deletions[self.classification]:
-                if verbose: print "[INFO] Deleting iiso3c and eiso3c code: %s" % item
-                init_numobs = self.dataset.shape[0]
-                self.dataset = self.dataset[self.dataset['eiso3c'] != item]
-                self.dataset = self.dataset[self.dataset['iiso3c'] != item]
-                if verbose: print "[DELETED] %s observations" % (init_numobs - self.dataset.shape[0])
+            items = self.country_only_iso3c_deletions[self.classification]
         else:
             raise ValueError("'cid' must be 'iso3n' or 'iso3c'")
+        #-Single Mask over Exporter and Importer Codes-#
+        mask, counts = isin_columns(self.dataset, ['e%s' % cid, 'i%s' % cid], items)
+        if verbose:
+            for item, count in zip(items, counts):
+                print "[INFO] Deleting i%s and e%s code: %s" % (cid, cid, item)
+                print "[DELETED] %s observations" % count
+        self.dataset = self.dataset.loc[~mask]
 
     def concord_productcode(self, concordance, new_classification, new_level, verbose=True):
         """ 
@@ -857,7 +957,7 @@ class BACIConstructor(BACI):
         #-Add Special Cases to the concordance-#
         for k,v in  self.adjust_hs6_to_sitc[self.classification].items():
             concordance[k] = v
-        self.dataset[new_classification] = self.dataset['hs6'].apply(lambda x: concord_data(concordance, x, issue_error='.'))
+        self.dataset[new_classification] = concord_series(concordance, self.dataset['hs6'], issue_error='.')
         self.dataset = self.dataset[['year', 'eiso3n', 'iiso3n', 'value']+[new_classification]].groupby(['year', 'eiso3n', 'iiso3n']+[new_classification]).sum().reset_index()
         #-Reset Attributes-#
         self.classification = new_classification
@@ -1373,7 +1473,7 @@ class BACIConstructor(BACI):
             data = dropna_iso3c(data, column='iiso3c')
             #-Merge in SITCR2 Level 3-#
             #-------------------------#
-            data['sitc3'] = data['hs6'].apply(lambda x: concord_data(concordance, x, issue_error=np.nan))
+            data['sitc3'] = concord_series(concordance, data['hs6'], issue_error=np.nan)
             del data['hs6']
             data = data.groupby(['year', 'eiso3c', 'iiso3c', 'sitc3']).sum()
             self.classification = 'SITC'                                                                        #duplication could be reduced here using a function
@@ -1391,7 +1491,7 @@ class BACIConstructor(BACI):
             data = dropna_iso3c(data, column='eiso3c')
             #-Merge in SITCR2 Level 3-#
             #-------------------------#
-            data['sitc3'] = data['hs6'].apply(lambda x: concord_data(concordance, x, issue_error=np.nan))
+            data['sitc3'] = concord_series(concordance, data['hs6'], issue_error=np.nan)
             del data['hs6']
             data = data.groupby(['year', 'eiso3c', 'sitc3']).sum()
             self.classification = 'SITC'                                                                        #duplication could be reduced here using a function
@@ -1409,7 +1509,7 @@ class BACIConstructor(BACI):
             data = dropna_iso3c(data, column='iiso3c')
             #-Merge in SITCR2 Level 3-#
             #-------------------------#
-            data['sitc3'] = data['hs6'].apply(lambda x: concord_data(concordance, x, issue_error=np.nan))
+            data['sitc3'] = concord_series(concordance, data['hs6'], issue_error=np.nan)
             del data['hs6']
             data = data.groupby(['year', 'iiso3c', 'sitc3']).sum()
             self.classification = 'SITC'                                                                        #duplication could be reduced here using a function
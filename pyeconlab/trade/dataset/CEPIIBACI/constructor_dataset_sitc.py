@@ -16,7 +16,7 @@ Testing
 
 import pandas as pd
 import numpy as np
-from pyeconlab.util import concord_data
+from pyeconlab.util import concord_data, concord_series
 
 
 def construct_sitc(data, data_classification, data_type, level, revision, check_concordance=True, adjust_units=False, concordance_institution="un", multiindex=False, verbose=True):
@@ -108,7 +108,7 @@ def construct_sitc(data, data_classification, data_type, level, revision, check_
         data = dropna_iso3c(data, column='eiso3c')
         data = dropna_iso3c(data, column='iiso3c')
         #-Merge in SITCR2 Level 3-#
-        data['sitc%s'%level] = data['hs6'].apply(lambda x: concord_data(concordance, x, issue_error=np.nan))
+        data['sitc%s'%level] = concord_series(concordance, data['hs6'], issue_error=np.nan)
         if check_concordance:
             check_concordance_helper(data, level)
         del data['hs6']
@@ -122,7 +122,7 @@ def construct_sitc(data, data_classification, data_type, level, revision, check_
         data = merge_iso3c_and_replace_iso3n(data, cntry_data, column='eiso3n')
         data = dropna_iso3c(data, column='eiso3c')
         #-Merge in SITCR2 Level 3-#
-        data['sitc%s'%level] = data['hs6'].apply(lambda x: concord_data(concordance, x, issue_error=np.nan))
+        data['sitc%s'%level] = concord_series(concordance, data['hs6'], issue_error=np.nan)
         if check_concordance:
             check_concordance_helper(data, level)
         del data['hs6']
@@ -136,7 +136,7 @@ def construct_sitc(data, data_classification, data_type, level, revision, check_
         data = merge_iso3c_and_replace_iso3n(data, cntry_data, column='iiso3n')
         data = dropna_iso3c(data, column='iiso3c')
         #-Merge in SITCR2 Level 3-#
-        data['sitc%s'%level] = data['hs6'].apply(lambda x: concord_data(concordance, x, issue_error=np.nan))
+        data['sitc%s'%level] = concord_series(concordance, data['hs6'], issue_error=np.nan)
         if check_concordance:
             check_concordance_helper(data, level)
         del data['hs6']
@@ -14,7 +14,8 @@ import shutil
 
 from .base import AtlasOfComplexity
 from .dataset import CIDAtlasTradeData, CIDAtlasExportData, CIDAtlasImportData
-from pyeconlab.util import check_directory, check_operations, update_operations, from_idxseries_to_pydict, concord_data
+from pyeconlab.util import check_directory, check_operations, update_operations, from_idxseries_to_pydict, concord_data, read_frames, cow_view
+from pyeconlab.util.cache import get_cache, CACHE_FORMATS, HDFYearIndexWriter
 
 
 class CIDAtlasDataConstructor(AtlasOfComplexity):
@@ -40,6 +41,8 @@ class CIDAtlasDataConstructor(AtlasOfComplexity):
                                     Specify Data Type to work with ["trade", "export", "import"]
         years                   :   list, optional(default=[])
                                     Apply a Year Filter [Default: All Years Available in the Data]
+        ftype                   :   str, optional(default='hdf')
+                                    Specify File Type ['tsv', 'hdf', 'npy'] ('npy' = year partitioned columnar cache)
         skip_setup              :   bool, optional(default=True)
                                     [Testing] This allows you to skip __init__ setup of object to manually load the object with csv data etc. 
                                     This is mainly used for loading test data to check attributes and methods etc. 
@@ -78,6 +81,8 @@ class CIDAtlasDataConstructor(AtlasOfComplexity):
         #-Load Data-#
         if ftype=="tsv" or reset_cache:
             self.load_raw_from_tsv(reset_cache=reset_cache)
+        elif ftype in CACHE_FORMATS:
+            self.load_raw_from_columnar(cache_format=ftype, verbose=verbose)
         else:
             if not os.path.exists(self.__source_dir + self.__cache_dir):
                 self.load_raw_from_tsv()
@@ -88,7 +93,7 @@ class CIDAtlasDataConstructor(AtlasOfComplexity):
             self.dataset = self.__raw_data
             self.__raw_data = None
         else:
-            self.dataset = self.__raw_data.copy(deep=True)                
+            self.dataset = cow_view(self.__raw_data)
         
         #-Standardize-#
         if standardize_dataset:
@@ -99,13 +104,18 @@ class CIDAtlasDataConstructor(AtlasOfComplexity):
         return self.__raw_data
     
 
+    @property
+    def raw_data_fn(self):
+        """ Source TSV File for the dtype and classification """
+        if self.dtype == "trade":
+            return self.__source_dir+self.source_trade_datafl[self.classification]
+        elif self.dtype == "export" or self.dtype == "import":
+            return self.__source_dir+self.source_exportimport_datafl[self.classification]
+
     def load_raw_from_tsv(self, reset_cache=False, verbose=True):
         """ Load Raw Data from TSV """
         #-Data Type-#
-        if self.dtype == "trade":
-            fl = self.__source_dir+self.source_trade_datafl[self.classification]
-        elif self.dtype == "export" or self.dtype == "import":
-            fl = self.__source_dir+self.source_exportimport_datafl[self.classification]
+        fl = self.raw_data_fn
         #-Classification-#
         if self.classification == "SITCR2":
             self.productcode = "sitc4"
@@ -130,28 +140,49 @@ class CIDAtlasDataConstructor(AtlasOfComplexity):
         hdf_fn = self.__source_dir + self.__cache_dir + "cidatlas_%s_%s_year.h5" % (self.classification, self.dtype)
         if reset_cache or os.path.exists(hdf_fn) == False:
             if verbose: print "[INFO] Writing raw_data to %s" % hdf_fn
-            #-Construct HDF File-#
-            hdf = pd.HDFStore(hdf_fn, complevel=9, complib='zlib')
-            for year in self.years: 
-                if verbose: print "[INFO] Processing year %s ..." % year
-                data = self.__raw_data.loc[self.__raw_data['year'] == year].reset_index()
-                del data["index"]
-                hdf.put('Y'+str(year), data, format='table')    
-            if verbose: print hdf
-            hdf.close()
+            #-Construct HDF File (Years are split with a single sort and written atomically)-#
+            HDFYearIndexWriter(hdf_fn, format='table').write(self.__raw_data, partition='year', reset_index=True, verbose=verbose)
         gc.collect()
 
-    def load_raw_from_hdf(self, verbose=True):
-        """ Load Raw Data from HDF Cache """
+    def load_raw_from_hdf(self, workers=None, downcast=False, verbose=True):
+        """ 
+        Load Raw Data from HDF Cache 
+
+        Year keys are read concurrently (bounded process pool) and concatenated once
+        """
         #-Data Type-#
         hdf_fn = self.__source_dir + self.__cache_dir + "cidatlas_%s_%s_year.h5" % (self.classification, self.dtype) 
         if not os.path.exists(hdf_fn):
             self.load_raw_from_tsv(verbose=verbose)
         #-Data-#
-        self.__raw_data = pd.DataFrame()  
-        for year in self.years:
-            if verbose: print "[INFO] Loading RAW DATA for year: %s ..." % (year)
-            self.__raw_data = self.__raw_data.append(pd.read_hdf(hdf_fn, key='Y'+str(year)))
+        if verbose: print "[INFO] Loading RAW DATA for years: %s ..." % (list(self.years))
+        items = [((hdf_fn,), {'key' : 'Y'+str(year)}) for year in self.years]
+        self.__raw_data = read_frames(pd.read_hdf, items, pool='process', workers=workers, downcast=downcast, ignore_index=False, verbose=verbose)
+
+    def load_raw_from_columnar(self, columns=None, cache_format='npy', verbose=True):
+        """ 
+        Load Raw Data from the Year Partitioned Columnar Cache (only self.years and columns are read)
+
+        The cache is generated from the tsv source file if it is not found and regenerated if it is stale 
+        (the requested years are validated against the manifest which records the signature of the tsv source file)
+        """
+        cache = get_cache(self.__source_dir + self.__cache_dir + "cidatlas_%s_%s_columnar/" % (self.classification, self.dtype), format=cache_format)
+        years = [int(year) for year in self.years]
+        problems = cache.validate(years=years)
+        if len(problems) == 0:
+            for year in years:
+                if 'sources' not in cache.manifest['partitions'][str(year)]:
+                    problems[year] = ["source file signature is not in the manifest"]
+        if len(problems) > 0:
+            if verbose: print "[INFO] Columnar Cache: %s is stale or incomplete: %s" % (cache.path, problems)
+            complete_dataset = self.complete_dataset
+            self.complete_dataset = True                                #Cache all years
+            self.load_raw_from_tsv(reset_cache=True, verbose=verbose)
+            self.complete_dataset = complete_dataset
+            if verbose: print "[INFO] Writing raw_data to %s" % cache.path
+            sources = dict([(int(year), [self.raw_data_fn]) for year in self.__raw_data['year'].unique()])
+            cache.write(self.__raw_data, partition='year', sources=sources, verbose=verbose)
+        self.__raw_data = cache.read(years=years, columns=columns, verbose=verbose)
 
     def load_country_data(self, verbose=True):
         """ Load Country Meta Data File """
@@ -7,7 +7,7 @@ API for NBER World Trade Flows Subpackage
 """
 
 from .constructor import NBERWTFConstructor
-from .constructor_dataset_sitcr2 import construct_sitcr2
+from .constructor_dataset_sitcr2 import construct_sitcr2, construct_sitcr2_by_year
 from .constructor_dataset_sitcr2l1 import construct_sitcr2l1
 from .constructor_dataset_sitcr2l2 import construct_sitcr2l2
 from .constructor_dataset_sitcr2l3 import construct_sitcr2l3
@@ -55,8 +55,13 @@ warnings.simplefilter("always")
 from .base import NBERWTF
 from .dataset import NBERWTFTradeData, NBERWTFExportData, NBERWTFImportData 
 from pyeconlab.util import  from_series_to_pyfile, check_directory, recode_index, merge_columns, check_operations, update_operations, from_idxseries_to_pydict, \
-                            countryname_concordance, concord_data, random_sample, find_row, assert_merged_series_items_equal
-from pyeconlab.trade.classification import SITC
+                            countryname_concordance, concord_data, concord_series, random_sample, find_row, assert_merged_series_items_equal, read_frames, downcast_dtypes, \
+                            categorize, groupby_sum, collapse_duplicates, isin_columns, map_unique, LazyPlan, rollup_productcodes, coverage_matrix, \
+                            coverage_frame, coverage_stats, cow_view, FrameStats, cached_stats
+from pyeconlab.util.cache import get_cache, CACHE_FORMATS, validate_manifest_entry, read_json, write_json, BuildCache, build_key, \
+                                 HDFYearIndexWriter, partition_frame, frame_manifest_entry
+from pyeconlab.util.files import file_signature
+from pyeconlab.trade.classification import get_sitc
 
 #-Debug and Testing-#
 # from memory_profiler import profile
@@ -69,6 +74,64 @@ META_PATH = check_directory(os.path.join(this_dir, "meta"))
 #-Concordances-#
 from pyeconlab.country import iso3n_to_iso3c, iso3n_to_name             #Why does this import prevent nosetests from running?               
 
+# ------------------------------- #
+# - Country Code Helper Functions - #
+# ------------------------------- #
+
+def split_countrycode_series(codes):
+    """
+    Split a Series of NBER Country Codes (XXYYYZ) into (region, iso3n, modifier) Arrays
+
+    The slicing is done once on the unique codes and broadcast back to the rows
+
+    Parameters
+    ----------
+    codes   :   pd.Series(str)
+
+    Returns
+    -------
+    (region, iso3n, mod) :  tuple(np.array(int))
+    """
+    labels, uniques = pd.factorize(codes)
+    if (labels < 0).any():
+        raise ValueError("Country Codes contain missing values")
+    uniques = pd.Series(np.asarray(uniques, dtype=object))                  #Categorical codes return Categorical uniques
+    region  = uniques.str[:2].astype(int).values
+    iso3n   = uniques.str[2:5].astype(int).values
+    mod     = uniques.str[-1].astype(int).values
+    return region.take(labels), iso3n.take(labels), mod.take(labels)
+
+def recode_from_keys(keys, values, recode):
+    """
+    Replace values where the corresponding key is found in a recode dictionary
+    
+    The dictionary is matched once against the unique keys and the result broadcast back to the rows
+
+    Parameters
+    ----------
+    keys    :   pd.Series
+                Series to match against recode keys (i.e. 'ecode')
+    values  :   pd.Series
+                Series to update (i.e. 'eiso3n')
+    recode  :   dict('key' : 'value')
+
+    Returns
+    -------
+    np.array of updated values
+    """
+    labels, uniques = pd.factorize(keys)
+    match = np.array([key in recode for key in uniques], dtype=bool)
+    update = np.append(match, False).take(labels)              #labels = -1 (missing keys) are not updated
+    if not update.any():
+        return values.values.copy()
+    new = np.array([recode[key] if key in recode else 0 for key in uniques])
+    dtype = values.dtype
+    if not (dtype.kind in 'iu' and new.dtype.kind in 'iu' and new.min() >= np.iinfo(dtype).min and new.max() <= np.iinfo(dtype).max):
+        dtype = np.result_type(dtype, new.dtype)                                #Retain (downcast) dtype where recodes fit
+    result = values.values.astype(dtype)                                        #copy
+    result[update] = new.take(labels[update])
+    return result
+
 class NBERWTFConstructor(NBERWTF):
     """
     Data Constructor / Compilation Object for Feenstra NBER World Trade Data
@@ -217,7 +280,10 @@ class NBERWTFConstructor(NBERWTF):
     _exporters          = None                      #These are defined due to property check to None. But these could be removed if property just try/except
     _importers          = None 
     _country_list       = None
+    _stats_cache        = None                                          #Cached Statistics (pyeconlab.util.stats.cached_stats)
     _dataset            = None                                  
+    _plan               = None                                      #LazyPlan (see lazy() and collect())
+    _stream             = None                                      #Source ftype when streaming raw data by year (see stream)
 
     # - Dataset Attributes - #
 
@@ -237,6 +303,8 @@ class NBERWTFConstructor(NBERWTF):
     _units_value        = 1000
     _units_value_str    = "$1000's"
     _file_interface     = [u'year', u'icode', u'importer', u'ecode', u'exporter', u'sitc4', u'unit', u'dot', u'value', u'quantity']
+    _categorical_columns = [u'icode', u'importer', u'ecode', u'exporter', u'sitc4', u'unit']
+    _optimize_memory    = False
     notes               = ""
 
     # - Other Data in NBER Feenstra WTF -#
@@ -245,9 +313,12 @@ class NBERWTFConstructor(NBERWTF):
     # - Dataset Reference - #
     __raw_data_hdf_fn   = u'wtf62-00_raw.h5'
     __raw_data_hdf_yearindex_fn = u'wtf62-00_yearindex.h5'
+    __raw_data_columnar_dir = u'wtf62-00_columnar/'
+    __build_cache_dir = u'builds/'
+    _build_format       = 1                                             #Bump when the output of construct_sitc_dataset() changes (see _sitc_dataset_build_key)
     __cache_dir = u"cache/"
 
-    def __init__(self, source_dir, years=[], ftype='hdf', standardise=False, apply_fixes=True, skip_setup=False, force=False, reduce_memory=False, verbose=True):
+    def __init__(self, source_dir, years=[], ftype='hdf', standardise=False, apply_fixes=True, skip_setup=False, force=False, reduce_memory=False, optimize_memory=False, stream=False, verbose=True):
         """ 
         Load RAW Data into Object
 
@@ -258,7 +329,8 @@ class NBERWTFConstructor(NBERWTF):
         years           :   list, optional(default=[])
                             Apply a Year Filter [Default: ALL]
         ftype           :   str, optional(default='hdf')
-                            File Type ['dta', 'hdf'] [Default 'hdf' -> however it will generate one if not found from 'dta']
+                            File Type ['dta', 'hdf', 'npy'] [Default 'hdf' -> however it will generate one if not found from 'dta']
+                            'npy' uses the year partitioned columnar cache (see pyeconlab.util.cache) and is generated from 'dta' if not found
         standardise     :   bool, optional(default=False)
                             Include Standardised Codes (Countries: ISO3C etc.)
         apply_fixes     :   bool, optional(default=True)
@@ -274,12 +346,21 @@ class NBERWTFConstructor(NBERWTF):
                             [Warning: This will render properties that depend on self.__raw_data inoperable]
                             Usage: Useful when building datasets to be more memory efficient as the operations don't require a record of the original raw_data
                             [Default: False] Only Saves ~2GB of RAM
+        optimize_memory :   bool, optional(default=False)
+                            Load string columns (importer, exporter, icode, ecode, sitc4, unit) as Categoricals with categories shared 
+                            across years and downcast numeric columns (int32, float32 where lossless). This representation is kept
+                            through fix_raw_data(), split_countrycodes(), collapse_to_valuesonly() and construct_sitcr2()
+        stream          :   bool, optional(default=False)
+                            Do not load the raw data. construct_sitc_dataset() and construct_sitc_dataset_levels() read and construct
+                            one year at a time from ftype (see read_raw_year) so peak memory is proportional to a single year of raw data
+                            [Warning: Methods that operate on raw_data or dataset are not available until a dataset is constructed]
         
         """
         #-Assign Source Directory-#
         self._source_dir    = check_directory(source_dir)   # check_directory() performs basic tests on the specified directory
         self.data_type      = u"trade"
         self._apply_fixes   = apply_fixes
+        self._optimize_memory = optimize_memory
         #-Parse Skip Setup-#
         if skip_setup == True:
             print "[INFO] Skipping Setup of NBERWTFConstructor!"
@@ -293,29 +374,54 @@ class NBERWTFConstructor(NBERWTF):
         #-Assign to Attribute-#
         self.years  = years
         # - Fetch Raw Data for Years - #
+        if optimize_memory:
+            load_options = {'downcast' : 'all', 'categorical' : self._categorical_columns}
+        else:
+            load_options = {}
+        #-Streaming Mode-#
+        if stream:
+            if ftype != 'dta' and ftype != 'hdf' and ftype not in CACHE_FORMATS:
+                raise ValueError("ftype must be dta, hdf or a columnar cache format %s" % sorted(CACHE_FORMATS.keys()))
+            self.__raw_data = None
+            self._stream = ftype
+            if ftype in CACHE_FORMATS:
+                self.update_columnar_cache(years=years, cache_format=ftype, verbose=verbose)
+            elif ftype == 'hdf' and not os.path.exists(self._source_dir + self.__cache_dir + self.__raw_data_hdf_yearindex_fn):
+                if not os.path.exists(self._source_dir + self.__cache_dir):
+                    os.makedirs(self._source_dir + self.__cache_dir)
+                self.convert_stata_to_hdf_yearindex(verbose=verbose)                #Converted one year at a time
+            if verbose: print "[INFO] Streaming RAW DATA by year from: %s" % ftype
+            return None
         if ftype == 'dta':
-            self.load_raw_from_dta(verbose=verbose)
+            self.load_raw_from_dta(verbose=verbose, **load_options)
         elif ftype == 'hdf':
             try:
-                self.load_raw_from_hdf(years=years, verbose=verbose)
+                self.load_raw_from_hdf(years=years, verbose=verbose, **load_options)
             except:
                 print "[INFO] Your source_directory: %s does not contain h5 version in cache folder.\n Starting to compile one now ...."
                 #-Check Cache Folder Exists-#
                 if not os.path.exists(self._source_dir + self.__cache_dir):
                     print "[INFO] Setting up a Cache Directory ..."
                     os.makedirs(self._source_dir + self.__cache_dir)
-                self.load_raw_from_dta(verbose=verbose)
+                self.load_raw_from_dta(verbose=verbose, **load_options)
                 self.convert_raw_data_to_hdf(verbose=verbose)           #Compute hdf file for next load
                 self.convert_stata_to_hdf_yearindex(verbose=verbose)    #Compute Year Index Version Also
+        elif ftype in CACHE_FORMATS:
+            try:
+                self.load_raw_from_columnar(years=years, cache_format=ftype, verbose=verbose, **load_options)
+            except (IOError, ValueError):
+                print "[INFO] Your source_directory: %s does not contain a %s columnar cache.\n Starting to compile one now ...." % (self._source_dir, ftype)
+                self.load_raw_from_dta(verbose=verbose, **load_options)
+                self.convert_raw_data_to_columnar(cache_format=ftype, verbose=verbose)
         else:
-            raise ValueError("ftype must be dta or hdf")  
+            raise ValueError("ftype must be dta, hdf or a columnar cache format %s" % sorted(CACHE_FORMATS.keys()))  
 
         #-Reduce Memory-#
         if reduce_memory:
             self._dataset = self.__raw_data                                     #Saves ~2Gb of RAM (but cannot access raw_data)
             self.__raw_data = None
         else:
-            self._dataset = self.__raw_data.copy(deep=True)                     #[Default] pandas.DataFrame.copy(deep=True) is much more efficient than copy.deepcopy()
+            self._dataset = cow_view(self.__raw_data)                           #[Default] Copy-on-Write View (columns are copied when modified)
 
         #-Apply Fixes-#
         if apply_fixes:
@@ -359,11 +465,11 @@ class NBERWTFConstructor(NBERWTF):
         
         Notes
         -----
-        1. This isn't very memory efficient
+        1. Returns a copy-on-write view (see pyeconlab.util.views) so only the columns that are modified are copied
         2. Should this be complicated by loading raw from an HDF File of the Dataset?
         """ 
         try:
-            return self.__raw_data.copy(deep=True)                              #Always Return a Copy
+            return cow_view(self.__raw_data)                                    #Always Return a Copy (on Write)
         except:                                                                 #Load from h5 file
             self.load_raw_from_hdf(years=self.years, verbose=False)
             return self.__raw_data
@@ -393,7 +499,7 @@ class NBERWTFConstructor(NBERWTF):
         """
         Force Set raw_data (used for testing)
         """
-        if type(self.__raw_data) == pd.DataFrame:
+        if isinstance(self.__raw_data, pd.DataFrame):
             if force == False:
                 print "[WARNING] To force the replacement of raw_data use 'force'=True"
                 return None
@@ -480,27 +586,84 @@ class NBERWTFConstructor(NBERWTF):
     def dataset(self):
         """
         Dataset contains the Exportable Result to NBERWTF
+
+        Notes
+        -----
+        1. A pending lazy plan is collected before the dataset is returned
         """
+        if self._plan is not None and len(self._plan) > 0:
+            self.collect(end=False)
         try:
             return self._dataset 
         except:                                             #-Raw Data Not Yet Copied-#
-            self._dataset = self.__raw_data.copy(deep=True)
+            self._dataset = cow_view(self.__raw_data)
             return self._dataset
 
     def reset_dataset(self, verbose=True):
         """
         Reset Dataset to raw_data
         """
-        if type(self.__raw_data) != pd.DataFrame:
+        if not isinstance(self.__raw_data, pd.DataFrame):
             raise ValueError("RAW DATA is not a DataFrame! Most likely it has been deleted")
         if verbose: print "[INFO] Reseting Dataset to Raw Data"
         del self._dataset                                                                           #Clean-up old dataset
-        self._dataset = self.__raw_data.copy(deep=True)
+        self._plan = None
+        self._dataset = cow_view(self.__raw_data)                                                   #Views of the raw data columns
         if self._apply_fixes:
             self.fix_raw_data(verbose=verbose)
         self.operations = ''
         self.level = 4
 
+    def lazy(self, verbose=False):
+        """
+        Start Recording Operations on the Dataset to a Lazy Plan
+
+        Supported methods (add_iso3c, countries_only, world_only, drop_world_observations, adjust_countrycodes_intertemporal, 
+        collapse_to_valuesonly, change_value_units, add_productcode_level(s), collapse_to_productcode_level, 
+        identify_alpha_productcodes, drop_alpha_productcodes) append to the plan and update the operations string 
+        without touching the data. ``collect()`` then executes the plan using a single filter mask per aggregation.
+
+        Notes
+        -----
+        1. Accessing the dataset attribute (i.e. any other method) collects the plan first
+        2. Verbose reporting that requires the data (i.e. observations dropped) is not available in lazy mode
+
+        Example
+        -------
+        obj.lazy()
+        obj.countries_only()
+        obj.collapse_to_valuesonly()
+        obj.collect()
+        """
+        if self._plan is not None:
+            return None
+        if verbose: print "[INFO] Recording operations to a lazy plan (use collect() to compute the dataset)"
+        self._plan = LazyPlan(self.dataset.columns)
+
+    def collect(self, end=True, verbose=False):
+        """
+        Execute the Lazy Plan and set the dataset attribute to the result
+
+        Parameters
+        ----------
+        end     :   bool, optional(default=True)
+                    End lazy mode (otherwise subsequent operations are recorded to a new plan)
+        """
+        if self._plan is None:
+            return None
+        plan = self._plan
+        self._plan = None
+        if verbose: print "[INFO] Collecting %s" % plan
+        self._dataset = plan.collect(self.dataset, verbose=verbose)
+        if not end:
+            self._plan = LazyPlan(self._dataset.columns)
+
+    def _record(self):
+        """ Return the lazy plan (columns are synchronised with the dataset when no operations are pending) """
+        if len(self._plan) == 0:
+            self._plan = LazyPlan(self._dataset.columns)
+        return self._plan
+
     def set_dataset(self, df, force=False, reset_operations=True):
         """ 
         Check if Dataset Exists Prior to Assignment
@@ -509,7 +672,7 @@ class NBERWTFConstructor(NBERWTF):
         -----
         1. Is this ever going to be used? Consider DEPRECATED?
         """
-        if type(self._dataset) == pd.DataFrame:
+        if isinstance(self._dataset, pd.DataFrame):
             if force == False:
                 print "[WARNING] The dataset attribute has previously been set. To force the replacement use 'force'=True"
                 return None
@@ -535,15 +698,28 @@ class NBERWTFConstructor(NBERWTF):
             return False
         return True
 
+    def _raw_data_stats(self):
+        """ Cached Statistics Engine for the RAW Data (see pyeconlab.util.stats) """
+        if self.__raw_data is None:
+            self.raw_data                                                       #Load from h5 file
+        return cached_stats(self, self.__raw_data, name='raw_data', persistent=True)
+
+    def _data_stats(self, data):
+        """ Statistics Engine for data (cached if data is the dataset) """
+        if data is self._dataset:
+            return cached_stats(self, data, name='dataset')
+        if data is self.__raw_data:
+            return self._raw_data_stats()
+        return FrameStats(data)
+
     @property 
     def yearly_world_values(self):
         """
         Construct yearly world values
         """
-        rdf = self.raw_data
-        rdf = rdf.loc[(rdf.importer=="World") & (rdf.exporter == "World")]
+        stats = self._raw_data_stats()
         #-Year Values-#
-        rdfy = rdf[['year', 'value']].groupby(['year']).sum()
+        rdfy = stats.totals(['year'], where={'importer' : 'World', 'exporter' : 'World'}).to_frame()
         return rdfy
     
     def yearly_product_world_values(self, level=4):
@@ -555,14 +731,13 @@ class NBERWTFConstructor(NBERWTF):
         level   :   int, optional(default=4)
                     Specify SITC Level to Return
         """
-        rdf = self.raw_data
-        rdf = rdf.loc[(rdf.importer=="World") & (rdf.exporter == "World")]
+        stats = self._raw_data_stats()
         #-Year Product Values-#
-        rdfpy = rdf[['year', 'sitc4', 'value']].groupby(['year', 'sitc4']).sum()
+        rdfpy = stats.totals(['year', 'sitc4'], where={'importer' : 'World', 'exporter' : 'World'}).to_frame()
         #-Simple Adjust Level-#
         if level < 4:
             rdfpy.reset_index(inplace=True)
-            rdfpy['sitc%s'%level] = rdfpy['sitc4'].apply(lambda x: x[:level])
+            rdfpy['sitc%s'%level] = map_unique(rdfpy['sitc4'], lambda x: x[:level])
             rdfpy = rdfpy[['year', 'sitc%s'%level, 'value']].groupby(['year', 'sitc%s'%level]).sum()
         return rdfpy
 
@@ -574,33 +749,36 @@ class NBERWTFConstructor(NBERWTF):
         if self.operations != "":
             raise ValueError("This operation needs to be conducted on a fresh dataset with no operations. You can reset the data with .reset_dataset()")
         self.add_iso3c()
-        rdf = self.dataset.copy(deep=True) 
-        rdf = rdf.loc[(rdf.importer=="World") & (rdf.exporter!="World")]
+        stats = self._data_stats(self.dataset)
         #-Year Country Values-#
-        rdfpy = rdf[['year', 'eiso3c', 'value']].groupby(['year', 'eiso3c']).sum()
+        rdfpy = stats.totals(['year', 'eiso3c'], where={'importer' : 'World'}, exclude={'exporter' : 'World'}).to_frame()
         return rdfpy
 
     def stats(self, dataset=True, basic=False, extended=False, dlimit=10):
         """
         Print Some Basic Summary Statistics about the Dataset or RAW DATA
+
+        Notes
+        -----
+        1. Unique entries are computed from integer codes and cached until the next operation (see pyeconlab.util.stats)
         """
         if dataset:
-            df = self.dataset
+            stats = self._data_stats(self.dataset)
             msg = "Dataset (%s) Statistics\n-------------------------------\n" % self._name
         else:
-            df = self.raw_data
+            stats = self._raw_data_stats()
             msg = "Raw Data (%s) Statistics\n-------------------------------\n" % self._name
         msg += "Years: %s\n" % self.years
-        msg += "Observations: %s; Variables: %s\n" % (df.shape[0], df.shape[1])
+        msg += "Observations: %s; Variables: %s\n" % (stats.shape[0], stats.shape[1])
         if basic:
             print msg
             return None
-        for col in df.columns:
+        for col in stats.columns:
             if col in ['value', 'quantity']:
                 continue
-            uniq = list(df[col].unique())
-            msg += "Column: '%s' has %s Unique Entries\n" % (col, len(uniq))
+            msg += "Column: '%s' has %s Unique Entries\n" % (col, stats.nunique(col))
             if extended:
+                    uniq = stats.unique(col)
                     if len(uniq) >= dlimit:
                         msg += "Items => %s ... %s\n" % (uniq[:int(dlimit/2)], uniq[-int(dlimit/2):])
                     else:
@@ -622,8 +800,8 @@ class NBERWTFConstructor(NBERWTF):
 
         """
         if year:
-            return data.groupby(['year', key]).sum()['value']
-        return data.groupby([key]).sum()['value']
+            return self._data_stats(data).totals(['year', key])
+        return self._data_stats(data).totals([key])
 
     def importer_total_values(self, data, key='importer', year=False):
         """ 
@@ -640,8 +818,8 @@ class NBERWTFConstructor(NBERWTF):
 
         """
         if year:
-            return data.groupby(by=['year', key]).sum()['value']
-        return data.groupby(by=[key]).sum()['value']
+            return self._data_stats(data).totals(['year', key])
+        return self._data_stats(data).totals([key])
 
     def to_exports(self, dataset=False, verbose=True):
         """ 
@@ -672,26 +850,35 @@ class NBERWTFConstructor(NBERWTF):
     # - IO - #
     # ------ #
 
-    def load_raw_from_dta(self, verbose=True):
+    def load_raw_from_dta(self, workers=None, downcast=False, categorical=None, verbose=True):
         """
         Load RAW ``*.dta`` files from a source_directory
+
+        Parameters
+        ----------
+        workers     :   int, optional(default=None)
+                        Number of threads used to read the year files (Default: min(#years, cpu_count, 4))
+        downcast    :   bool or str, optional(default=False)
+                        Downcast dtypes of each year as it is read (True = integers, 'all' = integers and floats to float32)
+        categorical :   list, optional(default=None)
+                        Columns to convert to Categoricals as each year is read (i.e. self._categorical_columns)
         
         Notes
         -----
         1. Move to Generic Class of DatasetConstructors?
         2. This should try and load from a raw_data file first rather than raw_data_year
+        3. Year files are read concurrently and concatenated once (rather than appending in the loop)
         """
         if verbose: print "[INFO]: Loading RAW [.dta] Files from: %s" % (self._source_dir)
-        self.__raw_data     = pd.DataFrame()                                    
+        fns = []
         for year in self.years:
             fn = self._source_dir + self._fn_prefix + str(year)[-2:] + self._fn_postfix
             if verbose: print "Loading Year: %s from file: %s" % (year, fn)
-            self.__raw_data = self.__raw_data.append(pd.read_stata(fn))
-        self.__raw_data = self.__raw_data.reset_index()                                     #Otherwise Each year has repeated obs numbers
-        del self.__raw_data['index']                                                        #Remove Old Index
+            fns.append(fn)
+        self.__raw_data = read_frames(pd.read_stata, fns, pool='thread', workers=workers, downcast=downcast, categorical=categorical, ignore_index=True, verbose=verbose)     #New Index: Otherwise Each year has repeated obs numbers
         gc.collect()
 
-    def load_raw_from_hdf(self, years=[], use_raw_years_fl=False, gc_collect=True, verbose=True):
+    def load_raw_from_hdf(self, years=[], use_raw_years_fl=False, gc_collect=True, workers=None, downcast=False, categorical=None, validate=True, verbose=True):
         """
         Load HDF Version of RAW Dataset from a source_directory
         
@@ -703,11 +890,21 @@ class NBERWTFConstructor(NBERWTF):
                                 Use raw_years HDF file. 
         gc_collect          :   bool, optional(default=True)
                                 Garbage Collection Objects to Ensure Memory is released. 
+        workers             :   int, optional(default=None)
+                                Number of processes used to read year keys (Default: min(#years, cpu_count, 4))
+        downcast            :   bool or str, optional(default=False)
+                                Downcast dtypes of each year as it is read (True = integers, 'all' = integers and floats to float32)
+        categorical         :   list, optional(default=None)
+                                Columns to convert to Categoricals as each year is read (i.e. self._categorical_columns)
+        validate            :   bool, optional(default=True)
+                                Validate the HDF file against its manifest before loading (see validate_hdf_cache)
 
         Note   
         -----        
         1. To construct your own hdf version requires to initially load from NBER supplied RAW dta files. Then use Constructor method ``convert_source_dta_to_hdf()``
         2. This currently accomodates two types of HDF files. Adopt a single specification with Years to reduce complexity
+        3. A ValueError is raised if the HDF file is stale, doesn't contain the requested years or has no manifest 
+           (files written before manifests were recorded) so it can be regenerated
 
         ..  Questions
             ---------
@@ -717,28 +914,143 @@ class NBERWTFConstructor(NBERWTF):
         #-Complete Raw Data File-#
         if years == [] or years == self._available_years and not use_raw_years_fl:                  
             fn = self._source_dir + self.__cache_dir + self.__raw_data_hdf_fn
+            if validate:
+                problems = self.validate_hdf_cache(fn, key='raw_data', years=list(self._available_years), verbose=False)
+                if len(problems) > 0:
+                    raise ValueError("HDF Cache: %s is stale or incomplete: %s" % (fn, problems))
             if verbose: print "[INFO] Loading RAW DATA from %s" % fn
             self.__raw_data = pd.read_hdf(fn, key='raw_data')
+            if downcast:
+                downcast_dtypes(self.__raw_data, integer=True, floating=(downcast == 'all'))
+            if categorical:
+                categorize(self.__raw_data, categorical)
             if gc_collect:
                 gc.collect()
         #-Year Indexed File-#
         else:
-            self.__raw_data     = pd.DataFrame() 
             fn = self._source_dir + self.__cache_dir + self.__raw_data_hdf_yearindex_fn 
-            for year in years:
-                if verbose: print "[INFO] Loading RAW DATA for year: %s from %s" % (year, fn)
-                self.__raw_data = self.__raw_data.append(pd.read_hdf(fn, key='Y'+str(year)))
-                if gc_collect:
-                    gc.collect()
+            if validate:
+                problems = self.validate_hdf_cache(fn, years=years, verbose=False)
+                if len(problems) > 0:
+                    raise ValueError("HDF Cache: %s is stale or incomplete: %s" % (fn, problems))
+            if verbose: print "[INFO] Loading RAW DATA for years: %s from %s" % (years, fn)
+            items = [((fn,), {'key' : 'Y'+str(year)}) for year in years]
+            self.__raw_data = read_frames(pd.read_hdf, items, pool='process', workers=workers, downcast=downcast, categorical=categorical, ignore_index=False, verbose=verbose)
+            if gc_collect:
+                gc.collect()
 
-    def check_cache(self, check="year", verbose=True):
+    def load_raw_from_columnar(self, years=[], columns=None, cache_format='npy', downcast=False, categorical=None, verbose=True):
+        """
+        Load RAW Dataset from the Year Partitioned Columnar Cache
+
+        Parameters
+        ----------
+        years           :   list, optional(default=[])
+                            Specify Years to Load (only these partitions are read)
+        columns         :   list, optional(default=None)
+                            Specify Columns to Load (only these column files are read) [Default: All]
+        cache_format    :   str, optional(default='npy')
+                            Registered Cache Format (pyeconlab.util.cache.CACHE_FORMATS)
+        downcast        :   bool or str, optional(default=False)
+                            Downcast dtypes (True = integers, 'all' = integers and floats to float32)
+        categorical     :   list, optional(default=None)
+                            Return these columns as Categoricals (the cache stores string columns as codes)
+
+        Notes
+        -----
+        1. Generate the cache using ``convert_raw_data_to_columnar()``
+        2. The requested partitions are validated against the manifest (source file signatures and rows).
+           A ValueError is raised if the cache is stale so it can be regenerated
+        """
+        cache = get_cache(self._source_dir + self.__cache_dir + self.__raw_data_columnar_dir, format=cache_format)
+        if years == []:
+            years = None
+        else:
+            years = [int(year) for year in years]
+        problems = cache.validate(years=years)
+        if len(problems) > 0:
+            raise ValueError("Columnar Cache: %s is stale or incomplete: %s" % (cache.path, problems))
+        if verbose: print "[INFO] Loading RAW DATA from %s" % cache
+        self.__raw_data = cache.read(years=years, columns=columns, verbose=verbose)
+        if downcast:
+            downcast_dtypes(self.__raw_data, integer=True, floating=(downcast == 'all'))
+        if categorical:
+            categorize(self.__raw_data, categorical)
+
+    def read_raw_year(self, year, ftype=None, verbose=False):
+        """
+        Read the RAW data for a single year 
+
+        Parameters
+        ----------
+        year        :   int
+        ftype       :   str, optional(default=None)
+                        'dta', 'hdf' (year indexed file) or a columnar cache format [Default: the stream ftype or 'hdf']
+
+        Notes
+        -----
+        1. optimize_memory settings are applied to the year (Categoricals are unified across years when the years are combined)
+        """
+        if ftype is None:
+            ftype = self._stream if self._stream is not None else 'hdf'
+        if ftype == 'dta':
+            df = pd.read_stata(self._source_dir + self._fn_prefix + str(year)[-2:] + self._fn_postfix)
+        elif ftype == 'hdf':
+            df = pd.read_hdf(self._source_dir + self.__cache_dir + self.__raw_data_hdf_yearindex_fn, key='Y'+str(year))
+        else:
+            cache = get_cache(self._source_dir + self.__cache_dir + self.__raw_data_columnar_dir, format=ftype)
+            df = cache.read(years=[int(year)], mmap=False, verbose=verbose)
+        if self._optimize_memory:
+            downcast_dtypes(df, integer=True, floating=True)
+            categorize(df, self._categorical_columns)
+        return df
+
+    def update_columnar_cache(self, years=[], cache_format='npy', verbose=True):
+        """
+        Write missing or stale year partitions of the columnar cache from the ``*.dta`` files (one year at a time)
+
+        Parameters
+        ----------
+        years           :   list, optional(default=[])
+                            Years to check [Default: All]
+        cache_format    :   str, optional(default='npy')
+                            Registered Cache Format (pyeconlab.util.cache.CACHE_FORMATS)
+        """
+        cache_dir = self._source_dir + self.__cache_dir
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        cache = get_cache(cache_dir + self.__raw_data_columnar_dir, format=cache_format)
+        if years == []:
+            years = self._available_years
+        years = [int(year) for year in years]
+        problems = cache.validate(years=years)
+        if None in problems:
+            stale = years
+        else:
+            stale = sorted(problems.keys())
+        for year in stale:
+            dta_fn = self._source_dir + self._fn_prefix + str(year)[-2:] + self._fn_postfix
+            if verbose: print "[INFO] Writing year: %s from: %s to the columnar cache" % (year, dta_fn)
+            cache.write_partition(year, pd.read_stata(dta_fn), sources=[dta_fn], verbose=verbose)
+            gc.collect()
+        return stale
+
+    def check_cache(self, check="manifest", deep=False, verbose=True):
         """
         Check cache files match dta
         
         Parameters
         ----------
-        check       :       str, optional(default="both")
-                            Check "raw", "year" or "both" types of cache files
+        check       :       str, optional(default="manifest")
+                            Check "manifest", "raw", "year" or "both" types of cache files
+                            "manifest" validates the columnar, year index and raw data caches against their manifests (without reading the dta files)
+        deep        :       bool, optional(default=False)
+                            "manifest" only: also read the cached data and compare column hashes
+
+        Returns
+        -------
+        "manifest" returns (valid, dict(cache : problems)). A cache without a manifest (written before manifests were recorded)
+        or without all of self.source_years is reported as a problem (use check="year" to compare these against the dta files)
 
         Notes
         -----
@@ -746,6 +1058,30 @@ class NBERWTFConstructor(NBERWTF):
         2. This currently FAILS for "raw" becuase when tables get appended together this forces the 'values' to be floats in all years and it is only found in some year specific files
 
         """
+        #-Check Manifests-#
+        if check == "manifest":
+            problems = dict()
+            years = list(self.source_years)
+            found = False
+            cache = get_cache(self._source_dir + self.__cache_dir + self.__raw_data_columnar_dir)
+            if os.path.isdir(cache.path):
+                found = True
+                if verbose: print "[INFO] Checking Columnar Cache: %s" % cache.path
+                result = cache.validate(years=years, deep=deep, verbose=verbose)
+                if len(result) > 0:
+                    problems[cache.path] = result
+            for fn, key in [(self.__raw_data_hdf_yearindex_fn, None), (self.__raw_data_hdf_fn, 'raw_data')]:
+                fn = self._source_dir + self.__cache_dir + fn
+                if not os.path.exists(fn):
+                    continue
+                found = True
+                if verbose: print "[INFO] Checking HDF Cache: %s" % fn
+                result = self.validate_hdf_cache(fn, key=key, years=years, deep=deep, verbose=verbose)
+                if len(result) > 0:
+                    problems[fn] = result
+            if not found:
+                problems[self._source_dir + self.__cache_dir] = {None : ["no cache files found"]}
+            return len(problems) == 0, problems
         #-Check RAW File-#
         years = self.source_years
         if check == "raw" or check == "both":   
@@ -791,6 +1127,82 @@ class NBERWTFConstructor(NBERWTF):
         return True, True
 
 
+    def validate_hdf_cache(self, fn, key=None, years=None, deep=False, verbose=True):
+        """
+        Validate a HDF Cache against its manifest (fn + '.manifest.json')
+
+        Parameters
+        ----------
+        fn      :   str
+                    HDF File
+        key     :   str, optional(default=None)
+                    Key holding all years (i.e. 'raw_data') [Default: None = a year index file with keys Y####]
+        years   :   list, optional(default=None)
+                    Years the cache must contain (only these years are validated) [Default: self.source_years]
+        deep    :   bool, optional(default=False)
+                    Read the cached data and compare column hashes 
+
+        Returns
+        -------
+        dict(year : list of problems) for years with problems. Problems with the file or manifest use the key None
+
+        Notes
+        -----
+        1. A missing manifest is reported as a problem. Files written before manifests were recorded can't be validated
+        """
+        if not os.path.exists(fn):
+            return {None : ["cache file not found: %s" % fn]}
+        if not os.path.exists(fn + '.manifest.json'):
+            return {None : ["manifest not found: %s" % (fn + '.manifest.json')]}
+        partitions = read_json(fn + '.manifest.json')['partitions']
+        years = [int(year) for year in (self.source_years if years is None else years)]
+        problems = dict()
+        for year in years:
+            if str(year) not in partitions:
+                problems[year] = ["year is not in the cache"]
+        years = [year for year in years if str(year) in partitions]
+        hdf = pd.HDFStore(fn, mode='r')
+        def nrows(key):
+            storer = hdf.get_storer(key)
+            return storer.nrows if storer.nrows is not None else storer.shape[0]          #Fixed format stores shape only
+        try:
+            keys = hdf.keys()
+            if key is not None:
+                if '/' + key not in keys:
+                    return {None : ["key %s is missing" % key]}
+                total = sum([entry['rows'] for entry in partitions.values()])
+                rows = nrows(key)
+                if rows != total:
+                    problems[None] = ["rows: %s != manifest rows: %s" % (rows, total)]
+                data = dict(partition_frame(hdf[key])) if deep else dict()
+            for year in years:
+                entry = partitions[str(year)]
+                if key is None:
+                    ykey = 'Y' + str(year)
+                    if '/' + ykey not in keys:
+                        problems[year] = ["key %s is missing" % ykey]
+                        continue
+                    if deep:
+                        result = validate_manifest_entry(entry, df=hdf[ykey])
+                    else:
+                        result = validate_manifest_entry(entry, rows=nrows(ykey))
+                elif deep:
+                    result = validate_manifest_entry(entry, df=data[year]) if year in data else ["year has no rows in key %s" % key]
+                else:
+                    result = validate_manifest_entry(entry)
+                if len(result) > 0:
+                    problems[year] = result
+                if verbose: print "[INFO] Year %s: %s" % (year, "OK" if len(result) == 0 else result)
+        finally:
+            hdf.close()
+        return problems
+
+    def validate_hdf_yearindex(self, fn, deep=False, verbose=True):
+        """
+        Validate a Year Index HDF Cache against its manifest (see validate_hdf_cache)
+        """
+        return self.validate_hdf_cache(fn, deep=deep, verbose=verbose)
+
     def dataset_to_hdf(self, flname='default', key='default', format='table', verbose=True):
         """
         Save a dataset to HDF File
@@ -851,12 +1263,13 @@ class NBERWTFConstructor(NBERWTF):
             print "[NOTICE] It appears China Hong Kong Data has Already Been Imported!"
             return self._supp_data[key]
         except:
-            data = pd.DataFrame()
-            for year in years:
-                if verbose: print "[INFO] Using source_dir: %s" % self._source_dir
+            if verbose: print "[INFO] Using source_dir: %s" % self._source_dir
+            fns = []
+            for year in sorted(years):
                 fn = self._source_dir + fn_prefix + str(year)[-2:] + fn_postfix
                 if verbose: print "[INFO] Loading Year: %s from file: %s" % (year, fn)
-                data = data.append(pd.read_stata(fn))
+                fns.append(fn)
+            data = read_frames(pd.read_stata, fns, pool='thread', ignore_index=False, verbose=verbose)      #Years are read concurrently
             # - Add Notes to the DataFrame - #
             data.notes =    u'Files: ' + fn_prefix + u'??' + fn_postfix + '\n'  +\
                             u'Years: ' + str(years) + '\n'                      +\
@@ -958,51 +1371,27 @@ class NBERWTFConstructor(NBERWTF):
         #     raise ValueError("This method requires no previous operations to have been performed on the dataset!")
         # else:
         #     on          =   [u'year', u'icode', u'importer', u'ecode', u'exporter', u'sitc4', u'unit', u'dot']              #Merge on the Full complement of Items in the Original Dataset
-        on = [u'year', u'icode', u'importer', u'ecode', u'exporter', u'sitc4', u'unit', u'dot']
-        #-Note: Current merge_columns utility merges one column set at a time-#
-        #-Values-#
-        raw_value = self.dataset[on+['value']].rename(columns={'value' : 'value_raw'})
+        from .constructor_dataset_sitcr2 import adjust_china_hongkong
         try:
-            supp_value = self._supp_data[u'chn_hk_adjust'][on+['value_adj']]
+            supp_data = self._supp_data[u'chn_hk_adjust']
         except:
             raise ValueError("[ERROR] China/Hong Kong Data has not been loaded!")
-        value = merge_columns(raw_value, supp_value, on, collapse_columns=('value_raw', 'value_adj', 'value'), dominant='right', output='final', verbose=verbose)
-
-        # Note: Imposing the requirement that this be merged on complete matching information (i.e. no previous operations on the dataset, this section could be removed from try,except)
-        #'Quantity' May not be available if collapse_to_valuesonly has been done etc.
-        try:                                                             
-            #-Quantity-#
-            raw_quantity = self._dataset[on+['quantity']]
-            supp_quantity = self._supp_data[u'chn_hk_adjust'][on+['quantity']]
-            quantity = merge_columns(raw_quantity, supp_quantity, on, collapse_columns=('quantity_x', 'quantity_y', 'quantity'), dominant='right', output='final', verbose=verbose)
-            #-Join Values and Quantity-#
-            if verbose: 
-                print "[INFO] Merging Value Adjusted and Quantity Adjusted Series"
-                print "[INFO] Value Adjusted Number of Observations: \t%s (Variables: %s)" % (value.shape[0], value.shape[1])
-                print "[INFO] Quantity Adjusted Number of Observations: %s (Variables: %s)" % (quantity.shape[0], quantity.shape[1])
-            updated_raw_values = value.merge(quantity, how='outer', on=on)
-            if verbose:
-                print "[INFO] Merged Number of Observations: \t\t%s (Variables: %s)" % (updated_raw_values.shape[0], updated_raw_values.shape[1])
-        except:
-            if verbose: print "[INFO] Quantity Information is not available in the current dataset\n"
-            updated_raw_values = value  #-Quantity Not Available-#
+        #-Values and Quantity ('quantity' may not be available if collapse_to_valuesonly has been done etc.)-#
+        update = {'value' : 'value_adj'}
+        if 'quantity' in self.dataset.columns and 'quantity' in supp_data.columns:
+            update['quantity'] = 'quantity'
+        elif verbose: 
+            print "[INFO] Quantity Information is not available in the current dataset\n"
+        updated_raw_values = adjust_china_hongkong(self.dataset, supp_data, update=update, verbose=verbose)
 
         report =    u"[INFO] # of Observations in Original Dataset: %s\n" % (len(self._dataset)) +\
                     u"[INFO] # of Observations in Updated Dataset: \t%s\n" % (len(updated_raw_values))
         if verbose: print report
 
-        #-Cleanup of Temporary Objects-#
-        del raw_value, supp_value, value
-        try:
-            del raw_quantity, supp_quantity, quantity
-        except:
-            pass    #-Quantity Merge Hasn't Taken Place-#
-
         #- Add Notes -#
         update_operations(self, op_string)
 
         #-Set Dataset to the Update Values-#
-        updated_raw_values["year"] = updated_raw_values["year"].apply(lambda x: int(x))      #merge_columns is causing year to change from int to float?
         self._dataset = updated_raw_values
 
         
@@ -1044,9 +1433,15 @@ class NBERWTFConstructor(NBERWTF):
         ZWE - Drop Data in 1963,1964
         MWI - Drop Data in 1963,1964
 
+        """
+        self._dataset = self.raw_data_fixes(self._dataset, verbose=verbose)    #Set Property
+
+    def raw_data_fixes(self, data, verbose=False):
+        """
+        Return data with the NBER FAQ fixes applied (see fix_raw_data). 
+        The fixes are within year so this can be applied to a single year of raw data
         """
         if verbose: print "[INFO] Adjustments to RAW DATA based on NBER FAQ ..."
-        data = self._dataset
         for yr in xrange(1963,1964+1,1):
             for country in ["Malawi", "Zimbabwe"]:
                 if verbose:
@@ -1061,7 +1456,7 @@ class NBERWTFConstructor(NBERWTF):
                 data = data.drop(drop.index)
                 if verbose: print "[INFO] Number of Observations after drop = %s"%data.shape[0]
                 gc.collect()
-        self._dataset = data    #Set Property
+        return data
 
     # ------------------------------- #
     # - Operations on Country Codes - #
@@ -1118,8 +1513,8 @@ class NBERWTFConstructor(NBERWTF):
 
         Notes
         -----
-        1.  Should this be done more efficiently? (i.e. over a single pass of the data) 
-            Current timeit result: 975ms per loop for 1 year
+        1.  Codes are split on the unique set of codes and broadcast back to the data 
+            (previously 975ms per loop for 1 year using row-wise apply)
         """
         #-Set Data from Dataset OR Raw Data-#
         if dataset:
@@ -1135,14 +1530,13 @@ class NBERWTFConstructor(NBERWTF):
                 return None
         # - Importers - #
         if verbose: print "Spliting icode into (iregion, iiso3n, imod)"
-        data['iregion'] = data['icode'].apply(lambda x: int(x[:2]))
-        data['iiso3n']  = data['icode'].apply(lambda x: int(x[2:5]))
-        data['imod']    = data['icode'].apply(lambda x: int(x[-1]))
+        data['iregion'], data['iiso3n'], data['imod'] = split_countrycode_series(data['icode'])
         # - Exporters - #
         if verbose: print "Spliting ecode into (eregion, eiso3n, emod)"
-        data['eregion'] = data['ecode'].apply(lambda x: int(x[:2]))
-        data['eiso3n']  = data['ecode'].apply(lambda x: int(x[2:5]))
-        data['emod']    = data['ecode'].apply(lambda x: int(x[-1]))
+        data['eregion'], data['eiso3n'], data['emod'] = split_countrycode_series(data['ecode'])
+        if self._optimize_memory:
+            for item in ['iregion', 'iiso3n', 'imod', 'eregion', 'eiso3n', 'emod']:
+                data[item] = data[item].astype(np.int16)                            #region < 100, iso3n < 1000, mod < 10
         #- Add Operation to df attribute -#
         update_operations(self, op_string)
         if not dataset:
@@ -1183,24 +1577,25 @@ class NBERWTFConstructor(NBERWTF):
             if verbose: print "[INFO] Calling split_countrycodes() method"
             self.split_countrycodes(apply_fixes=False, iso3n_only=True, verbose=verbose)
         #-Core-#
+        df = self._dataset
         if match_on == 'countryname':
             fix_countryname_to_iso3n = self.fix_countryname_to_iso3n
-            for key in sorted(fix_countryname_to_iso3n.keys()):
-                if verbose: print "For countryname %s updating iiso3n and eiso3n codes to %s" % (key, fix_countryname_to_iso3n[key])
-                df = self._dataset
-                df.loc[df.importer == key, 'iiso3n'] = fix_countryname_to_iso3n[key]
-                df.loc[df.exporter == key, 'eiso3n'] = fix_countryname_to_iso3n[key]
+            if verbose:
+                for key in sorted(fix_countryname_to_iso3n.keys()):
+                    print "For countryname %s updating iiso3n and eiso3n codes to %s" % (key, fix_countryname_to_iso3n[key])
+            df['iiso3n'] = recode_from_keys(df['importer'], df['iiso3n'], fix_countryname_to_iso3n)
+            df['eiso3n'] = recode_from_keys(df['exporter'], df['eiso3n'], fix_countryname_to_iso3n)
         elif match_on == 'countrycode':
             fix_ecode_to_iso3n = self.fix_ecode_to_iso3n                                                        #Will be moved to Meta
-            for key in sorted(fix_ecode_to_iso3n.keys()):
-                if verbose: print "For ecode %s updating eiso3n codes to %s" % (key, fix_ecode_to_iso3n[key])
-                df = self._dataset
-                df.loc[df.ecode == key, 'eiso3n'] = fix_ecode_to_iso3n[key]
+            if verbose:
+                for key in sorted(fix_ecode_to_iso3n.keys()):
+                    print "For ecode %s updating eiso3n codes to %s" % (key, fix_ecode_to_iso3n[key])
+            df['eiso3n'] = recode_from_keys(df['ecode'], df['eiso3n'], fix_ecode_to_iso3n)
             fix_icode_to_iso3n = self.fix_icode_to_iso3n                                                        #Will be moved to Meta
-            for key in sorted(fix_icode_to_iso3n.keys()):
-                if verbose: print "For icode %s updating iiso3n codes to %s" % (key, fix_icode_to_iso3n[key])
-                df = self._dataset
-                df.loc[df.icode == key, 'iiso3n'] = fix_icode_to_iso3n[key]
+            if verbose:
+                for key in sorted(fix_icode_to_iso3n.keys()):
+                    print "For icode %s updating iiso3n codes to %s" % (key, fix_icode_to_iso3n[key])
+            df['iiso3n'] = recode_from_keys(df['icode'], df['iiso3n'], fix_icode_to_iso3n)
         else:
             raise ValueError("match_on must be either 'countryname' or 'countrycode'")
         #- Add Operation to class attribute -#
@@ -1240,8 +1635,12 @@ class NBERWTFConstructor(NBERWTF):
             self.split_countrycodes(apply_fixes=True, iso3n_only=True, verbose=verbose)
         un_iso3n_to_iso3c = iso3n_to_iso3c(source_institution='un')
         #-Concord and Add a Column-#
-        self._dataset['iiso3c'] = self._dataset['iiso3n'].apply(lambda x: concord_data(un_iso3n_to_iso3c, x, issue_error='.'))
-        self._dataset['eiso3c'] = self._dataset['eiso3n'].apply(lambda x: concord_data(un_iso3n_to_iso3c, x, issue_error='.'))
+        if self._plan is not None:
+            self._record().assign(op_string, 'iiso3c', lambda df: concord_series(un_iso3n_to_iso3c, df['iiso3n'], issue_error='.'))
+            self._record().assign(op_string, 'eiso3c', lambda df: concord_series(un_iso3n_to_iso3c, df['eiso3n'], issue_error='.'))
+        else:
+            self._dataset['iiso3c'] = concord_series(un_iso3n_to_iso3c, self._dataset['iiso3n'], issue_error='.')
+            self._dataset['eiso3c'] = concord_series(un_iso3n_to_iso3c, self._dataset['eiso3n'], issue_error='.')
         #- Add Operation to cls attribute -#
         update_operations(self, op_string)
 
@@ -1273,8 +1672,8 @@ class NBERWTFConstructor(NBERWTF):
         #-Core-#
         un_iso3n_to_un_name = iso3n_to_name(source_institution=source_institution) 
         #-Concord and Add a Column-#
-        self._dataset['icountryname'] = self._dataset['iiso3n'].apply(lambda x: concord_data(un_iso3n_to_un_name, x, issue_error='.'))
-        self._dataset['ecountryname'] = self._dataset['eiso3n'].apply(lambda x: concord_data(un_iso3n_to_un_name, x, issue_error='.'))
+        self._dataset['icountryname'] = concord_series(un_iso3n_to_un_name, self._dataset['iiso3n'], issue_error='.')
+        self._dataset['ecountryname'] = concord_series(un_iso3n_to_un_name, self._dataset['eiso3n'], issue_error='.')
 
         #-OpString-#
         update_operations(self, op_string)
@@ -1306,15 +1705,17 @@ class NBERWTFConstructor(NBERWTF):
         if not check_operations(self, u"(add_iso3c)"):          
             if verbose: print "[INFO] Calling add_iso3c method"
             self.add_iso3c(verbose=verbose)
-        #-Drop NES and Unmatched Countries-#
-        self._dataset = self.dataset[self.dataset.iiso3c != error_code]     #Keep iiso3n Countries
-        self._dataset = self.dataset[self.dataset.eiso3c != error_code]     #Keep eiso3n Countries
-        #-Drop WLD-#
-        self._dataset = self.dataset[self.dataset.iiso3c != 'WLD']
-        self._dataset = self.dataset[self.dataset.eiso3c != 'WLD']
-        #-Drop '.'-#
-        self._dataset = self.dataset[self.dataset.iiso3c != '.']
-        self._dataset = self.dataset[self.dataset.eiso3c != '.']
+        drop = [error_code, 'WLD', '.']                                     #NES and Unmatched Countries, WLD and '.'
+        if self._plan is not None:
+            self._record().filter(op_string, lambda df: ~isin_columns(df, ['iiso3c', 'eiso3c'], drop)[0])
+            update_operations(self, op_string)
+            return None
+        #-Drop Codes in iiso3c or eiso3c (Single Mask)-#
+        mask, counts = isin_columns(self._dataset, ['iiso3c', 'eiso3c'], drop)
+        if verbose:
+            for item, count in zip(drop, counts):
+                if count > 0: print "[INFO] Dropping %s observations with iiso3c or eiso3c code: %s" % (count, item)
+        self._dataset = self._dataset.loc[~mask]
         #-ResetIndex-#
         self._dataset = self._dataset.reset_index()                         
         #-OpString-#
@@ -1334,9 +1735,12 @@ class NBERWTFConstructor(NBERWTF):
             return None             #Already been computed
         #-Core-#
         if verbose: print "[INFO] Dropping Observations that include `World` in importer or exporter attribute"
-        df = self.dataset
-        df = df.loc[(df.importer != "World") & (df.exporter != "World")]
-        self._dataset = df
+        if self._plan is not None:
+            self._record().filter(op_string, lambda df: ~isin_columns(df, ['importer', 'exporter'], ["World"])[0])
+            return None
+        mask, counts = isin_columns(self._dataset, ['importer', 'exporter'], ["World"])
+        if verbose: print "[INFO] Dropping %s observations" % counts[0]
+        self._dataset = self._dataset.loc[~mask]
 
 
     def world_only(self, error_code='.', rtrn=False, verbose=True):
@@ -1369,7 +1773,13 @@ class NBERWTFConstructor(NBERWTF):
         if not check_operations(self, u"(add_iso3c)"):          #Requires iiso3n, eiso3n
             self.add_iso3c(verbose=verbose)
         #-Core-#
-        self._dataset = self._dataset.loc[(self._dataset.iiso3c == 'WLD') | (self._dataset.eiso3c == 'WLD')]            #Take WLD either in iiso3c or eiso3c (| = or)
+        if self._plan is not None:
+            self._record().filter(op_string, lambda df: isin_columns(df, ['iiso3c', 'eiso3c'], ['WLD'])[0])
+            update_operations(self, op_string)
+            return None
+        mask, counts = isin_columns(self._dataset, ['iiso3c', 'eiso3c'], ['WLD'])                                     #Take WLD either in iiso3c or eiso3c
+        if verbose: print "[INFO] Keeping %s of %s observations with WLD in iiso3c or eiso3c" % (counts[0], len(mask))
+        self._dataset = self._dataset.loc[mask]
         #-OpString-#    
         update_operations(self, op_string)
         if rtrn:
@@ -1410,22 +1820,24 @@ class NBERWTFConstructor(NBERWTF):
             self.countries_only(verbose=verbose)
         #-Adjust Codes-#
         if verbose: print "[INFO] Adjusting Codes for Intertemporal Consistency from meta subpackage (iso3c_recodes_for_1962_2000)"
-        self._dataset['iiso3c'] = self.dataset['iiso3c'].apply(lambda x: concord_data(iso3c_recodes_for_1962_2000, x, issue_error=False))   #issue_error = false returns x if no match
-        self._dataset['eiso3c'] = self.dataset['eiso3c'].apply(lambda x: concord_data(iso3c_recodes_for_1962_2000, x, issue_error=False))   #issue_error = false returns x if no match
+        if self._plan is not None:
+            self._record().assign(op_string, 'iiso3c', lambda df: concord_series(iso3c_recodes_for_1962_2000, df['iiso3c'], issue_error=False))
+            self._record().assign(op_string, 'eiso3c', lambda df: concord_series(iso3c_recodes_for_1962_2000, df['eiso3c'], issue_error=False))
+            self._record().filter(op_string, lambda df: (df['iiso3c'] != '.') & (df['eiso3c'] != '.'))
+            subidx = [item for item in self._record().columns if item not in ['value', 'quantity', 'unit', 'dot'] + dropvars]
+            self._record().aggregate(op_string, subidx, ['value'])
+            update_operations(self, op_string)
+            return None
+        self._dataset['iiso3c'] = concord_series(iso3c_recodes_for_1962_2000, self.dataset['iiso3c'], issue_error=False)   #issue_error = false returns x if no match
+        self._dataset['eiso3c'] = concord_series(iso3c_recodes_for_1962_2000, self.dataset['eiso3c'], issue_error=False)   #issue_error = false returns x if no match
         #-Drop Removals-#
         if verbose: print "[INFO] Deleting Recodes to '.'"
         self._dataset = self.dataset[self.dataset['iiso3c'] != '.']
         self._dataset = self.dataset[self.dataset['eiso3c'] != '.']
         #-Collapse Constructed Duplicates-#
-        subidx = set(self.dataset.columns)
-        subidx.remove('value')
-        for item in ['quantity', 'unit', 'dot'] + dropvars:
-            try:
-                subidx.remove(item)
-            except:
-                pass
-        if verbose: print "[INFO] Collapsing Dataset to SUM duplicate entries on %s" % list(subidx)
-        self._dataset = self.dataset[list(subidx) + ['value']].groupby(list(subidx)).sum()
+        subidx = [item for item in self.dataset.columns if item not in ['value', 'quantity', 'unit', 'dot'] + dropvars]
+        if verbose: print "[INFO] Collapsing Dataset to SUM duplicate entries on %s" % subidx
+        self._dataset = self.dataset[subidx + ['value']].groupby(subidx).sum()
             #self._dataset = self.dataset.groupby(list(['year', 'iiso3c', 'eiso3c', 'sitc%s' % self.level])).sum()
             #self._dataset = self.dataset.sort(columns=['year', 'iiso3c', 'eiso3c', 'sitc%s' % self.level])
         self._dataset = self.dataset.reset_index()                                                  #Return Flat File                                                           
@@ -1522,28 +1934,26 @@ class NBERWTFConstructor(NBERWTF):
         """
         #-Find Appropriate idx-#
         if type(subidx) != list:
-            subidx = set(self.dataset.columns)
-            for item in ['quantity', 'unit', 'dot']:    #Cannot Aggregate These Items
-                try:
-                    subidx.remove(item)
-                except:
-                    pass
-            subidx.remove('value')                      #Remove to Aggregate in groupby
-            subidx = list(subidx)                       
+            columns = self.dataset.columns if self._plan is None else self._record().columns
+            subidx = [item for item in columns if item not in ['quantity', 'unit', 'dot', 'value']]     #Cannot Aggregate 'quantity', 'unit', 'dot' (Dataset Column Order)
         #-Check if Operation has been conducted-#
         op_string = u"(collapse_to_valuesonly[%s])" % subidx
         if check_operations(self, op_string): return None
-        # - Conduct Duplicate Analysis - #
-        dup = self._dataset.duplicated(subset=subidx)  
+        if self._plan is not None:
+            if return_duplicates:
+                raise ValueError("return_duplicates is not available in lazy mode")
+            self._record().aggregate(op_string, subidx, ['value'])
+            update_operations(self, op_string)
+            return None
+        #-Collapse/Sum Duplicates (Duplicate Rows are identified from the same Packed Key)-#
+        data, dup = collapse_duplicates(self._dataset, subidx, ['value'], return_duplicated=True)    #Not Indexed for Later Data Operations (Categoricals are retained)
         if verbose:
             print "[INFO] Current Dataset Length: %s" % self._dataset.shape[0]
-            print "[INFO] Current Number of Duplicate Entry's: %s" % len(dup[dup==True])
+            print "[INFO] Current Number of Duplicate Entry's: %s" % dup.sum()
             print "[INFO] Deleted 'quantity', 'unit' as cannot aggregate quantity data in different units and 'dot' due to the existence of np.nan"
         if return_duplicates:           #Return Duplicate Rows
-            dup = self.dataset[dup]
-        #-Collapse/Sum Duplicates-#
-        self._dataset = self.dataset[subidx+['value']].groupby(by=subidx).sum()
-        self._dataset = self.dataset.reset_index()                                  #Remove IDX For Later Data Operations
+            dup = self._dataset[dup]
+        self._dataset = data
         if verbose:
             print "[INFO] New Dataset Length: %s" % self._dataset.shape[0]
         #- Add Operation to df attribute -#
@@ -1560,7 +1970,11 @@ class NBERWTFConstructor(NBERWTF):
         if check_operations(self, op_string): return None
         #-Core-#
         if verbose: print "[INFO] Setting Values to be in $'s not %s$'s" % (self._units_value)
-        self._dataset['value'] = self.dataset['value'] * self._units_value
+        if self._plan is not None:
+            units_value = self._units_value
+            self._record().assign(op_string, 'value', lambda df: df['value'] * units_value)
+        else:
+            self._dataset['value'] = self.dataset['value'] * self._units_value
         #-OpString-#
         update_operations(self, op_string)
 
@@ -1581,10 +1995,9 @@ class NBERWTFConstructor(NBERWTF):
         if check_operations(self, op_string): return None
         #-Core-#
         if verbose: print "[INFO] Adding SITC Revision 2 (Source='un') marker variable 'SITCR2'"
-        sitc = SITC(revision=2, source_institution=source_institution)
-        codes = sitc.get_codes(level=level)
+        sitc = get_sitc(revision=2, source_institution=source_institution)
         sitcl = 'sitc%s' % level
-        self._dataset['SITCR2'] = self.dataset[sitcl].apply(lambda x: 1 if x in codes else 0)
+        self._dataset['SITCR2'] = sitc.is_official(self.dataset[sitcl], level=level).astype(np.int64)
         #-OpString-#
         update_operations(self, op_string)
 
@@ -1622,6 +2035,10 @@ class NBERWTFConstructor(NBERWTF):
             raise ValueError("SITC4 Can Only Be Split into Levels 1,2, or 3")
         #-Core-#
         if verbose: print "[INFO] Adding Product Code Level: SITC L%s" % level
+        if self._plan is not None:
+            self._record().assign(op_string, 'SITCL%s' % level, lambda df: map_unique(df['sitc4'], lambda x: x[0:level]))
+            update_operations(self, op_string)
+            return None
         if level == 1:
             self._dataset['SITCL1'] = self._dataset['sitc4'].apply(lambda x: x[0:1])
         if level == 2:
@@ -1661,28 +2078,56 @@ class NBERWTFConstructor(NBERWTF):
         if level not in [1,2,3]:
             raise ValueError("Level must be 1,2, or 3 for SITC4 Data")
         if subidx == 'default':
-            cols = set(self.dataset.columns)
-            for item in ['quantity', 'unit', 'dot']:
-                try:
-                    cols.remove(item)
-                except:
-                    pass                                                                #Item not in dataset, report?
-            #-Ensure 'value' is last-#
-            cols.remove('value')
-            subidx = list(cols) + ['value']                                         #Is this really necessary? just remove value?
+            cols = self.dataset.columns if self._plan is None else self._record().columns
+            #-Ensure 'value' is last (Dataset Column Order)-#
+            subidx = [item for item in cols if item not in ['quantity', 'unit', 'dot', 'value']] + ['value']
         if verbose: print "[INFO] Collapsing Data to SITC Level #%s" % level
         colcode = 'sitc%s' % level
-        self._dataset[colcode] = self.dataset['sitc4'].apply(lambda x: x[0:level])
+        if self._plan is not None:
+            self._record().assign(op_string, colcode, lambda df: map_unique(df['sitc4'], lambda x: x[0:level]))
         #-Aggregate-#
+        rollup = 'sitc4' in subidx
         for idx,item in enumerate(subidx):
             if item == 'sitc4': subidx[idx] = colcode                               # Remove sitc4 and add in the lower level of aggregation sitc3 etc.
         if verbose: print "[INFO] Aggregating on: %s" % subidx[:-1]
-        self._dataset = self.dataset[subidx].groupby(by=subidx[:-1]).sum()      # Exclude 'value', as want to sum over it. It needs to be last in the list!
-        self._dataset = self.dataset.reset_index()
+        if self._plan is not None:
+            self._record().aggregate(op_string, subidx[:-1], subidx[-1:])
+            self.level = level
+            update_operations(self, op_string)
+            return None
+        if rollup:
+            by = [item for item in subidx[:-1] if item != colcode]
+            self._dataset = rollup_productcodes(self.dataset, by, code='sitc4', levels=[level], values=subidx[-1:])[level][subidx]
+        else:
+            self._dataset[colcode] = self.dataset['sitc4'].apply(lambda x: x[0:level])
+            self._dataset = self.dataset[subidx].groupby(by=subidx[:-1]).sum()      # Exclude 'value', as want to sum over it. It needs to be last in the list!
+            self._dataset = self.dataset.reset_index()
         self.level = level
         #-OpString-#
         update_operations(self, op_string)
 
+    def rollup_productcode_levels(self, levels=[1,2,3], subidx='default', verbose=False):
+        """
+        Aggregate the SITC4 Dataset to multiple product levels in one pass (the dataset attribute is not modified)
+
+        Parameters
+        ----------
+        levels  :   list(int), optional(default=[1,2,3])
+                    SITC Levels (1 to 4)
+        subidx  :   list, optional(default='default')
+                    Index columns. [Default: all columns except 'sitc4', 'value', 'quantity', 'unit', 'dot']
+
+        Returns
+        -------
+        dict(level : pd.DataFrame) with columns subidx + ['sitc#', 'value']
+        """
+        if self.level != 4:
+            raise ValueError("The Dataset must be using SITC level 4 Data")
+        if subidx == 'default':
+            subidx = [item for item in self.dataset.columns if item not in ['sitc4', 'value', 'quantity', 'unit', 'dot']]
+        if verbose: print "[INFO] Aggregating SITC Levels: %s on %s" % (levels, subidx)
+        return rollup_productcodes(self.dataset, subidx, code='sitc4', levels=levels, values=['value'])
+
     def delete_sitc4_issues_with_raw_data(self, verbose=False):
         """
         This method deletes any known issues with the raw_data associated with productcodes
@@ -1735,6 +2180,12 @@ class NBERWTFConstructor(NBERWTF):
         if check_operations(self, op_string): return None
         #-Core-#
         if verbose: print "[INFO] Identifying SITC Codes with A and X"
+        if self._plan is not None:
+            sitcl = 'sitc%s' % self.level
+            self._record().assign(op_string, 'SITCA', lambda df: map_unique(df[sitcl], lambda x: 1 if re.search("[aA]",x) else 0))
+            self._record().assign(op_string, 'SITCX', lambda df: map_unique(df[sitcl], lambda x: 1 if re.search("[xX]",x) else 0))
+            update_operations(self, op_string)
+            return None
         self._dataset['SITCA'] = self._dataset['sitc%s' % self.level].apply(lambda x: 1 if re.search("[aA]",x) else 0)
         self._dataset['SITCX'] = self._dataset['sitc%s' % self.level].apply(lambda x: 1 if re.search("[xX]",x) else 0)
         #-OpString-#
@@ -1758,6 +2209,14 @@ class NBERWTFConstructor(NBERWTF):
         """
         op_string = u"(drop_alpha_productcodes)"
         if check_operations(self, op_string): return None
+        if self._plan is not None:
+            self.identify_alpha_productcodes(verbose=verbose)
+            if verbose: print "[INFO] Dropping SITC Codes with A and X"
+            self._record().filter(op_string, lambda df: (df.SITCA != 1) & (df.SITCX != 1))
+            update_operations(self, op_string)
+            if cleanup:
+                self._record().drop(op_string, ['SITCA', 'SITCX'])
+            return None
         pre_value = self.dataset["value"].sum()
         #-Core-#
         if not check_operations(self, u"(identify_alpha_productcodes)"):
@@ -1882,7 +2341,100 @@ class NBERWTFConstructor(NBERWTF):
     # - Construct Predefined Datasets Wrappers  - #
     # ------------------------------------------- #
     
-    def construct_sitc_dataset(self, data_type, dataset, product_level, sitc_revision=2, report=True, dataset_object=False, special_years="", verbose=True):
+    @property
+    def source_hash(self):
+        """
+        Hash identifying the source data of this object (years, source file signatures and apply_fixes)
+
+        Notes
+        -----
+        1. File signatures use size and modification time (see pyeconlab.util.file_signature)
+        """
+        sources = []
+        for year in self.years:
+            for prefix in [self._fn_prefix, u'china_hk']:
+                fn = self._source_dir + prefix + str(year)[-2:] + self._fn_postfix
+                if os.path.exists(fn):
+                    signature = file_signature(fn, md5=False)
+                    sources.append((os.path.basename(fn), signature['size'], signature['mtime']))
+        return build_key(years=list(self.years), sources=sources, apply_fixes=self._apply_fixes)
+
+    def sitc_dataset_options(self, dataset, product_level, special_years="", verbose=True):
+        """
+        Return the construct_sitcr2 options for a Predefined SITC Dataset at a product level
+
+        Parameters
+        ----------
+        dataset         :   str
+                            Specify Predefined set of Parameters ('A', 'B' etc.)
+        product_level   :   int
+                            Specify a Product Level (1, 2, 3, or 4)
+        special_years   :   str, optional(default="")
+                            Specify Special Year Case for Intertemporal Productcodes Option
+
+        Notes
+        -----
+        1. Loads the China/Hong Kong Supplementary Data if required
+        """
+        from .constructor_dataset import SITC_DATASET_OPTIONS
+        if dataset not in SITC_DATASET_OPTIONS.keys():
+            raise ValueError("Specified Dataset (%s) is not found in the SITC_DATASET_OPTIONS property" % dataset)
+        OPTIONS = dict(SITC_DATASET_OPTIONS[dataset])                       #Copy: SITC_DATASET_OPTIONS is not modified
+        #-Check and add Supplementary Data-#
+        if OPTIONS['adjust_hk'] == True:
+            if not check_operations(self, "load_china_hongkongdata"):
+                self.load_china_hongkongdata(verbose=verbose) #-Load Data with Default Attributes-#
+            OPTIONS['adjust_hk'] = (True, self.supp_data(item='chn_hk_adjust'))
+        else:
+            OPTIONS['adjust_hk'] = (False, None)
+        #-Intertemporal Product Codes-#
+        if OPTIONS['intertemp_productcode']:
+            OPTIONS['intertemp_productcode'] = (True, self._sitc_dataset_intertemporal_productcodes(product_level, special_years))
+        else:
+            OPTIONS['intertemp_productcode'] = (False, None)
+        return OPTIONS
+
+    def _sitc_dataset_intertemporal_productcodes(self, product_level, special_years=""):
+        """ Return the Intertemporal ProductCode Adjustments (drop, collapse, recode) for a product level and special year case """
+        from .meta import IntertemporalProducts
+        if special_years == "":
+            return IntertemporalProducts().IC6200[product_level]
+        elif special_years == "7400":
+            return IntertemporalProducts().IC7400[product_level]
+        elif special_years == "8400":
+            return IntertemporalProducts().IC8400[product_level]
+        raise ValueError("special_years must be '', '7400' or '8400'")
+
+    def _sitc_dataset_build_key(self, data_type, dataset, product_level, sitc_revision, special_years):
+        """ 
+        Build Cache Key for a Predefined SITC Dataset 
+
+        Notes
+        -----
+        1. The key contains the resolved options (including the intertemporal productcode adjustments), the md5 hash of the 
+           construction module (constructor_dataset_sitcr2.py) and meta data (meta/*.py, meta/csv/*.csv) and _build_format
+        2. The China/Hong Kong supplementary data is keyed by its source files (see source_hash)
+        """
+        import pyeconlab
+        from .constructor_dataset import SITC_DATASET_OPTIONS
+        options = dict(SITC_DATASET_OPTIONS[dataset])
+        if options['intertemp_productcode']:
+            options['intertemp_productcode'] = (True, self._sitc_dataset_intertemporal_productcodes(product_level, special_years))
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        files = [os.path.join(this_dir, 'constructor_dataset_sitcr2.py')]
+        for folder in ['meta', os.path.join('meta', 'csv')]:
+            folder = os.path.join(this_dir, folder)
+            files += sorted([os.path.join(folder, fn) for fn in os.listdir(folder) if os.path.splitext(fn)[1] in ['.py', '.csv']])
+        modules = [(os.path.relpath(fn, this_dir), file_signature(fn)['md5']) for fn in files]
+        return build_key(source=self.source_hash, dataset=dataset, product_level=product_level, data_type=data_type, sitc_revision=sitc_revision, 
+                         special_years=special_years, options=options, modules=modules, build_format=self._build_format, version=pyeconlab.__version__)
+
+    @property
+    def build_cache(self):
+        """ On-disk cache of constructed datasets (source_dir/cache/builds/) """
+        return BuildCache(self._source_dir + self.__cache_dir + self.__build_cache_dir)
+
+    def construct_sitc_dataset(self, data_type, dataset, product_level, sitc_revision=2, report=True, dataset_object=False, special_years="", build_cache=False, verbose=True):
         """
         Constructor of Predefined SITC Datasets
 
@@ -1900,6 +2452,16 @@ class NBERWTFConstructor(NBERWTF):
                             Specify if the method should return an nberwtf object
         special_years   :   str, optional(default="")
                             Specify Special Year Case for Intertemporal Productcodes Option
+        build_cache     :   bool, optional(default=False)
+                            Return a previously constructed dataset from the build cache (source_dir/cache/builds/) if available,
+                            otherwise construct the dataset and add it to the build cache.
+                            Builds are keyed by (source_hash, dataset, product_level, data_type, resolved options, construction module and
+                            meta data hashes, build format and package version)
+
+        Notes
+        -----
+        1. If the object was initialised with stream=True the dataset is constructed one year at a time (see construct_sitcr2_by_year)
+           and the report uses the 'World' totals collected while streaming
 
         Future Work
         -----------
@@ -1908,7 +2470,7 @@ class NBERWTFConstructor(NBERWTF):
 
         """
         #-Dataset Definitions-#
-        from .constructor_dataset import SITC_DATASET_DESCRIPTION, SITC_DATASET_OPTIONS
+        from .constructor_dataset import SITC_DATASET_OPTIONS
         #-Checks-#
         if self.operations != "":
             raise ValueError("This Method requires a complete RAW dataset")
@@ -1927,42 +2489,39 @@ class NBERWTFConstructor(NBERWTF):
         self.notes = op_string #-Save Settings-#
         if check_operations(self, op_string): 
             return None
+        #-Build Cache-#
+        df = None
+        if build_cache:
+            key = self._sitc_dataset_build_key(data_type, dataset, product_level, sitc_revision, special_years)
+            df = self.build_cache.get(key, verbose=verbose)
         #-Main Work-#
-        DESCRIPTION = SITC_DATASET_DESCRIPTION[dataset]
-        OPTIONS = SITC_DATASET_OPTIONS[dataset]
-        #-Check and add Supplementary Data-#
-        if OPTIONS['adjust_hk'] == True:
-            if not check_operations(self, "load_china_hongkongdata"):
-                self.load_china_hongkongdata(verbose=verbose) #-Load Data with Default Attributes-#
-            OPTIONS['adjust_hk'] = (True, self.supp_data(item='chn_hk_adjust'))
-        else:
-            OPTIONS['adjust_hk'] = (False, None)
-        #-Intertemporal Product Codes-#
-        if OPTIONS['intertemp_productcode']:
-            from .meta import IntertemporalProducts
-            if special_years == "":
-                ICP = IntertemporalProducts().IC6200[product_level]
-            elif special_years == "7400":
-                ICP = IntertemporalProducts().IC7400[product_level]
-            elif special_years == "8400":
-                ICP = IntertemporalProducts().IC8400[product_level]
-            OPTIONS['intertemp_productcode'] = (True, ICP)
-        else:
-            OPTIONS['intertemp_productcode'] = (False, None)
-        #-Compute Dataset-#
-        self._dataset = construct_dataset(self.dataset, data_type=data_type, level=product_level, verbose=verbose, **OPTIONS)
+        summary = None
+        if df is None:
+            OPTIONS = self.sitc_dataset_options(dataset, product_level, special_years=special_years, verbose=verbose)
+            if self._stream is not None:
+                df, summary = self._construct_sitc_dataset_by_year(data_type, product_level, OPTIONS, verbose=verbose)
+            else:
+                df = construct_dataset(self.dataset, data_type=data_type, level=product_level, verbose=verbose, **OPTIONS)
+            if build_cache:
+                options = {'data_type' : data_type, 'dataset' : dataset, 'product_level' : product_level, 'sitc_revision' : sitc_revision, 'special_years' : special_years}
+                self.build_cache.put(key, df, options=options, verbose=verbose)
+        self._dataset = df
         self.dataset_name = "SITCR2-%s" % dataset
-        #-Restore Original Option-#
-        if type(OPTIONS['adjust_hk']) == tuple:
-            OPTIONS['adjust_hk'] = OPTIONS['adjust_hk'][0]
-        if type(OPTIONS['intertemp_productcode']) == tuple:
-            OPTIONS['intertemp_productcode'] = OPTIONS['intertemp_productcode'][0]
         #-Construct Report-#
         if report:
-            rdf = self.raw_data                                                     #Note: This produces a copy!
-            rdf = rdf.loc[(rdf.importer=="World") & (rdf.exporter == "World")]
-            #-Year Values-#
-            rdfy = rdf.groupby(['year']).sum()['value'].reset_index()
+            if self._stream is not None:
+                if summary is None:                                                 #Dataset from the build cache
+                    values = []
+                    for year in self.years:
+                        rdf = self.read_raw_year(year)
+                        values.append(rdf['value'].values[((rdf.importer == "World") & (rdf.exporter == "World")).values].sum())
+                    summary = pd.DataFrame({'world_value' : values}, index=pd.Index(list(self.years), name='year'))
+                rdfy = summary['world_value'].rename('value').reset_index()
+            else:
+                rdf = self.raw_data                                                 #Note: This produces a copy!
+                rdf = rdf.loc[(rdf.importer=="World") & (rdf.exporter == "World")]
+                #-Year Values-#
+                rdfy = rdf.groupby(['year']).sum()['value'].reset_index()
             dfy = self._dataset.groupby(['year']).sum()['value'].reset_index()
             y = rdfy.merge(dfy, how="outer", on=['year']).set_index(['year'])
             y['%'] = y['value_y'] / y['value_x'] * 100
@@ -1981,6 +2540,61 @@ class NBERWTFConstructor(NBERWTF):
             obj = self.to_nberwtf(data_type=data_type)
             return obj
 
+    def _construct_sitc_dataset_by_year(self, data_type, product_level, OPTIONS, verbose=True):
+        """ Construct a dataset one year at a time from the stream source (see construct_sitcr2_by_year) """
+        from .constructor_dataset_sitcr2 import construct_sitcr2_by_year
+        fix = self.raw_data_fixes if self._apply_fixes else None
+        return construct_sitcr2_by_year(self.read_raw_year, self.years, data_type=data_type, level=product_level, fix=fix, verbose=verbose, **OPTIONS)
+
+    def construct_sitc_dataset_levels(self, data_type, dataset, product_levels=[1,2,3,4], sitc_revision=2, special_years="", build_cache=False, verbose=True):
+        """
+        Construct a Predefined SITC Dataset at multiple product levels from one shared SITC Level 4 intermediate
+
+        The dataset attribute is not modified (see construct_sitc_dataset for Parameters)
+
+        Returns
+        -------
+        dict(product_level : pd.DataFrame)
+
+        Notes
+        -----
+        1. The China/Hong Kong adjustment is computed once (construct_sitcr2_sitc4) rather than once per level 
+           and all product levels are aggregated from it in one pass (rollup_productcodes)
+        2. When streaming each level is constructed year by year (the raw data is read once per level)
+        """
+        if self.operations != "":
+            raise ValueError("This Method requires a complete RAW dataset")
+        if sum(self.years) != 77259:
+            raise ValueError("This Dataset must contain the full range of years to be constructed")
+        if sitc_revision == 2:
+            from .constructor_dataset_sitcr2 import construct_sitcr2 as construct_dataset, construct_sitcr2_sitc4 as construct_intermediate
+        else:
+            raise ValueError("SITC Revision 2 is currently the only implimented revision")
+        datasets = dict()
+        intermediate = None
+        for product_level in product_levels:
+            if build_cache:
+                key = self._sitc_dataset_build_key(data_type, dataset, product_level, sitc_revision, special_years)
+                datasets[product_level] = self.build_cache.get(key, verbose=verbose)
+                if datasets[product_level] is not None:
+                    continue
+            OPTIONS = self.sitc_dataset_options(dataset, product_level, special_years=special_years, verbose=verbose)
+            if self._stream is not None:
+                if verbose: print "[INFO] Constructing Dataset: %s at SITC Level %s (by year)" % (dataset, product_level)
+                datasets[product_level] = self._construct_sitc_dataset_by_year(data_type, product_level, OPTIONS, verbose=verbose)[0]
+            elif intermediate is None:
+                if verbose: print "[INFO] Constructing SITC Level 4 Intermediate Dataset"
+                intermediate = construct_intermediate(self.dataset, adjust_hk=OPTIONS['adjust_hk'], verbose=verbose)
+                levels = rollup_productcodes(intermediate, by=['year', 'exporter', 'importer'], code='sitc4', levels=[level for level in product_levels if level != 4])
+                levels[4] = intermediate
+            if self._stream is None:
+                if verbose: print "[INFO] Constructing Dataset: %s at SITC Level %s" % (dataset, product_level)
+                datasets[product_level] = construct_dataset(levels[product_level], data_type=data_type, level=product_level, sitc4_intermediate=True, verbose=verbose, **OPTIONS)
+            if build_cache:
+                options = {'data_type' : data_type, 'dataset' : dataset, 'product_level' : product_level, 'sitc_revision' : sitc_revision, 'special_years' : special_years}
+                self.build_cache.put(key, datasets[product_level], options=options, verbose=verbose)
+        return datasets
+
     # -------------------------------------------------------------------------------------- #
     # -- NOTICE: With the Addition of construct_sitc_dataset() this section is deprecated -- #
     # -------------------------------------------------------------------------------------- #
@@ -2558,13 +3172,9 @@ class NBERWTFConstructor(NBERWTF):
             self.split_countrycodes(dataset=False, verbose=verbose)
         #-Core-#
         #-Importers-#
-        table_iiso3n = data[['year', 'importer', 'icode', 'iiso3n']].drop_duplicates().set_index(['importer', 'icode', 'year'])
-        table_iiso3n = table_iiso3n.unstack(level='year')
-        table_iiso3n.columns = table_iiso3n.columns.droplevel()     #Removes Unnecessary 'iiso3n' label
+        table_iiso3n = coverage_frame(*coverage_matrix(data, ['importer', 'icode'], column='year', values='iiso3n'), name='year')
         #-Exporters-#
-        table_eiso3n = data[['year', 'exporter', 'ecode', 'eiso3n']].drop_duplicates().set_index(['exporter', 'ecode', 'year'])
-        table_eiso3n = table_eiso3n.unstack(level='year')
-        table_eiso3n.columns = table_eiso3n.columns.droplevel()     #Removes Unnecessary 'eiso3n' label
+        table_eiso3n = coverage_frame(*coverage_matrix(data, ['exporter', 'ecode'], column='year', values='eiso3n'), name='year')
         return table_iiso3n, table_eiso3n
 
     def intertemporal_countrycodes_dataset(self, cid='default', force=False, verbose=False):
@@ -2614,21 +3224,13 @@ class NBERWTFConstructor(NBERWTF):
                 ecid.add(item)
         #-Importers-#
         if verbose: print "[INFO] icid: %s" % list(icid)
-        table_iiso3n = data[['year'] + list(icid)].drop_duplicates()
         icid.remove('iiso3n')                                       #Fill Table with iiso3n data
-        idx = list(icid) + ['year']
-        table_iiso3n = table_iiso3n.set_index(idx)
-        table_iiso3n = table_iiso3n.unstack(level='year')
-        table_iiso3n.columns = table_iiso3n.columns.droplevel()     #Removes Unnecessary 'iiso3n' label
+        table_iiso3n = coverage_frame(*coverage_matrix(data, list(icid), column='year', values='iiso3n'), name='year')
         table_iiso3n.index = table_iiso3n.index.reorder_levels(order=['iiso3c', 'importer', 'icode'])
         #-Exporters-#
         if verbose: print "[INFO] ecid: %s" % list(ecid)
-        table_eiso3n = data[['year'] + list(ecid)].drop_duplicates()
         ecid.remove('eiso3n')
-        idx = list(ecid) + ['year']
-        table_eiso3n = table_eiso3n.set_index(idx)
-        table_eiso3n = table_eiso3n.unstack(level='year')
-        table_eiso3n.columns = table_eiso3n.columns.droplevel()     #Removes Unnecessary 'eiso3n' label
+        table_eiso3n = coverage_frame(*coverage_matrix(data, list(ecid), column='year', values='eiso3n'), name='year')
         table_eiso3n.index = table_eiso3n.index.reorder_levels(order=['eiso3c', 'exporter', 'ecode'])
         return table_iiso3n, table_eiso3n
 
@@ -2636,6 +3238,32 @@ class NBERWTFConstructor(NBERWTF):
     # - Product Codes Meta - #
     # ---------------------- #
 
+    def add_productcode_meta(self, table, source_institution='un'):
+        """
+        Add SITCR2, SITCA and SITCX markers (to the index) and SITCNAME to an intertemporal productcode table
+
+        Markers are computed once for each unique productcode and broadcast to the rows
+
+        Parameters
+        ----------
+        table       :   pd.DataFrame
+                        Table indexed by productcode (i.e. 'sitc4') and optionally a country identifier
+        source_institution  :   str, optional(default='un')
+                                Specify source institution for meta data
+        """
+        sitcl = "sitc%s" % self.level
+        pidx = table.index.names
+        table = table.reset_index()
+        sitc = get_sitc(revision=2, source_institution=source_institution)
+        table['SITCR2'] = sitc.is_official(table[sitcl], level=self.level).astype(np.int64)
+        #-AX IDENTIFIERS-#
+        table['SITCA'] = map_unique(table[sitcl], lambda x: 1 if re.search("[aA]",x) else 0)
+        table['SITCX'] = map_unique(table[sitcl], lambda x: 1 if re.search("[xX]",x) else 0)
+        #-ProductCode Names-#
+        table["SITCNAME"] = sitc.describe(table[sitcl], missing=".")
+        #-Set Index-#
+        return table.set_index(pidx + ['SITCR2', 'SITCA', 'SITCX'])
+
     def intertemporal_productcodes_raw_data(self, force=False, verbose=False):
         """
         Construct a table of productcodes by year
@@ -2656,11 +3284,8 @@ class NBERWTFConstructor(NBERWTF):
             if verbose: print "Running .split_countrycodes() as is required ..."
             self.split_countrycodes(dataset=False, verbose=verbose)
         #-Core-#
-        table_sitc4 = data[['year', 'sitc4']].drop_duplicates()
-        table_sitc4['code'] = 1
-        table_sitc4 = table_sitc4.set_index(['sitc4', 'year']).unstack(level='year')
-        #-Drop TopLevel Name in Columns MultiIndex-#
-        table_sitc4.columns = table_sitc4.columns.droplevel()   #Removes Unnecessary 'code' label
+        keys, years, coverage = coverage_matrix(data, ['sitc4'], column='year')
+        table_sitc4 = coverage_frame(keys, years, coverage, name='year')
         return table_sitc4
 
     def intertemporal_productcodes_dataset(self, tabletype='indicator', meta=True, countries='None', cpidx=True, source_institution='un', level=-1, force=False, verbose=False):
@@ -2702,7 +3327,7 @@ class NBERWTFConstructor(NBERWTF):
     
 
 
-    def intertemporal_productcodes_dataset_indicator(self, meta=True, countries='None', cpidx=True, source_institution='un', force=False, verbose=False):
+    def intertemporal_productcodes_dataset_indicator(self, meta=True, countries='None', cpidx=True, source_institution='un', spells=False, force=False, verbose=False):
         """
         Construct a table of productcodes by year
         This is different to the RAW DATA method as it adds in meta data such as SITC ALPHA MARKERS AND Official SITCR2 Indicator
@@ -2717,9 +3342,15 @@ class NBERWTFConstructor(NBERWTF):
                         <update this>
         source_institution  :   str, optional(default='un')
                                 Specify source institution for meta data
+        spells      :   bool, optional(default=False)
+                        Add FirstYear, LastYear, Gaps and Spells to the Coverage Stats
         force       :   bool, optional(default=False)
                         Force method to be performed on incomplete dataset
 
+        Notes
+        -----
+        1. Coverage is computed from a (keys x years) boolean matrix (see ``coverage_matrix``)
+
         """
         if self.complete_dataset != True:
             if force == False:
@@ -2734,32 +3365,19 @@ class NBERWTFConstructor(NBERWTF):
             idx = ['year', 'importer', sitcl]
         else:
             idx = ['year', sitcl]
-        #-Core-#                                                    
-        table_sitc = data[idx].drop_duplicates()
-        table_sitc['attr'] = 1                                                                                          
-        table_sitc = table_sitc.set_index(idx).unstack(level='year')
-        table_sitc.columns = table_sitc.columns.droplevel()                               #Drop TopLevel Name 'attr' in Columns MultiIndex
+        #-Core-#
+        keys, years, coverage = coverage_matrix(data, idx[1:], column='year')            #(keys x years) Boolean Matrix
+        table_sitc = coverage_frame(keys, years, coverage, name='year')
         #-Add Coverage Stats-#                                                            #Note this isn't classified as meta
         total_coverage = len(table_sitc.columns)
-        table_sitc['Coverage'] = table_sitc.sum(axis=1)
-        table_sitc['%Coverage'] = table_sitc['Coverage'] / total_coverage               
+        stats = coverage_stats(coverage, years, spells=spells)
+        for col in stats.columns:
+            table_sitc[col] = stats[col].values
         #-Add Meta Devider-#
         table_sitc.insert(total_coverage,'META', '|')
         #-Add in Meta for ProductCodes-#
         if meta:
-            #-SITCR2-#
-            pidx = table_sitc.index.names
-            table_sitc = table_sitc.reset_index()
-            sitc = SITC(revision=2, source_institution=source_institution)
-            codes = sitc.get_codes(level=self.level)
-            table_sitc['SITCR2'] = table_sitc[sitcl].apply(lambda x: 1 if x in codes else 0)
-            #-AX IDENTIFIERS-#
-            table_sitc['SITCA'] = table_sitc['sitc%s' % self.level].apply(lambda x: 1 if re.search("[aA]",x) else 0)
-            table_sitc['SITCX'] = table_sitc['sitc%s' % self.level].apply(lambda x: 1 if re.search("[xX]",x) else 0)
-            #-ProductCode Names-#
-            table_sitc["SITCNAME"] = table_sitc['sitc%s' % self.level].apply(lambda x: concord_data(sitc.code_description_dict(), x, issue_error="."))
-            #-Set Index-#
-            table_sitc = table_sitc.set_index(pidx + ['SITCR2', 'SITCA', 'SITCX'])
+            table_sitc = self.add_productcode_meta(table_sitc, source_institution=source_institution)
         if not cpidx and countries in ['exporter', 'importer']:
             if meta:
                 table_sitc = table_sitc.reorder_levels([1,0,2,3,4]).sort_index()                                #Swap Country and Product
@@ -2822,19 +3440,7 @@ class NBERWTFConstructor(NBERWTF):
             #-Coverage Stats-#
             coverage = self.intertemporal_productcodes_dataset_indicator(meta=False, countries=countries, cpidx=cpidx, force=force)[['Coverage', '%Coverage']]
             table_sitc = table_sitc.merge(coverage, left_index=True, right_index=True)
-            #-SITCR2-#
-            pidx = table_sitc.index.names
-            table_sitc = table_sitc.reset_index()
-            sitc = SITC(revision=2, source_institution=source_institution)
-            codes = sitc.get_codes(level=self.level)
-            table_sitc['SITCR2'] = table_sitc[sitcl].apply(lambda x: 1 if x in codes else 0)
-            #-AX IDENTIFIERS-#
-            table_sitc['SITCA'] = table_sitc['sitc%s' % self.level].apply(lambda x: 1 if re.search("[aA]",x) else 0)
-            table_sitc['SITCX'] = table_sitc['sitc%s' % self.level].apply(lambda x: 1 if re.search("[xX]",x) else 0)
-            #-ProductCode Names-#
-            table_sitc["SITCNAME"] = table_sitc['sitc%s' % self.level].apply(lambda x: concord_data(sitc.code_description_dict(), x, issue_error="."))
-            #-Set Index-#
-            table_sitc = table_sitc.set_index(pidx + ['SITCR2', 'SITCA', 'SITCX'])
+            table_sitc = self.add_productcode_meta(table_sitc, source_institution=source_institution)
         if not cpidx and countries in ['exporter', 'importer']:
             if meta:
                 table_sitc = table_sitc.reorder_levels([1,0,2,3,4]).sort_index()                                #Swap Country and Product
@@ -2901,19 +3507,7 @@ class NBERWTFConstructor(NBERWTF):
             #-Coverage-#
             coverage = self.intertemporal_productcodes_dataset_indicator(meta=False, countries=countries, cpidx=True, force=force)[['Coverage', '%Coverage']]   #need cpindex to merge
             table_sitc = table_sitc.merge(coverage, left_index=True, right_index=True)
-            #-SITCR2-#
-            pidx = table_sitc.index.names
-            table_sitc = table_sitc.reset_index()
-            sitc = SITC(revision=2, source_institution=source_institution)
-            codes = sitc.get_codes(level=self.level)
-            table_sitc['SITCR2'] = table_sitc[sitcl].apply(lambda x: 1 if x in codes else 0)
-            #-AX IDENTIFIERS-#
-            table_sitc['SITCA'] = table_sitc['sitc%s' % self.level].apply(lambda x: 1 if re.search("[aA]",x) else 0)
-            table_sitc['SITCX'] = table_sitc['sitc%s' % self.level].apply(lambda x: 1 if re.search("[xX]",x) else 0)
-            #-ProductCode Names-#
-            table_sitc["SITCNAME"] = table_sitc['sitc%s' % self.level].apply(lambda x: concord_data(sitc.code_description_dict(), x, issue_error="."))
-            #-Set Index-#
-            table_sitc = table_sitc.set_index(pidx+['SITCR2', 'SITCA', 'SITCX'])
+            table_sitc = self.add_productcode_meta(table_sitc, source_institution=source_institution)
         if not cpidx and countries in ['exporter', 'importer']:
             if meta:
                 table_sitc = table_sitc.reorder_levels([1,0,2,3,4]).sort_index()                                #Swap Country and Product
@@ -3025,62 +3619,64 @@ class NBERWTFConstructor(NBERWTF):
         cleanup     :   bool, optional(default=True)
                         Cleanup Construction Variables
 
+        Notes
+        -----
+        1. Row level rules are boolean column expressions and group level ("-ING") conditions are computed 
+           once per chapter with groupby(...).transform
+
         """
+        if self.level < 2:
+            raise ValueError("Level Cannot be Less than 2")
         table = self.intertemporal_productcodes_dataset(tabletype=tabletype, meta=True, verbose=verbose)
         idx = list(table.index.names)
         table = table.reset_index()
-        table["NOTSITCR2"] = table["SITCR2"].apply(lambda x: False if x == 1 else True)  #defines sitc revision 2 code
-        if self.level < 2:
-            raise ValueError("Level Cannot be Less than 2")
-        table["sitc%s"%(self.level-1)] = table["sitc%s"%self.level].apply(lambda x: x[0:self.level-1])     #defines higher chapter level
-        #-Group Analysis-#
+        sitcl, sitcg = "sitc%s"%self.level, "sitc%s"%(self.level-1)
+        official = (table["SITCR2"] == 1).values
+        table["NOTSITCR2"] = ~official                                                          #defines sitc revision 2 code
+        table[sitcg] = map_unique(table[sitcl], lambda x: x[0:self.level-1])                    #defines higher chapter level
+        #-Group Analysis (Group Level Conditions are broadcast to each row with transform)-#
+        group = table.groupby(sitcg, sort=False)
         #-Check Any Non SITCR2 in Higher Chapter Level-#
-        indicator = table[["NOTSITCR2","sitc%s"%(self.level-1)]].groupby("sitc%s"%(self.level-1))["NOTSITCR2"].any()              #For Each Higher Chapter Level see if any codes are not SITCR2          
-        indicator.name = "NOTSITCR2-ING"
-        table = table.join(indicator, on="sitc%s"%(self.level-1), how="left")
+        table["NOTSITCR2-ING"] = group["NOTSITCR2"].transform('sum').values > 0              #For Each Higher Chapter Level see if any codes are not SITCR2
         idx.append("NOTSITCR2-ING")
         #-Compute Number of Items in Group-#
-        num_items = table[["SITCR2","sitc%s"%(self.level-1)]].groupby("sitc%s"%(self.level-1))["SITCR2"].count()
-        num_items.name = "SITC-COUNT-ING"
-        table = table.join(num_items, on="sitc%s"%(self.level-1), how="left")
+        table["SITC-COUNT-ING"] = group["SITCR2"].transform('count')
         idx.append("SITC-COUNT-ING")
         #-Compute Number of Non SITCR2 Items in Group-#
-        num_sitcr2 = table[["SITCR2","sitc%s"%(self.level-1)]].groupby("sitc%s"%(self.level-1))["SITCR2"].sum()
-        num_sitcr2.name = "SITCR2-SUM-ING"
-        table = table.join(num_sitcr2, on="sitc%s"%(self.level-1), how="left")
+        table["SITCR2-SUM-ING"] = group["SITCR2"].transform('sum')
         idx.append("SITCR2-SUM-ING")
         table["NUM-NOTSITCR2-ING"] = table["SITC-COUNT-ING"] - table["SITCR2-SUM-ING"]
         idx.append("NUM-NOTSITCR2-ING")
         #-Check if any group members are intertemporally inconsistent-#
-        table["NotIntertempConsistent"] = table["%Coverage"].apply(lambda x: False if x == 1 else True)
-        inconsistent = table[["NotIntertempConsistent", "sitc%s"%(self.level-1)]].groupby("sitc%s"%(self.level-1))["NotIntertempConsistent"].any()
-        inconsistent.name = "NotIntertempConsistent-ING"
-        table = table.join(inconsistent, on="sitc%s"%(self.level-1), how="left")
-        idx.append("NotIntertempConsistent-ING")
+        table["NotIntertempConsistent"] = (table["%Coverage"] != 1).values
         #-Check for Low Value Group Members-#
         if tabletype != "composition":
-            data = self.intertemporal_productcode_simple_adjustments_table(tabletype="composition", verbose=verbose).reset_index()
+            data = self.intertemporal_productcodes_dataset(tabletype="composition", meta=True, verbose=verbose).reset_index()     #Same Row Order as table
         else:
             data = table
         rowavgnorm, rowmax = low_value_settings
-        table["LowValue"] = data[["AvgNorm", "Max"]].apply(lambda row: True if (row["AvgNorm"] < rowavgnorm)&(row["Max"] < rowmax) else False, axis=1)
-        low_value = table[["LowValue", "sitc%s"%(self.level-1)]].groupby("sitc%s"%(self.level-1))["LowValue"].any()
-        low_value.name = "LowValue-ING"
-        table = table.join(low_value, on="sitc%s"%(self.level-1), how="left")
+        lowvalue = (data["AvgNorm"] < rowavgnorm) & (data["Max"] < rowmax)
+        #-Check Official Codes Coverage-#
+        officialnotic = (table["%Coverage"] < 1).values & official
+        #-Any within Group-#
+        flags = pd.DataFrame({"NotIntertempConsistent" : table["NotIntertempConsistent"].values, "LowValue" : lowvalue.reindex(table.index).fillna(False).values, \
+                              "OfficialNotIC" : officialnotic, sitcg : table[sitcg].values}, index=table.index)
+        anying = flags.groupby(sitcg, sort=False).transform('sum') > 0
+        table["NotIntertempConsistent-ING"] = anying["NotIntertempConsistent"]
+        idx.append("NotIntertempConsistent-ING")
+        table["LowValue"] = flags["LowValue"]
+        table["LowValue-ING"] = anying["LowValue"]
         idx.append("LowValue")
         idx.append("LowValue-ING")
-        #-Check Official Codes Coverage-#
-        table["OfficialNotIC"] = table[["SITCR2", "%Coverage"]].apply(lambda row: True if (row["%Coverage"]<1)&(row["SITCR2"]==True) else False , axis=1)
-        officialnotic = table[["OfficialNotIC", "sitc%s"%(self.level-1)]].groupby("sitc%s"%(self.level-1))["OfficialNotIC"].any()
-        officialnotic.name = "OfficialNotIC-ING"
-        table = table.join(officialnotic, on="sitc%s"%(self.level-1), how="left")
+        table["OfficialNotIC"] = flags["OfficialNotIC"]
+        table["OfficialNotIC-ING"] = anying["OfficialNotIC"]
         idx.append("OfficialNotIC")
         idx.append("OfficialNotIC-ING")
         #-Set Index-#
         table = table.set_index(idx)
         if cleanup:
             del table["NOTSITCR2"]
-            del table["sitc%s"%(self.level-1)]
+            del table[sitcg]
             del table["NotIntertempConsistent"]
         return table
 
@@ -3088,53 +3684,56 @@ class NBERWTFConstructor(NBERWTF):
         """
         Return a list of items to Drop and Collapse to Produce an Intertemporally Consistent Set of Codes for NBER
 
+        Parameters
+        ----------
+        tabletype       :   str, optional(default="value")
+                            Table type passed to intertemporal_productcode_simple_adjustments_table()
+        return_table    :   bool, optional(default=False)
+                            Return the rule table with the lists
+        include_special :   tuple(bool, str), optional(default=(True, "6200"))
+                            Integrate the manual special cases in meta.IntertemporalProducts ("6200", "7400" or "8400")
+        value_check     :   tuple(bool, float, float), optional(default=(True, 1, 4))
+                            (apply, rowavgnorm, rowmax) Apply the Low Value Rules (VD, VC, VK)
+        official_coverage : bool, optional(default=True)
+                            Collapse value checked groups that contain official codes that are not intertemporally complete
+
         Returns
         -------
         drop_items, collapse_items
         OR
         drop_items, collapse_items, table
+
+        Notes
+        -----
+        1. When value_check is off the "VC" column is "." for all rows so the official_coverage rule ("JVCOC") and the 
+           "CHECK" marker (which depend on the value check) select no codes
         """
 
-        def all_sitcr2_in_group(df, level, column="VC", indicator="VK"):
-            """ Check to see if non_sitcr2 code is in a chapter group """
-            sitcg = "sitc%s"%(level-1)
-            df[sitcg] = df["sitc%s"%level].apply(lambda x: x[0:level-1])
-            df["ALLSITCR2"] = df["SITCR2"].apply(lambda x: True if x == 1 else 0)
-            columns = [sitcg, "ALLSITCR2", column]
-            result = df[columns].groupby([column, sitcg]).all()                 #Column will split results between VK and VD groups within the chapter definitions
-            #-Cleanup Table-#
-            del df[sitcg]
-            del df["ALLSITCR2"]
-            return result.ix[indicator]
-
-        def check_vc_rule(allsitcr2ing, row):
-            if row["VC"] == "VD":
-                return False
-            #-Parse Other Elements within that Group-#
-            try:
-                return allsitcr2ing.ix[row["sitc%s"%self.level][0:self.level-1]]["ALLSITCR2"]
-            except:
-                return False #SITC Code not in Results Table
- 
+        def codes_where(mask):
+            """ Set of ProductCodes for rows where mask is True """
+            return set(table.loc[mask, sitcl].unique())
+
         #-Core-#
         value_check, rowavgnorm, rowmax = value_check
         include_special, SpecialCase = include_special
         table = self.intertemporal_productcode_simple_adjustments_table(tabletype=tabletype, low_value_settings=(rowavgnorm, rowmax), verbose=verbose)
         idx = list(table.index.names)
         table = table.reset_index()
+        sitcl = "sitc%s"%self.level
         #-Drop-#
-        table["D"] = (table["SITC-COUNT-ING"] - table["NUM-NOTSITCR2-ING"]).apply(lambda x: "D" if x == 0 else ".")
-        drop_items = set(table.loc[table.D == "D"]["sitc%s"%self.level].unique())
+        table["D"] = np.where((table["SITC-COUNT-ING"] - table["NUM-NOTSITCR2-ING"]) == 0, "D", ".")
+        drop_items = codes_where(table.D == "D")
         #-Collapse-#
         #-Collapse Items that contain non official SITC R2 Codes within the SITC group to higher chapter level-#
-        table["C"] = table["NOTSITCR2-ING"].apply(lambda x: "C" if x == True else ".")
-        collapse_items = set(table.loc[table.C == "C"]["sitc%s"%self.level].unique())
+        table["C"] = np.where(table["NOTSITCR2-ING"] == True, "C", ".")
+        collapse_items = codes_where(table.C == "C")
         #-Itertemporal Check-#
         #-Collapse Items that have productcodes within the SITC group that are intertemporally incomplete-#
-        table["IC"] = table["NotIntertempConsistent-ING"].apply(lambda x: "IC" if x == True else ".")        #Post 1974 and 1984 the products should not get dropped according to this rule (Check this!)
-        table["IC"] = table[["SITC-COUNT-ING", "NotIntertempConsistent-ING", "IC"]].apply(lambda row: "ID" if (row["SITC-COUNT-ING"] == 1) & (row["NotIntertempConsistent-ING"]) else row["IC"] , axis=1)
-        intertemp_collapse_items = set(table.loc[table.IC == "IC"]["sitc%s"%self.level].unique())
-        intertemp_drop_items = set(table.loc[table.IC == "ID"]["sitc%s"%self.level].unique())
+        notic = (table["NotIntertempConsistent-ING"] == True).values
+        table["IC"] = np.where(notic, "IC", ".")                                                  #Post 1974 and 1984 the products should not get dropped according to this rule (Check this!)
+        table.loc[(table["SITC-COUNT-ING"] == 1).values & notic, "IC"] = "ID"
+        intertemp_collapse_items = codes_where(table.IC == "IC")
+        intertemp_drop_items = codes_where(table.IC == "ID")
         if verbose:
             print "[INFO] Dropping Items becuase they cannot be collapsed ..."
             print drop_items
@@ -3149,16 +3748,21 @@ class NBERWTFConstructor(NBERWTF):
         collapse_items = collapse_items.union(intertemp_collapse_items).difference(drop_items)                            #Can be Overlap based on Identifying Rules
         if value_check:
             #-Value Check-#
-            table["VC"] = table[["SITCR2", "LowValue"]].apply(lambda row: "VD" if (row["LowValue"] == True)&(row["SITCR2"]==False) else ".", axis=1)
-            #table["VC"] = table[["LowValue-ING", "VC"]].apply(lambda row: "VK" if (row["LowValue-ING"])&(row["VC"]!="VD") else row["VC"], axis=1) #This might not be a 100% reliable so undertake a Manual Review of these items. This requires checking if there are still nonsitr2 codes or significant intertemp inconsistent lines
-            table["VC"] = table[["LowValue-ING", "VC"]].apply(lambda row: "VC" if (row["LowValue-ING"])&(row["VC"]!="VD") else row["VC"], axis=1) #This might not be a 100% reliable so undertake a Manual Review of these items. This requires checking if there are still nonsitr2 codes or significant intertemp inconsistent lines
-            #-Keep Adjustments-#
-            allsitcr2ing = all_sitcr2_in_group(table, level=self.level, column="VC", indicator="VC")
-            table["VC"] = table[["sitc%s"%self.level, "VC"]].apply(lambda row: "VK" if check_vc_rule(allsitcr2ing, row) == True else row["VC"], axis=1)
+            official = (table["SITCR2"] == 1).values
+            vd = (table["LowValue"] == True).values & (table["SITCR2"] == False).values
+            table["VC"] = np.where(vd, "VD", ".")
+            #table.loc[(table["LowValue-ING"] == True).values & ~vd, "VC"] = "VK" #This might not be a 100% reliable so undertake a Manual Review of these items. This requires checking if there are still nonsitr2 codes or significant intertemp inconsistent lines
+            table.loc[(table["LowValue-ING"] == True).values & ~vd, "VC"] = "VC" #This might not be a 100% reliable so undertake a Manual Review of these items. This requires checking if there are still nonsitr2 codes or significant intertemp inconsistent lines
+            #-Keep Adjustments (All 'VC' Codes in the SITC Group are SITCR2)-#
+            isvc = (table["VC"] == "VC").values
+            chapter = map_unique(table[sitcl], lambda x: x[0:self.level-1]).values
+            group = pd.DataFrame({"VC" : isvc, "NOTSITCR2" : isvc & ~official}, index=table.index).groupby(chapter, sort=False).transform('sum')
+            allsitcr2ing = (group["VC"] > 0).values & (group["NOTSITCR2"] == 0).values
+            table.loc[allsitcr2ing & ~vd, "VC"] = "VK"
             #-Set's-#
-            value_collapse_items = set(table.loc[table.VC == "VC"]["sitc%s"%self.level].unique())
-            value_keep_items = set(table.loc[table.VC == "VK"]["sitc%s"%self.level].unique())
-            value_drop_items = set(table.loc[table.VC == "VD"]["sitc%s"%self.level].unique())
+            value_collapse_items = codes_where(table.VC == "VC")
+            value_keep_items = codes_where(table.VC == "VK")
+            value_drop_items = codes_where(table.VC == "VD")
             if verbose:
                 print "[INFO] Dropping Items due to insignificant values ..."
                 print value_drop_items
@@ -3167,11 +3771,13 @@ class NBERWTFConstructor(NBERWTF):
             #-Adjust-#
             drop_items = drop_items.union(value_drop_items) - value_keep_items
             collapse_items = collapse_items.union(value_collapse_items) - value_keep_items - value_drop_items
+        else:
+            table["VC"] = "."
         if official_coverage:
             #-Check Official Codes that don't have complete intertemporal coverage-#
-            table["OC"] = table["OfficialNotIC-ING"].apply(lambda x: "OC" if x else ".")
-            table["JVCOC"] = table[["VC", "OC"]].apply(lambda row: "OC" if (row["VC"]!=".")&(row["OC"]=="OC") else ".", axis=1)
-            official_coverage_collapse = set(table.loc[table.JVCOC == "OC"]["sitc%s"%self.level].unique())
+            table["OC"] = np.where(table["OfficialNotIC-ING"] == True, "OC", ".")
+            table["JVCOC"] = np.where((table["VC"] != ".").values & (table["OC"] == "OC").values, "OC", ".")
+            official_coverage_collapse = codes_where(table.JVCOC == "OC")
             #-Adjust-#
             drop_items = drop_items - official_coverage_collapse
             collapse_items = collapse_items.union(official_coverage_collapse)
@@ -3197,10 +3803,10 @@ class NBERWTFConstructor(NBERWTF):
                 special_keep = set(IntertemporalProducts().IC8400SpecialCases["L%s"%self.level]["keep"])
                 recode = IntertemporalProducts().IC8400SpecialCases["L%s"%self.level]["recode"]                     #Dictionary            
             special_recode = set(recode.keys())
-            table["SP"] = table["sitc%s"%self.level].apply(lambda x: "SK" if x in special_keep else ".")
-            table["SP"] = table[["sitc%s"%self.level,"SP"]].apply(lambda row: "SC" if row["sitc%s"%self.level] in special_collapse else row["SP"], axis=1)
-            table["SP"] = table[["sitc%s"%self.level,"SP"]].apply(lambda row: "SD" if row["sitc%s"%self.level] in special_drop else row["SP"], axis=1)
-            table["SP"] = table[["sitc%s"%self.level,"SP"]].apply(lambda row: "SR" if row["sitc%s"%self.level] in special_recode else row["SP"], axis=1)
+            codes = table[sitcl]
+            table["SP"] = "."
+            for rule, items in [("SK", special_keep), ("SC", special_collapse), ("SD", special_drop), ("SR", special_recode)]:       #Later Rules take Preference
+                table.loc[codes.isin(items).values, "SP"] = rule
             if verbose: 
                 print "[INFO] Integrating Special Requests ..."
                 print "special_drop = %s" % special_drop
@@ -3211,13 +3817,16 @@ class NBERWTFConstructor(NBERWTF):
             drop_items = drop_items.union(special_drop) - special_keep - special_recode
             collapse_items = collapse_items.union(special_collapse) - special_keep - special_drop - special_recode
         #-Final Rule-#
+        codes = table[sitcl]
         table["RULE"] = "K"     #Default Rule
-        table["RULE"] = table[["sitc%s"%self.level,"RULE"]].apply(lambda row: "C" if row["sitc%s"%self.level] in collapse_items else row["RULE"], axis=1)
+        table.loc[codes.isin(collapse_items).values, "RULE"] = "C"
         if include_special:
-            table["RULE"] = table[["sitc%s"%self.level,"RULE"]].apply(lambda row: "R(%s)"%recode[row["sitc%s"%self.level]] if row["sitc%s"%self.level] in special_recode else row["RULE"], axis=1)    
-        table["RULE"] = table[["sitc%s"%self.level,"RULE"]].apply(lambda row: "D" if row["sitc%s"%self.level] in drop_items else row["RULE"], axis=1)
+            recoded = codes.isin(special_recode).values
+            if recoded.any():
+                table.loc[recoded, "RULE"] = map_unique(codes[recoded], lambda x: "R(%s)"%recode[x]).astype(object)
+        table.loc[codes.isin(drop_items).values, "RULE"] = "D"
         warnings.warn("This requires a manual check in the event some K's should in fact be C due to the presence of nested within group SITCR2")
-        table["CHECK"] = table[["C", "VC", "RULE"]].apply(lambda row: "<-- CHECK" if (row["VC"]=="VK")&(row["C"]=="C") else "", axis=1)
+        table["CHECK"] = np.where((table["VC"] == "VK").values & (table["C"] == "C").values, "<-- CHECK", "")
         #-Sortedness-#
         drop_items = sorted(drop_items)
         collapse_items = sorted(collapse_items)
@@ -3312,34 +3921,19 @@ class NBERWTFConstructor(NBERWTF):
         idxnames = comp.index.names
         colnames = comp.columns
         comp = comp.reset_index()
-        comp['SITCL3'] = comp['sitc4'].apply(lambda x: str(x)[:3])
-        comp['4D'] = comp['sitc4'].apply(lambda x: str(x)[3:])           
+        comp['SITCL3'] = map_unique(comp['sitc4'], lambda x: str(x)[:3])
+        comp['4D'] = map_unique(comp['sitc4'], lambda x: str(x)[3:])
         # comp = comp.loc[(comp.SITCL3 == '011') | (comp.SITCL3 == '025')]  #Test Filter. Think about special cases when remove
-        r = pd.DataFrame()
-        for idx, df in comp.groupby(by=['SITCL3']):
-            s1 = df[['SITCR2', '%Coverage']].groupby(by=['SITCR2']).mean()['%Coverage'] #Average Coverage Within SITCL3
-            try: 
-                avg_official_coverage = s1[1]
-            except: 
-                avg_official_coverage = 0
-            try:
-                avg_notofficial_coverage = s1[0]
-            except:
-                avg_notofficial_coverage = 0
-            s2 = df[['SITCR2', 'Avg']].groupby(by=['SITCR2']).sum()['Avg']
-            try:
-                comp_official = s2[1]
-            except:
-                comp_official = 0
-            try:
-                comp_notofficial = s2[0]
-            except: 
-                comp_notofficial = 0
-            if avg_official_coverage > 0.95 and comp_official >0.95:
-                df['ACTION'] = df['SITCR2'].apply(lambda x: 'K' if x == 1 else 'D')              #Keep Offical Codes, Delete Unofficial
-            else:
-                df['ACTION'] = 'C' # Collapse ALL Codes
-            r = r.append(df[list(idxnames)+list(colnames)+['ACTION']])
+        #-Group Level Conditions within each SITCL3 Group-#
+        official = (comp['SITCR2'] == 1).values
+        group = pd.DataFrame({'coverage' : comp['%Coverage'].where(official), 'comp' : comp['Avg'].where(official)}, index=comp.index).groupby(comp['SITCL3'].values, sort=False)
+        avg_official_coverage = group['coverage'].transform('mean').fillna(0).values                       #Average Coverage of Official Codes Within SITCL3
+        comp_official = group['comp'].transform('sum').fillna(0).values
+        keepdrop = (avg_official_coverage > 0.95) & (comp_official > 0.95)
+        comp['ACTION'] = np.where(keepdrop, np.where(official, 'K', 'D'), 'C')                                  #Keep Offical Codes, Delete Unofficial OR Collapse ALL Codes
+        #-Order by SITCL3 Group-#
+        r = comp.iloc[np.argsort(comp['SITCL3'].astype(str).values, kind='mergesort')]
+        r = r[list(idxnames)+list(colnames)+['ACTION']]
         r = r.set_index(list(idxnames))
         return r
 
@@ -3403,37 +3997,64 @@ class NBERWTFConstructor(NBERWTF):
     # - Converters - #
     # -------------- #
 
-    def convert_stata_to_hdf_yearindex(self, format='table', verbose=True):
+    def convert_stata_to_hdf_yearindex(self, format='table', complevel=9, complib='zlib', workers=None, verbose=True):
         """
         Convert the Raw Stata Source Files to a HDF File Container indexed by Y#### (where #### = year)
 
-        ..  Future Work
-            -----------
-            1. Integrity Checking against original dta file hash?
-            2. Move this to a Utility?
-            3. Is there a way to make this work across 4 cores writing separate container names? 
-                May require separate h5 files
+        Parameters
+        ----------
+        format      :   str, optional(default='table')
+                        Specify HDF File type
+        complevel   :   int, optional(default=9)
+        complib     :   str, optional(default='zlib')
+                        Compression library ('blosc' is much faster to write)
+        workers     :   int, optional(default=None)
+                        Number of processes used to read the dta files (Default: min(#years, cpu_count, 4))
+
+        Notes
+        -----
+        1. A manifest (hdf_fn + '.manifest.json') records rows, column hashes and the dta file signature
+           for each year (see check_cache(check="manifest"))
+        2. dta files are read (and hashed) in a process pool and the container is written atomically (see pyeconlab.util.HDFYearIndexWriter)
 
         """
-        #Note: This might write into a dataset!
         years = self._available_years
         hdf_fn = self._source_dir + self.__cache_dir + self._fn_prefix + str(years[0])[-2:] + '-' + str(years[-1])[-2:] + '_yearindex' + '.h5'     
         pd.set_option('io.hdf.default_format', format)
-        hdf = pd.HDFStore(hdf_fn, complevel=9, complib='zlib')
-        self.__raw_data_hdf_yearindex = hdf                                     #SHould this be a filename rather than a Container?
+        self.__raw_data_hdf_yearindex = hdf_fn
+        items = [(year, self._source_dir + self._fn_prefix + str(year)[-2:] + self._fn_postfix) for year in years]
+        if verbose: print "[INFO] Converting %s dta files to file: %s" % (len(items), hdf_fn)
+        writer = HDFYearIndexWriter(hdf_fn, format=format, complevel=complevel, complib=complib, manifest=True)
+        writer.convert(pd.read_stata, items, pool='process', workers=workers, verbose=verbose)
+        gc.collect()
 
-        #-Convert Files -#                  
-        for year in self._available_years:
+
+    def convert_raw_data_to_columnar(self, cache_format='npy', verbose=True):
+        """
+        Convert the RAW Data to the Year Partitioned Columnar Cache (cache/wtf62-00_columnar/)
+
+        Parameters
+        ----------
+        cache_format    :   str, optional(default='npy')
+                            Registered Cache Format (pyeconlab.util.cache.CACHE_FORMATS)
+
+        Notes
+        -----
+        1. Only the years in self.__raw_data are written (existing partitions for other years are kept)
+        """
+        cache_dir = self._source_dir + self.__cache_dir
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        cache = get_cache(cache_dir + self.__raw_data_columnar_dir, format=cache_format)
+        sources = dict()
+        for year in self.__raw_data['year'].unique():
             dta_fn = self._source_dir + self._fn_prefix + str(year)[-2:] + self._fn_postfix
-            if verbose: print "Converting file: %s to file: %s" % (dta_fn, hdf_fn)
-            #pd.read_stata(dta_fn).to_hdf(hdf_fn, 'Y'+str(year))
-            hdf.put('Y'+str(year), pd.read_stata(dta_fn), format=format)
-            
-        print hdf
-        hdf.close()
+            if os.path.exists(dta_fn):
+                sources[year] = [dta_fn]
+        if verbose: print "[INFO] Writing RAW DATA to %s" % cache.path
+        cache.write(self.__raw_data, partition='year', sources=sources, verbose=verbose)
         gc.collect()
 
-
     def convert_raw_data_to_hdf(self, format='table', verbose=True):
         """
         Convert the Entire RAW Data Compilation to a HDF File with index 'raw_data'
@@ -3443,18 +4064,30 @@ class NBERWTFConstructor(NBERWTF):
         format  :   str, optional(default='table')
                     Specify HDF File type
 
+        Notes
+        -----
+        1. A manifest (hdf_fn + '.manifest.json') records rows, column hashes and the dta file signature
+           for each year (see validate_hdf_cache)
+
         ..  Future Work
             -----------
-            1. Integrity Checking against original dta file hash?
-            2. Move this to a Utility?
+            1. Move this to a Utility?
 
         """
         years = self._available_years
         hdf_fn = self._source_dir + self.__cache_dir + self._fn_prefix + str(years[0])[-2:] + '-' + str(years[-1])[-2:] +  '_raw' + '.h5'
+        if os.path.exists(hdf_fn + '.manifest.json'):
+            os.remove(hdf_fn + '.manifest.json')                                #Written again once the data is written
         hdf = pd.HDFStore(hdf_fn, complevel=9, complib='zlib')
         hdf.put('raw_data', self.__raw_data, format=format)
         if verbose: print hdf
         hdf.close()
+        #-Manifest-#
+        manifest = {'format' : 'hdf', 'key' : 'raw_data', 'partition' : 'year', 'partitions' : {}}
+        for year, df in partition_frame(self.__raw_data):
+            fn = self._source_dir + self._fn_prefix + str(year)[-2:] + self._fn_postfix
+            manifest['partitions'][str(year)] = frame_manifest_entry(df, sources=[fn] if os.path.exists(fn) else None)
+        write_json(hdf_fn + '.manifest.json', manifest)
         gc.collect()
 
     #---------#
@@ -26,18 +26,165 @@ Current Country RECODES adjust for all timeperiods using 1962 to 2000 meta data!
 
 #-Library Imports-#
 import re
+import gc
 import warnings
+import numpy as np
+import pandas as pd
 #-Package Imports-#
-from pyeconlab.trade.classification import SITC
-from pyeconlab.util import concord_data, merge_columns
+from pyeconlab.trade.classification import get_sitc
+from pyeconlab.util import concord_data, concord_series, merge_columns, map_unique, groupby_sum, keyed_update, union_categories, is_categorical
 #-Relative Imports-#
 from .meta import countryname_to_iso3c, iso3c_recodes_for_1962_2000, incomplete_iso3c_for_1962_2000 
 
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+#-Intertemporal ProductCode Functions -#
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+
+def compile_intertemporal_productcodes(IC, level):
+    """
+    Compile an Intertemporal Product Code System into a single (drop, collapse, recode) specification
+
+    Parameters
+    ----------
+    IC      :   dict
+                Intertemporal Product Code Dictionary (IC["drop"] = [], IC["collapse"] = [], IC["recode"] = {})
+    level   :   int
+                SITC Level of the codes 
+
+    Returns
+    -------
+    (drop, collapse, recode) :  (set, set, dict)
+                                collapse contains the level-1 prefixes and recode chains are resolved (i.e. a->b, b->c => a->c)
+    """
+    drop = set(IC["drop"])
+    collapse = {x[0:level-1] for x in IC["collapse"]}
+    recodes = IC.get("recode", {})
+    recode = dict()
+    for code in recodes.keys():
+        target = recodes[code]
+        for step in xrange(len(recodes)-1):                     #Chains are limited to the number of recodes (cycle guard)
+            if target not in recodes:
+                break
+            target = recodes[target]
+        recode[code] = target
+    return drop, collapse, recode
+
+def apply_intertemporal_productcodes(codes, compiled, level):
+    """
+    Apply a compiled Intertemporal Product Code System to a Series of product codes
+
+    The mapping is evaluated once for each unique code and broadcast back to the rows
+
+    Parameters
+    ----------
+    codes       :   pd.Series
+                    Product Codes
+    compiled    :   tuple
+                    Output of ``compile_intertemporal_productcodes``
+    level       :   int
+                    SITC Level of the codes
+
+    Returns
+    -------
+    (keep, labels, uniques)     :   keep is a boolean row mask (drop codes), labels are integer codes (into uniques)
+                                    of the new product codes for each row
+    """
+    drop, collapse, recode = compiled
+    labels, uniques = pd.factorize(codes)
+    new = []
+    for code in uniques:
+        prefix = code[0:level-1]
+        if prefix in collapse:
+            code = prefix
+        new.append(recode.get(code, code))
+    keep_unique = np.array([code not in drop for code in uniques] + [False], dtype=bool)   #Missing codes are labelled -1
+    keep = keep_unique.take(labels)
+    new_labels, new_uniques = pd.factorize(pd.Series(new + [np.nan]), sort=True)          #Sorted so integer order matches code order
+    labels = new_labels.take(labels)
+    return keep, labels, np.asarray(new_uniques, dtype=object)
+
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 #-Generalised SC Constructor Functions-#
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 
-def construct_sitcr2(df, data_type, level, AX=True, dropAX=True, sitcr2=True, drop_nonsitcr2=True, adjust_hk=(False, None), intertemp_productcode=(False, None), intertemp_cntrycode=False, drop_incp_cntrycode=False, adjust_units=False, source_institution='un', harmonised_raw=False, values_only=False, verbose=True):
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+#-China Hong Kong Adjustment Functions    -#
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+
+def adjust_china_hongkong(df, hkdata, update={'value' : 'value_adj'}, verbose=True):
+    """
+    Replace/Adjust China and Hong Kong Data using the NBER supplementary (CHINA_HK) data
+
+    Rows are matched on ['year', 'icode', 'importer', 'ecode', 'exporter', 'sitc4', 'unit', 'dot'] using a packed integer key 
+    (see pyeconlab.util.keyed_update) for the years in hkdata. Years that are not in hkdata are not modified
+
+    Parameters
+    ----------
+    df          :   DataFrame
+                    Raw Data
+    hkdata      :   DataFrame
+                    China/Hong Kong Supplementary Data
+    update      :   dict, optional(default={'value' : 'value_adj'})
+                    Columns in df to update with columns in hkdata
+
+    Returns
+    -------
+    DataFrame [idx + columns in update]
+
+    Notes
+    -----
+    1. Unmatched rows in hkdata are added to the data (consistent with merge_columns(dominant='right'))
+    2. Rows keep their order in df and the new rows from hkdata follow (the row order of merge_columns(dominant='right'))
+    3. Duplicate keys in hkdata are summed with a warning. merge_columns(dominant='right') returned a row for each duplicate
+       which gives the same totals once the data is aggregated
+    """
+    idx = [u'year', u'icode', u'importer', u'ecode', u'exporter', u'sitc4', u'unit', u'dot']
+    columns = idx + [col for col in df.columns if col in update]
+    try:
+        hkdata = hkdata[idx + sorted(set(update.values()))]
+    except:
+        raise ValueError("[ERROR] China/Hong Kong Data has not been passed in properly!")
+    df = df[columns].reset_index(drop=True)
+    adjust = np.flatnonzero(df['year'].isin(set(hkdata['year'].unique())).values)
+    if verbose: print "[INFO] Adjusting China/Hong Kong Data for years: %s" % sorted(hkdata['year'].unique())
+    updated = keyed_update(df.iloc[adjust], hkdata, on=idx, update=update, duplicates='sum', verbose=verbose)     #LEFT rows come first (in order)
+    df = df.copy()
+    for col in update.keys():
+        values = df[col].values.astype(np.result_type(df[col].values, updated[col].values))
+        values[adjust] = updated[col].values[:len(adjust)]
+        df[col] = values
+    return pd.concat([df, updated.iloc[len(adjust):]], ignore_index=True)
+
+def construct_sitcr2_sitc4(df, adjust_hk=(False, None), verbose=True):
+        """
+        Construct the SITC Level 4 intermediate dataset used by construct_sitcr2 (Operations Requiring RAW SITC Level 4)
+
+        This can be computed once and passed to construct_sitcr2(sitc4_intermediate=True) to construct multiple product levels
+
+        Parameters
+        ----------
+        df                  :   DataFrame
+                                Pandas DataFrame containing the raw data
+        adjust_hk           :   Tuple(bool, df), optional(default=(False, None))
+                                Adjust the Hong Kong Data using NBER supplemental files which needs to be supplied as a dataframe
+
+        Returns
+        -------
+        DataFrame ['year', 'exporter', 'importer', 'sitc4', 'value']
+        """
+        #-Hong Kong China Data Adjustment Option-#
+        if type(adjust_hk) == bool:
+            adjust_hk = (adjust_hk, None)
+        if adjust_hk[0]:
+            if verbose: print "[INFO] Adjusting Hong Kong and China Values"
+            df = adjust_china_hongkong(df, adjust_hk[1], update={'value' : 'value_adj'}, verbose=verbose)
+            #-Note: Adjust Quantity has not been implemented. See NBERWTF constructor -#
+
+        #-Filter Data-#
+        idx = [u'year', u'exporter', u'importer', u'sitc4']         #Note: This collapses duplicate entries with unit differences (collapse_valuesonly())
+        return df.loc[:,idx + ['value']]
+
+def construct_sitcr2(df, data_type, level, AX=True, dropAX=True, sitcr2=True, drop_nonsitcr2=True, adjust_hk=(False, None), intertemp_productcode=(False, None), intertemp_cntrycode=False, drop_incp_cntrycode=False, adjust_units=False, source_institution='un', harmonised_raw=False, values_only=False, sitc4_intermediate=False, verbose=True):
         """
         Construct a Self Contained (SC) Direct Action Dataset for Countries at the SITC Revision 2 Level 3
         
@@ -79,6 +226,9 @@ def construct_sitcr2(df, data_type, level, AX=True, dropAX=True, sitcr2=True, dr
                                 Return simple RAW dataset with Quantity disaggregation collapsed and eiso3c and iiso3c columns (Note: You may use hk_adjust with this option)
         values_only         :   bool, optional(default=False)
                                 Return Values and Relevant Index Data Only (i.e. drop 'AX', 'sitcr2')
+        sitc4_intermediate  :   bool, optional(default=False)
+                                df is the output of construct_sitcr2_sitc4() (adjust_hk is ignored as it has already been applied)
+                                or the corresponding level of rollup_productcodes(construct_sitcr2_sitc4(), by=['year', 'exporter', 'importer'])
 
         Notes
         -----
@@ -112,44 +262,34 @@ def construct_sitcr2(df, data_type, level, AX=True, dropAX=True, sitcr2=True, dr
         #-Operations Requiring RAW SITC Level 4-#
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 
-        idx = [u'year', u'icode', u'importer', u'ecode', u'exporter', u'sitc4', u'unit', u'dot']
-
-        #-Hong Kong China Data Adjustment Option-#
-        if type(adjust_hk) == bool:
-            adjust_hk = (adjust_hk, None)
-        if adjust_hk[0]:
-            if verbose: print "[INFO] Adjusting Hong Kong and China Values"
-            hkdata = adjust_hk[1]
-            #-Values-#
-            raw_value = df[idx+['value']].rename(columns={'value' : 'value_raw'})
-            try:
-                adjust_value = hkdata[idx+['value_adj']]
-            except:
-                raise ValueError("[ERROR] China/Hong Kong Data has not been passed in properly!")
-            #-Note: Current merge_columns utility merges one column set at a time-# 
-            df = merge_columns(raw_value, adjust_value, idx, collapse_columns=('value_raw', 'value_adj', 'value'), dominant='right', output='final', verbose=verbose)
-            #-Note: Adjust Quantity has not been implemented. See NBERWTF constructor -#
-
-        #-Filter Data-#
-        idx = [u'year', u'exporter', u'importer', u'sitc4']         #Note: This collapses duplicate entries with unit differences (collapse_valuesonly())
-        df = df.loc[:,idx + ['value']]
+        idx = [u'year', u'exporter', u'importer', u'sitc4']
+        collapsed = False
+        if sitc4_intermediate:
+            if level != 4 and 'sitc%s'%level in df.columns:                 #Already collapsed using rollup_productcodes()
+                idx = [u'year', u'exporter', u'importer', u'sitc%s'%level]
+                collapsed = True
+            df = df.loc[:,idx + ['value']]                          #Copy as the intermediate may be shared across levels
+        else:
+            df = construct_sitcr2_sitc4(df, adjust_hk=adjust_hk, verbose=verbose)
 
         #-Raw Trade Data Option with Added IISO3C and EISO3C-#
         if harmonised_raw and data_type == "trade":
-            df = df.groupby(idx).sum().reset_index()                              #Sum Over Quantity Disaggregations
+            df = groupby_sum(df, idx)                              #Sum Over Quantity Disaggregations
             #-Add EISO3C and IISO3C-#
-            df['eiso3c'] = df['exporter'].apply(lambda x: countryname_to_iso3c[x])
-            df['iiso3c'] = df['importer'].apply(lambda x: countryname_to_iso3c[x])
+            df['eiso3c'] = map_unique(df['exporter'], lambda x: countryname_to_iso3c[x])
+            df['iiso3c'] = map_unique(df['importer'], lambda x: countryname_to_iso3c[x])
             return df
         if harmonised_raw and data_type in {"export", "import"}:
             warnings.warn("Cannot run harmonised_raw over export and import data as raw data is trade data")
             return None
 
         #-Collapse to SITC Level -#
-        if level != 4:
+        if collapsed:
+            if verbose: print "[INFO] Data has been collapsed to SITC Level %s" % level
+        elif level != 4:
             if verbose: print "[INFO] Collapsing to SITC Level %s Data" % level
-            df['sitc%s'%level] = df.sitc4.apply(lambda x: x[0:level])
-            df = df.groupby(['year', 'exporter', 'importer', 'sitc%s'%level]).sum()['value'].reset_index()
+            df['sitc%s'%level] = map_unique(df['sitc4'], lambda x: x[0:level])
+            df = groupby_sum(df, ['year', 'exporter', 'importer', 'sitc%s'%level], ['value'])
         elif level == 4:
             if verbose: print "[INFO] Data is already at the requested level"
         else:
@@ -166,22 +306,22 @@ def construct_sitcr2(df, data_type, level, AX=True, dropAX=True, sitcr2=True, dr
         #-Exports (can include NES on importer side)-#
         if data_type == 'export' or data_type == 'exports':
             if verbose: print "[INFO] Adding eiso3c using nber meta data"
-            df['eiso3c'] = df.exporter.apply(lambda x: countryname_to_iso3c[x])
+            df['eiso3c'] = map_unique(df['exporter'], lambda x: countryname_to_iso3c[x])
             df = df.loc[(df.eiso3c != '.')]
-            df = df.groupby(['year', 'eiso3c', 'sitc%s'%level]).sum()['value'].reset_index()
+            df = groupby_sum(df, ['year', 'eiso3c', 'sitc%s'%level], ['value'])
         #-Imports (can include NES on importer side)-#
         elif data_type == 'import' or data_type == 'imports':
             if verbose: print "[INFO] Adding iiso3c using nber meta data"
-            df['iiso3c'] = df.importer.apply(lambda x: countryname_to_iso3c[x])
+            df['iiso3c'] = map_unique(df['importer'], lambda x: countryname_to_iso3c[x])
             df = df.loc[(df.iiso3c != '.')]
-            df = df.groupby(['year','iiso3c', 'sitc%s'%level]).sum()['value'].reset_index()
+            df = groupby_sum(df, ['year','iiso3c', 'sitc%s'%level], ['value'])
         #-Trade-#
         else: 
             if verbose: print "[INFO] Adding eiso3c and iiso3c using nber meta data"
-            df['iiso3c'] = df.importer.apply(lambda x: countryname_to_iso3c[x])
-            df['eiso3c'] = df.exporter.apply(lambda x: countryname_to_iso3c[x])
+            df['iiso3c'] = map_unique(df['importer'], lambda x: countryname_to_iso3c[x])
+            df['eiso3c'] = map_unique(df['exporter'], lambda x: countryname_to_iso3c[x])
             df = df.loc[(df.iiso3c != '.') & (df.eiso3c != '.')]
-            df = df.groupby(['year', 'eiso3c', 'iiso3c', 'sitc%s'%level]).sum()['value'].reset_index()
+            df = groupby_sum(df, ['year', 'eiso3c', 'iiso3c', 'sitc%s'%level], ['value'])
         
         #-Remove Product Code Errors in Dataset-#
         df = df.loc[(df['sitc%s'%level] != "")]                                                                   #Does this need a reset_index?
@@ -199,7 +339,7 @@ def construct_sitcr2(df, data_type, level, AX=True, dropAX=True, sitcr2=True, dr
         #-AX-#
         if AX:
             if verbose: print "[INFO] Adding Indicator Codes of 'A' and 'X'"
-            df['AX'] = df['sitc%s'%level].apply(lambda x: 1 if re.search("[AX]", x) else 0)
+            df['AX'] = map_unique(df['sitc%s'%level], lambda x: 1 if re.search("[AX]", x) else 0)
             #-dropAX-#
             if dropAX:
                 if verbose: print "[INFO] Dropping SITC Codes with 'A' or 'X'"
@@ -218,33 +358,30 @@ def construct_sitcr2(df, data_type, level, AX=True, dropAX=True, sitcr2=True, dr
             if verbose: 
                 print "Dropping the following productcodes ..."
                 print drop_codes
-            keep_codes = set(df['sitc%s'%level].unique()).difference(set(drop_codes))
-            df = df.loc[df["sitc%s"%level].isin(keep_codes)].copy(deep=True)
             #-Collapse Codes-#
             collapse_codes = IC["collapse"]
             if verbose:
                 print "Collapsing the following productcodes ..."
                 print collapse_codes
-            collapse_codes = {x[0:level-1] for x in collapse_codes}     #-Simplify Computations-#
-            for code in collapse_codes:
-                df["sitc%s"%level] = df["sitc%s"%level].apply(lambda x: code if x[0:level-1] == code else x)
             #-Recodes-#
             recodes = IC["recode"]
-            recode_codes = set(recodes.keys())
             if verbose: 
                 print "Recoding the following productcodes ..."
-                print recode_codes
-            for code in recode_codes:
-                df["sitc%s"%level] = df["sitc%s"%level].apply(lambda x: recodes[x] if x in recode_codes else x)
-            df = df.groupby(list(df.columns.drop("value"))).sum()
-            df = df.reset_index()
+                print set(recodes.keys())
+            #-Single Pass: Drop, Collapse and Recode on Unique Codes-#
+            compiled = compile_intertemporal_productcodes(IC, level)
+            keep, labels, uniques = apply_intertemporal_productcodes(df["sitc%s"%level], compiled, level)
+            df = df.loc[keep].copy(deep=True)
+            df["sitc%s"%level] = labels[keep]
+            #-Aggregate on Integer Product Codes-#
+            df = groupby_sum(df, list(df.columns.drop("value")), ['value'])
+            df["sitc%s"%level] = uniques.take(df["sitc%s"%level].values)
 
         #-Official SITCR2 Codes-#
         if sitcr2:
             if verbose: print "[INFO] Adding SITCR2 Indicator"
-            sitc = SITC(revision=2, source_institution=source_institution)
-            codes = sitc.get_codes(level=level)
-            df['sitcr2'] = df['sitc%s'%level].apply(lambda x: 1 if x in codes else 0)
+            sitc = get_sitc(revision=2, source_institution=source_institution)
+            df['sitcr2'] = sitc.is_official(df['sitc%s'%level], level=level).astype(np.int64)
             if drop_nonsitcr2:
                 if verbose: print "[INFO] Dropping Non Standard SITCR2 Codes"
                 df = df.loc[(df.sitcr2 == 1)]
@@ -257,39 +394,39 @@ def construct_sitcr2(df, data_type, level, AX=True, dropAX=True, sitcr2=True, dr
             #-Export-#
             if data_type == 'export' or data_type == 'exports':
                 if verbose: print "[INFO] Imposing dynamically consistent eiso3c recodes across 1962-2000"
-                df['eiso3c'] = df['eiso3c'].apply(lambda x: concord_data(iso3c_recodes_for_1962_2000, x, issue_error=False))    #issue_error = false returns x if no match
+                df['eiso3c'] = concord_series(iso3c_recodes_for_1962_2000, df['eiso3c'], issue_error=False)    #issue_error = false returns x if no match
                 df = df[df['eiso3c'] != '.']
-                df = df.groupby(['year', 'eiso3c', 'sitc%s'%level]).sum().reset_index()
+                df = groupby_sum(df, ['year', 'eiso3c', 'sitc%s'%level])
             #-Import-#
             elif data_type == 'import' or data_type == 'imports':
                 if verbose: print "[INFO] Imposing dynamically consistent iiso3c recodes across 1962-2000"
-                df['iiso3c'] = df['iiso3c'].apply(lambda x: concord_data(iso3c_recodes_for_1962_2000, x, issue_error=False))    #issue_error = false returns x if no match
+                df['iiso3c'] = concord_series(iso3c_recodes_for_1962_2000, df['iiso3c'], issue_error=False)    #issue_error = false returns x if no match
                 df = df[df['iiso3c'] != '.']
-                df = df.groupby(['year', 'iiso3c', 'sitc%s'%level]).sum().reset_index()
+                df = groupby_sum(df, ['year', 'iiso3c', 'sitc%s'%level])
             #-Trade-#
             else:
                 if verbose: print "[INFO] Imposing dynamically consistent iiso3c and eiso3c recodes across 1962-2000"
-                df['iiso3c'] = df['iiso3c'].apply(lambda x: concord_data(iso3c_recodes_for_1962_2000, x, issue_error=False))    #issue_error = false returns x if no match
-                df['eiso3c'] = df['eiso3c'].apply(lambda x: concord_data(iso3c_recodes_for_1962_2000, x, issue_error=False))    #issue_error = false returns x if no match
+                df['iiso3c'] = concord_series(iso3c_recodes_for_1962_2000, df['iiso3c'], issue_error=False)    #issue_error = false returns x if no match
+                df['eiso3c'] = concord_series(iso3c_recodes_for_1962_2000, df['eiso3c'], issue_error=False)    #issue_error = false returns x if no match
                 df = df[df['iiso3c'] != '.']
                 df = df[df['eiso3c'] != '.']
-                df = df.groupby(['year', 'eiso3c', 'iiso3c', 'sitc%s'%level]).sum().reset_index()
+                df = groupby_sum(df, ['year', 'eiso3c', 'iiso3c', 'sitc%s'%level])
         
         #-Drop Incomplete Country Codes-#
         if drop_incp_cntrycode:
             if verbose: print "[INFO] Dropping countries with incomplete data across 1962-2000"
             #-Export-#
             if data_type == 'export' or data_type == 'exports':
-                df['eiso3c'] = df['eiso3c'].apply(lambda x: concord_data(incomplete_iso3c_for_1962_2000, x, issue_error=False))     #issue_error = false returns x if no match
+                df['eiso3c'] = concord_series(incomplete_iso3c_for_1962_2000, df['eiso3c'], issue_error=False)     #issue_error = false returns x if no match
                 df = df[df['eiso3c'] != '.']
             #-Import-#
             elif data_type == 'import' or data_type == 'imports':
-                df['iiso3c'] = df['iiso3c'].apply(lambda x: concord_data(incomplete_iso3c_for_1962_2000, x, issue_error=False))     #issue_error = false returns x if no match
+                df['iiso3c'] = concord_series(incomplete_iso3c_for_1962_2000, df['iiso3c'], issue_error=False)     #issue_error = false returns x if no match
                 df = df[df['iiso3c'] != '.']
             #-Trade-#
             else:
-                df['iiso3c'] = df['iiso3c'].apply(lambda x: concord_data(incomplete_iso3c_for_1962_2000, x, issue_error=False))     #issue_error = false returns x if no match
-                df['eiso3c'] = df['eiso3c'].apply(lambda x: concord_data(incomplete_iso3c_for_1962_2000, x, issue_error=False))     #issue_error = false returns x if no match
+                df['iiso3c'] = concord_series(incomplete_iso3c_for_1962_2000, df['iiso3c'], issue_error=False)     #issue_error = false returns x if no match
+                df['eiso3c'] = concord_series(incomplete_iso3c_for_1962_2000, df['eiso3c'], issue_error=False)     #issue_error = false returns x if no match
                 df = df[df['iiso3c'] != '.']
                 df = df[df['eiso3c'] != '.']
             df = df.reset_index()
@@ -302,4 +439,68 @@ def construct_sitcr2(df, data_type, level, AX=True, dropAX=True, sitcr2=True, dr
         
         #-Return Dataset-#
         if verbose: print "[INFO] Finished Computing Dataset (%s) ..." % (data_type) 
-        return df
\ No newline at end of file
+        return df
+
+def construct_sitcr2_by_year(read_year, years, data_type, level, fix=None, adjust_hk=(False, None), verbose=True, **kwargs):
+        """
+        Construct a Self Contained (SC) Dataset (see construct_sitcr2) one year at a time
+
+        Only one year of raw data is held in memory at any time (plus the constructed years which are much smaller)
+
+        Parameters
+        ----------
+        read_year           :   function
+                                read_year(year) returns the raw data for a single year (i.e. from the year partitioned cache)
+        years               :   list
+                                Years to construct
+        data_type           :   str
+                                Specify what type of data 'trade', 'export', 'import'
+        level               :   int
+                                Specify Level of Final dataset (i.e. SITC Level 1, 2, 3, or 4)
+        fix                 :   function, optional(default=None)
+                                fix(df) returns a year of raw data with fixes applied (i.e. NBERWTFConstructor.raw_data_fixes)
+        adjust_hk           :   Tuple(bool, df), optional(default=(False, None))
+                                Adjust the Hong Kong Data using NBER supplemental files (split by year)
+        kwargs              :   Other construct_sitcr2 options
+
+        Returns
+        -------
+        dataset, summary 
+            summary is a DataFrame indexed by year with ['raw_rows', 'world_value', 'rows', 'value']. 
+            world_value is the total 'World' to 'World' value in the raw data
+
+        Notes
+        -----
+        1. Every operation in construct_sitcr2 is within year (aggregations include 'year' and the intertemporal country and product 
+           code adjustments are defined by meta data) so the dataset is equivalent to construct_sitcr2 applied to all years
+        2. Categorical columns share categories across years in the result
+        """
+        if type(adjust_hk) == bool:
+            adjust_hk = (adjust_hk, None)
+        frames, summary = [], []
+        for year in years:
+            if verbose: print "[INFO] Constructing year: %s" % year
+            df = read_year(year)
+            world = (df['importer'] == "World").values & (df['exporter'] == "World").values
+            stats = {'year' : year, 'raw_rows' : len(df), 'world_value' : df['value'].values[world].sum()}
+            if fix is not None:
+                df = fix(df)
+            if adjust_hk[0]:
+                hkdata = adjust_hk[1]
+                year_hk = (True, hkdata.loc[(hkdata['year'] == year).values])
+            else:
+                year_hk = (False, None)
+            df = construct_sitcr2(df, data_type=data_type, level=level, adjust_hk=year_hk, verbose=False, **kwargs)
+            stats['rows'], stats['value'] = len(df), df['value'].sum()
+            frames.append(df)
+            summary.append(stats)
+            del df
+            gc.collect()
+        summary = pd.DataFrame(summary, columns=['year', 'raw_rows', 'world_value', 'rows', 'value']).set_index('year')
+        if len(frames) == 0:
+            return pd.DataFrame(), summary
+        union_categories(frames, [col for col in frames[0].columns if is_categorical(frames[0][col])])
+        df = pd.concat(frames, ignore_index=True)
+        del frames
+        if verbose: print "[INFO] Finished Computing Dataset (%s) for %s years ..." % (data_type, len(years))
+        return df, summary
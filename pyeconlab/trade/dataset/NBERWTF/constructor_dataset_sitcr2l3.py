@@ -18,8 +18,8 @@ Notes
 #-Library Imports-#
 import re
 #-Package Imports-#
-from pyeconlab.trade.classification import SITC
-from pyeconlab.util import concord_data, merge_columns
+from pyeconlab.trade.classification import get_sitc
+from pyeconlab.util import concord_data, concord_series, merge_columns
 #-Relative Imports-#
 from .meta import countryname_to_iso3c, iso3c_recodes_for_1962_2000, incomplete_iso3c_for_1962_2000 
             
@@ -157,9 +157,8 @@ def construct_sitcr2l3(df, data_type, dropAX=True, sitcr2=True, drop_nonsitcr2=T
         #-Official SITCR2 Codes-#
         if sitcr2:
             if verbose: print "[INFO] Adding SITCR2 Indicator"
-            sitc = SITC(revision=2, source_institution=source_institution)
-            codes = sitc.get_codes(level=3)
-            df['sitcr2'] = df['sitc3'].apply(lambda x: 1 if x in codes else 0)
+            sitc = get_sitc(revision=2, source_institution=source_institution)
+            df['sitcr2'] = sitc.is_official(df['sitc3'], level=3).astype(int)
             if drop_nonsitcr2:
                 if verbose: print "[INFO] Dropping Non Standard SITCR2 Codes"
                 df = df.loc[(df.sitcr2 == 1)]
@@ -170,20 +169,20 @@ def construct_sitcr2l3(df, data_type, dropAX=True, sitcr2=True, drop_nonsitcr2=T
             #-Export-#
             if data_type == 'export' or data_type == 'exports':
                 if verbose: print "[INFO] Imposing dynamically consistent eiso3c recodes across 1962-2000"
-                df['eiso3c'] = df['eiso3c'].apply(lambda x: concord_data(iso3c_recodes_for_1962_2000, x, issue_error=False))    #issue_error = false returns x if no match
+                df['eiso3c'] = concord_series(iso3c_recodes_for_1962_2000, df['eiso3c'], issue_error=False)    #issue_error = false returns x if no match
                 df = df[df['eiso3c'] != '.']
                 df = df.groupby(['year', 'eiso3c', 'sitc3']).sum().reset_index()
             #-Import-#
             elif data_type == 'import' or data_type == 'imports':
                 if verbose: print "[INFO] Imposing dynamically consistent iiso3c recodes across 1962-2000"
-                df['iiso3c'] = df['iiso3c'].apply(lambda x: concord_data(iso3c_recodes_for_1962_2000, x, issue_error=False))    #issue_error = false returns x if no match
+                df['iiso3c'] = concord_series(iso3c_recodes_for_1962_2000, df['iiso3c'], issue_error=False)    #issue_error = false returns x if no match
                 df = df[df['iiso3c'] != '.']
                 df = df.groupby(['year', 'iiso3c', 'sitc3']).sum().reset_index()
             #-Trade-#
             else:
                 if verbose: print "[INFO] Imposing dynamically consistent iiso3c and eiso3c recodes across 1962-2000"
-                df['iiso3c'] = df['iiso3c'].apply(lambda x: concord_data(iso3c_recodes_for_1962_2000, x, issue_error=False))    #issue_error = false returns x if no match
-                df['eiso3c'] = df['eiso3c'].apply(lambda x: concord_data(iso3c_recodes_for_1962_2000, x, issue_error=False))    #issue_error = false returns x if no match
+                df['iiso3c'] = concord_series(iso3c_recodes_for_1962_2000, df['iiso3c'], issue_error=False)    #issue_error = false returns x if no match
+                df['eiso3c'] = concord_series(iso3c_recodes_for_1962_2000, df['eiso3c'], issue_error=False)    #issue_error = false returns x if no match
                 df = df[df['iiso3c'] != '.']
                 df = df[df['eiso3c'] != '.']
                 df = df.groupby(['year', 'eiso3c', 'iiso3c', 'sitc3']).sum().reset_index()
@@ -193,16 +192,16 @@ def construct_sitcr2l3(df, data_type, dropAX=True, sitcr2=True, drop_nonsitcr2=T
             if verbose: print "[INFO] Dropping countries with incomplete data across 1962-2000"
             #-Export-#
             if data_type == 'export' or data_type == 'exports':
-                df['eiso3c'] = df['eiso3c'].apply(lambda x: concord_data(incomplete_iso3c_for_1962_2000, x, issue_error=False))     #issue_error = false returns x if no match
+                df['eiso3c'] = concord_series(incomplete_iso3c_for_1962_2000, df['eiso3c'], issue_error=False)     #issue_error = false returns x if no match
                 df = df[df['eiso3c'] != '.']
             #-Import-#
             elif data_type == 'import' or data_type == 'imports':
-                df['iiso3c'] = df['iiso3c'].apply(lambda x: concord_data(incomplete_iso3c_for_1962_2000, x, issue_error=False))     #issue_error = false returns x if no match
+                df['iiso3c'] = concord_series(incomplete_iso3c_for_1962_2000, df['iiso3c'], issue_error=False)     #issue_error = false returns x if no match
                 df = df[df['iiso3c'] != '.']
             #-Trade-#
             else:
-                df['iiso3c'] = df['iiso3c'].apply(lambda x: concord_data(incomplete_iso3c_for_1962_2000, x, issue_error=False))     #issue_error = false returns x if no match
-                df['eiso3c'] = df['eiso3c'].apply(lambda x: concord_data(incomplete_iso3c_for_1962_2000, x, issue_error=False))     #issue_error = false returns x if no match
+                df['iiso3c'] = concord_series(incomplete_iso3c_for_1962_2000, df['iiso3c'], issue_error=False)     #issue_error = false returns x if no match
+                df['eiso3c'] = concord_series(incomplete_iso3c_for_1962_2000, df['eiso3c'], issue_error=False)     #issue_error = false returns x if no match
                 df = df[df['iiso3c'] != '.']
                 df = df[df['eiso3c'] != '.']
             df = df.reset_index()
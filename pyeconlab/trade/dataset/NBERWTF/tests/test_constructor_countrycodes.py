@@ -0,0 +1,29 @@
+"""
+Tests for NBERWTF Constructor Country Code Helpers
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+
+from ..constructor import split_countrycode_series, recode_from_keys
+
+
+class TestCountryCodeHelpers(unittest.TestCase):
+
+	def setUp(self):
+		self.codes = pd.Series(['100000', '138400', '451562', '138400', '100000'])
+
+	def test_split_countrycode_series(self):
+		region, iso3n, mod = split_countrycode_series(self.codes)
+		assert list(region) == [int(x[:2]) for x in self.codes]
+		assert list(iso3n) == [int(x[2:5]) for x in self.codes]
+		assert list(mod) == [int(x[-1]) for x in self.codes]
+
+	def test_recode_from_keys(self):
+		values = pd.Series([0, 384, 156, 384, 0])
+		result = recode_from_keys(self.codes, values, {'138400' : 999})
+		assert list(result) == [0, 999, 156, 999, 0]
+		assert list(values) == [0, 384, 156, 384, 0] 			#Original is not modified
+		result = recode_from_keys(self.codes, values, {'XXXXXX' : 999})
+		assert list(result) == list(values)
@@ -22,8 +22,10 @@ Notes
 
 import sys
 import os
+import unittest
 import re
 import gc
+import warnings
 import pandas as pd
 from pandas.util.testing import assert_frame_equal
 from numpy.testing import assert_allclose
@@ -52,9 +54,10 @@ def load_raw_dataset(fn, start_year, end_year, verbose=False):
     return data
 
 from pyeconlab import NBERWTFConstructor
-from pyeconlab.trade.dataset.NBERWTF import construct_sitcr2
+from pyeconlab.trade.dataset.NBERWTF import construct_sitcr2, construct_sitcr2_by_year
+from pyeconlab.trade.dataset.NBERWTF.constructor_dataset_sitcr2 import adjust_china_hongkong
 from pyeconlab.trade.dataset.NBERWTF import construct_sitcr2l1, construct_sitcr2l2, construct_sitcr2l3, construct_sitcr2l4 
-from pyeconlab.util import package_folder
+from pyeconlab.util import package_folder, merge_columns
 
 #-Package Data-#
 TEST_DATA_DIR = package_folder(__file__, "data") 
@@ -273,6 +276,75 @@ class TestGenericVsSpecificNBERFunctions():
 TEST_DATA_DIR = os.path.expanduser("~/work-data/repos-pyeconlab-testdata/")
 SOURCE_DATA_DIR = os.path.expanduser("~/work-data/datasets/36a376e5a01385782112519bddfac85e/")
 
+class TestConstructByYear(unittest.TestCase):
+    """
+    Test construct_sitcr2_by_year() against construct_sitcr2() using the random samples of the raw data
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        frames = []
+        for year in ['62', '85', '90', '00']:
+            frames.append(pd.read_csv(package_folder(__file__, "data") + "nberfeenstra_wtf%s_random_sample.csv" % year, dtype={'icode' : str, 'ecode' : str, 'sitc4' : str}).drop('obs', axis=1))
+        cls.rawdata = pd.concat(frames, ignore_index=True)
+
+    def read_year(self, year):
+        return self.rawdata.loc[self.rawdata.year == year].reset_index(drop=True)
+
+    def test_by_year(self):
+        years = sorted(self.rawdata.year.unique())
+        for dataset in ['A', 'D', 'F']:
+            OPTIONS = dict(SITC_DATASET_OPTIONS[dataset])
+            OPTIONS['adjust_hk'] = (False, None)
+            OPTIONS['intertemp_productcode'] = (False, None)
+            for data_type in DATA_TYPE:
+                data1 = construct_sitcr2(self.rawdata.copy(), data_type=data_type, level=3, verbose=False, **OPTIONS)
+                data2, summary = construct_sitcr2_by_year(self.read_year, years, data_type=data_type, level=3, verbose=False, **OPTIONS)
+                columns = list(data1.columns)
+                data1 = data1.sort_values(columns).reset_index(drop=True)
+                data2 = data2[columns].sort_values(columns).reset_index(drop=True)
+                assert_frame_equal(data1, data2, check_dtype=False)
+                assert list(summary['rows']) == list(data2.groupby('year').size().reindex(years).fillna(0))
+
+class TestAdjustChinaHongKong(unittest.TestCase):
+    """
+    Test adjust_china_hongkong() against merge_columns(dominant='right') using the random samples of the raw data
+    """
+
+    idx = [u'year', u'icode', u'importer', u'ecode', u'exporter', u'sitc4', u'unit', u'dot']
+
+    def setUp(self):
+        frames = []
+        for year in ['62', '85', '90', '00']:
+            frames.append(pd.read_csv(package_folder(__file__, "data") + "nberfeenstra_wtf%s_random_sample.csv" % year, dtype={'icode' : str, 'ecode' : str, 'sitc4' : str, 'unit' : str}).drop('obs', axis=1))
+        self.rawdata = pd.concat(frames, ignore_index=True)
+        matched = self.rawdata.loc[self.rawdata.year.isin([1990, 2000]), self.idx].iloc[::2].copy()
+        matched['value_adj'] = 1000
+        new = self.rawdata.loc[self.rawdata.year == 1990, self.idx].iloc[:3].copy()
+        new['exporter'] = 'China HK SAR'
+        new['value_adj'] = 10
+        self.hkdata = pd.concat([new.iloc[:1], matched, new.iloc[1:]], ignore_index=True)
+
+    def merge_columns(self, hkdata):
+        raw_value = self.rawdata[self.idx + ['value']].rename(columns={'value' : 'value_raw'})
+        return merge_columns(raw_value, hkdata, self.idx, collapse_columns=('value_raw', 'value_adj', 'value'), dominant='right', verbose=False)
+
+    def test_against_merge_columns(self):
+        expected = self.merge_columns(self.hkdata)
+        computed = adjust_china_hongkong(self.rawdata, self.hkdata, verbose=False)
+        assert_frame_equal(computed[self.idx + ['value']], expected[self.idx + ['value']], check_dtype=False)           #Same Row Order
+
+    def test_duplicates(self):
+        hkdata = pd.concat([self.hkdata, self.hkdata.iloc[:2]], ignore_index=True)
+        expected = self.merge_columns(hkdata).fillna({'unit' : '', 'dot' : -1}).groupby(self.idx)['value'].sum()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            computed = adjust_china_hongkong(self.rawdata, hkdata, verbose=False)
+            assert len(w) == 1
+        assert len(computed) == len(self.merge_columns(self.hkdata))
+        computed = computed.fillna({'unit' : '', 'dot' : -1}).groupby(self.idx)['value'].sum()
+        assert_allclose(computed.values, expected.reindex(computed.index).values)
+
 class TestAgainstStataData():
     """
     Test Suite for Comparing Data with STATA script
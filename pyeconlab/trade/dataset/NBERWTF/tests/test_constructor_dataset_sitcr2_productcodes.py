@@ -0,0 +1,51 @@
+"""
+Tests for the Intertemporal ProductCode Functions in constructor_dataset_sitcr2
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+from pandas.util.testing import assert_frame_equal
+
+from ..constructor_dataset_sitcr2 import compile_intertemporal_productcodes, apply_intertemporal_productcodes
+
+
+def loop_intertemporal_productcodes(df, IC, level):
+	""" Reference Implementation (Row-wise apply for each code) """
+	df = df.loc[~df["sitc%s"%level].isin(IC["drop"])].copy(deep=True)
+	for code in {x[0:level-1] for x in IC["collapse"]}:
+		df["sitc%s"%level] = df["sitc%s"%level].apply(lambda x: code if x[0:level-1] == code else x)
+	recodes = IC["recode"]
+	for code in recodes.keys():
+		df["sitc%s"%level] = df["sitc%s"%level].apply(lambda x: recodes[x] if x in recodes else x)
+	return df.groupby(list(df.columns.drop("value"))).sum().reset_index()
+
+
+class TestIntertemporalProductCodes(unittest.TestCase):
+
+	def setUp(self):
+		self.level = 3
+		self.IC = {'drop' : ['011', '999'], 'collapse' : ['021', '023'], 'recode' : {'031' : '032', '032' : '033', '041' : '042'}}
+		codes = ['011', '012', '021', '022', '023', '024', '031', '032', '033', '041', '042', '051']
+		rows = []
+		for year in [1990, 1991]:
+			for eiso3c in ['AUS', 'USA']:
+				for idx, code in enumerate(codes):
+					rows.append([year, eiso3c, code, float(year + idx)])
+		self.df = pd.DataFrame(rows, columns=['year', 'eiso3c', 'sitc3', 'value'])
+
+	def test_compile(self):
+		drop, collapse, recode = compile_intertemporal_productcodes(self.IC, self.level)
+		assert drop == {'011', '999'}
+		assert collapse == {'02'}
+		assert recode == {'031' : '033', '032' : '033', '041' : '042'}
+
+	def test_against_loop(self):
+		expected = loop_intertemporal_productcodes(self.df, self.IC, self.level)
+		compiled = compile_intertemporal_productcodes(self.IC, self.level)
+		keep, labels, uniques = apply_intertemporal_productcodes(self.df["sitc3"], compiled, self.level)
+		df = self.df.loc[keep].copy(deep=True)
+		df["sitc3"] = labels[keep]
+		df = df.groupby(list(df.columns.drop("value"))).sum().reset_index()
+		df["sitc3"] = uniques.take(df["sitc3"].values)
+		assert_frame_equal(df, expected)
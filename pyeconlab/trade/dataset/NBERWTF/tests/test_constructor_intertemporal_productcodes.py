@@ -0,0 +1,139 @@
+"""
+Tests for the Intertemporal ProductCode Rule Tables of NBERWTFConstructor
+
+Test Suites:
+-----------
+[1] TestIntertemporalProductCodeRules 	> Test the simple adjustments table, the drop and collapse lists and the adjustments table
+										  on a small (year x sitc4) value table
+
+Notes
+-----
+[1] The dataset contains official and non-official SITC R2 codes, codes that are not intertemporally complete,
+	a low value code and codes in the special cases for 6200, 7400 and 8400 (meta.IntertemporalProducts)
+[2] Expected results were checked against the row-wise (apply) implementation these methods replaced
+"""
+
+import unittest
+import warnings
+import pandas as pd
+
+from pyeconlab.util import package_folder
+from ..constructor import NBERWTFConstructor
+
+TEST_DATA_DIR = package_folder(__file__, "data")
+
+#-Data-#
+YEARS = [1962, 1963, 1964]
+VALUES = [
+			('0011', [500, 520, 540]), 			#Chapter 001: Official Codes with complete coverage
+			('0012', [300, 310, 320]),
+			('0021', [50, 60, 70]), 			#Chapter 002: Non-Official Code (6200 Special Drop)
+			('0110', [100, 0, 0]), 				#Chapter 011: Official Codes and a Non-Official '0' Code
+			('0111', [400, 410, 420]),
+			('0112', [200, 210, 220]),
+			('0121', [300, 300, 300]), 			#Chapter 012: Non-Official Low Value Code with incomplete coverage
+			('0122', [1, None, 2]),
+			('01AA', [10, 10, 10]), 			#Chapter 01A: Only Non-Official Codes
+			('0571', [50, None, 60]), 			#Chapter 057: Single Official Code with incomplete coverage
+			('6811', [80, 90, 100]), 			#Chapter 681: 6200 Special Recode
+			('9310', [20, 20, 20]), 			#Chapter 931: 7400 and 8400 Special Drop
+		]
+CODES = [code for code, values in VALUES]
+
+#-Expected Simple Adjustments Table (Index Columns in sitc4 order)-#
+SIMPLE_TABLE = {
+			'NOTSITCR2-ING' 				: [False, False, True, True, True, True, True, True, True, False, False, False],
+			'SITC-COUNT-ING' 				: [2, 2, 1, 3, 3, 3, 2, 2, 1, 1, 1, 1],
+			'SITCR2-SUM-ING' 				: [2, 2, 0, 2, 2, 2, 1, 1, 0, 1, 1, 1],
+			'NUM-NOTSITCR2-ING' 			: [0, 0, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0],
+			'NotIntertempConsistent-ING' 	: [False, False, False, False, False, False, True, True, False, True, False, False],
+			'LowValue' 						: [False, False, False, False, False, False, False, True, False, False, False, False],
+			'LowValue-ING' 					: [False, False, False, False, False, False, True, True, False, False, False, False],
+			'OfficialNotIC' 				: [False, False, False, False, False, False, False, False, False, True, False, False],
+			'OfficialNotIC-ING' 			: [False, False, False, False, False, False, False, False, False, True, False, False],
+}
+
+#-Expected Rule Table (Columns in sitc4 order)-#
+RULE_TABLE = {
+			'D' 		: ['.', '.', 'D', '.', '.', '.', '.', '.', 'D', '.', '.', '.'],
+			'C' 		: ['.', '.', 'C', 'C', 'C', 'C', 'C', 'C', 'C', '.', '.', '.'],
+			'IC' 		: ['.', '.', '.', '.', '.', '.', 'IC', 'IC', '.', 'ID', '.', '.'],
+			'VC' 		: ['.', '.', '.', '.', '.', '.', 'VK', 'VD', '.', '.', '.', '.'],
+			'OC' 		: ['.', '.', '.', '.', '.', '.', '.', '.', '.', 'OC', '.', '.'],
+			'JVCOC' 	: ['.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.'],
+			'CHECK' 	: ['', '', '', '', '', '', '<-- CHECK', '', '', '', '', ''],
+}
+
+SPECIAL_6200_DROP = ['0021', '0022', '0023', '0024', '0025', '0031', '0035', '0039', '9000', '9110', '9310', '9410', '9610', '9710']
+SPECIAL_7400_DROP = ['9000', '9110', '9310', '9410', '9610', '9710']
+
+
+class TestIntertemporalProductCodeRules(unittest.TestCase):
+
+	def setUp(self):
+		rows = []
+		for code, values in VALUES:
+			for year, value in zip(YEARS, values):
+				if value is not None:
+					rows.append((year, code, value))
+		self.obj = NBERWTFConstructor(source_dir=TEST_DATA_DIR, skip_setup=True)
+		self.obj.set_dataset(df=pd.DataFrame(rows, columns=['year', 'sitc4', 'value']), force=True, reset_operations=False)
+		self.obj.years = YEARS
+		self.obj.level = 4
+		self.obj.complete_dataset = True
+		warnings.simplefilter("ignore")
+
+	def tearDown(self):
+		warnings.resetwarnings()
+
+	def check_columns(self, table, expected):
+		table = table.reset_index()
+		assert table['sitc4'].tolist() == CODES
+		for column in sorted(expected.keys()):
+			assert table[column].tolist() == expected[column], "Column %s: %s != %s" % (column, table[column].tolist(), expected[column])
+
+	def test_simple_adjustments_table(self):
+		for tabletype in ['indicator', 'value', 'composition']:
+			table = self.obj.intertemporal_productcode_simple_adjustments_table(tabletype=tabletype, verbose=False)
+			self.check_columns(table, SIMPLE_TABLE)
+
+	def test_lists_special_6200(self):
+		for tabletype in ['indicator', 'value']:
+			drop, collapse, table = self.obj.intertemporal_productcode_lists(tabletype=tabletype, return_table=True, include_special=(True, "6200"), verbose=False)
+			assert drop == sorted(SPECIAL_6200_DROP + ['0122', '01AA', '0571'])
+			assert collapse == ['0110', '0111', '0112']
+			self.check_columns(table, RULE_TABLE)
+			assert table.reset_index()['SP'].tolist() == ['.', '.', 'SD', '.', '.', '.', '.', '.', '.', '.', 'SR', 'SD']
+			assert table.reset_index()['RULE'].tolist() == ['K', 'K', 'D', 'C', 'C', 'C', 'K', 'D', 'D', 'D', 'R(68)', 'D']
+
+	def test_lists_special_7400_8400(self):
+		for special in ["7400", "8400"]:
+			for tabletype in ['indicator', 'value']:
+				drop, collapse, table = self.obj.intertemporal_productcode_lists(tabletype=tabletype, return_table=True, include_special=(True, special), verbose=False)
+				assert drop == sorted(SPECIAL_7400_DROP + ['0021', '0122', '01AA', '0571'])
+				assert collapse == ['0110', '0111', '0112']
+				self.check_columns(table, RULE_TABLE)
+				assert table.reset_index()['SP'].tolist() == ['.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', 'SD']
+				assert table.reset_index()['RULE'].tolist() == ['K', 'K', 'D', 'C', 'C', 'C', 'K', 'D', 'D', 'D', 'K', 'D']
+
+	def test_lists_no_special(self):
+		drop, collapse = self.obj.intertemporal_productcode_lists(include_special=(False, None), verbose=False)
+		assert drop == ['0021', '0122', '01AA', '0571']
+		assert collapse == ['0110', '0111', '0112']
+
+	def test_lists_no_value_check(self):
+		""" Without the value check 'VC' is '.' and the rules that depend on it select no codes """
+		drop, collapse, table = self.obj.intertemporal_productcode_lists(return_table=True, include_special=(False, None), value_check=(False, 1, 4), verbose=False)
+		assert drop == ['0021', '01AA', '0571']
+		assert collapse == ['0110', '0111', '0112', '0121', '0122']
+		table = table.reset_index()
+		assert set(table['VC']) == set(['.'])
+		assert set(table['JVCOC']) == set(['.'])
+		assert set(table['CHECK']) == set([''])
+		assert table['RULE'].tolist() == ['K', 'K', 'D', 'C', 'C', 'C', 'C', 'C', 'D', 'D', 'K', 'K']
+
+	def test_adjustments_table(self):
+		table = self.obj.intertemporal_productcode_adjustments_table(force=True).reset_index()
+		assert table['sitc4'].tolist() == CODES
+		assert table['SITCR2'].tolist() == [1, 1, 0, 0, 1, 1, 1, 0, 0, 1, 1, 1]
+		assert table['ACTION'].tolist() == ['K', 'K', 'C', 'D', 'K', 'K', 'K', 'D', 'C', 'C', 'K', 'K']
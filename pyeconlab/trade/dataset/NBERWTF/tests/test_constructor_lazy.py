@@ -0,0 +1,75 @@
+"""
+Tests for the Lazy Plan (lazy() / collect()) of NBERWTFConstructor
+
+Test Suites:
+-----------
+[1] TestLazyAgainstEager 	> Run the same pipeline lazily and eagerly on the random samples and compare the results
+
+Notes
+-----
+[1] Test Data: 'data/nberfeenstra_wtf{62,85,90,00}_random_sample.csv'
+"""
+
+import unittest
+import warnings
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from pyeconlab.util import package_folder
+from ..constructor import NBERWTFConstructor
+
+TEST_DATA_DIR = package_folder(__file__, "data")
+
+YEARS = [1962, 1985, 1990, 2000]
+SAMPLES = ["nberfeenstra_wtf62_random_sample.csv", "nberfeenstra_wtf85_random_sample.csv", "nberfeenstra_wtf90_random_sample.csv", "nberfeenstra_wtf00_random_sample.csv"]
+
+
+class TestLazyAgainstEager(unittest.TestCase):
+
+	def setUp(self):
+		import_types = {'icode' : str, 'ecode' : str, 'sitc4' : str, 'unit' : str}
+		self.df = pd.concat([pd.read_csv(TEST_DATA_DIR+fl, dtype=import_types) for fl in SAMPLES], ignore_index=True).drop('obs', axis=1)
+		warnings.simplefilter("ignore")
+
+	def tearDown(self):
+		warnings.resetwarnings()
+
+	def construct(self, lazy, level):
+		obj = NBERWTFConstructor(source_dir=TEST_DATA_DIR, skip_setup=True)
+		obj.set_dataset(df=self.df.copy(), force=True, reset_operations=False)
+		obj.years = YEARS
+		obj.level = 4
+		obj.complete_dataset = True
+		if lazy:
+			obj.lazy()
+		obj.add_iso3c()
+		obj.countries_only(verbose=False)
+		obj.adjust_countrycodes_intertemporal(verbose=False)
+		obj.collapse_to_valuesonly()
+		obj.change_value_units()
+		obj.add_productcode_levels()
+		obj.identify_alpha_productcodes()
+		obj.drop_alpha_productcodes()
+		if level != 4:
+			obj.collapse_to_productcode_level(level=level)
+		if lazy:
+			obj.collect()
+		return obj
+
+	def check(self, eager, lazy):
+		assert lazy.operations == eager.operations
+		assert list(lazy.dataset.columns) == list(eager.dataset.columns)
+		columns = [item for item in eager.dataset.columns if item != 'value']
+		eager = eager.dataset.sort_values(by=columns).reset_index(drop=True)
+		lazy = lazy.dataset.sort_values(by=columns).reset_index(drop=True)
+		assert_frame_equal(lazy, eager)
+
+	def test_sitc4(self):
+		self.check(self.construct(lazy=False, level=4), self.construct(lazy=True, level=4))
+
+	def test_collapse_to_productcode_level(self):
+		for level in [1, 2, 3]:
+			eager = self.construct(lazy=False, level=level)
+			lazy = self.construct(lazy=True, level=level)
+			assert lazy.level == eager.level == level
+			self.check(eager, lazy)
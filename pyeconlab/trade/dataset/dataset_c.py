@@ -68,7 +68,7 @@ class CTradeDataset(object):
                       }
 
     def __init__(self, data):   
-        if type(data) == pd.DataFrame:
+        if isinstance(data, pd.DataFrame):
             self.from_dataframe(data)
         elif type(data) == str:
             fn, ftype = data.split('.')
@@ -94,7 +94,7 @@ class CTradeDataset(object):
         Populate Object from Pandas DataFrame
         """
         #-Force Interface Variables-#
-        if type(df) == pd.DataFrame:
+        if isinstance(df, pd.DataFrame):
             # - Check Incoming Data Conforms - #
             columns = set(df.columns)
             for item in self.interface[dtype]:
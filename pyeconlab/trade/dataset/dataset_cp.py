@@ -42,7 +42,7 @@ import cPickle as pickle
 import warnings
 import matplotlib.pyplot as plt
 
-from pyeconlab.util import concord_data
+from pyeconlab.util import concord_data, concord_series
 
 #-Country x Product Trade Dataset-#
 
@@ -103,7 +103,7 @@ class CPTradeDataset(object):
      
     def __init__(self, data, data_type, prep_dynamic=False, skip_attributes=False, allow_mixed_productcode=False):    
         #-Fill Object with Data-#
-        if type(data) == pd.DataFrame:
+        if isinstance(data, pd.DataFrame):
             self.from_dataframe(data, data_type, skip_attributes, allow_mixed_productcode)
         elif type(data) == str:
             fn, ftype = data.split('.')
@@ -306,7 +306,7 @@ class CPTradeDataset(object):
 
         """
         #-Force Interface Variables-#
-        if type(df) == pd.DataFrame:
+        if isinstance(df, pd.DataFrame):
             # - Check Incoming Data Conforms - #
             columns = set(df.columns)
             for item in self.interface[data_type.lower()]:
@@ -514,15 +514,10 @@ class CPTradeDataset(object):
 
         """
         df = self.data.reset_index()
-        for cntry in members.keys():
-            try:
-                df['eiso3c'] = df['eiso3c'].apply(lambda x: concord_data(members, x, issue_error=issue_error))  #issue_error = false returns x if no match
-            except:
-                pass #-eiso3c not found-#
-            try:
-                df['iiso3c'] = df['iiso3c'].apply(lambda x: concord_data(members, x, issue_error=issue_error))  #issue_error = false returns x if no match
-            except:
-                pass #-iiso3c not found-#
+        #-Recode Unique Countries Once-#
+        for item in ['eiso3c', 'iiso3c']:
+            if item in df.columns:
+                df[item] = concord_series(members, df[item], issue_error=issue_error)  #issue_error = false returns x if no match
         #-Collapse Items-#
         idx = ['year']
         for item in ['eiso3c', 'iiso3c']:
@@ -50,6 +50,8 @@ import cPickle as pickle
 
 ### -- Project Imports --- ###
 import pyeconlab.wdi as wdi
+from pyeconlab.trade.util.panel import dict_to_panel_array, panel_array_to_dict, smooth_panel_array, fill_panel_array, year_windows, window_panel_mean, \
+										first_emergence, emergence_transitions
 from Countries import Country, Countries 			#Move to Package Countries Subpackage
 from Products import Product 						#Move to Package Trade/Classifications?
 
@@ -754,6 +756,39 @@ class DynamicProductLevelExportSystem(object):
 			self.ples[year] = ples
 		return self.ples
 
+	def from_panel_array(self, values, years, countries, products, series_name='export', verbose=False):
+		"""
+		Construct ProductLevelExportSystem's from a Panel Array
+
+		Parameters
+		----------
+		values 		: 	np.array((Y, C, P))
+						Array of Values with np.nan for missing Country x Product cells
+		years 		: 	list(int)
+		countries 	: 	pd.Index or list
+		products 	: 	pd.Index or list
+		series_name : 	str, optional(default='export')
+						Name of the Data Series in self.data
+
+		Notes
+		-----
+			1. Only the 'DataFrame' data structure is compiled
+			2. np.nan cells are dropped so each cross-section only contains observed (country, productcode) pairs
+
+		"""
+		countries = pd.Index(countries, name='country')
+		products = pd.Index(products, name='productcode')
+		data = panel_array_to_dict(values, years, countries, products, name=series_name, rtype='long', dropna=True)
+		self.years = sorted(years)
+		for year in self.years:
+			if verbose: print "Computing ProductLevelExportSystem for Year: %s (From Panel Array)" % year
+			ples = ProductLevelExportSystem()
+			ples.year = year
+			ples.data_from_df(data[year], self.country_classification, self.product_classification, verbose=verbose)
+			ples.data_file = self.data_file
+			self.ples[year] = ples
+		return self.ples
+
 	## -- Pickle Methods -- ##
 	##########################
 
@@ -1015,6 +1050,28 @@ class DynamicProductLevelExportSystem(object):
 			raise ValueError("out_type must be 'wide' or 'long'")
 	
 
+	def get_panel_array(self, data=None, years=None, series_name='export', verbose=False):
+		"""
+		Return a Dense Panel Array Representation of a Property
+
+		Parameters
+		----------
+		data 		: 	Property or Matrix, optional(default=None **self.data**)
+						Dict(year : DataFrame) of 'cp' or 'pp' shaped data (i.e. self.data, self.rca, self.proximity)
+		years 		: 	list(int), optional(default=None **All**)
+						Specify a year filter
+		series_name : 	str, optional(default='export')
+						Data Series to use when data is in Long Format (i.e. self.data)
+
+		Returns
+		-------
+		(years, index, columns, values) where values.shape = (Y, Index, Columns)
+
+		"""
+		if data is None:
+			data = self.data
+		return dict_to_panel_array(data, years=years, series_name=series_name, verbose=verbose)
+
 	#######################################
 	## -- International Trade Methods -- ##
 	#######################################
@@ -1576,159 +1633,179 @@ class DynamicProductLevelExportSystem(object):
 	## -- Time-Series Methods -- ##	
 	###############################
 
-	def compute_smoothed_data(self, data_dict, dshape, smoother=(1,1,1), rtype='dict', dropna=False, verbose=False):
+	def compute_smoothed_data(self, data_dict, dshape, smoother=(1,1,1), rtype='dict', dropna=False, weights=None, min_count=None, edges='drop', verbose=False):
 		"""	
-			Smoothing Function that takes in a Property and returns smoothed version of the data
+		Smoothing Function that takes in a Property and returns smoothed version of the data
 
-			Input:
-			-----
-				[1] data  		=> 	Data Matrix or Series (i.e. self.data, self.rca etc.)
-				
-			Options:
-			-------
-				[1]	smoother 	=> 	Smoother Tuple (pre-period, cur-period, post-period) [Default: 3YRMA (1,1,1)]
+		Parameters
+		----------
+		data_dict 	: 	Property or Matrix
+						Dict(year : Wide DataFrame) (i.e. self.rca, self.proximity etc.)
+		dshape 		: 	str
+						'cp' or 'pp'
+		smoother 	: 	tuple, optional(default=(1,1,1))
+						Smoother Tuple (pre-period, cur-period, post-period) [Default: 3YRMA]
+						Windows do not need to be centred (i.e. (2,1,0) is a trailing 3YRMA)
+		rtype 		: 	str, optional(default='dict')
+						'dict' : {year : Wide DataFrame}
+						'df'   : Wide DataFrame indexed by ('year', <row>)
+						'long' : Long DataFrame indexed by ('year', <row>, <column>)
+		dropna 		: 	bool, optional(default=False)
+						Drop np.nan values when rtype='long'
+		weights 	: 	array, optional(default=None)
+						Observation weights (see smooth_panel_array)
+		min_count 	: 	int, optional(default=None **Window Length**)
+						Minimum number of non-np.nan observations required in a window
+		edges 		: 	str, optional(default='drop')
+						'drop' removes years without a complete window, 'partial' truncates windows at the panel edges
 
-			Future Work:
-			-----------
-				[1] Write a Super Conversion method that detects incoming data arrangement and converts to any combination requested. 
+		Notes
+		-----
+			1. Smoothing is computed on a dense (Year, Row, Column) array using cumulative sums (see pyeconlab.trade.util.panel)
 		"""
 		# - Setup Defaults - #
-		if dshape == 'cp': 
-			selection=['country', 'productcode']
-			idx_order = ['year', 'country', 'productcode']
-		elif dshape == 'pp': 
-			selection=['productcode1', 'productcode2']
-			idx_order = ['year', 'productcode1', 'productcode2']
+		if dshape == 'cp':
+			idx_names = ['country', 'productcode']
+		elif dshape == 'pp':
+			idx_names = ['productcode1', 'productcode2']
 		else:
 			raise ValueError("dshape needs to be 'cp' or 'pp'")
-		# - Parse Smoother - #
-		(pre_periods, cur_period, post_periods) = smoother
 		if verbose: 
 			print "Smoothing: %s-year moving average" % sum(smoother)
-			print "Previous Years: %s" % pre_periods
-			print "Future Years: %s" % post_periods
+			print "Previous Years: %s" % smoother[0]
+			print "Future Years: %s" % smoother[2]
 		years = sorted(data_dict.keys()) 								# Could also use self.years?
-		if type(data_dict[years[0]]) == pd.DataFrame:
-			# - Convert Data to Long Format - #
-			long_data = self.reshape_data(data_dict, datashape=dshape, rshape='long') 
-			window = sum(smoother)
-			#data = data.groupby(level=selection).apply(lambda x: pd.rolling_mean(x, window=window, center=True))
-			data = pd.rolling_mean(long_data.unstack(level=selection), window=window, center=True).stack(level=selection, dropna=dropna)  # This Delivers 10 x the Performance
-			# - Remove begining and end np.nan years - #
-			years = data.index.levels[0]          				# - data is indexed by ('year', 'country', 'productcode')
-			keep_yrs = years[pre_periods:post_periods*-1]
-			exclude_yrs =  list(set(years) - set(keep_yrs))
-			data = data.unstack(level='year').stack(level=0, dropna=False) 	# Level 0 is the SeriesName #
-			data.drop(labels=exclude_yrs, axis=1, inplace=True)
-			data = data.unstack(level=-1).stack(level='year', dropna=False).reorder_levels(order=idx_order).sort_index()
-			data.name = data_dict[years[0]].name + " [Smoothed=(%s,%s,%s)]" % smoother
-			data.columns = [data.name]
-			# - Return it to the Incoming Shape - #
-			if rtype == 'long':
-				return data
-			else:
-				return self.long_data_to(data, rshape=dshape, rtype=rtype, verbose=verbose)
+		if type(data_dict[years[0]]) != pd.DataFrame:
+			raise NotImplementedError("data_dict must contain DataFrames")
+		years, index, columns, values = dict_to_panel_array(data_dict, years=years)
+		positions, values = smooth_panel_array(values, smoother=smoother, weights=weights, min_count=min_count, edges=edges)
+		years = [years[pos] for pos in positions]
+		name = "%s [Smoothed=(%s,%s,%s)]" % ((getattr(data_dict[years[0]], 'name', None),) + tuple(smoother))
+		index.name, columns.name = idx_names
+		data = panel_array_to_dict(values, years, index, columns, name=name, rtype='wide')
+		# - Return it to the Requested Shape - #
+		if rtype == 'dict':
+			return data
+		elif rtype == 'df':
+			data = pd.concat([data[year] for year in years], keys=years, names=['year'])
+			data.name = name
+			return data
+		elif rtype == 'long':
+			data = pd.concat([data[year] for year in years], keys=years, names=['year'])
+			data.columns.name = idx_names[1]
+			data = pd.DataFrame(data.stack(dropna=dropna), columns=[name])
+			return data
 		else:
-			raise NotImplementedError
+			raise ValueError("rtype must be 'dict', 'df' or 'long'")
 
-	def compute_smoothed_trade_data(self, smoother=(1,1,1), method='pandas', data_name='self.data', years=None, verbose=False):
+	def compute_smoothed_trade_data(self, smoother=(1,1,1), method='numpy', data_name='self.data', years=None, series_name='export', weights=None, min_count=None, edges='drop', verbose=False):
 		"""
-			Compute Smoothed Trade Data (i.e. 3YRMA) and Return a New DynamicProductLevelExportSystem
-			Note: This function only acts on self.data
-			Assumptions: Centering of Smoother = True
+		Compute Smoothed Trade Data (i.e. 3YRMA) and Return a New DynamicProductLevelExportSystem
 
-			Input:
-			-----
-				[1] smoother 	=> 	Smoother Tuple (pre-period, cur-period, post-period). 
-									(1,1,1) = [D(t-1) + D(t) + D(t+1)] * 1/3 [Default: 3YRMA]
-			
-			Options:
-			--------
-				[1] method 		=> 	'pandas' : Leverage Pandas 
-									'numpy'  : <possible if Pandas is slow (Currently NotImplemented)
-				[2] data_name 	=> 	'data' : Able to Smooth Core Export Data in self.data
-									'matrix' : Able to compute any Wide DataFrame (i.e. matrix)
+		Parameters
+		----------
+		smoother 	: 	tuple, optional(default=(1,1,1))
+						Smoother Tuple (pre-period, cur-period, post-period). 
+						(1,1,1) = [D(t-1) + D(t) + D(t+1)] * 1/3 [Default: 3YRMA]
+						(2,1,0) = [D(t-2) + D(t-1) + D(t)] * 1/3
+		method 		: 	str, optional(default='numpy')
+						'numpy' : Cumulative Sum Smoother over the (Year, Country, Product) Panel Array
+						'pandas' is DEPRICATED and is computed using 'numpy'
+		data_name 	: 	str, optional(default='self.data')
+						'self.data' 	: Smooth Core Export Data in self.data
+						'self.matrix' 	: Smooth RCA Matrices in self.rca [Returned System is populated from RCA Data]
+		years 		: 	list(int), optional(default=None **All**)
+						Specify a year filter
+		series_name : 	str, optional(default='export')
+		weights 	: 	array, optional(default=None)
+						Observation weights (see smooth_panel_array)
+		min_count 	: 	int, optional(default=None **Window Length**)
+						Minimum number of non-np.nan observations required in a window (i.e. 2 allows one missing year in a 3YRMA)
+		edges 		: 	str, optional(default='drop')
+						'drop' removes years without a complete window, 'partial' truncates windows at the panel edges
 
-			Notes:
-			------
-				[1] This will return DynamicProductLevelExportSystem that are build on self.data and self.matrix. 
-				How will Country and Product Objects be treated?  => split the from_df() function into a simple from_df() to self.data and construct_network()
-				Then Networks can be constructed from self.data and Node and Edge Objects
-				[2] This function was written when originally thinking about that data structure of the object to be self.data, self.matrix
+		Notes
+		-----
+			1. The Returned System only contains the 'DataFrame' data structure. Networks can be constructed using construct_network()
+			2. Cells that are np.nan after smoothing are not included in the returned cross-sections
 		"""
-
 		## -- Parse Options -- ##
 		if years == None: years = self.years
-		(pre_periods, cur_period, post_periods) = smoother
-		print "[NOTICE] Currently this function ONLY does centered smoothers (i.e. (1,1,0)==(0,1,1)==(1,0,1) ALL EQUAL TO (0,1,1))\nValid Smoothers: (1,1,1), (2,1,2) etc"
+		if method == 'pandas':
+			warnings.warn("[DEPRICATED] method='pandas' has been replaced by method='numpy'", UserWarning)
+		elif method != 'numpy':
+			raise ValueError("method must be 'numpy'")
 		if verbose: 
 			print "Smoothing: %s-year moving average" % sum(smoother)
-			print "Previous Years: %s" % pre_periods
-			print "Future Years: %s" % post_periods
+			print "Previous Years: %s" % smoother[0]
+			print "Future Years: %s" % smoother[2]
 		## -- Compute -- ##
-		if method == 'pandas':
-			# - Core Data - #
-			if data_name == 'self.data':
-				data = self.get_data(rtype='long')
-				selection = ['country', 'productcode']
-				window = sum(smoother)
-				data = data.groupby(level=selection).apply(lambda x: pd.rolling_mean(x, window=window, center=True)) # Raw=True prevents series generation but doesn't work for groupby objects
-				#data = pd.rolling_mean(data.unstack(level=['country', 'productcode']), window=3, center=True).stack(level=['country', 'productcode'])  # This Delivers 10 x the Performance
-				# - Remove begining and end np.nan years - #
-				years = data.index.levels[0]          				# - data is indexed by ('year', 'country', 'productcode')
-				years = years[pre_periods:post_periods*-1]
-				idx = zip(['export']*len(years), years)
-				data = data.unstack(level='year')[idx].stack().reorder_levels(order=['year', 'country', 'productcode']).sort_index()
-				# - Construct return system - #
-				dynples = DynamicProductLevelExportSystem()
-				dynples.from_df(data.reset_index().set_index(keys=['year'])) 
-				# - Carry Over Attributes - #
-				dynples.country_classification = self.country_classification
-				dynples.product_classification = self.product_classification
-				dynples.complete_trade_network = self.complete_trade_network	
-				return dynples
-			# - Core Matrix - #
-			elif data_name == 'self.matrix':                        # - Currently this is written for RCA MATRIX! - #
-				matrix = self.get_matrix(rtype='long')
-				selection = ['country', 'productcode']
-				window = sum(smoother)
-				matrix = matrix.groupby(level=selection).apply(lambda x: pd.rolling_mean(x, window=window, center=True))
-				return DynamicProductLevelExportSystem().from_rca_df(data.reset_index().set_index(keys=['year']), rca_notes='Smoothed by Smoother: %s' % smoother) 				#Return New TradeSystem with Smoothed RCA Matrices
-			else:
-				raise ValueError("method has only been constructed for self.data and self.matrix")
+		if data_name == 'self.data':
+			data = self.data
+		elif data_name == 'self.matrix':
+			data = self.rca
+		else:
+			raise ValueError("method has only been constructed for self.data and self.matrix")
+		years, countries, products, values = dict_to_panel_array(data, years=years, series_name=series_name, verbose=verbose)
+		positions, values = smooth_panel_array(values, smoother=smoother, weights=weights, min_count=min_count, edges=edges)
+		years = [years[pos] for pos in positions]
+		# - Construct return system - #
+		dynples = DynamicProductLevelExportSystem()
+		dynples.country_classification = self.country_classification
+		dynples.product_classification = self.product_classification
+		dynples.data_file = self.data_file
+		if data_name == 'self.data':
+			dynples.from_panel_array(values, years, countries, products, series_name=series_name, verbose=verbose)
+			dynples.complete_trade_network = self.complete_trade_network
 		else:
-			raise ValueError("Only method implimented leverages pandas. Specify method='pandas'")
+			countries.name, products.name = 'country', 'productcode'
+			rca = panel_array_to_dict(values, years, countries, products, name='rca', rtype='wide')
+			dynples.years = years
+			for year in years:
+				ples = ProductLevelExportSystem()
+				ples.from_rca_df(rca[year], self.country_classification, self.product_classification, year, verbose=verbose)
+				ples.rca_notes = 'Smoothed by Smoother: %s' % (smoother,)
+				dynples.ples[year] = ples
+		return dynples
 
-	def compute_intertemporal_fill(self, interpolate=True, ffill=True, ffill_limit=1, bfill=True, bfill_limit=1, verbose=False):
+	def compute_intertemporal_fill(self, interpolate=True, ffill=True, ffill_limit=1, bfill=True, bfill_limit=1, zero_fill=False, max_gap=None, years=None, series_name='export', verbose=False):
 		"""
-			Compute Data with Intertemporal Fill and Return a New DynamicProductLevelExportSystem with new data
-			
-			** Status: NEEDS TESTING **
+		Compute Data with Intertemporal Fill and Return a New DynamicProductLevelExportSystem with new data
 
-			Options:
-			-------
-				interpolate 	: 	Interpolate between gaps within the time series
-				ffill 			: 	Forward fill the end of time-series gaps with the last value
-				ffill_limit 	: 	Limit the number of periods for ffill
-				bfill 			: 	Backward fill the begining of the time-series with the first value
-				bfill_limit 	: 	Limit the number of periods for bfill
+		Parameters
+		----------
+		interpolate 	: 	bool, optional(default=True)
+							Linearly interpolate between gaps within the time series
+		ffill 			: 	bool, optional(default=True)
+							Forward fill the end of time-series gaps with the last value
+		ffill_limit 	: 	int, optional(default=1)
+							Limit the number of periods for ffill (None for no limit)
+		bfill 			: 	bool, optional(default=True)
+							Backward fill the begining of the time-series with the first value
+		bfill_limit 	: 	int, optional(default=1)
+							Limit the number of periods for bfill (None for no limit)
+		zero_fill 		: 	bool, optional(default=False)
+							Fill all remaining cells in the (Country x Product) panel with 0
+		max_gap 		: 	int, optional(default=None **No Limit**)
+							Only interpolate gaps of up to max_gap years
+		years 			: 	list(int), optional(default=None **All**)
+							Specify a year filter
+		series_name 	: 	str, optional(default='export')
 
-			Note: 
-			-----
-				[1] This is useful when using the current compute_smoothed_data() function as it requires all cells to include data to compute which creates intertemporal gaps
-				[2] Return basic DynamicProductLevelExportSystem based only on the Default 'DataFrame' data structure. If network representations desired in the new DynPLES then will need to construct them using appropriate constructor methods
-		"""
-		# - Obtain Long Form Data to Leverage Pandas - #
-		data = self.get_data(rtype='long', sort=True)
-		if interpolate:
-			data.apply(pd.Series.interpolate)
-		if ffill == True:
-			data.fillna(method='ffill', limit=ffill_limit)
-		if bfill == True:
-			data.fillna(method='bfill', limit=bfill_limit)
+		Notes
+		-----
+			[1] This is useful when using compute_smoothed_data() as it requires all cells in a window to include data
+			[2] Return basic DynamicProductLevelExportSystem based only on the Default 'DataFrame' data structure. If network representations desired in the new DynPLES then will need to construct them using appropriate constructor methods
+			[3] Filling is computed on a dense (Year, Country, Product) array (see pyeconlab.trade.util.panel.fill_panel_array)
+		"""
+		years, countries, products, values = self.get_panel_array(years=years, series_name=series_name, verbose=verbose)
+		values = fill_panel_array(values, interpolate=interpolate, max_gap=max_gap, ffill=ffill, ffill_limit=ffill_limit, bfill=bfill, bfill_limit=bfill_limit, zero_fill=zero_fill)
 		# - Construct DynPLES - #
 		DynPLES = DynamicProductLevelExportSystem()
-		DynPLES.from_df(data)
+		DynPLES.country_classification = self.country_classification
+		DynPLES.product_classification = self.product_classification
+		DynPLES.data_file = self.data_file
+		DynPLES.from_panel_array(values, years, countries, products, series_name=series_name, verbose=verbose)
 		return DynPLES
 
 	# - Return Averaged Data - #
@@ -1736,18 +1813,23 @@ class DynamicProductLevelExportSystem(object):
 
 	def compute_average(self, data, start_year=None, end_year=None, step=1, verbose=False):
 		"""
-			Compute and Return Some Averaged Data as a pd.DataFrame
-			[Important: This method is sensative to np.nan (i.e. 1 + np.nan = np.nan)]
+		Compute and Return Some Averaged Data as a pd.DataFrame
+		[Important: This method is sensative to np.nan (i.e. 1 + np.nan = np.nan)]
 
-			Options:
-			-------
-				start_year 		: 	year to start averaging from 	[Default: Start Year Found in Data]
-				end_year 		: 	year to end averaging on 		[Default: End Year Found in Data]
-				step 			: 	step in years
-			
-			Notes:
-			-----
-				[1] df_data (i.e. A.data or A.proximity etc) will come in as a Dict(year : Data to Average)
+		Parameters
+		----------
+		data 		: 	Property or Matrix
+						Dict(year : Data to Average) (i.e. A.data or A.proximity etc)
+		start_year 	: 	int, optional(default=None)
+						year to start averaging from 	[Default: Start Year Found in Data]
+		end_year 	: 	int, optional(default=None)
+						year to end averaging on 		[Default: End Year Found in Data]
+		step 		: 	int, optional(default=1)
+						step in years
+
+		Notes
+		-----
+			[1] Use compute_averages() to compute many windows in a single pass
 		"""
 		years = sorted(data.keys())
 		# - Set Defaults - #
@@ -1759,12 +1841,64 @@ class DynamicProductLevelExportSystem(object):
 		if verbose: print "Computing Averaging for Passed Data between Year: %s and %s" % (start_year, end_year)
 		# - Averaging - #
 		averaging_years = range(start_year, end_year+1, step)
-		num_years = len(averaging_years)
-		avg_data = data[averaging_years[0]]
-		for year in averaging_years[1:]:
-			avg_data = avg_data + data[year]
-		avg_data = avg_data / num_years
-		return avg_data
+		avg_data = self.compute_averages(data, windows=[(0, len(averaging_years))], years=averaging_years, positions=True, verbose=verbose)
+		return avg_data.values()[0]
+
+	def compute_averages(self, data, windows, years=None, skipna=False, min_count=1, positions=False, verbose=False):
+		"""
+		Compute Averages of a Property over many Year Windows in a single Prefix Sum pass
+
+		Parameters
+		----------
+		data 		: 	Property or Matrix
+						Dict(year : DataFrame) (i.e. A.data, A.rca, A.proximity)
+		windows 	: 	list((start_year, end_year)) or tuple(length, step)
+						Inclusive year windows (i.e. [(1962, 1966), (1967, 1971)])
+						A tuple (length, step) constructs windows over years (i.e. (5,5) for 5 year blocks or (5,1) for rolling 5 year windows)
+		years 		: 	list(int), optional(default=None **All**)
+						Specify a year filter
+		skipna 		: 	bool, optional(default=False)
+						False : Any np.nan within a window results in np.nan (i.e. 1 + np.nan = np.nan)
+						True  : Average over available years in each window
+		min_count 	: 	int, optional(default=1)
+						Minimum number of available years when skipna=True
+		positions 	: 	bool, optional(default=False)
+						windows are specified as positions [start, stop) in years rather than inclusive years
+
+		Returns
+		-------
+		Dict((start_year, end_year) : DataFrame) with the same layout as the incoming data
+		
+		Usage
+		-----
+		A.compute_averages(A.proximity, windows=(5,5)) 		# - 5 Year Average Proximity Matrices - #
+		"""
+		if years is None:
+			years = sorted(data.keys())
+		if type(windows) == tuple:
+			windows = year_windows(years, *windows)
+		# - Convert Year Windows to Positions - #
+		if not positions:
+			year_positions = dict([(year, i) for i, year in enumerate(years)])
+			pos_windows = []
+			for (start_year, end_year) in windows:
+				window_years = range(start_year, end_year+1)
+				missing = [year for year in window_years if year not in year_positions]
+				if len(missing) > 0:
+					raise ValueError("Window (%s, %s) contains years not found in data: %s" % (start_year, end_year, missing))
+				pos_windows.append((year_positions[start_year], year_positions[end_year] + 1))
+		else:
+			pos_windows = windows
+		years, index, columns, values = dict_to_panel_array(data, years=years)
+		if verbose: print "Computing Averages for %s windows over %s years" % (len(pos_windows), len(years))
+		values = window_panel_mean(values, pos_windows, skipna=skipna, min_count=min_count)
+		# - Return to the Incoming Layout - #
+		keys = [(years[start], years[stop-1]) for (start, stop) in pos_windows]
+		first = data[years[0]]
+		if isinstance(first.index, pd.MultiIndex):
+			return panel_array_to_dict(values, keys, index, columns, name=first.columns[0], rtype='long')
+		else:
+			return panel_array_to_dict(values, keys, index, columns, name=getattr(first, 'name', None), rtype='wide')
 
 	##########################
 	## -- Change Methods -- ##
@@ -2079,21 +2213,66 @@ class DynamicProductLevelExportSystem(object):
 
 ### --- WORKING HERE --- ####
 
-	def construct_cp_emergence_graph(self, verbose=False):
+	def construct_cp_emergence_graph(self, persistence=1, absence=1, exclude_initial=False, years=None, rtype='sparse', verbose=False):
 		"""
-			Construct a Country x Product Emergence Graphs
-
-			Algorithm Details:
-			-----------------
-				[1] A Product can only emerge once and the first emergent event is recorded!
-
-			Options:
-			-------
-				[1] Allow Construction for a Single Country and then build off that function for other countries!
-
+		Construct a Country x Product Emergence Graph
 
+		Parameters
+		----------
+		persistence 	: 	int, optional(default=1)
+							Number of years a product must remain Mcp == 1 (including the year of emergence)
+		absence 		: 	int, optional(default=1)
+							Number of prior years a product must be Mcp == 0
+		exclude_initial : 	bool, optional(default=False)
+							Products exported with Mcp == 1 in the first year are left-censored and not recorded
+		years 			: 	list(int), optional(default=None **All**)
+							Specify a year filter (years should be consecutive)
+		rtype 			: 	str, optional(default='sparse')
+							'sparse' 	: scipy.sparse.csr_matrix((P, P)) with a pd.Index of productcodes
+							'networkx' 	: nx.DiGraph with edge attribute 'weight'
+
+		Returns
+		-------
+		emergence 	: 	pd.DataFrame (Country x Product) of first emergence years (dtype=int16 and -1 for no emergence)
+		graph 		: 	Product -> Product emergence transitions (weight = number of countries) 
+						[(csr_matrix, productcodes) for rtype='sparse']
+
+		Algorithm Details
+		-----------------
+			[1] A Product can only emerge once and the first emergent event is recorded!
+			[2] First emergence is the argmax over the year axis of the (Year, Country, Product) Mcp array meeting the persistence requirements
+			[3] Products emerging in a country are linked to the products emerging at that country's next emergence event 
+				(Products with Mcp == 1 in the first year form the initial emergence event unless exclude_initial=True)
 		"""
-		raise NotImplementedError
+		# - Check Required Data is Computed - #
+		if years == None: years = self.years
+		for year in years:
+			if type(self.ples[year].mcp) != pd.DataFrame:
+				print "[NOTICE] Mcp matrix at (self.mcp) is currently not available. Computing Mcp with default kwargs"
+				self.mcp_matrices()
+				break
+		years, countries, products, values = self.get_panel_array(data=self.mcp, years=years, verbose=verbose)
+		active = values == 1 												# np.nan cells are not active
+		del values
+		first = first_emergence(active, persistence=persistence, absence=absence, exclude_initial=exclude_initial)
+		# - Emergence Years - #
+		emergence = np.where(first >= 0, np.asarray(years, dtype=np.int16)[first], -1).astype(np.int16)
+		emergence = pd.DataFrame(emergence, index=countries, columns=products)
+		emergence.index.name, emergence.columns.name = 'country', 'productcode'
+		emergence.name = 'EmergenceYear'
+		if verbose: print "Number of Country x Product Emergence Events: %s" % (first >= 0).sum()
+		# - Emergence Transitions - #
+		graph = emergence_transitions(first, len(years))
+		if rtype == 'sparse':
+			return emergence, (graph, products)
+		elif rtype == 'networkx':
+			G = nx.DiGraph()
+			G.add_nodes_from(products)
+			graph = graph.tocoo()
+			G.add_weighted_edges_from(zip(products.take(graph.row), products.take(graph.col), graph.data))
+			return emergence, G
+		else:
+			raise ValueError("rtype must be 'sparse' or 'networkx'")
 
 
  # def generate_country_product_emergence_graph(df, tradesystem='', country_filter=[], base_year=-1, end_year=-1, verbose=False, allow_repeats=True):
@@ -2,6 +2,8 @@
 Tests for DynamicProductLevelExportSystem Module
 """
 
+import unittest
+import numpy as np
 import pandas as pd
 from pyeconlab.util import package_folder
 from pyeconlab.trade.systems import DynamicProductLevelExportSystem
@@ -195,4 +197,66 @@ class TestDynamicProductLevelExportSystemBasic(object):
 	# print A[2001].cp_matrix
 
 	# print "\nTesting cp_matrices() Getter Method"
-	# print A.cp_matrices()
\ No newline at end of file
+	# print A.cp_matrices()
+
+
+class TestDynamicProductLevelExportSystemTimeSeries(unittest.TestCase):
+	"""
+	Tests for Time-Series Methods of the Dynamic Product Level Export System
+	"""
+
+	def setUp(self):
+		data = []
+		for year in [2000, 2001, 2002, 2003]:
+			data.append([year, "AUS", "0001", 100.0*(year-1999)])
+			data.append([year, "USA", "0001", 10.0])
+			if year != 2002:
+				data.append([year, "USA", "0002", float(year-1999)])
+		data = pd.DataFrame(data, columns=['year','country','productcode','export']).set_index('year')
+		self.A = DynamicProductLevelExportSystem()
+		self.A.from_df(data)
+
+	def test_compute_smoothed_trade_data(self):
+		B = self.A.compute_smoothed_trade_data(smoother=(1,1,1))
+		assert B.years == [2001, 2002]
+		assert B[2001].data.ix[("AUS", "0001"), 'export'] == 200.0
+		assert ("USA", "0002") not in B[2001].data.index 							#Window Contains a Missing Year
+
+	def test_compute_smoothed_trade_data_asymmetric(self):
+		B = self.A.compute_smoothed_trade_data(smoother=(2,1,0), min_count=2)
+		assert B.years == [2002, 2003]
+		assert B[2003].data.ix[("AUS", "0001"), 'export'] == 300.0
+		assert B[2003].data.ix[("USA", "0002"), 'export'] == 3.0 					#(2 + 4) / 2
+
+	def test_compute_smoothed_trade_data_window_longer_than_panel(self):
+		self.assertRaises(ValueError, self.A.compute_smoothed_trade_data, smoother=(2,1,2))
+
+	def test_compute_intertemporal_fill(self):
+		B = self.A.compute_intertemporal_fill()
+		assert B.years == [2000, 2001, 2002, 2003]
+		assert B[2002].data.ix[("USA", "0002"), 'export'] == 3.0 					#Interpolated between 2 and 4
+		assert ("AUS", "0002") not in B[2002].data.index
+
+	def test_compute_averages(self):
+		avg = self.A.compute_averages(self.A.data, windows=(2,2))
+		assert sorted(avg.keys()) == [(2000, 2001), (2002, 2003)]
+		assert avg[(2000, 2001)].ix[("AUS", "0001"), 'export'] == 150.0
+		assert ("USA", "0002") not in avg[(2002, 2003)].index 						#np.nan in 2002
+		avg = self.A.compute_averages(self.A.data, windows=[(2001, 2003)], skipna=True)
+		assert avg[(2001, 2003)].ix[("USA", "0002"), 'export'] == 3.0
+
+	def test_compute_average(self):
+		avg = self.A.compute_average(self.A.data, start_year=2000, end_year=2003, step=3)
+		assert avg.ix[("AUS", "0001"), 'export'] == 250.0
+
+	def test_construct_cp_emergence_graph(self):
+		for year in self.A.years:
+			self.A[year].mcp = self.A[year].data['export'].unstack().notnull().astype(float)
+		emergence, (graph, products) = self.A.construct_cp_emergence_graph()
+		assert emergence.dtypes.unique().tolist() == [np.int16]
+		assert emergence.ix["USA", "0002"] == 2000
+		assert emergence.ix["AUS", "0002"] == -1
+		emergence, G = self.A.construct_cp_emergence_graph(exclude_initial=True, rtype='networkx')
+		assert (emergence == -1).all().all()
+		assert G.number_of_edges() == 0
+
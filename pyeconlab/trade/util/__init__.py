@@ -4,4 +4,6 @@ from .dynamics import compute_product_changes
 from .dynamic_converters import reindex_dynamic_dataframe, compute_persistence, reindex_dynamic_dict
 from .network import compute_average_centrality, compute_diffusion_properties_nx, construct_network_from_adjacency_df
 from .dataframe import attach_attributes
-from .plotting import prepare_scaling_vectors
\ No newline at end of file
+from .plotting import prepare_scaling_vectors
+from .panel import dict_to_panel_array, panel_array_to_dict, smooth_panel_array, fill_panel_array, year_windows, window_panel_mean, \
+						first_emergence, emergence_transitions
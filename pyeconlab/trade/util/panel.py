@@ -0,0 +1,450 @@
+"""
+Panel Array Utilities
+=====================
+
+Numpy routines for working with a Dynamic System as a dense (Year x Row x Column) array
+(i.e. (Y, C, P) for Country x Product data or (Y, P, P) for Product x Product data)
+
+Notes
+-----
+	[1] 	All time-series operations act on axis=0 (the year axis) and treat years as consecutive periods
+	[2] 	Operations are computed in blocks over the trailing axes to bound temporary memory for large panels
+
+"""
+
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+#-Number of array cells to process in each block-#
+BLOCK_SIZE = 2**22
+
+###---------------###
+###---Conversion---###
+###---------------###
+
+def dict_to_panel_array(data, years=None, series_name=None, dtype=np.float64, verbose=False):
+	"""
+	Convert a Dict(year : DataFrame) into a dense Panel Array
+
+	Parameters
+	----------
+	data 		: 	dict(year : pd.DataFrame)
+					Wide DataFrames (i.e. cp_matrix, rca, proximity) or Long DataFrames with a 2-Level Index (i.e. data)
+	years 		: 	list(int), optional(default=None **All**)
+					Specify a year filter
+	series_name : 	str, optional(default=None)
+					Specify the column to use for Long DataFrames [Default: First Column]
+	dtype 		: 	numpy dtype, optional(default=np.float64)
+
+	Returns
+	-------
+	(years, index, columns, values) where values.shape = (len(years), len(index), len(columns))
+	and missing cells are filled with np.nan
+
+	"""
+	if years is None:
+		years = sorted(data.keys())
+	first = data[years[0]]
+	long_format = isinstance(first.index, pd.MultiIndex)
+	#-Union of Row and Column Labels across Years-#
+	index, columns = set(), set()
+	for year in years:
+		if long_format:
+			index.update(data[year].index.levels[0])
+			columns.update(data[year].index.levels[1])
+		else:
+			index.update(data[year].index)
+			columns.update(data[year].columns)
+	index = pd.Index(sorted(index), name=first.index.names[0])
+	if long_format:
+		columns = pd.Index(sorted(columns), name=first.index.names[1])
+	else:
+		columns = pd.Index(sorted(columns), name=first.columns.name)
+	if verbose: print "Panel Array Shape: (%s, %s, %s)" % (len(years), len(index), len(columns))
+	#-Populate Array-#
+	values = np.empty((len(years), len(index), len(columns)), dtype=dtype)
+	values.fill(np.nan)
+	for i, year in enumerate(years):
+		df = data[year]
+		if long_format:
+			if series_name is None:
+				series_name = df.columns[0]
+			rows = index.get_indexer(df.index.get_level_values(0))
+			cols = columns.get_indexer(df.index.get_level_values(1))
+			values[i, rows, cols] = df[series_name].values
+		else:
+			rows = index.get_indexer(df.index)
+			cols = columns.get_indexer(df.columns)
+			values[i][np.ix_(rows, cols)] = df.values
+	return list(years), index, columns, values
+
+def panel_array_to_dict(values, years, index, columns, name=None, rtype='wide', dropna=True):
+	"""
+	Convert a Panel Array into a Dict(year : DataFrame)
+
+	Parameters
+	----------
+	values 	: 	np.array((Y, R, C))
+	years 	: 	list(int)
+	index 	: 	pd.Index
+				Row Labels
+	columns : 	pd.Index
+				Column Labels
+	name 	: 	str, optional(default=None)
+				Name attached to each DataFrame (Series Column Name for rtype='long')
+	rtype 	: 	str, optional(default='wide')
+				'wide' : Row x Column DataFrames (i.e. cp_matrix)
+				'long' : DataFrames Indexed by (Row, Column) with a single column (i.e. data)
+	dropna 	: 	bool, optional(default=True)
+				Drop np.nan cells when rtype='long'
+
+	"""
+	index, columns = pd.Index(index), pd.Index(columns)
+	data = dict()
+	for i, year in enumerate(years):
+		if rtype == 'wide':
+			df = pd.DataFrame(values[i], index=index, columns=columns)
+		elif rtype == 'long':
+			cross_section = values[i].ravel()
+			if dropna:
+				loc = np.flatnonzero(~np.isnan(cross_section))
+			else:
+				loc = np.arange(cross_section.size)
+			rows, cols = loc // len(columns), loc % len(columns)
+			idx = pd.MultiIndex.from_arrays([index.take(rows), columns.take(cols)], names=[index.name, columns.name])
+			df = pd.DataFrame({name : cross_section[loc]}, index=idx, columns=[name])
+		else:
+			raise ValueError("rtype must be 'wide' or 'long'")
+		df.name = name
+		data[year] = df
+	return data
+
+def _blocks(n, nyears, block_size=BLOCK_SIZE):
+	""" Generate Slices over n Series of length nyears in Blocks of approximately block_size cells """
+	step = max(1, block_size // max(nyears, 1))
+	for start in xrange(0, n, step):
+		yield slice(start, min(start + step, n))
+
+###---------------###
+###---Smoothing---###
+###---------------###
+
+def smooth_panel_array(values, smoother=(1,1,1), weights=None, min_count=None, edges='drop'):
+	"""
+	Moving Average along the Year Axis of a Panel Array using Cumulative Sums
+
+	Parameters
+	----------
+	values 		: 	np.array((Y, ...))
+	smoother 	: 	tuple, optional(default=(1,1,1))
+					Smoother Tuple (pre-periods, cur-period, post-periods) [Default: 3YRMA]
+					cur-period must be 0 or 1 (exclude or include the current period)
+					(2,1,0) = [D(t-2) + D(t-1) + D(t)] * 1/3
+	weights 	: 	np.array, optional(default=None)
+					Observation weights broadcastable to values.shape (i.e. shape (Y,1,1) for year weights)
+					Computes sum(w*x)/sum(w) over the non-np.nan observations in the window
+	min_count 	: 	int, optional(default=None **Window Length**)
+					Minimum number of non-np.nan observations in a window to compute an average
+					Default requires a complete window (i.e. pd.rolling_mean behaviour)
+	edges 		: 	str, optional(default='drop')
+					'drop' 		: Only return years with a complete window
+					'partial' 	: Return all years and truncate windows at the edges of the panel
+
+	Returns
+	-------
+	(year_positions, smoothed) where year_positions index the year axis of values
+
+	Raises
+	------
+	ValueError
+		if edges='drop' and the panel is too short for any complete window
+
+	"""
+	pre, cur, post = smoother
+	if pre < 0 or post < 0 or cur not in (0, 1):
+		raise ValueError("smoother must be (pre-periods >= 0, cur-period in (0,1), post-periods >= 0)")
+	window = pre + cur + post
+	if window == 0:
+		raise ValueError("smoother must contain at least one period")
+	if min_count is None:
+		min_count = window
+	values = np.asarray(values, dtype=np.float64)
+	shape = values.shape
+	nyears = shape[0]
+	#-Year Positions and Window Boundaries in Prefix Sum Coordinates-#
+	if edges == 'drop':
+		if pre + post >= nyears:
+			raise ValueError("smoother %s requires more than %s years to compute a complete window (try edges='partial')" % (tuple(smoother), nyears))
+		positions = np.arange(pre, nyears - post)
+	elif edges == 'partial':
+		positions = np.arange(nyears)
+	else:
+		raise ValueError("edges must be 'drop' or 'partial'")
+	lo = np.clip(positions - pre, 0, nyears)
+	hi = np.clip(positions + post + 1, 0, nyears)
+	flat = values.reshape(nyears, -1)
+	if weights is not None:
+		weights = np.asarray(weights, dtype=np.float64)
+		if weights.size == nyears:
+			weights = weights.reshape(nyears, 1) 						#Year Weights are shared by all series
+		else:
+			weights = np.broadcast_arrays(weights, values)[0].reshape(nyears, -1)
+	result = np.empty((len(positions), flat.shape[1]), dtype=np.float64)
+	for block in _blocks(flat.shape[1], nyears):
+		x = flat[:, block]
+		valid = ~np.isnan(x)
+		if weights is None:
+			w = valid.astype(np.float64)
+		else:
+			w = np.where(valid, weights if weights.shape[1] == 1 else weights[:, block], 0.0)
+		#-Prefix Sums with a Leading Zero Row-#
+		cs = np.zeros((nyears + 1, x.shape[1]), dtype=np.float64)
+		np.cumsum(np.where(valid, x, 0.0) * w, axis=0, out=cs[1:])
+		cw = np.zeros_like(cs)
+		np.cumsum(w, axis=0, out=cw[1:])
+		cn = np.zeros((nyears + 1, x.shape[1]), dtype=np.int32)
+		np.cumsum(valid, axis=0, out=cn[1:])
+		total = cs[hi] - cs[lo]
+		weight = cw[hi] - cw[lo]
+		count = cn[hi] - cn[lo]
+		if cur == 0:
+			total -= cs[positions + 1] - cs[positions]
+			weight -= cw[positions + 1] - cw[positions]
+			count -= cn[positions + 1] - cn[positions]
+		with np.errstate(invalid='ignore', divide='ignore'):
+			avg = total / weight
+		avg[(count < min_count) | (weight == 0)] = np.nan
+		result[:, block] = avg
+	return positions, result.reshape((len(positions),) + shape[1:])
+
+###---------------###
+###---Averaging---###
+###---------------###
+
+def year_windows(years, length, step=None):
+	"""
+	Construct a list of (start_year, end_year) windows over consecutive years
+
+	Parameters
+	----------
+	years 	: 	list(int)
+	length 	: 	int
+				Number of years in each window
+	step 	: 	int, optional(default=None **length**)
+				Years between the start of each window
+				step=length gives non-overlapping blocks (i.e. 5 year averages), step=1 gives rolling windows
+
+	"""
+	if step is None: step = length
+	years = sorted(years)
+	return [(year, year + length - 1) for year in range(years[0], years[-1] - length + 2, step)]
+
+def window_panel_mean(values, windows, skipna=False, min_count=1):
+	"""
+	Average a Panel Array over a collection of Year Windows using a single Prefix Sum pass
+
+	Parameters
+	----------
+	values 		: 	np.array((Y, ...))
+	windows 	: 	list((start, stop))
+					Positions along the year axis (half-open [start, stop))
+	skipna 		: 	bool, optional(default=False)
+					False : Any np.nan in a window results in np.nan (i.e. 1 + np.nan = np.nan)
+					True  : Average over the non-np.nan observations in each window
+	min_count 	: 	int, optional(default=1)
+					Minimum number of observations when skipna=True
+
+	Returns
+	-------
+	np.array((len(windows), ...))
+
+	"""
+	values = np.asarray(values, dtype=np.float64)
+	shape = values.shape
+	nyears = shape[0]
+	start = np.array([window[0] for window in windows], dtype=np.intp)
+	stop = np.array([window[1] for window in windows], dtype=np.intp)
+	if len(windows) == 0 or (start < 0).any() or (stop > nyears).any() or (stop <= start).any():
+		raise ValueError("windows must be a non-empty list of (start, stop) positions within the year axis")
+	flat = values.reshape(nyears, -1)
+	result = np.empty((len(windows), flat.shape[1]), dtype=np.float64)
+	for block in _blocks(flat.shape[1], nyears):
+		x = flat[:, block]
+		valid = ~np.isnan(x)
+		cs = np.zeros((nyears + 1, x.shape[1]), dtype=np.float64)
+		np.cumsum(np.where(valid, x, 0.0), axis=0, out=cs[1:])
+		cn = np.zeros((nyears + 1, x.shape[1]), dtype=np.int32)
+		np.cumsum(valid, axis=0, out=cn[1:])
+		count = cn[stop] - cn[start]
+		if skipna:
+			with np.errstate(invalid='ignore', divide='ignore'):
+				avg = (cs[stop] - cs[start]) / count
+			avg[count < max(min_count, 1)] = np.nan
+		else:
+			avg = (cs[stop] - cs[start]) / (stop - start).reshape(-1, 1)
+			avg[count < (stop - start).reshape(-1, 1)] = np.nan
+		result[:, block] = avg
+	return result.reshape((len(windows),) + shape[1:])
+
+###-------------###
+###---Filling---###
+###-------------###
+
+def fill_panel_array(values, interpolate=True, max_gap=None, ffill=True, ffill_limit=1, bfill=True, bfill_limit=1, zero_fill=False):
+	"""
+	Fill Intertemporal Gaps along the Year Axis of a Panel Array
+
+	Parameters
+	----------
+	values 		: 	np.array((Y, ...))
+	interpolate : 	bool, optional(default=True)
+					Linearly interpolate np.nan gaps between two observations
+	max_gap 	: 	int, optional(default=None **No Limit**)
+					Only interpolate gaps of up to max_gap consecutive years
+	ffill 		: 	bool, optional(default=True)
+					Forward fill remaining np.nan values with the last observation
+	ffill_limit : 	int, optional(default=1)
+					Limit the number of periods for ffill (None for no limit)
+	bfill 		: 	bool, optional(default=True)
+					Backward fill remaining np.nan values with the next observation
+	bfill_limit : 	int, optional(default=1)
+					Limit the number of periods for bfill (None for no limit)
+	zero_fill 	: 	bool, optional(default=False)
+					Fill any remaining np.nan values with 0
+
+	Returns
+	-------
+	np.array with the same shape as values
+
+	Notes
+	-----
+		[1] 	Steps are applied in order (interpolate, ffill, bfill, zero_fill) and all fills are computed from the original observations
+		[2] 	Gaps are located using the cumulative maximum (minimum) of the index of the last (next) observation in each series
+	"""
+	values = np.array(values, dtype=np.float64)
+	shape = values.shape
+	nyears = shape[0]
+	if ffill_limit is None: ffill_limit = nyears
+	if bfill_limit is None: bfill_limit = nyears
+	if max_gap is None: max_gap = nyears
+	flat = values.reshape(nyears, -1)
+	for block in _blocks(flat.shape[1], nyears):
+		x = flat[:, block]
+		valid = ~np.isnan(x)
+		if valid.all():
+			continue
+		cols = np.arange(x.shape[1])
+		pos = np.arange(nyears, dtype=np.int32).reshape(nyears, 1)
+		#-Index of the Last and Next Observation for each cell-#
+		prev = np.maximum.accumulate(np.where(valid, pos, -1), axis=0)
+		nxt = np.minimum.accumulate(np.where(valid, pos, nyears)[::-1], axis=0)[::-1]
+		has_prev, has_next = prev >= 0, nxt < nyears
+		prev_value = x[np.where(has_prev, prev, 0), cols]
+		next_value = x[np.where(has_next, nxt, 0), cols]
+		missing = ~valid
+		if interpolate:
+			gap = missing & has_prev & has_next & ((nxt - prev - 1) <= max_gap)
+			with np.errstate(invalid='ignore', divide='ignore'):
+				frac = (pos - prev) / (nxt - prev).astype(np.float64)
+			x[gap] = (prev_value + (next_value - prev_value) * frac)[gap]
+			missing &= ~gap
+		if ffill:
+			fill = missing & has_prev & ((pos - prev) <= ffill_limit)
+			x[fill] = prev_value[fill]
+			missing &= ~fill
+		if bfill:
+			fill = missing & has_next & ((nxt - pos) <= bfill_limit)
+			x[fill] = next_value[fill]
+			missing &= ~fill
+		if zero_fill:
+			x[missing] = 0.0 									#x is a view into values
+	return values
+
+###---------------###
+###---Emergence---###
+###---------------###
+
+def first_emergence(active, persistence=1, absence=1, exclude_initial=False):
+	"""
+	Compute the First Emergence Position of each Series along the Year Axis
+
+	A series emerges at position t if it is active for persistence periods [t, t+persistence)
+	and inactive in the absence periods before t (truncated at the start of the panel)
+
+	Parameters
+	----------
+	active 			: 	np.array((Y, ...), dtype=bool)
+						Activity Indicator (i.e. Mcp == 1)
+	persistence 	: 	int, optional(default=1)
+						Number of periods a series must remain active (including the emergence period)
+	absence 		: 	int, optional(default=1)
+						Number of prior periods a series must be inactive
+	exclude_initial : 	bool, optional(default=False)
+						Treat series that are active in the first period as left-censored (no emergence)
+
+	Returns
+	-------
+	np.array(...) of year axis positions with -1 where no emergence is found
+
+	Notes
+	-----
+		[1] 	Series active in the first period emerge at position 0 unless exclude_initial=True
+		[2] 	Emergence within the last (persistence-1) periods cannot be confirmed and is not recorded
+	"""
+	if persistence < 1 or absence < 0:
+		raise ValueError("persistence must be >= 1 and absence >= 0")
+	active = np.asarray(active, dtype=bool)
+	nyears = active.shape[0]
+	first = np.empty(active.shape[1:], dtype=np.int32).reshape(-1)
+	flat = active.reshape(nyears, -1)
+	pos = np.arange(nyears)
+	hi = np.clip(pos + persistence, 0, nyears)
+	lo = np.clip(pos - absence, 0, nyears)
+	confirmed = (pos + persistence <= nyears).reshape(nyears, 1)
+	for block in _blocks(flat.shape[1], nyears):
+		x = flat[:, block]
+		cs = np.zeros((nyears + 1, x.shape[1]), dtype=np.int32)
+		np.cumsum(x, axis=0, out=cs[1:])
+		persists = (cs[hi] - cs[pos]) == persistence
+		absent = (cs[pos] - cs[lo]) == 0
+		emerge = persists & absent & confirmed
+		found = emerge.any(axis=0)
+		if exclude_initial:
+			found &= ~x[0]
+		first[block] = np.where(found, emerge.argmax(axis=0), -1)
+	return first.reshape(active.shape[1:])
+
+def emergence_transitions(first, nyears):
+	"""
+	Construct a Sparse Directed Graph of Product to Product Emergence Transitions
+
+	For each country, the products emerging at one emergence event are linked to the products emerging 
+	at the country's next emergence event. Edge weights count the number of countries with each transition
+
+	Parameters
+	----------
+	first 	: 	np.array((C, P), dtype=int)
+				First emergence positions (-1 for no emergence) (see first_emergence())
+	nyears 	: 	int
+				Number of positions along the year axis
+
+	Returns
+	-------
+	scipy.sparse.csr_matrix((P, P)) with transition counts (row = source product, column = target product)
+
+	"""
+	first = np.asarray(first)
+	ncountries, nproducts = first.shape
+	country, product = np.nonzero(first >= 0)
+	key = country.astype(np.int64) * nyears + first[country, product]
+	#-Emergence Events (country, year) in sorted order and the following event for the same country-#
+	events, event_id = np.unique(key, return_inverse=True)
+	same_country = (events[1:] // nyears) == (events[:-1] // nyears)
+	src = np.flatnonzero(same_country)
+	nevents = len(events)
+	E = sparse.csr_matrix((np.ones(len(key)), (event_id, product)), shape=(nevents, nproducts))
+	N = sparse.csr_matrix((np.ones(len(src)), (src, src + 1)), shape=(nevents, nevents))
+	return (E.T * N * E).tocsr()
@@ -5,6 +5,8 @@ Meta Data and Statistical Descriptive Tools for Trade Datasets
 
 import pandas as pd
 
+from pyeconlab.util.stats import FrameStats
+
 def describe(dataset, table_name="", productcode="productcode", importer="iiso3c", exporter="eiso3c", year="year", verbose=False):
 	"""
 	Describe a Trade Dataset 
@@ -20,26 +22,28 @@ def describe(dataset, table_name="", productcode="productcode", importer="iiso3c
 	------
 	1. Requires iso3c codes
 	1. Infer parameter from calling class?
+	2. Unique entries are computed from integer codes (pyeconlab.util.FrameStats)
 	"""
+	stats = FrameStats(dataset)
 	table_data = [] 								#Collector For Table Data
 	table_idx = [] 									#Collector for Table Index
 	#-Export and Import Specific Data-#
 	try:
-		table_data.append(len(dataset[exporter].unique()))
+		table_data.append(stats.nunique(exporter))
 		table_idx.append("Exporters")
 		if table_name == "": table_name = "Exports"
-	except:
+	except KeyError:
 		if table_name == "": table_name = "Imports"
 	try:
-		table_data.append(len(dataset[importer].unique()))
+		table_data.append(stats.nunique(importer))
 		table_idx.append("Importers")
 		if table_name == "Exports": table_name = "Trade"
-	except:
+	except KeyError:
 		pass
 	#-General Statistics-#
-	table_data.append(len(dataset[productcode].unique()))
+	table_data.append(stats.nunique(productcode))
 	table_idx.append('Products')
-	table_data.append(len(dataset['year'].unique()))
+	table_data.append(stats.nunique(year))
 	table_idx.append('Years')
 	table_data.append(len(dataset))
 	table_idx.append('Trade Flows')
@@ -0,0 +1,194 @@
+"""
+Tests for Panel Array Utilities
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+from numpy.testing import assert_allclose, assert_array_equal
+from pandas.util.testing import assert_frame_equal
+from pyeconlab.trade.util.panel import dict_to_panel_array, panel_array_to_dict, smooth_panel_array, fill_panel_array, year_windows, window_panel_mean, \
+										first_emergence, emergence_transitions
+
+
+class TestPanelArrayConversion(unittest.TestCase):
+	"""
+	Tests for dict_to_panel_array() and panel_array_to_dict()
+	"""
+
+	long_data = {	2000 : 	pd.DataFrame([200., 100., 400.], columns=['export'], 
+										index=pd.MultiIndex.from_tuples([("AUS","0001"), ("AUS","0002"), ("USA","0001")], names=['country', 'productcode'])),
+					2001 : 	pd.DataFrame([25., 30.], columns=['export'], 
+										index=pd.MultiIndex.from_tuples([("AFG","0004"), ("AUS","0001")], names=['country', 'productcode'])),
+				}
+
+	def test_long_data(self):
+		years, index, columns, values = dict_to_panel_array(self.long_data)
+		assert years == [2000, 2001]
+		assert list(index) == ['AFG', 'AUS', 'USA']
+		assert list(columns) == ['0001', '0002', '0004']
+		assert_array_equal(values[0], [[np.nan, np.nan, np.nan], [200., 100., np.nan], [400., np.nan, np.nan]])
+		assert_array_equal(values[1], [[np.nan, np.nan, 25.], [30., np.nan, np.nan], [np.nan, np.nan, np.nan]])
+
+	def test_long_data_roundtrip(self):
+		years, index, columns, values = dict_to_panel_array(self.long_data)
+		data = panel_array_to_dict(values, years, index, columns, name='export', rtype='long')
+		for year in years:
+			assert_frame_equal(data[year], self.long_data[year])
+
+	def test_wide_data(self):
+		wide = dict([(year, df['export'].unstack()) for year, df in self.long_data.items()])
+		years, index, columns, values = dict_to_panel_array(wide)
+		data = panel_array_to_dict(values, years, index, columns, rtype='wide')
+		for year in years:
+			assert_frame_equal(data[year].reindex(index=wide[year].index, columns=wide[year].columns), wide[year], check_names=False)
+
+
+class TestSmoothPanelArray(unittest.TestCase):
+	"""
+	Tests for smooth_panel_array()
+	"""
+
+	values = np.array([	[1., 2.], 
+						[3., np.nan], 
+						[5., 6.], 
+						[7., 8.],
+						[9., 10.] ]).reshape(5, 1, 2)
+
+	def brute_force(self, values, smoother, min_count):
+		pre, cur, post = smoother
+		result = []
+		for t in range(pre, values.shape[0] - post):
+			window = range(t - pre, t) + [t]*cur + range(t + 1, t + post + 1)
+			x = values[window]
+			count = (~np.isnan(x)).sum(axis=0)
+			with np.errstate(invalid='ignore'):
+				avg = np.nansum(x, axis=0) / count
+			avg[count < min_count] = np.nan
+			result.append(avg)
+		return np.array(result)
+
+	def test_centred(self):
+		positions, smoothed = smooth_panel_array(self.values, smoother=(1,1,1))
+		assert_array_equal(positions, [1, 2, 3])
+		assert_allclose(smoothed[:,0,0], [3., 5., 7.])
+		assert np.isnan(smoothed[:,0,1]).tolist() == [True, True, False]
+
+	def test_asymmetric_windows(self):
+		for smoother in [(2,1,0), (0,1,2), (1,0,1), (2,1,1)]:
+			positions, smoothed = smooth_panel_array(self.values, smoother=smoother, min_count=1)
+			assert_allclose(smoothed, self.brute_force(self.values, smoother, min_count=1))
+
+	def test_min_count(self):
+		positions, smoothed = smooth_panel_array(self.values, smoother=(1,1,1), min_count=2)
+		assert_allclose(smoothed[:,0,1], [4., 7., 8.])
+
+	def test_weights(self):
+		weights = np.array([1., 1., 2., 1., 1.])
+		positions, smoothed = smooth_panel_array(self.values, smoother=(1,1,1), weights=weights)
+		assert_allclose(smoothed[:,0,0], [(3. + 10. + 1.)/4., (3. + 10. + 7.)/4., (10. + 7. + 9.)/4.])
+
+	def test_partial_edges(self):
+		positions, smoothed = smooth_panel_array(self.values, smoother=(1,1,1), min_count=1, edges='partial')
+		assert_array_equal(positions, range(5))
+		assert_allclose(smoothed[[0,4],0,0], [2., 8.])
+
+	def test_invalid_smoother(self):
+		self.assertRaises(ValueError, smooth_panel_array, self.values, (1,2,1))
+
+	def test_window_longer_than_panel(self):
+		self.assertRaises(ValueError, smooth_panel_array, self.values, (3,1,2))
+		self.assertRaises(ValueError, smooth_panel_array, self.values[:2], (1,1,1))
+		positions, smoothed = smooth_panel_array(self.values[:2], smoother=(1,1,1), min_count=1, edges='partial')
+		assert_array_equal(positions, [0, 1])
+
+
+class TestWindowPanelMean(unittest.TestCase):
+	"""
+	Tests for year_windows() and window_panel_mean()
+	"""
+
+	values = np.array([	[1., 2.], 
+						[3., np.nan], 
+						[5., 6.], 
+						[7., 8.] ]).reshape(4, 1, 2)
+
+	def test_year_windows(self):
+		assert year_windows(range(1962, 1972), 5) == [(1962, 1966), (1967, 1971)]
+		assert year_windows(range(1962, 1968), 5, step=1) == [(1962, 1966), (1963, 1967)]
+
+	def test_blocks(self):
+		avg = window_panel_mean(self.values, [(0, 2), (2, 4)])
+		assert_allclose(avg[:,0,0], [2., 6.])
+		assert_allclose(avg[:,0,1], [np.nan, 7.])
+
+	def test_skipna(self):
+		avg = window_panel_mean(self.values, [(0, 2), (0, 4)], skipna=True)
+		assert_allclose(avg[:,0,1], [2., 16./3])
+		avg = window_panel_mean(self.values, [(0, 2)], skipna=True, min_count=2)
+		assert np.isnan(avg[0,0,1])
+
+	def test_invalid_windows(self):
+		self.assertRaises(ValueError, window_panel_mean, self.values, [(0, 5)])
+
+
+class TestFillPanelArray(unittest.TestCase):
+	"""
+	Tests for fill_panel_array()
+	"""
+
+	values = np.array([	[np.nan, 1., np.nan], 
+						[np.nan, np.nan, np.nan], 
+						[2., np.nan, np.nan], 
+						[np.nan, 7., np.nan],
+						[np.nan, np.nan, np.nan] ]).reshape(5, 1, 3)
+
+	def test_interpolate(self):
+		filled = fill_panel_array(self.values, ffill=False, bfill=False)
+		assert_allclose(filled[:,0,1], [1., 3., 5., 7., np.nan])
+		assert np.isnan(filled[:,0,0]).tolist() == [True, True, False, True, True]
+
+	def test_fill_limits(self):
+		filled = fill_panel_array(self.values, interpolate=False, ffill_limit=1, bfill_limit=2)
+		assert_allclose(filled[:,0,0], [2., 2., 2., 2., np.nan])
+		assert_allclose(filled[:,0,1], [1., 1., 7., 7., 7.])
+
+	def test_max_gap(self):
+		filled = fill_panel_array(self.values, max_gap=1, ffill=False, bfill=False)
+		assert np.isnan(filled[:,0,1]).tolist() == [False, True, True, False, True]
+
+	def test_zero_fill(self):
+		filled = fill_panel_array(self.values, ffill_limit=None, bfill_limit=None, zero_fill=True)
+		assert_allclose(filled[:,0,0], [2., 2., 2., 2., 2.])
+		assert_allclose(filled[:,0,2], [0., 0., 0., 0., 0.])
+		assert np.isnan(self.values[1,0,1]) 										#Incoming Array is not modified
+
+
+class TestEmergence(unittest.TestCase):
+	"""
+	Tests for first_emergence() and emergence_transitions()
+	"""
+
+	#-(Year, Country, Product)-#
+	active = np.array([	[[1, 0, 0], [0, 0, 0]],
+						[[1, 1, 0], [1, 0, 0]],
+						[[1, 0, 1], [1, 1, 0]],
+						[[0, 1, 1], [1, 1, 1]] ], dtype=bool)
+
+	def test_first_emergence(self):
+		first = first_emergence(self.active)
+		assert_array_equal(first, [[0, 1, 2], [1, 2, 3]])
+
+	def test_persistence(self):
+		first = first_emergence(self.active, persistence=2)
+		assert_array_equal(first, [[0, -1, 2], [1, 2, -1]])
+
+	def test_exclude_initial(self):
+		first = first_emergence(self.active, exclude_initial=True)
+		assert_array_equal(first, [[-1, 1, 2], [1, 2, 3]])
+
+	def test_emergence_transitions(self):
+		first = first_emergence(self.active)
+		graph = emergence_transitions(first, self.active.shape[0]).toarray()
+		assert_array_equal(graph, [[0, 2, 0], [0, 0, 2], [0, 0, 0]])
@@ -3,11 +3,17 @@ Subpackage: Utilities
 """
 
 from .convert   	import  from_series_to_pyfile, from_idxseries_to_pydict, from_dict_to_csv   
-from .files     	import  home_folder, check_directory, package_folder, verify_md5hash, expand_homepath
+from .files     	import  home_folder, check_directory, package_folder, verify_md5hash, expand_homepath, compute_md5hash, file_signature, file_changed
 from .files_excel 	import 	assert_excel_equal
 from .dataframe 	import  recode_index, random_sample, merge_columns, update_operations, check_operations,                                            \
                         	find_row, assert_unique_row_in_df, assert_row_in_df, assert_unique_rows_in_df, assert_rows_in_df,                           \
                         	compute_number_of_spells, compute_spell_lengths, assert_merged_series_items_equal, check_merged_series_items_equal,         \
-                        	mark_duplicates, compare_idx_items, compare_dataframe_rows
-from .concordance 	import 	countryname_concordance, concord_data
-from .hdf 			import 	convert_hdf_to_stata
\ No newline at end of file
+                        	mark_duplicates, compare_idx_items, compare_dataframe_rows, pack_keys, keyed_update, coverage_matrix, coverage_frame, coverage_stats
+from .concordance 	import 	countryname_concordance, concord_data, concord_series, recode_column
+from .hdf 			import 	convert_hdf_to_stata
+from .readers 		import 	read_frames
+from .categorical 	import 	downcast_dtypes, categorize, union_categories, map_unique, groupby_sum, collapse_duplicates, isin_columns, is_categorical, rollup_productcodes
+from .cache 			import 	get_cache, register_cache_format, BuildCache, HDFYearIndexWriter, partition_frame
+from .plan 			import 	LazyPlan
+from .views 			import 	cow_view, CopyOnWriteFrame
+from .stats 			import 	FrameStats, cached_stats, invalidate_stats
@@ -0,0 +1,702 @@
+"""
+Columnar Cache Utilities
+========================
+
+Year partitioned columnar cache for raw trade data. Each column of each year is stored
+in its own file so a load only touches the (year, column) files it requires.
+
+Layout ::
+
+    <path>/
+        manifest.json                   Columns, dtypes and partitions (rows, column hashes, sources)
+        Y1962/<column>.npy              Numeric columns
+        Y1962/<column>.codes.npy        String and Categorical columns (integer codes)
+        Y1962/<column>.categories.npy   Categories for <column>.codes.npy
+
+Notes
+-----
+1. Numeric and code files are read using memory mapping (np.load(mmap_mode='r'))
+2. Cache formats are registered in CACHE_FORMATS (name : class) and constructed using ``get_cache()``
+   so other columnar formats (i.e. feather/parquet) can be added without changing the constructors
+3. The manifest records rows, a content hash for each column and the signature (size, mtime, md5) of the 
+   source files of each partition so a cache can be validated without reloading the source files
+4. ``BuildCache`` stores constructed datasets (one columnar cache per set of construction options)
+5. ``HDFYearIndexWriter`` writes the HDF year index containers (keys Y####) used by the constructors.
+   Partitions are split with a single sort, source files are read in a process pool and the container
+   is written to a temporary file that is renamed once complete (an interrupted build never leaves a
+   partially written container in place)
+
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+from itertools import chain
+import numpy as np
+import pandas as pd
+
+from .categorical import is_categorical, union_categories
+from .files import file_signature, file_changed
+
+CACHE_FORMATS = dict()
+
+# ------------------- #
+# - Manifest Helpers - #
+# ------------------- #
+
+def write_json(fn, obj):
+    """ Write a JSON file via a temporary file so a partially written file is never read """
+    tmp_fn = fn + '.tmp'
+    with open(tmp_fn, 'w') as fl:
+        json.dump(obj, fl, indent=1, sort_keys=True)
+    os.rename(tmp_fn, fn)
+
+def read_json(fn):
+    with open(fn, 'r') as fl:
+        return json.load(fl)
+
+def hash_series(series):
+    """
+    Compute a content hash of a Series
+
+    String and Categorical columns are hashed on their values (sorted categories + codes) so the hash
+    doesn't depend on category order or storage type
+
+    Returns
+    -------
+    str (md5 hexdigest)
+    """
+    md5 = hashlib.md5()
+    if is_categorical(series) or series.dtype.kind == 'O':
+        if is_categorical(series):
+            categories = np.asarray(series.cat.categories, dtype=object)
+            order = np.argsort(categories)
+            rank = np.empty(len(order) + 1, dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            rank[-1] = -1                                                   #codes == -1 are missing values
+            codes = rank.take(series.cat.codes.values)
+            categories = categories[order]
+        else:
+            codes, categories = pd.factorize(series, sort=True)
+            codes = codes.astype(np.int64)
+        md5.update(u'\x00'.join([unicode(item) for item in categories]).encode('utf-8'))
+        md5.update(np.ascontiguousarray(codes).view(np.uint8))
+    else:
+        md5.update(str(series.dtype))
+        md5.update(np.ascontiguousarray(series.values).view(np.uint8))
+    return md5.hexdigest()
+
+def frame_manifest_entry(df, sources=None):
+    """
+    Construct a manifest entry for a DataFrame (rows, column hashes and source file signatures)
+
+    Parameters
+    ----------
+    df          :   pd.DataFrame
+    sources     :   list(str or dict), optional(default=None)
+                    Source files the data was constructed from (or their precomputed ``file_signature``)
+    """
+    entry = {'rows' : len(df), 'hashes' : dict([(str(col), hash_series(df[col])) for col in df.columns])}
+    if sources is not None:
+        entry['sources'] = [fl if isinstance(fl, dict) else file_signature(fl) for fl in sources]
+    return entry
+
+def validate_manifest_entry(entry, rows=None, df=None):
+    """
+    Validate a manifest entry
+
+    Parameters
+    ----------
+    entry   :   dict
+                Output of ``frame_manifest_entry``
+    rows    :   int, optional(default=None)
+                Number of rows in the cache (fast check)
+    df      :   pd.DataFrame, optional(default=None)
+                Cached data to compare column hashes against (deep check)
+
+    Returns
+    -------
+    list of problems (empty if valid)
+    """
+    problems = []
+    for signature in entry.get('sources', []):
+        if file_changed(signature):
+            problems.append("source file has changed: %s" % signature['path'])
+    if rows is not None and rows != entry['rows']:
+        problems.append("rows: %s != manifest rows: %s" % (rows, entry['rows']))
+    if df is not None:
+        if len(df) != entry['rows']:
+            problems.append("rows: %s != manifest rows: %s" % (len(df), entry['rows']))
+        for col, md5 in entry['hashes'].items():
+            if col not in df.columns:
+                problems.append("column %s is missing" % col)
+            elif hash_series(df[col]) != md5:
+                problems.append("column %s hash does not match manifest" % col)
+    return problems
+
+def partition_frame(df, partition='year', reset_index=False):
+    """
+    Split a DataFrame into partitions using a single (stable) sort and the boundaries between keys
+
+    Parameters
+    ----------
+    df          :   pd.DataFrame
+    partition   :   str, optional(default='year')
+                    Column to partition on
+    reset_index :   bool, optional(default=False)
+                    Construct a new index (0 .. n-1) for each partition
+
+    Returns
+    -------
+    list of (key, pd.DataFrame) in sorted key order
+
+    Notes
+    -----
+    1. Rows keep their original order within a partition (as df.loc[df[partition] == key])
+    2. A DataFrame that is already sorted by partition is sliced without a copy
+    """
+    values = np.asarray(df[partition].values)
+    if len(values) == 0:
+        return []
+    if not (values[1:] >= values[:-1]).all():
+        order = np.argsort(values, kind='mergesort')
+        df = df.take(order)
+        values = values[order]
+    bounds = np.flatnonzero(values[1:] != values[:-1]) + 1
+    starts = np.concatenate([[0], bounds])
+    stops = np.concatenate([bounds, [len(values)]])
+    partitions = []
+    for start, stop in zip(starts, stops):
+        data = df.iloc[start:stop]
+        if reset_index:
+            data = data.reset_index(drop=True)
+        partitions.append((values[start], data))
+    return partitions
+
+# ----------------- #
+# - Cache Formats - #
+# ----------------- #
+
+def register_cache_format(name, cls):
+    """ Register a Cache Class for a format name """
+    CACHE_FORMATS[name] = cls
+
+def get_cache(path, format='npy'):
+    """
+    Return a Cache object for a directory
+
+    Parameters
+    ----------
+    path    :   str
+                Cache Directory
+    format  :   str, optional(default='npy')
+                Registered cache format (see CACHE_FORMATS)
+    """
+    try:
+        cls = CACHE_FORMATS[format]
+    except KeyError:
+        raise ValueError("Cache format: %s is not supported [Valid: %s]" % (format, sorted(CACHE_FORMATS.keys())))
+    return cls(path)
+
+
+class NpyColumnCache(object):
+    """
+    Year partitioned cache of numpy column files with a JSON manifest
+
+    Parameters
+    ----------
+    path    :   str
+                Cache Directory (created on write)
+    """
+
+    format          = 'npy'
+    version         = 1
+    manifest_fn     = 'manifest.json'
+
+    def __init__(self, path):
+        self.path = os.path.join(path, '')
+        self._manifest = None
+
+    def __repr__(self):
+        return "%s(path=%s, years=%s)" % (self.__class__.__name__, self.path, self.years)
+
+    #-Manifest-#
+
+    def exists(self):
+        return os.path.exists(self.path + self.manifest_fn)
+
+    @property
+    def manifest(self):
+        if self._manifest is None:
+            if not self.exists():
+                raise IOError("Cache manifest not found: %s" % (self.path + self.manifest_fn))
+            with open(self.path + self.manifest_fn, 'r') as fl:
+                self._manifest = json.load(fl)
+        return self._manifest
+
+    def write_manifest(self, manifest):
+        """ Write the manifest (via a temporary file so a partially written manifest is never read) """
+        write_json(self.path + self.manifest_fn, manifest)
+        self._manifest = manifest
+
+    @property
+    def years(self):
+        if not self.exists():
+            return []
+        return sorted([int(year) for year in self.manifest['partitions'].keys()])
+
+    @property
+    def columns(self):
+        return [item['name'] for item in self.manifest['columns']]
+
+    def partition_dir(self, year):
+        return self.path + 'Y%s' % year + os.sep
+
+    #-Write-#
+
+    def _write_column(self, pdir, name, series):
+        """ Write a single column and return its spec """
+        if is_categorical(series) or series.dtype.kind == 'O':
+            if is_categorical(series):
+                codes, categories = series.cat.codes.values, series.cat.categories
+            else:
+                codes, categories = pd.factorize(series)
+                categories = pd.Index(categories)
+            spec = {'name' : name, 'kind' : 'categorical' if is_categorical(series) else 'object'}
+            if categories.dtype.kind == 'O':
+                spec['categories'] = 'unicode' if any([type(item) == unicode for item in categories]) else 'str'
+                categories = np.array([unicode(item) for item in categories], dtype=np.unicode_)
+            else:
+                spec['categories'] = str(categories.dtype)
+                categories = np.asarray(categories)
+            np.save(pdir + name + '.codes.npy', np.asarray(codes))
+            np.save(pdir + name + '.categories.npy', categories)
+        else:
+            spec = {'name' : name, 'kind' : 'numeric', 'dtype' : str(series.dtype)}
+            np.save(pdir + name + '.npy', series.values)
+        return spec
+
+    def write_partition(self, year, df, sources=None, update_manifest=True, verbose=False):
+        """
+        Write a single year partition
+
+        Parameters
+        ----------
+        year            :   int
+        df              :   pd.DataFrame
+                            Data for year (index is not stored)
+        sources         :   list(str), optional(default=None)
+                            Source files for year (signatures are stored in the manifest)
+        update_manifest :   bool, optional(default=True)
+                            Add the partition to the manifest
+
+        Returns
+        -------
+        (columns, entry)
+        """
+        pdir = self.partition_dir(year)
+        if not os.path.exists(pdir):
+            os.makedirs(pdir)
+        if verbose: print "[INFO] Writing %s rows for year %s to %s" % (len(df), year, pdir)
+        columns = [self._write_column(pdir, str(name), df[name]) for name in df.columns]
+        entry = frame_manifest_entry(df, sources=sources)
+        if update_manifest:
+            manifest = self.manifest if self.exists() else {'format' : self.format, 'version' : self.version, 'partition' : 'year', 'columns' : columns, 'partitions' : {}}
+            manifest['columns'] = columns
+            manifest['partitions'][str(year)] = entry
+            self.write_manifest(manifest)
+        return columns, entry
+
+    def write(self, df, partition='year', sources=None, verbose=False):
+        """
+        Write a DataFrame to the cache, partitioned by year (replaces existing partitions for these years)
+
+        Parameters
+        ----------
+        df          :   pd.DataFrame
+        partition   :   str, optional(default='year')
+                        Column containing the year
+        sources     :   dict(year : list(str)), optional(default=None)
+                        Source files for each year (signatures are stored in the manifest). 
+                        A source file shared by several years is only hashed once
+        """
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+        manifest = self.manifest if self.exists() else {'format' : self.format, 'version' : self.version, 'partition' : partition, 'partitions' : {}}
+        signatures = dict()
+        if sources is not None:
+            for fl in set(chain.from_iterable(sources.values())):
+                signatures[fl] = file_signature(fl)
+        columns = None
+        for year, data in partition_frame(df, partition=partition):
+            year_sources = None if sources is None or year not in sources else [signatures[fl] for fl in sources[year]]
+            columns, entry = self.write_partition(year, data, sources=year_sources, update_manifest=False, verbose=verbose)
+            manifest['partitions'][str(year)] = entry
+        if columns is not None:
+            manifest['columns'] = columns
+        manifest['partition'] = partition
+        self.write_manifest(manifest)
+
+    #-Validate-#
+
+    def validate(self, years=None, deep=False, verbose=False):
+        """
+        Validate the cache against the manifest
+
+        Parameters
+        ----------
+        years   :   list, optional(default=None)
+                    Partitions to validate (Default: All)
+        deep    :   bool, optional(default=False)
+                    Read each partition and compare column hashes. 
+                    Otherwise only source file signatures, column files and row counts are checked (fast)
+
+        Returns
+        -------
+        dict(year : list of problems) for partitions with problems (empty if valid)
+        """
+        if not self.exists():
+            return {None : ["manifest not found: %s" % (self.path + self.manifest_fn)]}
+        available = self.years
+        if years is None:
+            years = available
+        problems = dict()
+        for year in years:
+            if year not in available:
+                problems[year] = ["partition is not in the cache"]
+                continue
+            entry = self.manifest['partitions'][str(year)]
+            pdir = self.partition_dir(year)
+            missing = []
+            for spec in self.manifest['columns']:
+                suffixes = ['.npy'] if spec['kind'] == 'numeric' else ['.codes.npy', '.categories.npy']
+                missing += [spec['name'] + suffix for suffix in suffixes if not os.path.exists(pdir + spec['name'] + suffix)]
+            if len(missing) > 0:
+                problems[year] = ["missing column files: %s" % missing]
+                continue
+            if deep:
+                result = validate_manifest_entry(entry, df=self.read(years=[year], mmap=True))
+            else:
+                result = validate_manifest_entry(entry)
+                for spec in self.manifest['columns']:                       #Rows are read from the .npy headers
+                    suffix = '.npy' if spec['kind'] == 'numeric' else '.codes.npy'
+                    rows = np.load(pdir + spec['name'] + suffix, mmap_mode='r').shape[0]
+                    if rows != entry['rows']:
+                        result.append("column %s rows: %s != manifest rows: %s" % (spec['name'], rows, entry['rows']))
+            if len(result) > 0:
+                problems[year] = result
+            if verbose: print "[INFO] Year %s: %s" % (year, "OK" if len(result) == 0 else result)
+        return problems
+
+    def is_valid(self, years=None, deep=False):
+        """ Check if the cache is valid (see validate()) """
+        return len(self.validate(years=years, deep=deep)) == 0
+
+    #-Read-#
+
+    def _read_column(self, pdir, spec, mmap=True):
+        mmap_mode = 'r' if mmap else None
+        name = spec['name']
+        if spec['kind'] == 'numeric':
+            return np.load(pdir + name + '.npy', mmap_mode=mmap_mode)
+        codes = np.load(pdir + name + '.codes.npy', mmap_mode=mmap_mode)
+        categories = np.load(pdir + name + '.categories.npy')
+        if spec['categories'] == 'str':
+            categories = np.array([str(item) for item in categories], dtype=object)
+        elif spec['categories'] == 'unicode':
+            categories = categories.astype(object)
+        return pd.Categorical.from_codes(np.asarray(codes), categories=categories)
+
+    def read(self, years=None, columns=None, mmap=True, categorical=False, verbose=False):
+        """
+        Read years and columns from the cache
+
+        Parameters
+        ----------
+        years       :   list, optional(default=None)
+                        Only partitions for these years are read (Default: All)
+        columns     :   list, optional(default=None)
+                        Only these column files are read (Default: All)
+        mmap        :   bool, optional(default=True)
+                        Memory map column files
+        categorical :   bool, optional(default=False)
+                        Return string columns as Categoricals (Default: columns written as Categoricals only)
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        specs = self.manifest['columns']
+        if columns is not None:
+            missing = set(columns).difference(set(self.columns))
+            if len(missing) > 0:
+                raise ValueError("Columns: %s are not in the cache" % sorted(missing))
+            specs = [spec for spec in specs if spec['name'] in columns]
+            specs = sorted(specs, key=lambda spec: list(columns).index(spec['name']))
+        available = self.years
+        if years is None:
+            years = available
+        missing = set(years).difference(set(available))
+        if len(missing) > 0:
+            raise ValueError("Years: %s are not in the cache" % sorted(missing))
+        frames = []
+        for year in sorted(years):
+            pdir = self.partition_dir(year)
+            if verbose: print "[INFO] Reading %s columns for year %s from %s" % (len(specs), year, pdir)
+            data = pd.DataFrame(dict([(spec['name'], self._read_column(pdir, spec, mmap=mmap)) for spec in specs]), columns=[spec['name'] for spec in specs])
+            frames.append(data)
+        if len(frames) == 0:
+            return pd.DataFrame(columns=[spec['name'] for spec in specs])
+        string_columns = [spec['name'] for spec in specs if spec['kind'] != 'numeric']
+        union_categories(frames, string_columns)
+        data = pd.concat(frames, ignore_index=True)
+        del frames
+        if not categorical:
+            for spec in specs:
+                if spec['kind'] == 'object':
+                    data[spec['name']] = np.asarray(data[spec['name']], dtype=object)
+        return data
+
+register_cache_format(NpyColumnCache.format, NpyColumnCache)
+
+
+# ------------------ #
+# - HDF Year Index - #
+# ------------------ #
+
+def _read_partition(args):
+    """ Worker: Read a single year partition and (optionally) construct its manifest entry """
+    reader, year, rargs, rkwargs, sources, manifest = args
+    df = reader(*rargs, **rkwargs)
+    entry = frame_manifest_entry(df, sources=sources) if manifest else None
+    return year, df, entry
+
+class HDFYearIndexWriter(object):
+    """
+    Write year partitions to a HDF container with a key per year (Y####)
+
+    Parameters
+    ----------
+    fn          :   str
+                    HDF File
+    format      :   str, optional(default='table')
+                    HDF format ('table' or 'fixed')
+    complevel   :   int, optional(default=9)
+    complib     :   str, optional(default='zlib')
+                    Compression library ('blosc' compresses using multiple threads and is much faster than zlib at level 9)
+    mode        :   str, optional(default='w')
+                    'w' replaces the container, 'a' adds (or replaces) years in an existing container
+    manifest    :   bool, optional(default=False)
+                    Write a manifest (fn + '.manifest.json') with rows, column hashes and source file signatures for each year
+
+    Notes
+    -----
+    1. HDF5 files can't be written concurrently so partitions are compressed and written by the parent process.
+       ``convert()`` reads (and hashes) the next batch of source files in the pool while the current batch is written
+    2. The container is written to fn + '.tmp' and renamed to fn once complete
+    """
+
+    key_fmt = 'Y%s'
+
+    def __init__(self, fn, format='table', complevel=9, complib='zlib', mode='w', manifest=False):
+        if mode not in ['w', 'a']:
+            raise ValueError("mode must be 'w' or 'a'")
+        self.fn = fn
+        self.format = format
+        self.complevel = complevel
+        self.complib = complib
+        self.mode = mode
+        self.manifest = manifest
+
+    def __repr__(self):
+        return "%s(fn=%s)" % (self.__class__.__name__, self.fn)
+
+    @property
+    def manifest_fn(self):
+        return self.fn + '.manifest.json'
+
+    def _write(self, partitions, verbose=False):
+        """
+        Write an iterable of (year, df, manifest entry) to a temporary container and rename it to fn
+        """
+        tmp_fn = self.fn + '.tmp'
+        if os.path.exists(tmp_fn):
+            os.remove(tmp_fn)
+        if self.mode == 'a' and os.path.exists(self.fn):
+            shutil.copyfile(self.fn, tmp_fn)
+        if self.manifest and self.mode == 'a' and os.path.exists(self.manifest_fn):
+            manifest = read_json(self.manifest_fn)
+        else:
+            manifest = {'format' : 'hdf', 'partition' : 'year', 'partitions' : {}}
+        hdf = pd.HDFStore(tmp_fn, complevel=self.complevel, complib=self.complib)
+        try:
+            for year, df, entry in partitions:
+                if verbose: print "[INFO] Writing %s rows for year %s to %s" % (len(df), year, self.fn)
+                hdf.put(self.key_fmt % year, df, format=self.format)
+                if self.manifest:
+                    manifest['partitions'][str(year)] = entry if entry is not None else frame_manifest_entry(df)
+            if verbose: print hdf
+        except:
+            hdf.close()
+            os.remove(tmp_fn)
+            raise
+        hdf.close()
+        os.rename(tmp_fn, self.fn)
+        if self.manifest:
+            write_json(self.manifest_fn, manifest)
+        return self.fn
+
+    def write(self, df, partition='year', reset_index=False, verbose=False):
+        """
+        Write a DataFrame partitioned by year
+
+        Parameters
+        ----------
+        df          :   pd.DataFrame
+        partition   :   str, optional(default='year')
+                        Column containing the year
+        reset_index :   bool, optional(default=False)
+                        Construct a new index for each year (otherwise the index of df is stored)
+        """
+        partitions = partition_frame(df, partition=partition, reset_index=reset_index)
+        return self._write(((year, data, None) for year, data in partitions), verbose=verbose)
+
+    def convert(self, reader, items, pool='process', workers=None, verbose=False):
+        """
+        Read source files (one per year) using a bounded pool and write them to the container
+
+        Parameters
+        ----------
+        reader      :   function
+                        Module level function returning a pd.DataFrame (i.e. pd.read_stata)
+        items       :   list
+                        List of (year, fn) or (year, fn, kwargs) for reader(fn, **kwargs). fn is recorded as the source in the manifest
+        pool        :   str, optional(default='process')
+                        'thread', 'process' or None (serial)
+        workers     :   int, optional(default=None)
+                        Size of the pool. Default is min(len(items), cpu_count, 4)
+        """
+        tasks = []
+        for item in items:
+            year, fn = item[0], item[1]
+            rkwargs = item[2] if len(item) > 2 else {}
+            tasks.append((reader, year, (fn,), rkwargs, [fn], self.manifest))
+        if pool not in ['thread', 'process', None]:
+            raise ValueError("pool must be 'thread', 'process' or None")
+        if workers is None:
+            workers = max(min(len(tasks), multiprocessing.cpu_count(), 4), 1)
+        if pool is None or workers <= 1 or len(tasks) <= 1:
+            return self._write((_read_partition(task) for task in tasks), verbose=verbose)
+        p = ThreadPool(workers) if pool == 'thread' else multiprocessing.Pool(workers)
+        batches = [tasks[idx:idx+workers] for idx in range(0, len(tasks), workers)]
+        def pipeline():
+            pending = p.map_async(_read_partition, batches[0])
+            for idx in range(len(batches)):
+                current = pending.get()
+                if idx + 1 < len(batches):
+                    pending = p.map_async(_read_partition, batches[idx+1])     #Read the next batch while writing
+                for result in current:
+                    yield result
+        try:
+            return self._write(pipeline(), verbose=verbose)
+        finally:
+            p.terminate()
+            p.join()
+
+# --------------- #
+# - Build Cache - #
+# --------------- #
+
+def build_key(**options):
+    """
+    Compute a key (md5 hexdigest) for a set of construction options
+
+    Options are serialised to JSON (sorted keys) so the key doesn't depend on argument order
+    """
+    return hashlib.md5(json.dumps(options, sort_keys=True, default=str)).hexdigest()
+
+class BuildCache(object):
+    """
+    On-disk cache of constructed datasets keyed by their construction options
+
+    Each build is stored as a year partitioned columnar cache in <path>/<key>/ along with the options 
+    used to construct it (<path>/<key>/options.json)
+
+    Parameters
+    ----------
+    path    :   str
+                Cache Directory (created on write)
+    format  :   str, optional(default='npy')
+                Registered cache format (see CACHE_FORMATS)
+
+    Example
+    -------
+    builds = BuildCache(path)
+    key = builds.key(source=source_hash, dataset='A', level=3, data_type='trade')
+    df = builds.get(key)
+    if df is None:
+        df = construct(...)
+        builds.put(key, df, options)
+    """
+
+    options_fn = 'options.json'
+
+    def __init__(self, path, format='npy'):
+        self.path = os.path.join(path, '')
+        self.format = format
+
+    def __repr__(self):
+        return "%s(path=%s)" % (self.__class__.__name__, self.path)
+
+    def key(self, **options):
+        return build_key(**options)
+
+    def keys(self):
+        """ List of keys for builds in the cache """
+        if not os.path.exists(self.path):
+            return []
+        return sorted([item for item in os.listdir(self.path) if os.path.exists(os.path.join(self.path, item, self.options_fn))])
+
+    def options(self, key):
+        """ Construction options stored with a build """
+        return read_json(os.path.join(self.path, key, self.options_fn))
+
+    def get(self, key, verbose=False):
+        """
+        Return a previously constructed dataset (or None if the build is not in the cache or is invalid)
+        """
+        cache = get_cache(os.path.join(self.path, key), format=self.format)
+        if not os.path.exists(os.path.join(self.path, key, self.options_fn)) or not cache.is_valid():
+            return None
+        if verbose: print "[INFO] Loading dataset from build cache: %s" % cache.path
+        return cache.read(mmap=False)
+
+    def put(self, key, df, options=None, partition='year', verbose=False):
+        """
+        Store a constructed dataset
+
+        Parameters
+        ----------
+        key         :   str
+        df          :   pd.DataFrame
+                        Dataset (the index is not stored)
+        options     :   dict, optional(default=None)
+                        Construction options (stored for reference)
+        partition   :   str, optional(default='year')
+        """
+        self.clear(key)
+        path = os.path.join(self.path, key)
+        if verbose: print "[INFO] Writing dataset to build cache: %s" % path
+        get_cache(path, format=self.format).write(df, partition=partition)
+        write_json(os.path.join(path, self.options_fn), options if options is not None else {})   #Written last: marks a complete build
+
+    def clear(self, key=None):
+        """ Remove a build (or all builds if key is None) """
+        keys = self.keys() if key is None else [key]
+        for item in keys:
+            path = os.path.join(self.path, item)
+            if os.path.exists(path):
+                shutil.rmtree(path)
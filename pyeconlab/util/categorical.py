@@ -0,0 +1,386 @@
+"""
+Categorical and dtype Utilities
+===============================
+
+Utilities for holding large trade datasets in a memory efficient representation
+(Categorical string columns and downcast numeric columns) and operating on them
+without converting back to python objects
+
+Notes
+-----
+1. A groupby over more than one Categorical column returns the cartesian product of the categories
+   (observed=False). ``groupby_sum`` groups on the integer codes instead so only observed groups are returned
+2. ``collapse_duplicates`` sums values over duplicate keys by sorting a packed int64 key once and using np.add.reduceat
+3. ``isin_columns`` matches codes over multiple columns (i.e. exporter and importer) with a single mask
+4. ``rollup_productcodes`` aggregates a hierarchical product code (i.e. sitc4, hs6) to multiple levels using 
+   integer codes and np.bincount
+
+"""
+
+import numpy as np
+import pandas as pd
+
+def is_categorical(series):
+    """ Check if a Series has a Categorical dtype """
+    return str(series.dtype) == 'category'
+
+def downcast_dtypes(df, integer=True, floating=False):
+    """
+    Downcast Numeric Columns of a DataFrame (inplace)
+
+    Parameters
+    ----------
+    df          :   pd.DataFrame
+    integer     :   bool, optional(default=True)
+                    Downcast int64 columns to int32 when [min, max] fits
+                    (int32 is the floor so arithmetic such as unit conversions doesn't overflow)
+    floating    :   bool, optional(default=False)
+                    Downcast float64 columns to float32 when the conversion is lossless
+
+    Returns
+    -------
+    df          :   pd.DataFrame
+    """
+    for col in df.columns:
+        dtype = df[col].dtype
+        if integer and dtype.kind in 'iu' and dtype.itemsize > 4 and len(df[col]) > 0:
+            info = np.iinfo(np.int32)
+            if df[col].min() >= info.min and df[col].max() <= info.max:
+                df[col] = df[col].astype(np.int32)
+        elif floating and dtype == np.float64:
+            values = df[col].values
+            values32 = values.astype(np.float32)
+            with np.errstate(invalid='ignore'):
+                lossless = ((values32 == values) | np.isnan(values)).all()
+            if lossless:
+                df[col] = values32
+    return df
+
+def categorize(df, columns, categories=None):
+    """
+    Convert columns of a DataFrame to Categoricals (inplace)
+
+    Parameters
+    ----------
+    df          :   pd.DataFrame
+    columns     :   list
+                    Columns to convert (columns not in df are ignored)
+    categories  :   dict, optional(default=None)
+                    Dictionary of column : categories to share categories with other DataFrames
+
+    Returns
+    -------
+    df          :   pd.DataFrame
+    """
+    for col in columns:
+        if col not in df.columns:
+            continue
+        if categories is not None and col in categories:
+            df[col] = pd.Categorical(df[col], categories=categories[col])
+        elif not is_categorical(df[col]):
+            df[col] = df[col].astype('category')
+    return df
+
+def union_categories(frames, columns):
+    """
+    Set a shared (sorted) set of categories across a list of DataFrames (inplace)
+
+    This allows Categorical columns to be preserved when the frames are concatenated
+
+    Parameters
+    ----------
+    frames      :   list(pd.DataFrame)
+    columns     :   list
+                    Categorical columns
+
+    Returns
+    -------
+    categories  :   dict(column : pd.Index)
+    """
+    categories = dict()
+    for col in columns:
+        items = [df[col].cat.categories for df in frames if col in df.columns and is_categorical(df[col])]
+        if len(items) == 0:
+            continue
+        union = items[0]
+        for item in items[1:]:
+            union = union.union(item)
+        categories[col] = union
+        for df in frames:
+            if col in df.columns and is_categorical(df[col]):
+                df[col] = df[col].cat.set_categories(union)
+    return categories
+
+def map_unique(series, func, categorical=None):
+    """
+    Apply a function to each unique value of a series and broadcast the result back to the rows
+
+    Parameters
+    ----------
+    series          :   pd.Series
+    func            :   function
+    categorical     :   bool, optional(default=None)
+                        Return a Categorical. Default: only if series is Categorical and the result is not numeric
+
+    Returns
+    -------
+    pd.Series with the same index and name as series
+    """
+    if is_categorical(series):
+        labels, uniques = series.cat.codes.values, np.asarray(series.cat.categories, dtype=object)
+    else:
+        labels, uniques = pd.factorize(series)
+        uniques = np.asarray(uniques, dtype=object)
+    values = pd.Series([func(item) for item in uniques]).values
+    if categorical is None:
+        categorical = is_categorical(series) and values.dtype.kind == 'O'
+    if categorical:
+        new_labels, new_uniques = pd.factorize(values, sort=True)
+        codes = np.append(new_labels, -1).take(labels)                      #labels == -1 are missing values
+        result = pd.Categorical.from_codes(codes, categories=new_uniques)
+    else:
+        if (labels == -1).any():                                            #Only upcast (i.e. int to float) when there are missing values
+            if values.dtype.kind in 'iub':
+                values = values.astype(np.float64)
+            values = np.append(values, np.array([np.nan], dtype=object) if values.dtype.kind == 'O' else np.nan)
+        result = values.take(labels)
+    return pd.Series(result, index=series.index, name=series.name)
+
+def groupby_sum(df, by, values=None):
+    """
+    Sum value columns of a DataFrame grouped by one or more columns (which may be Categorical)
+
+    Parameters
+    ----------
+    df          :   pd.DataFrame
+    by          :   list
+                    Columns to group by
+    values      :   list, optional(default=None)
+                    Value columns to sum (Default: all remaining columns)
+
+    Returns
+    -------
+    pd.DataFrame (not indexed) with only observed groups and Categorical columns retained
+
+    Notes
+    -----
+    1. Groups containing missing keys are dropped (consistent with pandas groupby)
+    """
+    if type(by) != list:
+        by = [by]
+    if values is None:
+        values = [col for col in df.columns if col not in by]
+    elif type(values) != list:
+        values = [values]
+    categories = dict()
+    data = df[by + values]
+    if any([is_categorical(data[col]) for col in by]):
+        data = data.copy()
+        for col in by:
+            if is_categorical(data[col]):
+                categories[col] = data[col].cat.categories
+                codes = data[col].cat.codes
+                data[col] = codes.where(codes >= 0)                         #Missing values are excluded from groups
+    result = data.groupby(by).sum().reset_index()
+    for col in categories.keys():
+        result[col] = pd.Categorical.from_codes(result[col].values.astype(np.int64), categories=categories[col])
+    return result
+
+def collapse_duplicates(df, by, values=None, return_duplicated=False):
+    """
+    Sum value columns over rows with duplicate keys (as ``groupby_sum``) using a packed integer key
+
+    The integer codes of the key columns are packed into a single int64 key which is sorted once. Integer values
+    are summed within runs of equal keys using np.add.reduceat (float values with np.bincount over the run ids so 
+    they are summed in row order) and duplicate rows are identified from the first row of each run
+
+    Parameters
+    ----------
+    df                  :   pd.DataFrame
+    by                  :   list
+                            Key columns
+    values              :   list, optional(default=None)
+                            Value columns to sum (Default: all remaining columns)
+    return_duplicated   :   bool, optional(default=False)
+                            Also return a boolean array marking duplicate rows (as df.duplicated(subset=by))
+
+    Returns
+    -------
+    pd.DataFrame (not indexed, sorted by the key columns) or (pd.DataFrame, np.ndarray) if return_duplicated
+
+    Notes
+    -----
+    1. Groups containing missing keys are dropped from the result (consistent with groupby_sum) but are 
+       included when identifying duplicate rows (consistent with df.duplicated)
+    2. Key columns retain their dtype (including Categoricals) and integer values are summed as int64 and 
+       returned in their original dtype (as groupby().sum())
+    """
+    if type(by) != list:
+        by = [by]
+    if values is None:
+        values = [col for col in df.columns if col not in by]
+    elif type(values) != list:
+        values = [values]
+    nrows = len(df)
+    #-Packed Key (missing values take code 0; compressed when the key space would overflow an int64)-#
+    key = np.zeros(nrows, dtype=np.int64)
+    missing = np.zeros(nrows, dtype=bool)
+    size = 1
+    for col in by:
+        labels, uniques = _factorize(df[col])
+        missing |= (labels < 0)
+        if size * (len(uniques) + 1) >= 2**62:
+            uniques_key, key = np.unique(key, return_inverse=True)          #Sorted so the key order is preserved
+            key, size = key.astype(np.int64), len(uniques_key)
+        key = key * (len(uniques) + 1) + (labels + 1)
+        size = size * (len(uniques) + 1)
+    #-Runs of Equal Keys (one sort; the group id of each row and its first row follow from the run boundaries)-#
+    order = np.argsort(key)
+    key = key[order]
+    first = np.ones(nrows, dtype=bool)
+    first[1:] = key[1:] != key[:-1]
+    starts = np.flatnonzero(first)
+    ids = np.empty(nrows, dtype=np.int64)
+    ids[order] = np.cumsum(first) - 1
+    rows = np.empty(len(starts), dtype=np.int64)
+    rows[ids[::-1]] = np.arange(nrows - 1, -1, -1)                          #First row of each group
+    #-Sum Values within Runs-#
+    keep = ~missing[rows]
+    result = df[by].iloc[rows[keep]].reset_index(drop=True)
+    for col in values:
+        weights = df[col].values
+        dtype = weights.dtype
+        if dtype.kind in 'iub':
+            sums = np.add.reduceat(weights.astype(np.int64)[order], starts) if nrows > 0 else np.zeros(0, dtype=np.int64)
+        else:
+            weights = np.where(np.isnan(weights), 0, weights)
+            sums = np.bincount(ids, weights=weights, minlength=len(starts))     #Summed in row order (as groupby().sum())
+        sums = sums[keep]
+        if dtype.kind in 'iuf':
+            sums = sums.astype(dtype)
+        result[col] = sums
+    if return_duplicated:
+        duplicated = np.ones(nrows, dtype=bool)
+        duplicated[rows] = False
+        return result, duplicated
+    return result
+
+def isin_columns(df, columns, items):
+    """
+    Find rows where any of columns contains one of items, computed once on the integer codes of each column
+
+    Parameters
+    ----------
+    df          :   pd.DataFrame
+    columns     :   list
+                    Columns to match (i.e. ['eiso3c', 'iiso3c'])
+    items       :   list
+                    Codes to match (i.e. ['WLD', '.'])
+
+    Returns
+    -------
+    (mask, counts)  where mask is a boolean array of rows that match and counts is an array with the number of
+                    matched rows for each item. A row is counted against the first item (in the order of items) it 
+                    matches so counts are the same as filtering the items one at a time
+    """
+    if type(columns) != list:
+        columns = [columns]
+    items = list(items)
+    position = dict()
+    for idx, item in enumerate(items):
+        position.setdefault(item, idx)
+    rank = np.empty(len(df), dtype=np.int64)
+    rank.fill(len(items))
+    for col in columns:
+        labels, uniques = _factorize(df[col], sort=False)
+        lookup = np.array([position.get(item, len(items)) for item in uniques] + [len(items)], dtype=np.int64)   #Missing values (-1) don't match
+        rank = np.minimum(rank, lookup.take(labels))
+    mask = rank < len(items)
+    counts = np.bincount(rank[mask], minlength=len(items))
+    return mask, counts
+
+def _factorize(series, sort=True):
+    """ Return (labels, uniques) for a Series (Categoricals use their codes and categories) """
+    if is_categorical(series):
+        return series.cat.codes.values.astype(np.int64), np.asarray(series.cat.categories, dtype=object)
+    labels, uniques = pd.factorize(series, sort=sort)
+    return labels.astype(np.int64), np.asarray(uniques, dtype=object)
+
+def rollup_productcodes(df, by, code='sitc4', levels=[1,2,3,4], values=['value']):
+    """
+    Sum values at multiple (prefix) levels of a hierarchical product code in one pass over the data
+
+    The data is aggregated once to (by, code) cells using integer codes and np.bincount. Each coarser level 
+    is then computed from these cells using a child -> parent index array (over the unique codes) 
+
+    Parameters
+    ----------
+    df          :   pd.DataFrame
+    by          :   list
+                    Index columns (i.e. ['year', 'eiso3c', 'iiso3c'])
+    code        :   str, optional(default='sitc4')
+                    Product code column (i.e. 'sitc4', 'hs6')
+    levels      :   list(int), optional(default=[1,2,3,4])
+                    Levels (number of leading digits) to compute
+    values      :   list, optional(default=['value'])
+                    Value columns to sum
+
+    Returns
+    -------
+    dict(level : pd.DataFrame) with columns by + [<code name><level>] + values (i.e. 'sitc3'), sorted by (by, code). 
+
+    Notes
+    -----
+    1. Rows with missing keys or codes are dropped (consistent with groupby_sum)
+    2. Output code columns are Categorical if the code column is Categorical
+    """
+    if type(by) != list:
+        by = [by]
+    name = code.rstrip('0123456789')
+    #-Index Keys (sorted, combined progressively so the key space doesn't overflow)-#
+    missing = np.zeros(len(df), dtype=bool)
+    key = np.zeros(len(df), dtype=np.int64)
+    for col in by:
+        labels, uniques = _factorize(df[col])
+        missing |= (labels < 0)
+        key = key * len(uniques) + labels
+        key = pd.factorize(np.where(missing, -1, key), sort=True)[0].astype(np.int64)
+    labels, uniques = _factorize(df[code])
+    valid = ~missing & (labels >= 0)
+    key, labels = key[valid], labels[valid]
+    rows = np.flatnonzero(valid)
+    #-Shared Index Metadata (one representative row per key)-#
+    nkeys = key.max() + 1 if len(key) > 0 else 0
+    first = np.zeros(nkeys, dtype=np.int64)
+    first[key[::-1]] = rows[::-1]
+    meta = df[by].iloc[first].reset_index(drop=True)
+    #-Single Pass: Aggregate Rows to (key, code) cells-#
+    ncodes = len(uniques)
+    cell_ids, cells = pd.factorize(key * ncodes + labels, sort=True)
+    sums = dict()
+    for col in values:
+        weights = df[col].values[valid]
+        if weights.dtype.kind == 'f':
+            weights = np.where(np.isnan(weights), 0, weights)
+        sums[col] = np.bincount(cell_ids, weights=weights, minlength=len(cells))
+    cell_key, cell_code = cells // ncodes, cells % ncodes
+    #-Rollup Levels-#
+    categorical = is_categorical(df[code])
+    result = dict()
+    for level in levels:
+        parent, parent_uniques = pd.factorize(np.array([item[0:level] for item in uniques], dtype=object), sort=True)
+        nparents = len(parent_uniques)
+        ids, lcells = pd.factorize(cell_key * nparents + parent.take(cell_code), sort=True)
+        data = meta.take(lcells // nparents).reset_index(drop=True)
+        lcodes = lcells % nparents
+        if categorical:
+            data[name + str(level)] = pd.Categorical.from_codes(lcodes, categories=parent_uniques)
+        else:
+            data[name + str(level)] = np.asarray(parent_uniques, dtype=object).take(lcodes)
+        for col in values:
+            total = np.bincount(ids, weights=sums[col], minlength=len(lcells))
+            if df[col].dtype.kind in 'iu':
+                total = total.astype(df[col].dtype)
+            data[col] = total
+        result[level] = data
+    return result
@@ -104,4 +104,66 @@ def concord_data(concordance, item, issue_error=True, exception=False):
         elif issue_error == False:
             return item
         else:
-            return issue_error  # Can Specify a Return Code
\ No newline at end of file
+            return issue_error  # Can Specify a Return Code
+
+def concord_series(concordance, series, issue_error=True, exception=False):
+    """
+    Vectorised version of ``concord_data`` for a pd.Series
+
+    The concordance is evaluated once for each unique value (or category) in the series
+    and the result is broadcast back to the rows.
+
+    Parameters
+    ----------
+    concordance     :   dict
+                        A concordance dictionary object
+    series          :   pd.Series
+                        Series of keys to concord
+    issue_error     :   bool or value, optional(default=True)
+                        True returns ``np.nan``, False returns the item, any other value is used as a sentinel when no match is found
+    exception       :   bool, optional(default=False)
+                        Raise a ValueError if an item is not found in the concordance
+
+    Returns
+    -------
+    pd.Series with the same index and name as series
+
+    Notes
+    -----
+    1. Missing values in series are passed to ``concord_data`` in the same way as any other item
+
+    """
+    labels, uniques = _pd.factorize(series)
+    values = [concord_data(concordance, item, issue_error=issue_error, exception=exception) for item in uniques]
+    if (labels == -1).any():                                                            #Missing values are factorized to -1 (i.e. the last item)
+        values.append(concord_data(concordance, _np.nan, issue_error=issue_error, exception=exception))
+    values = _pd.Series(values).values                                                    #Infer dtype from the recoded values (int -> int concordances stay int)
+    return _pd.Series(values.take(labels), index=series.index, name=series.name)
+
+def recode_column(df, column, concordance, target=None, issue_error=True, exception=False):
+    """
+    Recode a DataFrame column (inplace) using a concordance
+
+    Parameters
+    ----------
+    df              :   pd.DataFrame
+    column          :   str
+                        Column containing the keys to concord
+    concordance     :   dict
+                        A concordance dictionary object
+    target          :   str, optional(default=None)
+                        Column to store the result (Default: overwrite column)
+    issue_error     :   bool or value, optional(default=True)
+                        See ``concord_series``
+    exception       :   bool, optional(default=False)
+                        See ``concord_series``
+
+    Returns
+    -------
+    df              :   pd.DataFrame
+
+    """
+    if target is None:
+        target = column
+    df[target] = concord_series(concordance, df[column], issue_error=issue_error, exception=exception).values
+    return df
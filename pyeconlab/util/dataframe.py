@@ -25,12 +25,15 @@ Future Work
 
 import copy
 import re
+import warnings
 import pandas as pd
 import numpy as np
 from itertools import chain, repeat
 
 from pandas.util.testing import assert_series_equal
 
+from .stats import invalidate_stats
+
 # ------------------- #
 # - Index Functions - #
 # ------------------- #
@@ -228,6 +231,112 @@ def merge_columns(ldf, rdf, on, collapse_columns=('value_x', 'value_y', 'value')
     return outer
 
 
+def pack_keys(frames, on):
+    """
+    Encode the values of a set of key columns as a single int64 key with a shared encoding across DataFrames
+
+    Parameters
+    ----------
+    frames      :   list(pd.DataFrame)
+    on          :   list(str)
+                    Key columns (common to all frames)
+
+    Returns
+    -------
+    list(np.array(int64)) one key array per frame
+
+    Notes
+    -----
+    1. Missing values (NaN) are encoded as a value so they match each other (consistent with pd.merge)
+    2. The key is compressed after each column so the packed key cannot overflow
+    """
+    sizes = [len(df) for df in frames]
+    key = np.zeros(sum(sizes), dtype=np.int64)
+    for col in on:
+        values = np.concatenate([np.asarray(df[col]) for df in frames])
+        labels, uniques = pd.factorize(values)
+        key = key * (len(uniques) + 1) + (labels + 1)
+        key = pd.factorize(key)[0].astype(np.int64)
+    return np.split(key, np.cumsum(sizes)[:-1])
+
+def keyed_update(ldf, rdf, on, update, append=True, duplicates='raise', verbose=False):
+    """
+    Update columns of a LEFT DataFrame with the (non-null) values of a RIGHT DataFrame matched on a set of key columns
+
+    This is a vectorised equivalent of merge_columns(dominant='right') using a hash join on a packed int64 key (see ``pack_keys``)
+
+    Parameters
+    ----------
+    ldf         :   pd.DataFrame
+                    Left DataFrame
+    rdf         :   pd.DataFrame
+                    Right DataFrame
+    on          :   list(str)
+                    Key columns
+    update      :   dict(left column : right column)
+                    Columns to update
+    append      :   bool, optional(default=True)
+                    Append RIGHT rows that aren't matched in LEFT
+    duplicates  :   str, optional(default='raise')
+                    Action for duplicate keys in RIGHT ::
+
+                    'raise'     :   raise a ValueError
+                    'sum'       :   sum the update columns of the duplicate rows (with a warning)
+                    'first'     :   keep the first row (with a warning)
+                    'last'      :   keep the last row (with a warning)
+
+    Returns
+    -------
+    pd.DataFrame with the columns of ldf (and a new index). LEFT rows keep their order and appended RIGHT rows follow
+
+    Notes
+    -----
+    1. merge_columns(dominant='right') returns one row for each duplicate RIGHT key. When the duplicate rows are subsequently summed
+       duplicates='sum' gives the same totals
+    """
+    lkey, rkey = pack_keys([ldf, rdf], on)
+    duplicated = pd.Index(rkey).duplicated()
+    if duplicated.any():
+        if duplicates not in ['sum', 'first', 'last']:
+            raise ValueError("RIGHT DataFrame contains %s duplicate keys on %s" % (duplicated.sum(), on))
+        warnings.warn("RIGHT DataFrame contains %s duplicate keys on %s (duplicates='%s')" % (duplicated.sum(), on, duplicates))
+        if duplicates == 'sum':
+            columns = sorted(set(update.values()))
+            totals = rdf[columns].groupby(rkey, sort=False).sum(min_count=1)
+            keep = np.flatnonzero(~duplicated)
+            rdf = rdf.iloc[keep].copy()
+            rkey = rkey[keep]
+            for col in columns:
+                rdf[col] = totals[col].reindex(rkey).values
+        else:
+            keep = np.flatnonzero(~pd.Index(rkey).duplicated(keep=duplicates))
+            rdf = rdf.iloc[keep]
+            rkey = rkey[keep]
+    idx = pd.Index(rkey).get_indexer(lkey)
+    matched = idx >= 0
+    result = ldf.copy()
+    updated = np.zeros(len(ldf), dtype=bool)
+    for lcol, rcol in update.items():
+        rvalues = rdf[rcol].values.take(idx[matched])
+        take = np.flatnonzero(matched)[pd.notnull(rvalues)]
+        values = result[lcol].values.astype(np.result_type(result[lcol].values, rvalues))
+        values[take] = rvalues[pd.notnull(rvalues)]
+        result[lcol] = values
+        updated[take] = True
+    num_appended = 0
+    if append:
+        new = np.ones(len(rdf), dtype=bool)
+        new[idx[matched]] = False
+        num_appended = new.sum()
+        if num_appended > 0:
+            extra = rdf.loc[new, on + list(update.values())].rename(columns=dict([(rcol, lcol) for lcol, rcol in update.items()]))
+            result = pd.concat([result, extra], ignore_index=True)
+            result = result[ldf.columns]
+    result = result.reset_index(drop=True)
+    if verbose:
+        print "[INFO] Keyed Update on %s: %s LEFT observations matched (%s updated) and %s new observations from RIGHT" % (on, matched.sum(), updated.sum(), num_appended)
+    return result
+
 # ------------------------- #
 # - Row Finding Functions - #
 # ------------------------- #
@@ -396,12 +505,14 @@ def update_operations(self, add_op_string):
     -----
     1. If no ``operations`` attribute is found then it constructs the attribute.
     2. Should this reset complete_dataset (# self.complete_dataset = False           #In General this is true)
+    3. Cached dataset statistics (see pyeconlab.util.stats.cached_stats) are invalidated
     """
     try:
         if type(self.operations) == str or type(self.operations) == unicode:
             self.operations += add_op_string
     except:
         self.operations = add_op_string
+    invalidate_stats(self)
 
 
 def check_operations(self, opstring, verbose=False):
@@ -745,6 +856,136 @@ def compute_spell_lengths(wide_df, incremental=False, inplace=False):
     return wide_df
 
 
+def _sorted_factorize(values):
+    """ Sorted factorization where missing values are encoded as 0 (sorted first) and uniques are labels 1 .. n """
+    labels, uniques = pd.factorize(values, sort=True)
+    uniques = np.asarray(uniques)
+    missing = np.array([np.nan], dtype=object if uniques.dtype.kind not in 'iuf' else np.float64)
+    return (labels + 1).astype(np.int64), np.concatenate([missing, uniques]) if (labels == -1).any() else np.concatenate([uniques[:1], uniques])
+
+def coverage_matrix(df, index, column='year', values=None):
+    """
+    Compute a (keys x column) coverage matrix from a long DataFrame (i.e. productcodes x years)
+
+    This is a vectorised equivalent of df[index+[column]].drop_duplicates().set_index(index+[column]).unstack(column) 
+    that fills a single array using fancy indexing on integer codes
+
+    Parameters
+    ----------
+    df          :   pd.DataFrame
+    index       :   list
+                    Key columns for the rows of the matrix
+    column      :   str, optional(default='year')
+                    Column for the columns of the matrix
+    values      :   str, optional(default=None)
+                    Fill the matrix with the values of this column. If None a boolean (bitset) matrix is returned
+
+    Returns
+    -------
+    keys, columns, matrix 
+        keys (pd.Index or pd.MultiIndex sorted), columns (sorted np.array) and a np.array(len(keys), len(columns))
+        When values is specified missing cells are np.nan (unless the matrix is complete)
+
+    Notes
+    -----
+    1. Missing values in the key columns are retained and sorted first (consistent with unstack)
+    2. Rows repeating a (keys, column) cell with different values raise a ValueError (as unstack would)
+    """
+    #-Row Keys (Sorted Lexicographically)-#
+    key = np.zeros(len(df), dtype=np.int64)
+    factors = []
+    for col in index:
+        labels, levels = _sorted_factorize(df[col].values)
+        key = key * len(levels) + labels
+        factors.append((labels, levels))
+        key = np.unique(key, return_inverse=True)[1].astype(np.int64)               #Compress (preserves order) so the key cannot overflow
+    rows = key
+    first = np.zeros(rows.max() + 1 if len(rows) else 0, dtype=np.int64)
+    first[rows] = np.arange(len(df))                                                #A representative row for each key
+    arrays = [levels.take(labels.take(first)) for labels, levels in factors]
+    if len(index) == 1:
+        keys = pd.Index(arrays[0], name=index[0])
+    else:
+        keys = pd.MultiIndex.from_arrays(arrays, names=index)
+    #-Columns-#
+    cols, columns = pd.factorize(df[column].values, sort=True)
+    columns = np.asarray(columns)
+    shape = (len(keys), len(columns))
+    if values is None:
+        matrix = np.zeros(shape, dtype=bool)
+        matrix[rows, cols] = True
+        return keys, columns, matrix
+    #-Values-#
+    vals = df[values].values
+    cell = rows * shape[1] + cols
+    order = np.argsort(cell, kind='mergesort')
+    cell, vals = cell.take(order), vals.take(order)
+    repeat = cell[1:] == cell[:-1]
+    if repeat.any():
+        conflict = vals[1:][repeat] != vals[:-1][repeat]
+        conflict &= ~(pd.isnull(vals[1:][repeat]) & pd.isnull(vals[:-1][repeat]))
+        if conflict.any():
+            raise ValueError("Index contains duplicate entries, cannot reshape")
+    filled = np.zeros(shape[0]*shape[1], dtype=bool)
+    filled[cell] = True
+    if filled.all():
+        matrix = np.empty(shape[0]*shape[1], dtype=vals.dtype)
+    elif vals.dtype.kind in 'iufb':
+        matrix = np.full(shape[0]*shape[1], np.nan)
+    else:
+        matrix = np.full(shape[0]*shape[1], np.nan, dtype=object)
+    matrix[cell] = vals
+    return keys, columns, matrix.reshape(shape)
+
+def coverage_frame(keys, columns, matrix, name=None):
+    """
+    Construct a wide DataFrame from the output of ``coverage_matrix``
+
+    Boolean matrices are converted to an indicator (1.0 or np.nan, or 1 if the matrix is complete) 
+    """
+    if matrix.dtype == bool:
+        matrix = np.ones(matrix.shape, dtype=np.int64) if matrix.all() else np.where(matrix, 1.0, np.nan)
+    return pd.DataFrame(matrix, index=keys, columns=pd.Index(columns, name=name))
+
+def coverage_stats(matrix, columns, spells=True):
+    """
+    Compute Coverage Statistics for each row of a coverage matrix (see ``coverage_matrix``)
+
+    Parameters
+    ----------
+    matrix      :   np.array
+                    Coverage matrix (boolean or values with np.nan as missing)
+    columns     :   array
+                    Column labels (i.e. years) in order
+    spells      :   bool, optional(default=True)
+                    Include FirstYear, LastYear, Gaps and Spells
+
+    Returns
+    -------
+    pd.DataFrame(Coverage, %Coverage[, FirstYear, LastYear, Gaps, Spells]) with a row for each row of matrix
+
+    Notes
+    -----
+    1. Gaps is the number of missing columns between the first and last observation
+    2. Spells is the number of continuous runs of observations
+    """
+    if matrix.dtype != bool:
+        matrix = pd.notnull(matrix)
+    nrows, ncols = matrix.shape
+    coverage = matrix.sum(axis=1)
+    stats = pd.DataFrame({'Coverage' : coverage, '%Coverage' : coverage / float(ncols) if ncols else np.nan}, columns=['Coverage', '%Coverage'])
+    if spells:
+        observed = coverage > 0
+        first = matrix.argmax(axis=1)
+        last = ncols - 1 - matrix[:, ::-1].argmax(axis=1)
+        columns = np.asarray(columns)
+        stats['FirstYear'] = np.where(observed, columns.take(first), np.nan) if ncols else np.nan
+        stats['LastYear'] = np.where(observed, columns.take(last), np.nan) if ncols else np.nan
+        stats['Gaps'] = np.where(observed, last - first + 1 - coverage, 0)
+        stats['Spells'] = matrix[:, :1].sum(axis=1) + (matrix[:, 1:] & ~matrix[:, :-1]).sum(axis=1)
+    return stats
+
+
 
 # ----------- #
 # - IN WORK - #
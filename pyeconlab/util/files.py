@@ -95,6 +95,23 @@ def package_folder(__file__, localdir):
     path = os.path.join(this_dir, localdir)
     return check_directory(path)
 
+def compute_md5hash(fl, blocksize=2**20):
+    """
+    Compute a File's md5 hash (reading blocks to limit memory use)
+
+    Parameters
+    ----------
+    fl          :   str
+                    absolute reference to file
+    blocksize   :   int, optional(default=2**20)
+                    number of bytes read at a time
+    """
+    md5 = hashlib.md5()
+    with open(fl, 'rb') as f:
+        for block in iter(lambda: f.read(blocksize), b''):
+            md5.update(block)
+    return md5.hexdigest()
+
 def verify_md5hash(fl, md5hash):
     """
     Verify a File's md5 hash
@@ -111,7 +128,50 @@ def verify_md5hash(fl, md5hash):
     value   :   bool
                 Returns if the file still matches supplied md5hash True/False
     """
-    computed_md5hash = hashlib.md5(open(fl, 'rb').read()).hexdigest()
+    computed_md5hash = compute_md5hash(fl)
     return (md5hash == computed_md5hash)
 
+def file_signature(fl, md5=True):
+    """
+    Compute a File Signature (path, size, mtime and md5 hash) for detecting changes to a file
+
+    Parameters
+    ----------
+    fl      :   str
+                absolute reference to file
+    md5     :   bool, optional(default=True)
+                include the md5 hash of the file
+    """
+    stat = os.stat(fl)
+    signature = {'path' : fl, 'size' : stat.st_size, 'mtime' : stat.st_mtime}
+    if md5:
+        signature['md5'] = compute_md5hash(fl)
+    return signature
+
+def file_changed(signature):
+    """
+    Check if a file has changed since its signature was computed 
+
+    Size and mtime are checked first. The md5 hash is only computed when mtime differs 
+    (i.e. the file has been touched or copied) so an unchanged file is checked in constant time
 
+    Parameters
+    ----------
+    signature   :   dict
+                    Output of ``file_signature``
+
+    Returns
+    -------
+    value       :   bool
+    """
+    fl = signature['path']
+    if not os.path.exists(fl):
+        return True
+    stat = os.stat(fl)
+    if stat.st_size != signature['size']:
+        return True
+    if stat.st_mtime == signature['mtime']:
+        return False
+    if 'md5' not in signature:
+        return True
+    return not verify_md5hash(fl, signature['md5'])
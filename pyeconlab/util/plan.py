@@ -0,0 +1,135 @@
+"""
+Lazy Plan Utilities
+===================
+
+Record a sequence of DataFrame operations (filters, column assignments and aggregations) and
+execute them in a fused manner using ``collect()``
+
+Execution
+---------
+1. Consecutive filters are combined into a single boolean mask (no intermediate DataFrames)
+2. Column assignments are computed on the full (unfiltered) data and set inplace
+3. The data is only sliced when an aggregation (or custom function) requires it, or at the end of the plan
+4. Aggregations use ``groupby_sum`` (Categorical columns are retained)
+
+Notes
+-----
+1. Filter and assignment functions must be row-wise (i.e. the value for a row doesn't depend on other rows)
+   so that evaluating them on rows that are later dropped doesn't change the result
+2. ``collect()`` operates inplace on the columns of the DataFrame it is given. The result has a new index (0 .. n-1)
+
+"""
+
+import numpy as np
+import pandas as pd
+
+from .categorical import groupby_sum
+
+class LazyPlan(object):
+    """
+    A logical plan of DataFrame operations
+
+    Parameters
+    ----------
+    columns     :   list
+                    Columns of the DataFrame the plan will be executed on.
+                    The plan tracks the columns after each step so operations can be defined against the result of the previous operations
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.steps = []
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __repr__(self):
+        return "%s(steps=%s)" % (self.__class__.__name__, [step['name'] for step in self.steps])
+
+    #-Record-#
+
+    def filter(self, name, func):
+        """
+        Keep rows where func(df) is True
+
+        Parameters
+        ----------
+        name    :   str
+                    Name of the operation (used in reporting)
+        func    :   function
+                    func(df) returns a boolean array
+        """
+        self.steps.append({'kind' : 'filter', 'name' : name, 'func' : func})
+
+    def assign(self, name, column, func):
+        """
+        Set df[column] = func(df)
+        """
+        self.steps.append({'kind' : 'assign', 'name' : name, 'column' : column, 'func' : func})
+        if column not in self.columns:
+            self.columns.append(column)
+
+    def drop(self, name, columns):
+        """ Drop columns """
+        self.steps.append({'kind' : 'drop', 'name' : name, 'columns' : list(columns)})
+        self.columns = [col for col in self.columns if col not in columns]
+
+    def aggregate(self, name, by, values):
+        """
+        Sum values grouped by the columns in by (see ``groupby_sum``)
+        """
+        self.steps.append({'kind' : 'aggregate', 'name' : name, 'by' : list(by), 'values' : list(values)})
+        self.columns = list(by) + list(values)
+
+    def apply(self, name, func, columns=None):
+        """
+        Apply a function to the (filtered) DataFrame, func(df) returns a DataFrame
+
+        Parameters
+        ----------
+        columns     :   list, optional(default=None)
+                        Columns of the result (Default: unchanged)
+        """
+        self.steps.append({'kind' : 'apply', 'name' : name, 'func' : func})
+        if columns is not None:
+            self.columns = list(columns)
+
+    #-Execute-#
+
+    def collect(self, df, verbose=False):
+        """
+        Execute the plan on a DataFrame
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        mask = None
+        passes = 0
+        for step in self.steps:
+            kind = step['kind']
+            if verbose: print "[INFO] Plan: %s (%s)" % (step['name'], kind)
+            if kind == 'filter':
+                result = np.asarray(step['func'](df), dtype=bool)
+                mask = result if mask is None else (mask & result)
+            elif kind == 'assign':
+                df[step['column']] = step['func'](df)
+            elif kind == 'drop':
+                for col in step['columns']:
+                    del df[col]
+            else:
+                if mask is not None:
+                    df = df.loc[mask].reset_index(drop=True)
+                    mask = None
+                    passes += 1
+                if kind == 'aggregate':
+                    df = groupby_sum(df, step['by'], step['values'])
+                else:
+                    df = step['func'](df)
+                passes += 1
+        if mask is not None:
+            df = df.loc[mask]
+            passes += 1
+        df = df.reset_index(drop=True)
+        if verbose: print "[INFO] Plan executed %s operations with %s slice/aggregate passes" % (len(self.steps), passes)
+        return df
@@ -0,0 +1,100 @@
+"""
+Reader Utilities
+================
+
+Utilities for reading a collection of source files (i.e. one file or HDF key per year)
+into a single DataFrame
+
+Notes
+-----
+1. Growing a DataFrame with ``append`` inside a loop copies the accumulated data on every
+   iteration. ``read_frames`` collects the chunks and concatenates them once.
+2. Readers must be module level functions (i.e. ``pd.read_stata``, ``pd.read_hdf``) when
+   using pool='process' as they are pickled to the worker processes
+
+"""
+
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+import numpy as np
+import pandas as pd
+
+from .categorical import downcast_dtypes, categorize, union_categories
+
+MAX_WORKERS = 4
+
+def _read_frame(args):
+    """ Worker: Read a single chunk and apply optional downcasting """
+    reader, rargs, rkwargs, downcast, categorical = args
+    df = reader(*rargs, **rkwargs)
+    if downcast:
+        downcast_dtypes(df, integer=True, floating=(downcast == 'all'))
+    if categorical:
+        categorize(df, categorical)
+    return df
+
+def read_frames(reader, items, pool='thread', workers=None, downcast=False, categorical=None, ignore_index=True, verbose=False):
+    """
+    Read a list of chunks concurrently using a bounded pool and concatenate them once
+
+    Parameters
+    ----------
+    reader          :   function
+                        Function returning a pd.DataFrame (i.e. pd.read_stata, pd.read_hdf)
+    items           :   list
+                        List of positional arguments for reader. Each item may be a single argument, a tuple of
+                        positional arguments or a (tuple, dict) pair of positional and keyword arguments
+    pool            :   str, optional(default='thread')
+                        'thread', 'process' or None (serial)
+    workers         :   int, optional(default=None)
+                        Size of the pool. Default is min(len(items), cpu_count, MAX_WORKERS)
+    downcast        :   bool or str, optional(default=False)
+                        True downcasts integer columns within each chunk, 'all' also downcasts floats to float32 (where lossless)
+    categorical     :   list, optional(default=None)
+                        Convert these columns to Categoricals within each chunk. Categories are unified across chunks
+                        before the concat so the result retains Categorical columns
+    ignore_index    :   bool, optional(default=True)
+                        Construct a new index for the concatenated DataFrame (otherwise each chunk's index is retained)
+
+    Returns
+    -------
+    pd.DataFrame in the order of items
+
+    Notes
+    -----
+    1. HDF5 (PyTables) is not safe to read concurrently from threads. Use pool='process' for pd.read_hdf
+
+    """
+    tasks = []
+    for item in items:
+        if type(item) is tuple and len(item) == 2 and type(item[0]) is tuple and type(item[1]) is dict:
+            rargs, rkwargs = item
+        elif type(item) is tuple:
+            rargs, rkwargs = item, {}
+        else:
+            rargs, rkwargs = (item,), {}
+        tasks.append((reader, rargs, rkwargs, downcast, categorical))
+    if len(tasks) == 0:
+        return pd.DataFrame()
+    if workers is None:
+        workers = min(len(tasks), multiprocessing.cpu_count(), MAX_WORKERS)
+    if pool not in ['thread', 'process', None]:
+        raise ValueError("pool must be 'thread', 'process' or None")
+    if verbose: print "[INFO] Reading %s chunks (pool=%s, workers=%s)" % (len(tasks), pool, workers)
+    if pool is None or workers <= 1 or len(tasks) == 1:
+        frames = [_read_frame(task) for task in tasks]
+    else:
+        if pool == 'thread':
+            p = ThreadPool(workers)
+        else:
+            p = multiprocessing.Pool(workers)
+        try:
+            frames = p.map(_read_frame, tasks)
+        finally:
+            p.close()
+            p.join()
+    if categorical:
+        union_categories(frames, categorical)
+    data = pd.concat(frames, ignore_index=ignore_index)
+    del frames
+    return data
@@ -0,0 +1,261 @@
+"""
+Dataset Statistics Utilities
+============================
+
+Compute summary statistics (unique entries per column) and value totals for a trade dataset
+from integer codes. Each key column is factorized once and totals are computed with np.bincount
+on a packed (year, key) code, so repeated requests (i.e. totals by year, by (year, exporter),
+by (year, importer) and by (year, product)) don't rescan the object columns
+
+Caching
+-------
+``cached_stats(obj, df)`` stores a ``FrameStats`` on obj keyed on obj.operations and the identity of df.
+The cache is invalidated when ``update_operations`` records an operation on obj (or the dataset is replaced)
+
+Notes
+-----
+1. ``nunique`` counts NaN as an entry (as len(df[col].unique()))
+2. Totals drop groups with a NaN key and treat NaN values as 0 (as df.groupby(by).sum())
+
+"""
+
+import weakref
+import numpy as np
+import pandas as pd
+
+class FrameStats(object):
+    """
+    Statistics Engine for a DataFrame
+
+    Parameters
+    ----------
+    df      :   pd.DataFrame
+    value   :   str, optional(default='value')
+                Column to compute totals for
+
+    Notes
+    -----
+    1. Codes, unique counts and totals are computed lazily and cached on the object
+    """
+
+    def __init__(self, df, value='value'):
+        self._ref = weakref.ref(df)
+        self.value = value
+        self._codes = dict()
+        self._sorted = dict()
+        self._totals = dict()
+        self._values = None
+        self.shape = df.shape
+        self.columns = list(df.columns)
+        self.key = None
+        self.persistent = False
+
+    def __repr__(self):
+        return "%s(shape=%s, columns=%s)" % (self.__class__.__name__, self.shape, self.columns)
+
+    @property
+    def df(self):
+        df = self._ref()
+        if df is None:
+            raise ValueError("The DataFrame for these statistics no longer exists")
+        return df
+
+    #-Codes-#
+
+    def codes(self, column):
+        """
+        Integer codes of a column (in order of appearance, -1 = NaN) and the unique values
+        """
+        if column not in self._codes:
+            codes, uniques = pd.factorize(self.df[column].values)
+            self._codes[column] = (codes, np.asarray(uniques, dtype=object) if str(uniques.dtype) == 'category' else np.asarray(uniques))
+        return self._codes[column]
+
+    def sorted_codes(self, column):
+        """
+        Integer codes of a column in sorted order of the unique values (-1 = NaN)
+        """
+        if column not in self._sorted:
+            codes, uniques = self.codes(column)
+            order = np.argsort(uniques, kind='mergesort')
+            rank = np.empty(len(order), dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            sorted_codes = np.where(codes >= 0, rank[np.maximum(codes, 0)], -1) if len(order) > 0 else codes
+            self._sorted[column] = (sorted_codes, uniques[order])
+        return self._sorted[column]
+
+    #-Unique Entries-#
+
+    def unique(self, column):
+        """ Unique entries of a column in order of appearance (as df[col].unique()) """
+        codes, uniques = self.codes(column)
+        uniques = list(uniques)
+        if (codes == -1).any():
+            uniques.append(np.nan)
+        return uniques
+
+    def nunique(self, column):
+        """ Number of unique entries in a column (NaN is counted as an entry) """
+        codes, uniques = self.codes(column)
+        return len(uniques) + int((codes == -1).any())
+
+    def summary(self, columns=None):
+        """
+        Number of unique entries for each column
+
+        Parameters
+        ----------
+        columns     :   list, optional(default=None)
+                        Default is all columns other than value and quantity
+
+        Returns
+        -------
+        pd.Series
+        """
+        if columns is None:
+            columns = [col for col in self.columns if col not in [self.value, 'quantity']]
+        return pd.Series([self.nunique(col) for col in columns], index=columns, name='unique')
+
+    #-Totals-#
+
+    def _values_array(self):
+        if self._values is None:
+            values = self.df[self.value].values
+            if values.dtype.kind == 'f':
+                values = np.where(np.isnan(values), 0, values)
+            self._values = values
+        return self._values
+
+    def _mask(self, where=None, exclude=None):
+        """ Boolean mask for column == item (where) and column != item (exclude) """
+        mask = np.ones(self.shape[0], dtype=bool)
+        for items, keep in [(where, True), (exclude, False)]:
+            if items is None:
+                continue
+            for column, item in items.items():
+                codes, uniques = self.codes(column)
+                position = np.flatnonzero(uniques == item)
+                if len(position) == 0:
+                    if keep:
+                        mask[:] = False
+                    continue
+                if keep:
+                    mask &= (codes == position[0])
+                else:
+                    mask &= (codes != position[0])
+        return mask
+
+    def totals(self, by, where=None, exclude=None):
+        """
+        Sum of value by a list of columns (as df.loc[mask].groupby(by).sum()[value])
+
+        Parameters
+        ----------
+        by          :   list
+                        Columns to group by
+        where       :   dict, optional(default=None)
+                        Only include rows where column == item ({column : item})
+        exclude     :   dict, optional(default=None)
+                        Exclude rows where column == item ({column : item})
+
+        Returns
+        -------
+        pd.Series (sorted index)
+        """
+        by = list(by)
+        key = (tuple(by), tuple(sorted((where or {}).items())), tuple(sorted((exclude or {}).items())))
+        if key in self._totals:
+            return self._totals[key].copy()
+        mask = self._mask(where, exclude)
+        if np.prod([float(self.nunique(col)) for col in by]) >= 2**62:                          #Codes can't be packed into an int64
+            result = self.df.loc[mask].groupby(by)[self.value].sum()
+            self._totals[key] = result
+            return result.copy()
+        packed = np.zeros(self.shape[0], dtype=np.int64)
+        levels, sizes = [], []
+        for column in by:
+            codes, uniques = self.sorted_codes(column)
+            mask &= (codes >= 0)
+            packed = packed * len(uniques) + codes
+            levels.append(uniques)
+            sizes.append(len(uniques))
+        packed = packed[mask]
+        values = self._values_array()[mask]
+        size = int(np.prod(sizes, dtype=np.float64)) if len(sizes) > 0 else 1
+        if size <= 4 * len(packed) + 1024:
+            counts = np.bincount(packed, minlength=size)
+            observed = np.flatnonzero(counts)
+            sums = np.bincount(packed, weights=values, minlength=size)[observed]
+        else:
+            observed, inverse = np.unique(packed, return_inverse=True)
+            sums = np.bincount(inverse, weights=values, minlength=len(observed))
+        if values.dtype.kind in 'iu':
+            sums = sums.astype(values.dtype)                                                   #As groupby().sum()
+        elif values.dtype.kind == 'b':
+            sums = sums.astype(np.int64)
+        if len(by) == 1:
+            index = pd.Index(levels[0][observed], name=by[0])
+        else:
+            codes = np.unravel_index(observed, sizes)
+            index = pd.MultiIndex(levels=levels, codes=list(codes), names=by).remove_unused_levels()
+        result = pd.Series(sums, index=index, name=self.value)
+        self._totals[key] = result
+        return result.copy()
+
+    def compute(self, year='year', exporter='exporter', importer='importer', product=None, where=None, exclude=None):
+        """
+        Compute the unique entries of each column and totals by year, (year, exporter), (year, importer)
+        and (year, product) from one set of integer codes
+
+        Parameters
+        ----------
+        year, exporter, importer, product   :   str, optional
+                                                Column names (None or a missing column skips the table)
+
+        Returns
+        -------
+        dict of pd.Series (keys: 'unique', 'year', 'exporter', 'importer', 'product')
+        """
+        results = {'unique' : self.summary()}
+        results['year'] = self.totals([year], where=where, exclude=exclude)
+        for name, column in [('exporter', exporter), ('importer', importer), ('product', product)]:
+            if column is not None and column in self.columns:
+                results[name] = self.totals([year, column], where=where, exclude=exclude)
+        return results
+
+def cached_stats(obj, df, name='dataset', value='value', persistent=False):
+    """
+    Return a FrameStats for df cached on obj (attribute _stats_cache)
+
+    Parameters
+    ----------
+    obj         :   object
+                    Object holding df (i.e. a dataset constructor) with an operations attribute
+    df          :   pd.DataFrame
+    name        :   str, optional(default='dataset')
+                    Name for df in the cache (i.e. 'dataset' or 'raw_data')
+    persistent  :   bool, optional(default=False)
+                    The statistics don't depend on obj.operations (i.e. for the protected raw data) and are kept by ``invalidate_stats``
+
+    Notes
+    -----
+    1. The cached statistics are reused while obj.operations, the identity and the shape of df are unchanged
+    """
+    key = (None if persistent else getattr(obj, 'operations', None), id(df), df.shape, value)
+    cache = getattr(obj, '_stats_cache', None)
+    if cache is None:
+        cache = dict()
+    stats = cache.get(name, None)
+    if stats is None or stats.key != key or stats._ref() is not df:
+        stats = FrameStats(df, value=value)
+        stats.key = key
+        stats.persistent = persistent
+        cache[name] = stats
+    obj._stats_cache = cache
+    return stats
+
+def invalidate_stats(obj):
+    """ Remove cached statistics from obj (other than persistent statistics) """
+    cache = getattr(obj, '_stats_cache', None)
+    if cache is not None:
+        obj._stats_cache = dict([(name, stats) for name, stats in cache.items() if stats.persistent])
@@ -0,0 +1,187 @@
+"""
+Tests for Columnar Cache Utilities
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+import numpy as np
+
+from pandas.util.testing import assert_frame_equal
+from pyeconlab.util import get_cache, BuildCache, HDFYearIndexWriter, partition_frame
+from pyeconlab.util.cache import read_json
+
+
+class TestSuite_NpyColumnCache(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		self.df = pd.DataFrame({
+					'year' 		: [1990, 1990, 1991, 1991, 1992],
+					'exporter' 	: ['USA', 'AUS', 'USA', np.nan, 'NZL'],
+					'sitc4' 	: ['0011', '0012', '0011', '0011', '0012'],
+					'value' 	: [1.5, 2., 3., 4., 5.],
+					'quantity' 	: [1, 2, 3, 4, 5],
+				}, columns=['year', 'exporter', 'sitc4', 'value', 'quantity'])
+		self.df['sitc4'] = self.df['sitc4'].astype('category')
+		self.cache = get_cache(os.path.join(self.tmp_dir, 'raw'), format='npy')
+		self.cache.write(self.df, partition='year')
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_dir)
+
+	def test_roundtrip(self):
+		result = self.cache.read()
+		assert self.cache.years == [1990, 1991, 1992]
+		assert_frame_equal(result, self.df)
+
+	def test_pruning_and_pushdown(self):
+		result = self.cache.read(years=[1991, 1992], columns=['value', 'year'])
+		expected = self.df.loc[self.df.year.isin([1991, 1992]), ['value', 'year']].reset_index(drop=True)
+		assert_frame_equal(result, expected)
+
+	def test_categorical(self):
+		result = self.cache.read(years=[1990], categorical=True)
+		assert str(result['exporter'].dtype) == 'category'
+
+	def test_missing(self):
+		self.assertRaises(ValueError, self.cache.read, years=[2000])
+		self.assertRaises(ValueError, self.cache.read, columns=['unit'])
+		self.assertRaises(ValueError, get_cache, self.tmp_dir, format='unknown')
+
+
+class TestSuite_NpyColumnCache_validate(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		self.df = pd.DataFrame({
+					'year' 		: [1990, 1990, 1991],
+					'sitc4' 	: ['0011', '0012', '0011'],
+					'value' 	: [1.5, 2., 3.],
+				}, columns=['year', 'sitc4', 'value'])
+		self.source = os.path.join(self.tmp_dir, 'source90.csv')
+		with open(self.source, 'w') as fl:
+			fl.write("year,sitc4,value\n")
+		self.cache = get_cache(os.path.join(self.tmp_dir, 'raw'), format='npy')
+		self.cache.write(self.df, partition='year', sources={1990 : [self.source]})
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_dir)
+
+	def test_valid(self):
+		assert self.cache.validate() == {}
+		assert self.cache.is_valid(deep=True)
+
+	def test_source_changed(self):
+		with open(self.source, 'a') as fl:
+			fl.write("1990,0011,1.5\n")
+		problems = self.cache.validate()
+		assert list(problems.keys()) == [1990]
+		assert self.cache.is_valid(years=[1991])
+
+	def test_shared_source(self):
+		""" A source file shared by all years (i.e. a single tsv file) is recorded in each partition """
+		cache = get_cache(os.path.join(self.tmp_dir, 'shared'), format='npy')
+		cache.write(self.df, partition='year', sources={1990 : [self.source], 1991 : [self.source]})
+		assert cache.manifest['partitions']['1990']['sources'] == cache.manifest['partitions']['1991']['sources']
+		with open(self.source, 'a') as fl:
+			fl.write("1990,0011,1.5\n")
+		assert sorted(cache.validate().keys()) == [1990, 1991]
+
+	def test_rows_and_deep(self):
+		pdir = self.cache.partition_dir(1991)
+		np.save(pdir + 'value.npy', np.array([4.]))  										#Same rows, different content
+		assert self.cache.is_valid(years=[1991])
+		assert not self.cache.is_valid(years=[1991], deep=True)
+		np.save(pdir + 'value.npy', np.array([4., 5.]))
+		assert not self.cache.is_valid(years=[1991])
+
+	def test_missing_partition(self):
+		shutil.rmtree(self.cache.partition_dir(1990))
+		assert 1990 in self.cache.validate()
+		assert 2000 in self.cache.validate(years=[2000])
+
+
+class TestSuite_BuildCache(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		self.df = pd.DataFrame({
+					'year' 		: [1990, 1990, 1991],
+					'eiso3c' 	: ['AUS', 'USA', 'AUS'],
+					'sitc3' 	: ['001', '001', '002'],
+					'value' 	: [1.5, 2., 3.],
+				}, columns=['year', 'eiso3c', 'sitc3', 'value'])
+		self.builds = BuildCache(os.path.join(self.tmp_dir, 'builds'))
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_dir)
+
+	def test_key(self):
+		assert self.builds.key(dataset='A', level=3) == self.builds.key(level=3, dataset='A')
+		assert self.builds.key(dataset='A', level=3) != self.builds.key(dataset='A', level=4)
+
+	def test_get_put(self):
+		key = self.builds.key(dataset='A', level=3, data_type='export')
+		assert self.builds.get(key) is None
+		self.builds.put(key, self.df, options={'dataset' : 'A'})
+		assert self.builds.keys() == [key]
+		assert self.builds.options(key) == {'dataset' : 'A'}
+		assert_frame_equal(self.builds.get(key), self.df)
+		self.builds.clear()
+		assert self.builds.keys() == []
+
+
+def read_csv_year(fn):
+	return pd.read_csv(fn, dtype={'sitc4' : str})
+
+
+class TestSuite_HDFYearIndexWriter(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		self.fn = os.path.join(self.tmp_dir, 'raw_yearindex.h5')
+		self.df = pd.DataFrame({
+					'year' 		: [1991, 1990, 1992, 1990, 1991],
+					'sitc4' 	: ['0011', '0012', '0011', '0011', '0012'],
+					'value' 	: [1.5, 2., 3., 4., 5.],
+				}, columns=['year', 'sitc4', 'value'])
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_dir)
+
+	def test_partition_frame(self):
+		result = partition_frame(self.df)
+		assert [year for year, data in result] == [1990, 1991, 1992]
+		for year, data in result:
+			assert_frame_equal(data, self.df.loc[self.df.year == year])
+		assert list(partition_frame(self.df, reset_index=True)[0][1].index) == [0, 1]
+
+	def test_write(self):
+		HDFYearIndexWriter(self.fn).write(self.df)
+		for year in [1990, 1991, 1992]:
+			assert_frame_equal(pd.read_hdf(self.fn, key='Y%s' % year), self.df.loc[self.df.year == year])
+		assert os.listdir(self.tmp_dir) == ['raw_yearindex.h5'] 			#Temporary file is renamed
+
+	def test_convert(self):
+		items = []
+		for year, data in partition_frame(self.df, reset_index=True):
+			fn = os.path.join(self.tmp_dir, 'data%s.csv' % year)
+			data.to_csv(fn, index=False)
+			items.append((year, fn))
+		writer = HDFYearIndexWriter(self.fn, manifest=True)
+		writer.convert(read_csv_year, items, pool='thread', workers=2)
+		for year, fn in items:
+			assert_frame_equal(pd.read_hdf(self.fn, key='Y%s' % year), read_csv_year(fn))
+		manifest = read_json(writer.manifest_fn)
+		assert sorted(manifest['partitions'].keys()) == ['1990', '1991', '1992']
+		assert manifest['partitions']['1990']['rows'] == 2
+
+	def test_interrupted(self):
+		HDFYearIndexWriter(self.fn).write(self.df)
+		writer = HDFYearIndexWriter(self.fn, mode='a')
+		self.assertRaises(IOError, writer.convert, read_csv_year, [(1993, os.path.join(self.tmp_dir, 'missing.csv'))], pool=None)
+		assert os.listdir(self.tmp_dir) == ['raw_yearindex.h5']
+		assert_frame_equal(pd.read_hdf(self.fn, key='Y1992'), self.df.loc[self.df.year == 1992])
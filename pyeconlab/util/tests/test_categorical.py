@@ -0,0 +1,84 @@
+"""
+Tests for Categorical and dtype Utilities
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+
+from pandas.util.testing import assert_frame_equal, assert_series_equal
+from pyeconlab.util import categorize, union_categories, map_unique, groupby_sum, collapse_duplicates, isin_columns, \
+							rollup_productcodes
+
+
+class TestSuite_categorical(unittest.TestCase):
+
+	def setUp(self):
+		self.df = pd.DataFrame({
+					'year' 		: [1990, 1990, 1990, 1991, 1991],
+					'exporter' 	: ['USA', 'AUS', 'USA', 'AUS', 'NZL'],
+					'sitc4' 	: ['0011', '0012', '0011', '0011', '0012'],
+					'value' 	: [1, 2, 3, 4, 5],
+				}, columns=['year', 'exporter', 'sitc4', 'value'])
+
+	def test_groupby_sum_observed_only(self):
+		expected = self.df.groupby(['year', 'exporter', 'sitc4']).sum().reset_index()
+		df = categorize(self.df.copy(), ['exporter', 'sitc4'])
+		result = groupby_sum(df, ['year', 'exporter', 'sitc4'], ['value'])
+		assert len(result) == len(expected)
+		assert str(result['exporter'].dtype) == 'category'
+		result['exporter'] = result['exporter'].astype(object)
+		result['sitc4'] = result['sitc4'].astype(object)
+		assert_frame_equal(result, expected)
+
+	def test_collapse_duplicates(self):
+		by = ['year', 'exporter', 'sitc4']
+		df = self.df.copy()
+		df.loc[4, 'exporter'] = np.nan
+		expected = df.groupby(by)[['value']].sum().reset_index()
+		result, duplicated = collapse_duplicates(df, by, ['value'], return_duplicated=True)
+		assert_frame_equal(result, expected)
+		assert list(duplicated) == list(df.duplicated(subset=by))
+		result = collapse_duplicates(categorize(df, ['exporter', 'sitc4']), by, ['value'])
+		assert str(result['sitc4'].dtype) == 'category'
+		assert list(result['value']) == [2, 4, 4]
+
+	def test_isin_columns(self):
+		df = self.df.copy()
+		df['importer'] = ['AUS', 'World', 'NZL', 'USA', 'World']
+		mask, counts = isin_columns(categorize(df, ['exporter']), ['exporter', 'importer'], ['World', 'USA', 'CAN'])
+		assert list(mask) == [True, True, True, True, True]
+		assert list(counts) == [2, 3, 0]
+		mask, counts = isin_columns(df, ['importer'], ['AUS', 'NZL'])
+		assert list(mask) == [True, False, True, False, False]
+
+	def test_map_unique(self):
+		expected = self.df['sitc4'].apply(lambda x: x[0:3])
+		assert_series_equal(map_unique(self.df['sitc4'], lambda x: x[0:3]), expected)
+		result = map_unique(self.df['sitc4'].astype('category'), lambda x: x[0:3])
+		assert str(result.dtype) == 'category'
+		assert list(result.cat.categories) == ['001']
+		assert list(result.astype(object)) == list(expected)
+		result = map_unique(self.df['sitc4'].astype('category'), lambda x: int(x))
+		assert list(result) == [11, 12, 11, 11, 12]
+
+	def test_union_categories(self):
+		a = categorize(self.df.iloc[:2].copy(), ['exporter'])
+		b = categorize(self.df.iloc[2:].copy(), ['exporter'])
+		categories = union_categories([a, b], ['exporter'])
+		assert list(categories['exporter']) == ['AUS', 'NZL', 'USA']
+		result = pd.concat([a, b])
+		assert str(result['exporter'].dtype) == 'category'
+		assert list(result['exporter'].astype(object)) == list(self.df['exporter'])
+
+	def test_rollup_productcodes(self):
+		result = rollup_productcodes(self.df, ['year', 'exporter'], code='sitc4', levels=[3, 4], values=['value'])
+		expected = self.df.groupby(['year', 'exporter', 'sitc4'])[['value']].sum().reset_index()
+		assert_frame_equal(result[4], expected)
+		df = self.df.copy()
+		df['sitc3'] = df['sitc4'].apply(lambda x: x[0:3])
+		expected = df.groupby(['year', 'exporter', 'sitc3'])[['value']].sum().reset_index()
+		assert_frame_equal(result[3], expected)
+		result = rollup_productcodes(categorize(self.df.copy(), ['sitc4']), ['year'], code='sitc4', levels=[1])
+		assert str(result[1]['sitc1'].dtype) == 'category'
+		assert list(result[1]['value']) == [6, 9]
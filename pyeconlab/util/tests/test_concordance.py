@@ -0,0 +1,56 @@
+"""
+Tests for Concordance Utilities
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+
+from pandas.util.testing import assert_series_equal
+from pyeconlab.util import concord_data, concord_series, recode_column
+
+
+class TestSuite_concord_series(unittest.TestCase):
+	"""
+	Test Suite for concord_series() against row-wise concord_data()
+	"""
+
+	concordance = {'AUS' : 'Australia', 'USA' : 'United States'}
+
+	def setUp(self):
+		self.series = pd.Series(['AUS', 'NZL', 'USA', 'AUS', np.nan], index=[10, 11, 12, 13, 14], name='iso3c')
+
+	def test_issue_error_options(self):
+		for issue_error in [True, False, '.']:
+			expected = self.series.apply(lambda x: concord_data(self.concordance, x, issue_error=issue_error))
+			result = concord_series(self.concordance, self.series, issue_error=issue_error)
+			assert_series_equal(result, expected)
+
+	def test_categorical(self):
+		expected = concord_series(self.concordance, self.series, issue_error='.')
+		result = concord_series(self.concordance, self.series.astype('category'), issue_error='.')
+		assert_series_equal(result, expected)
+
+	def test_numeric_result(self):
+		result = concord_series({1 : 10, 2 : 20}, pd.Series([1, 2, 3, 1]), issue_error=True)
+		assert result.dtype == np.float64
+		assert list(result.fillna(-1)) == [10, 20, -1, 10]
+
+	def test_integer_result(self):
+		series = pd.Series([1, 2, 1], index=[5, 6, 7])
+		expected = series.apply(lambda x: concord_data({1 : 10, 2 : 20}, x))
+		result = concord_series({1 : 10, 2 : 20}, series)
+		assert_series_equal(result, expected)
+		assert result.dtype == np.int64
+		result = concord_series({1 : 10, 2 : 20}, pd.Series([1, np.nan, 2]), issue_error=True)
+		assert result.dtype == np.float64
+		assert list(result.fillna(-1)) == [10, -1, 20]
+
+	def test_exception(self):
+		self.assertRaises(ValueError, concord_series, self.concordance, self.series, exception=True)
+
+	def test_recode_column(self):
+		df = pd.DataFrame({'iso3c' : ['AUS', 'NZL', 'USA']})
+		recode_column(df, 'iso3c', self.concordance, target='name', issue_error=False)
+		assert list(df['name']) == ['Australia', 'NZL', 'United States']
+		assert list(df['iso3c']) == ['AUS', 'NZL', 'USA']
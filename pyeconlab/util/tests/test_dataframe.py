@@ -3,6 +3,7 @@ Tests for DataFrame Utilities
 """
 
 import unittest
+import warnings
 import pandas as pd
 import numpy as np
 
@@ -76,6 +77,96 @@ class TestSuite_merge_columns(unittest.TestCase):
 		assert_series_equal(computed['value'], R1['value'], check_dtype=False)
 
 
+from pyeconlab.util import keyed_update
+
+class TestSuite_keyed_update(unittest.TestCase):
+	"""
+	Test Suite for keyed_update()
+	"""
+
+	a = TestSuite_merge_columns.a
+	b = TestSuite_merge_columns.b
+	on = ['iso3c', 'sitc4', 'year']
+
+	def test_keyed_update_vs_merge_columns(self):
+		expected = merge_columns(self.a, self.b, on=self.on, collapse_columns=('value_x', 'value_y', 'value'), dominant='right', verbose=False)
+		computed = keyed_update(self.a, self.b, on=self.on, update={'value' : 'value'})
+		assert_series_equal(computed['value'], expected['value'], check_dtype=False)
+		assert list(computed.columns) == list(self.a.columns)
+
+	def test_keyed_update_multiple_columns(self):
+		computed = keyed_update(self.a, self.b, on=self.on, update={'value' : 'value', 'quantity' : 'quantity'})
+		assert_series_equal(computed['quantity'], pd.Series([np.nan, 1, 2, 10, np.nan], name='quantity'))
+		computed = keyed_update(self.a, self.b, on=self.on, update={'value' : 'value'}, append=False)
+		assert len(computed) == len(self.a)
+
+	def test_keyed_update_missing_keys(self):
+		a = pd.DataFrame({'k' : ['a', np.nan], 'dot' : [np.nan, 1.], 'value' : [1., 2.]}, columns=['k', 'dot', 'value'])
+		b = pd.DataFrame({'k' : ['a', np.nan], 'dot' : [np.nan, 1.], 'value_adj' : [10., 20.]})
+		computed = keyed_update(a, b, on=['k', 'dot'], update={'value' : 'value_adj'})
+		assert list(computed['value']) == [10., 20.]
+		self.assertRaises(ValueError, keyed_update, a, pd.concat([b, b]), ['k', 'dot'], {'value' : 'value_adj'})
+
+	def test_keyed_update_duplicates(self):
+		a = pd.DataFrame({'k' : ['a', 'b', 'c'], 'value' : [1., 2., 3.]}, columns=['k', 'value'])
+		b = pd.DataFrame({'k' : ['b', 'd', 'b', 'd'], 'value_adj' : [10., 20., 30., np.nan]})
+		with warnings.catch_warnings(record=True) as w:
+			warnings.simplefilter("always")
+			computed = keyed_update(a, b, on=['k'], update={'value' : 'value_adj'}, duplicates='sum')
+			assert len(w) == 1
+		assert list(computed['k']) == ['a', 'b', 'c', 'd']
+		assert list(computed['value']) == [1., 40., 3., 20.]
+		computed = keyed_update(a, b, on=['k'], update={'value' : 'value_adj'}, duplicates='last')
+		assert list(computed['value'].fillna(-1)) == [1., 30., 3., -1]
+		computed = keyed_update(a, b, on=['k'], update={'value' : 'value_adj'}, duplicates='first')
+		assert list(computed['value']) == [1., 10., 3., 20.]
+
+
+from pyeconlab.util import coverage_matrix, coverage_frame, coverage_stats
+
+class TestSuite_coverage_matrix(unittest.TestCase):
+	"""
+	Test Suite for coverage_matrix(), coverage_frame() and coverage_stats()
+	"""
+
+	def setUp(self):
+		self.df = pd.DataFrame({
+					'year' 		: [1990, 1991, 1993, 1990, 1991, 1990, 1990],
+					'sitc4' 	: ['0011', '0011', '0011', '0012', '0012', '0013', '0011'],
+					'value' 	: [1., 2., 3., 4., 5., 6., 1.],
+				})
+
+	def test_coverage_frame(self):
+		table = self.df[['year', 'sitc4']].drop_duplicates()
+		table['attr'] = 1
+		expected = table.set_index(['sitc4', 'year']).unstack(level='year')
+		expected.columns = expected.columns.droplevel()
+		keys, years, matrix = coverage_matrix(self.df, ['sitc4'], column='year')
+		assert matrix.dtype == bool
+		assert_frame_equal(coverage_frame(keys, years, matrix, name='year'), expected)
+
+	def test_coverage_values(self):
+		keys, years, matrix = coverage_matrix(self.df, ['sitc4'], column='year', values='value')
+		assert list(matrix[1, :2]) == [4., 5.] and np.isnan(matrix[1, 2])
+		assert list(matrix[0]) == [1., 2., 3.] 										#Repeated (sitc4, year, value) rows are dropped
+		df = self.df.copy()
+		df.loc[6, 'value'] = 10.
+		self.assertRaises(ValueError, coverage_matrix, df, ['sitc4'], 'year', 'value')
+
+	def test_coverage_stats(self):
+		keys, years, matrix = coverage_matrix(self.df, ['sitc4'], column='year')
+		stats = coverage_stats(matrix, years)
+		assert list(stats['Coverage']) == [3, 2, 1]
+		assert list(stats['FirstYear']) == [1990, 1990, 1990]
+		assert list(stats['LastYear']) == [1993, 1991, 1990]
+		assert list(stats['Gaps']) == [0, 0, 0] 									#1992 is not in the data
+		matrix = np.array([[1, 0, 1, 1, 0], [0, 0, 0, 0, 0]], dtype=bool)
+		stats = coverage_stats(matrix, range(1990, 1995))
+		assert list(stats['Gaps']) == [1, 0]
+		assert list(stats['Spells']) == [2, 0]
+		assert np.isnan(stats['FirstYear'][1])
+
+
 #-Should these be at the top of the file OR near the use-#
 
 from pyeconlab.util import compute_number_of_spells, compute_spell_lengths
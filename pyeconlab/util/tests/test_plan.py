@@ -0,0 +1,46 @@
+"""
+Tests for Lazy Plan Utilities
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+
+from pandas.util.testing import assert_frame_equal
+from pyeconlab.util import LazyPlan
+
+
+class TestSuite_LazyPlan(unittest.TestCase):
+
+	def setUp(self):
+		self.df = pd.DataFrame({
+					'year' 		: [1990, 1990, 1990, 1991, 1991],
+					'exporter' 	: ['USA', 'AUS', 'USA', 'WLD', 'NZL'],
+					'sitc4' 	: ['0011', '0012', '0011', '001A', '0012'],
+					'value' 	: [1., 2., 3., 4., 5.],
+				}, columns=['year', 'exporter', 'sitc4', 'value'])
+
+	def test_collect(self):
+		df = self.df.copy()
+		expected = df.loc[(df.exporter != 'WLD') & (df.value > 1)].copy()
+		expected['sitc3'] = expected['sitc4'].apply(lambda x: x[0:3])
+		expected['value'] = expected['value'] * 1000
+		expected = expected.groupby(['year', 'exporter', 'sitc3'])[['value']].sum().reset_index()
+		plan = LazyPlan(df.columns)
+		plan.filter('countries', lambda df: df.exporter != 'WLD')
+		plan.assign('sitc3', 'sitc3', lambda df: df['sitc4'].str[0:3])
+		plan.filter('value', lambda df: df.value > 1)
+		plan.assign('units', 'value', lambda df: df['value'] * 1000)
+		plan.drop('drop', ['sitc4'])
+		assert plan.columns == ['year', 'exporter', 'value', 'sitc3']
+		plan.aggregate('collapse', ['year', 'exporter', 'sitc3'], ['value'])
+		assert len(plan) == 6
+		assert_frame_equal(plan.collect(df), expected)
+
+	def test_filter_only(self):
+		plan = LazyPlan(self.df.columns)
+		plan.filter('countries', lambda df: df.exporter != 'WLD')
+		plan.filter('alpha', lambda df: df.sitc4 != '001A')
+		result = plan.collect(self.df.copy())
+		assert list(result.index) == [0, 1, 2, 3]
+		assert_frame_equal(result, self.df.iloc[[0, 1, 2, 4]].reset_index(drop=True))
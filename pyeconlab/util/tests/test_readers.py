@@ -0,0 +1,62 @@
+"""
+Tests for Reader Utilities
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+
+from pandas.util.testing import assert_frame_equal
+from pyeconlab.util import read_frames, downcast_dtypes
+
+
+def make_year(year):
+	return pd.DataFrame({'year' : [year]*3, 'sitc4' : ['0011', '0012', '0013'], 'value' : [1.5, 2.5, year*1.0]})
+
+
+class TestSuite_read_frames(unittest.TestCase):
+	"""
+	Test Suite for read_frames()
+	"""
+
+	years = [1990, 1991, 1992, 1993]
+
+	def setUp(self):
+		self.expected = pd.concat([make_year(year) for year in self.years], ignore_index=True)
+
+	def test_thread_pool(self):
+		result = read_frames(make_year, self.years, pool='thread', workers=2)
+		assert_frame_equal(result, self.expected)
+
+	def test_serial(self):
+		result = read_frames(make_year, self.years, pool=None)
+		assert_frame_equal(result, self.expected)
+
+	def test_keep_index(self):
+		result = read_frames(make_year, [(year,) for year in self.years], pool='thread', ignore_index=False)
+		assert list(result.index) == [0, 1, 2]*4
+
+	def test_downcast(self):
+		result = read_frames(make_year, self.years, pool='thread', downcast=True)
+		assert result['year'].dtype == np.int32
+		assert result['value'].dtype == np.float64
+		result = read_frames(make_year, self.years, pool='thread', downcast='all')
+		assert result['value'].dtype == np.float32 								#Lossless
+		assert (result['year'].values == self.expected['year'].values).all()
+
+	def test_categorical(self):
+		result = read_frames(make_year, self.years, pool='thread', categorical=['sitc4'])
+		assert str(result['sitc4'].dtype) == 'category'
+		assert list(result['sitc4'].astype(str)) == list(self.expected['sitc4'])
+
+	def test_downcast_dtypes(self):
+		df = pd.DataFrame({'a' : [0, 100], 'b' : [-40000, 2**40], 'c' : [1.0, 2.0], 'd' : [0.1, np.nan]})
+		downcast_dtypes(df, floating=True)
+		assert df['a'].dtype == np.int32
+		assert df['b'].dtype == np.int64
+		assert df['c'].dtype == np.float32
+		assert df['d'].dtype == np.float64 										#0.1 is not exact in float32
+
+	def test_empty(self):
+		result = read_frames(make_year, [])
+		assert len(result) == 0
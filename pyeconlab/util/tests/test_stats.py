@@ -0,0 +1,56 @@
+"""
+Tests for Dataset Statistics Utilities
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+
+from pandas.util.testing import assert_series_equal
+from pyeconlab.util import FrameStats, cached_stats, update_operations
+
+
+class Holder(object):
+	operations = ''
+
+
+class TestSuite_FrameStats(unittest.TestCase):
+
+	def setUp(self):
+		self.df = pd.DataFrame({
+					'year' 		: [1991, 1990, 1990, 1991, 1991, 1990],
+					'exporter' 	: ['USA', 'World', 'AUS', 'AUS', np.nan, 'USA'],
+					'importer' 	: ['World', 'World', 'NZL', 'World', 'NZL', 'NZL'],
+					'sitc4' 	: ['0011', '0012', '0011', '0011', '0012', '0013'],
+					'value' 	: [1, 2, 3, 4, 5, 6],
+				}, columns=['year', 'exporter', 'importer', 'sitc4', 'value'])
+
+	def test_nunique(self):
+		stats = FrameStats(self.df)
+		for col in ['year', 'exporter', 'importer', 'sitc4']:
+			assert stats.nunique(col) == len(self.df[col].unique())
+		assert stats.unique('importer') == list(self.df['importer'].unique())
+		df = self.df.copy()
+		df['sitc4'] = df['sitc4'].astype('category')
+		assert FrameStats(df).nunique('sitc4') == 3
+
+	def test_totals(self):
+		stats = FrameStats(self.df)
+		assert_series_equal(stats.totals(['year']), self.df.groupby(['year'])['value'].sum())
+		assert_series_equal(stats.totals(['year', 'exporter']), self.df.groupby(['year', 'exporter'])['value'].sum())
+		df = self.df.loc[(self.df.importer == 'World') & (self.df.exporter != 'World')]
+		result = stats.totals(['year', 'exporter'], where={'importer' : 'World'}, exclude={'exporter' : 'World'})
+		assert_series_equal(result, df.groupby(['year', 'exporter'])['value'].sum())
+		assert len(stats.totals(['year'], where={'importer' : 'ABC'})) == 0
+		results = stats.compute(product='sitc4')
+		assert_series_equal(results['product'], self.df.groupby(['year', 'sitc4'])['value'].sum())
+
+	def test_cached_stats(self):
+		obj = Holder()
+		stats = cached_stats(obj, self.df)
+		assert cached_stats(obj, self.df) is stats
+		raw = cached_stats(obj, self.df, name='raw_data', persistent=True)
+		update_operations(obj, "(drop_world)")
+		assert cached_stats(obj, self.df) is not stats 					#Invalidated by update_operations
+		assert cached_stats(obj, self.df, name='raw_data', persistent=True) is raw
+		assert cached_stats(obj, self.df.copy()) is not cached_stats(obj, self.df)
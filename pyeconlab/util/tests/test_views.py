@@ -0,0 +1,76 @@
+"""
+Tests for Copy-on-Write DataFrame Views
+"""
+
+import unittest
+import pickle
+import pandas as pd
+import numpy as np
+
+from pandas.util.testing import assert_frame_equal
+from pyeconlab.util import cow_view, CopyOnWriteFrame
+
+
+def make_frame():
+	return pd.DataFrame({
+				'year' 		: [1990, 1990, 1991, 1991],
+				'exporter' 	: ['AUS', 'USA', 'AUS', 'NZL'],
+				'sitc4' 	: pd.Categorical(['0011', '0012', '0011', '0012']),
+				'value' 	: [1.0, 2.0, 3.0, 4.0],
+				'quantity' 	: [10.0, 20.0, 30.0, 40.0],
+			}, columns=['year', 'exporter', 'sitc4', 'value', 'quantity'])
+
+
+class TestSuite_cow_view(unittest.TestCase):
+	"""
+	Test Suite for cow_view() and CopyOnWriteFrame
+	"""
+
+	def setUp(self):
+		self.source = make_frame()
+		self.expected = make_frame()
+
+	def test_shared(self):
+		view = cow_view(self.source)
+		assert isinstance(view, CopyOnWriteFrame)
+		assert view.shared_columns == list(self.source.columns)
+		assert_frame_equal(pd.DataFrame(view), self.expected)
+
+	def test_setitem(self):
+		view = cow_view(self.source)
+		view['value'] = view['value'] * 1000
+		view['exporter'] = view['exporter'].str.lower()
+		view['sitc3'] = view['sitc4'].astype(str).str[0:3]
+		assert_frame_equal(self.source, self.expected)
+		assert list(view['value']) == [1000.0, 2000.0, 3000.0, 4000.0]
+		assert 'year' in view.shared_columns and 'value' not in view.shared_columns
+
+	def test_indexers(self):
+		view = cow_view(self.source)
+		view.loc[view.year == 1991, 'value'] = 0
+		view.iloc[0, 1] = 'CAN'
+		view.at[1, 'sitc4'] = '0011'
+		view['quantity'] += 1
+		assert_frame_equal(self.source, self.expected)
+		assert list(view['value']) == [1.0, 2.0, 0.0, 0.0]
+		assert list(view['exporter']) == ['CAN', 'USA', 'AUS', 'NZL']
+		assert list(view['sitc4'].astype(str)) == ['0011', '0011', '0011', '0012']
+
+	def test_inplace(self):
+		view = cow_view(self.source)
+		view.rename(columns={'value' : 'export'}, inplace=True)
+		view['export'] = 0.0 										#Tracked by array (not column name)
+		view.replace({'exporter' : {'AUS' : 'OZ'}}, inplace=True)
+		assert_frame_equal(self.source, self.expected)
+		assert list(view['exporter']) == ['OZ', 'USA', 'OZ', 'NZL']
+
+	def test_copy_and_pickle(self):
+		view = cow_view(self.source)
+		shallow = view.copy(deep=False)
+		shallow['value'] = 0.0
+		assert_frame_equal(self.source, self.expected)
+		assert type(view.copy()) is pd.DataFrame
+		assert type(view.loc[view.year == 1990]) is pd.DataFrame
+		result = pickle.loads(pickle.dumps(view))
+		assert type(result) is pd.DataFrame
+		assert_frame_equal(result, self.expected)
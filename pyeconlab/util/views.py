@@ -0,0 +1,216 @@
+"""
+Copy-on-Write DataFrame Views
+=============================
+
+A ``CopyOnWriteFrame`` is a shallow DataFrame that shares the column arrays of a source DataFrame
+(i.e. a constructor's protected raw_data). Columns are only copied when an operation writes to them,
+so starting (or resetting) a dataset from raw data doesn't duplicate the whole table in memory
+
+Tracking
+--------
+A column is shared when its array overlaps (``np.may_share_memory``) one of the source arrays. This is
+tracked per column from the block arrays rather than by column name so renaming, set_index etc. don't
+lose track of which columns are still views
+
+Intercepted Writes
+------------------
+1. ``df[col] = ...`` and attribute assignment of an existing column
+2. ``df.loc``, ``df.iloc``, ``df.at``, ``df.iat`` and ``df.ix`` assignment (only the targeted columns are copied)
+3. ``fillna``, ``replace``, ``where``, ``mask``, ``interpolate`` and ``clip`` with inplace=True and ``update``
+
+Notes
+-----
+1. Writes through a column Series (i.e. ``df['value'][mask] = 0`` or ``df['value'].values[:] = 0``) are not
+   intercepted and write through to the source (pandas' chained assignment)
+2. Operations that return a new DataFrame (slices, groupby, merge etc.) return a ``pd.DataFrame``.
+   Row slices (i.e. ``df.iloc[:10]``) can be views of the source, as they are of any DataFrame
+3. Pickling a ``CopyOnWriteFrame`` stores a ``pd.DataFrame``
+
+"""
+
+import functools
+import weakref
+import numpy as np
+import pandas as pd
+
+def _base_array(values):
+    """ ndarray holding the data of a Block (None if it can't be determined) """
+    if isinstance(values, np.ndarray):
+        return values
+    codes = getattr(values, '_codes', None)                         #Categorical
+    if isinstance(codes, np.ndarray):
+        return codes
+    return None
+
+def _block_arrays(df):
+    """ Base arrays of the Blocks of a DataFrame """
+    return [_base_array(blk.values) for blk in df._data.blocks]
+
+class _CopyOnWriteIndexer(object):
+    """ Wrap a pandas indexer (loc, iloc etc.) to copy the targeted columns before assignment """
+
+    def __init__(self, indexer, frame, name):
+        self._indexer = indexer
+        self._frame = frame
+        self._name = name
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    def __setitem__(self, key, value):
+        frame = self._frame
+        if isinstance(key, tuple) and len(key) == 2:
+            columns = key[1]
+            try:
+                if self._name in ['iloc', 'iat']:
+                    positions = np.arange(frame.shape[1])[columns]
+                elif pd.api.types.is_scalar(columns) or isinstance(columns, tuple):
+                    positions = [frame.columns.get_loc(columns)] if columns in frame.columns else []      #New columns are inserted
+                elif pd.api.types.is_list_like(columns) and not pd.api.types.is_bool_dtype(np.asarray(columns)):
+                    positions = [frame.columns.get_loc(col) for col in columns if col in frame.columns]
+                else:
+                    positions = pd.Series(np.arange(frame.shape[1]), index=frame.columns).loc[columns].values
+            except Exception:
+                positions = None                                    #Can't resolve: Copy all shared columns
+        else:
+            positions = None
+        frame._own(positions)
+        self._indexer[key] = value
+
+    def __getattr__(self, name):
+        return getattr(self._indexer, name)
+
+def _indexer_property(name):
+    def fget(self):
+        return _CopyOnWriteIndexer(getattr(pd.DataFrame, name).fget(self), self, name)
+    return property(fget)
+
+def _own_if_inplace(method):
+    """ Copy the shared columns before an inplace method writes to them """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if kwargs.get('inplace', False):
+            self._own()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+class CopyOnWriteFrame(pd.DataFrame):
+    """
+    A DataFrame that shares the column arrays of a source DataFrame until they are written to
+
+    Use ``cow_view(df)`` to construct
+    """
+
+    _cow_sources = ()                                               #Weak references to the source arrays (not pickled)
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    def __reduce__(self):
+        return pd.DataFrame(self._data).__reduce_ex__(2)
+
+    #-Tracking-#
+
+    def _is_shared(self, values):
+        base = _base_array(values)
+        if base is None:
+            return True                                             #Unknown storage: Always copy before writing
+        for ref in self._cow_sources:
+            source = ref()
+            if source is not None and np.may_share_memory(base, source):
+                return True
+        return False
+
+    @property
+    def shared_columns(self):
+        """ Columns that are still views of the source arrays """
+        mgr = self._data
+        return [col for loc, col in enumerate(self.columns) if self._is_shared(mgr.blocks[mgr._blknos[loc]].values)]
+
+    def _own(self, positions=None):
+        """
+        Copy shared columns (by position) so they can be written to. Default is all shared columns
+        """
+        if len(self._cow_sources) == 0:
+            return
+        if positions is None or not self.columns.is_unique:
+            mgr = self._data
+            if any(self._is_shared(blk.values) for blk in mgr.blocks):
+                self._update_inplace(mgr.copy(deep=True))
+                object.__setattr__(self, '_cow_sources', ())
+            return
+        for loc in sorted(set(np.atleast_1d(positions).tolist())):
+            mgr = self._data
+            if not self._is_shared(mgr.blocks[mgr._blknos[loc]].values):
+                continue
+            key = self.columns[loc]
+            column = self._ixs(loc, axis=1)
+            pd.DataFrame.__delitem__(self, key)
+            pd.DataFrame.insert(self, loc, key, column)             #insert copies the Series values
+
+    #-Intercepted Writes-#
+
+    def __setitem__(self, key, value):
+        if isinstance(key, (pd.DataFrame, np.ndarray, slice)) or (isinstance(key, pd.Series) and key.dtype == bool):
+            self._own()                                             #Row/Mask Assignment
+        elif pd.api.types.is_list_like(key) and not isinstance(key, tuple):
+            self._own([self.columns.get_loc(col) for col in key if col in self.columns])
+        elif key in self.columns:
+            self._own([self.columns.get_loc(key)])
+        pd.DataFrame.__setitem__(self, key, value)
+
+    def _maybe_cache_changed(self, item, value):
+        """ A cached column Series was replaced inplace (i.e. df['value'] += 1) """
+        if item in self.columns:
+            self._own([self.columns.get_loc(item)])
+        pd.DataFrame._maybe_cache_changed(self, item, value)
+
+    loc = _indexer_property('loc')
+    iloc = _indexer_property('iloc')
+    at = _indexer_property('at')
+    iat = _indexer_property('iat')
+    ix = _indexer_property('ix')
+
+    fillna = _own_if_inplace(pd.DataFrame.fillna)
+    replace = _own_if_inplace(pd.DataFrame.replace)
+    where = _own_if_inplace(pd.DataFrame.where)
+    mask = _own_if_inplace(pd.DataFrame.mask)
+    interpolate = _own_if_inplace(pd.DataFrame.interpolate)
+    clip = _own_if_inplace(pd.DataFrame.clip)
+
+    def update(self, other, **kwargs):
+        self._own()
+        return pd.DataFrame.update(self, other, **kwargs)
+
+    def copy(self, deep=True):
+        """ A deep copy returns a pd.DataFrame. A shallow copy returns a new view """
+        if deep:
+            return pd.DataFrame(self._data.copy(deep=True))
+        return cow_view(self)
+
+def cow_view(df):
+    """
+    Construct a copy-on-write view of a DataFrame
+
+    Parameters
+    ----------
+    df      :   pd.DataFrame
+                Source DataFrame (not modified by writes to the view)
+
+    Returns
+    -------
+    CopyOnWriteFrame
+
+    Notes
+    -----
+    1. When df is itself a CopyOnWriteFrame the columns it owns become shared with the new view (in both directions)
+    """
+    view = CopyOnWriteFrame(df._data.copy(deep=False))
+    arrays = [array for array in _block_arrays(df) if array is not None]
+    sources = [weakref.ref(array) for array in arrays]
+    if isinstance(df, CopyOnWriteFrame):
+        object.__setattr__(df, '_cow_sources', tuple(df._cow_sources) + tuple(sources))
+        sources = list(df._cow_sources)
+    object.__setattr__(view, '_cow_sources', tuple(sources))
+    return view
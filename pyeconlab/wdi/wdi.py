@@ -24,6 +24,7 @@ import itertools as it
 import pprint
 import warnings
 
+from pyeconlab.util import cow_view
 from .meta import WDISeriesCodes, CodeToName
 codes = WDISeriesCodes()
 
@@ -168,7 +169,7 @@ class WDI(object):
         """
         Make Stata DTA File of the Data
         """
-        stata_data = self.data.copy(deep=True)
+        stata_data = cow_view(self.data)                                #Only the relabelled axes are new
         if table_type == "long":   
             if fl=="":
                 fl = "wdi_data_long.dta"            
@@ -194,12 +195,12 @@ class WDI(object):
             fl = "wdi_data.h5"
         store = pd.HDFStore(os.path.expanduser(target_dir) + fl, complevel=9, complib='zlib')
         #-Long Data-#
-        hdf_long = self.data.copy(deep=True).stack().reset_index()
+        hdf_long = self.data.stack().reset_index()                      #stack() returns new data
         hdf_long.rename_axis({0:'value'}, inplace=True, axis=1)
         store.put('long', hdf_long, format='table')
         del hdf_long
         #Wide Data-#
-        hdf_wide = self.data.copy(deep=True)
+        hdf_wide = cow_view(self.data)
         hdf_wide.columns = ['Y'+col for col in hdf_wide.columns]    #Stata Friendly Column Names
         hdf_wide = hdf_wide.reset_index()
         store.put('wide', hdf_wide, format='table')